@@ -3,25 +3,21 @@ CCEF Connections - Reusable connection library for CCEF data integrations.
 
 This library provides unified connection management for Airtable, OpenAI,
 Google Sheets, and BigQuery with Civis credential compatibility.
+
+Connectors and ConfigManager are imported lazily on first attribute access
+(PEP 562), so ``from ccef_connections import AirtableConnector`` only loads
+the Airtable SDK rather than every supported service's client library.
 """
 
-from .config import ConfigManager
-from .connectors.action_builder import ActionBuilderConnector
-from .connectors.action_network import ActionNetworkConnector
-from .connectors.airtable import AirtableConnector
-from .connectors.bigquery import BigQueryConnector
-from .connectors.helpscout import HelpScoutConnector
-from .connectors.openai import OpenAIConnector
-from .connectors.ptv import PTVConnector
-from .connectors.sheets import SheetsConnector
-from .connectors.sheets_writer import SheetsWriterConnector
-from .connectors.roi_crm import ROICRMConnector
-from .connectors.zoom import ZoomConnector
+import importlib
+from typing import Any, Dict, List, Tuple
+
 from .core.credentials import CredentialManager, get_credential
 from .exceptions import (
     CCEFConnectionError,
     CredentialError,
     ConnectionError,
+    ClientError,
     AuthenticationError,
     RateLimitError,
     ConfigurationError,
@@ -34,10 +30,13 @@ __version__ = "0.1.0"
 __all__ = [
     # Main connectors
     "ActionBuilderConnector",
+    "AsyncActionBuilderConnector",
     "ActionNetworkConnector",
+    "AsyncActionNetworkConnector",
     "AirtableConnector",
     "BigQueryConnector",
     "HelpScoutConnector",
+    "AsyncHelpScoutConnector",
     "OpenAIConnector",
     "PTVConnector",
     "SheetsConnector",
@@ -53,9 +52,75 @@ __all__ = [
     "CCEFConnectionError",
     "CredentialError",
     "ConnectionError",
+    "ClientError",
     "AuthenticationError",
     "RateLimitError",
     "ConfigurationError",
     "QueryError",
     "WriteError",
 ]
+
+# Public name -> (module, attribute) for objects imported on first access
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "ActionBuilderConnector": (
+        "ccef_connections.connectors.action_builder",
+        "ActionBuilderConnector",
+    ),
+    "AsyncActionBuilderConnector": (
+        "ccef_connections.connectors.action_builder_async",
+        "AsyncActionBuilderConnector",
+    ),
+    "ActionNetworkConnector": (
+        "ccef_connections.connectors.action_network",
+        "ActionNetworkConnector",
+    ),
+    "AsyncActionNetworkConnector": (
+        "ccef_connections.connectors.action_network_async",
+        "AsyncActionNetworkConnector",
+    ),
+    "AirtableConnector": ("ccef_connections.connectors.airtable", "AirtableConnector"),
+    "BigQueryConnector": ("ccef_connections.connectors.bigquery", "BigQueryConnector"),
+    "HelpScoutConnector": ("ccef_connections.connectors.helpscout", "HelpScoutConnector"),
+    "AsyncHelpScoutConnector": (
+        "ccef_connections.connectors.helpscout_async",
+        "AsyncHelpScoutConnector",
+    ),
+    "OpenAIConnector": ("ccef_connections.connectors.openai", "OpenAIConnector"),
+    "PTVConnector": ("ccef_connections.connectors.ptv", "PTVConnector"),
+    "SheetsConnector": ("ccef_connections.connectors.sheets", "SheetsConnector"),
+    "SheetsWriterConnector": (
+        "ccef_connections.connectors.sheets_writer",
+        "SheetsWriterConnector",
+    ),
+    "ROICRMConnector": ("ccef_connections.connectors.roi_crm", "ROICRMConnector"),
+    "ZoomConnector": ("ccef_connections.connectors.zoom", "ZoomConnector"),
+    "ConfigManager": ("ccef_connections.config", "ConfigManager"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import connectors and ConfigManager on first access.
+
+    Args:
+        name: Attribute name being looked up on the package
+
+    Returns:
+        The requested class
+
+    Raises:
+        AttributeError: If the name is not a lazily exported attribute
+    """
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    obj = getattr(importlib.import_module(module_name), attr)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> List[str]:
+    """Include lazily exported names in dir() output."""
+    return sorted(set(globals()) | set(__all__))
@@ -5,16 +5,96 @@ This module provides the ConfigManager class for reading configuration
 from Google Sheets with caching and environment variable overrides.
 """
 
+import asyncio
+import json
 import logging
 import os
+import re
+import tempfile
+import threading
 import time
-from typing import Any, Dict, Optional
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Literal, Mapping, Optional, Tuple, Union
 
 from .connectors.sheets import SheetsConnector
 from .exceptions import ConfigurationError
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup: pip install ccef-connections[speedups]
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# What concurrent callers do while another thread refreshes an expired cache
+StampedePolicy = Literal["wait", "serve_stale"]
+
+# Value conversion tables for _convert_value. Numbers are recognised by
+# regex so that ordinary strings never go through a failing int()/float().
+_BOOL_TRUE = frozenset({"true", "yes", "1"})
+_BOOL_FALSE = frozenset({"false", "no", "0"})
+_INT_RE = re.compile(r"\s*[-+]?\d+\s*")
+_FLOAT_RE = re.compile(r"\s*[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*")
+
+# Read-only view of a parsed config, as published by ConfigManager
+FrozenConfig = Mapping[str, Mapping[str, Any]]
+_EMPTY_SECTION: Mapping[str, Any] = MappingProxyType({})
+
+
+def _freeze(config: Dict[str, Dict[str, Any]]) -> FrozenConfig:
+    """
+    Wrap a parsed config in read-only views.
+
+    Readers share the cached object without copying, and attempts to
+    mutate it raise TypeError instead of silently corrupting the cache.
+
+    Args:
+        config: Parsed configuration
+
+    Returns:
+        Read-only mapping of read-only section mappings
+    """
+    return MappingProxyType({s: MappingProxyType(v) for s, v in config.items()})
+
+
+def _convert_value(value: Any) -> Any:
+    """
+    Convert string values to appropriate types.
+
+    Attempts to convert to int, float, or boolean.
+    Returns original string if conversion fails.
+
+    A module-level function rather than a method so the per-cell call in
+    ConfigManager._parse_config avoids a bound-method lookup.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        Converted value
+    """
+    if not isinstance(value, str):
+        return value
+
+    # Try boolean
+    value_lower = value.lower()
+    if value_lower in _BOOL_TRUE:
+        return True
+    if value_lower in _BOOL_FALSE:
+        return False
+
+    # Try integer, then float
+    if _INT_RE.fullmatch(value):
+        return int(value)
+    if _FLOAT_RE.fullmatch(value):
+        return float(value)
+
+    # Return as string
+    return value
+
 
 class ConfigManager:
     """
@@ -41,12 +121,21 @@ class ConfigManager:
         >>> config = config_mgr.get_config()
     """
 
+    # Process-wide SheetsConnector shared by instances with shared_connector=True,
+    # so several managers pay for one Google auth and HTTP session
+    _shared_connector: Optional[SheetsConnector] = None
+    _shared_connector_lock = threading.Lock()
+
     def __init__(
         self,
         sheets_id: str,
         worksheet_name: str = "Config",
         ttl: int = 300,
         auto_refresh: bool = True,
+        stampede_policy: StampedePolicy = "wait",
+        background_refresh: bool = False,
+        cache_path: Optional[Union[str, Path]] = None,
+        shared_connector: bool = True,
     ) -> None:
         """
         Initialize the ConfigManager.
@@ -56,60 +145,220 @@ class ConfigManager:
             worksheet_name: Name of the worksheet containing config (default: "Config")
             ttl: Time-to-live for cache in seconds (default: 300 = 5 minutes)
             auto_refresh: Whether to auto-refresh when cache expires (default: True)
+            stampede_policy: What other threads do while one thread refreshes an
+                expired cache. "wait" blocks until the refresh finishes;
+                "serve_stale" returns the expired cache immediately (default: "wait")
+            background_refresh: Whether to refresh the cache from a daemon thread
+                shortly before it expires, so reads after the first load never
+                wait on Sheets. Call close() to stop the thread (default: False)
+            cache_path: Optional JSON file used to persist the configuration
+                across process restarts. If the file is younger than the TTL,
+                the first get_config() is served from it without calling Sheets
+                (default: None)
+            shared_connector: Whether to reuse one process-wide SheetsConnector
+                across ConfigManager instances instead of creating one per
+                instance (default: True)
+
+        Raises:
+            ValueError: If stampede_policy is not a valid value
         """
+        if stampede_policy not in ("wait", "serve_stale"):
+            raise ValueError(
+                f"Invalid stampede_policy '{stampede_policy}'. Must be one of: wait, serve_stale"
+            )
+
         self._sheets_id = sheets_id
         self._worksheet_name = worksheet_name
         self._ttl = ttl
         self._auto_refresh = auto_refresh
+        self._stampede_policy = stampede_policy
+        self._shared_connector_enabled = shared_connector
+
+        # CCEF_* overrides, snapshotted once; see reload_env()
+        self._env_overrides: Dict[str, str] = {}
+        self.reload_env()
 
-        self._config_cache: Optional[Dict[str, Dict[str, Any]]] = None
-        self._cache_timestamp: float = 0.0
+        # (time.monotonic() at refresh, frozen config), published by a single
+        # attribute assignment so lock-free readers never see a torn pair.
+        # A monotonic clock keeps staleness bounded by the TTL even if the
+        # wall clock jumps (NTP, VM resume).
+        self._snapshot: Optional[Tuple[float, FrozenConfig]] = None
+
+        # Single-flight guard so only one caller hits Sheets when the TTL expires
+        self._refresh_lock = threading.Lock()
+        # asyncio.Lock is bound to an event loop, so it is created per loop on demand
+        self._async_refresh_lock: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = None
 
         self._sheets_connector: Optional[SheetsConnector] = None
 
+        self._cache_path: Optional[Path] = Path(cache_path) if cache_path else None
+        if self._cache_path is not None:
+            self._load_disk_cache()
+
+        self._stop_event = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+        if background_refresh:
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_loop, name="ConfigManager-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+
         logger.debug(f"Initialized ConfigManager (TTL: {ttl}s)")
 
-    def get_config(self, refresh_if_expired: bool = True) -> Dict[str, Dict[str, Any]]:
+    def __enter__(self) -> "ConfigManager":
+        """
+        Context manager entry.
+
+        Returns:
+            self
+
+        Examples:
+            >>> with ConfigManager(sheets_id='ID', background_refresh=True) as mgr:
+            ...     config = mgr.get_config()
+        """
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """
+        Context manager exit. Stops the background refresh thread.
+
+        Args:
+            exc_type: Exception type if an exception occurred
+            exc_val: Exception value if an exception occurred
+            exc_tb: Exception traceback if an exception occurred
+        """
+        self.close()
+
+    def close(self) -> None:
+        """Stop the background refresh thread, if one is running."""
+        self._stop_event.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=5)
+            self._refresh_thread = None
+            logger.debug("Stopped background configuration refresh")
+
+    def _refresh_loop(self) -> None:
+        """
+        Refresh the cache periodically until close() is called.
+
+        Runs at 80% of the TTL so the cache is replaced before it expires.
+        Failures are logged and the last good configuration is kept.
+        """
+        interval = max(1.0, self._ttl * 0.8)
+        while not self._stop_event.wait(interval):
+            try:
+                with self._refresh_lock:
+                    self.refresh()
+            except ConfigurationError as e:
+                logger.warning(f"Background configuration refresh failed: {str(e)}")
+
+    def get_config(self, refresh_if_expired: bool = True) -> FrozenConfig:
         """
         Get the configuration.
 
-        Returns a nested dictionary with sections as top-level keys.
+        Returns a nested mapping with sections as top-level keys. The mapping
+        is the shared cache itself and is read-only; copy it with
+        ``{s: dict(v) for s, v in config.items()}`` if you need to modify it.
 
         Args:
             refresh_if_expired: Whether to auto-refresh if cache expired (default: True)
 
         Returns:
-            Nested dictionary of configuration values
+            Nested read-only mapping of configuration values
 
         Examples:
             >>> config = config_mgr.get_config()
             >>> print(config['airtable']['base_id'])
             >>> print(config['openai']['model'])
         """
-        current_time = time.time()
+        # Read the snapshot once so timestamp and config are consistent
+        snapshot = self._snapshot
 
         # Check if cache is valid
-        if self._config_cache is not None and not self._is_cache_expired(current_time):
+        if snapshot is not None and time.monotonic() - snapshot[0] < self._ttl:
             logger.debug("Returning cached configuration")
-            return self._config_cache
+            return snapshot[1]
 
         # Cache is invalid or expired
         if self._auto_refresh and refresh_if_expired:
             logger.debug("Cache expired or empty, refreshing configuration")
-            self.refresh()
-            if self._config_cache is None:
+            self._refresh_single_flight()
+            snapshot = self._snapshot
+            if snapshot is None:
                 raise ConfigurationError("Failed to load configuration")
-            return self._config_cache
+            return snapshot[1]
 
         # Return cached config even if expired (if auto_refresh is disabled)
-        if self._config_cache is not None:
+        if snapshot is not None:
             logger.warning("Returning expired cached configuration")
-            return self._config_cache
+            return snapshot[1]
 
         raise ConfigurationError(
             "No configuration available. Call refresh() to load from Google Sheets."
         )
 
+    async def aget_config(self, refresh_if_expired: bool = True) -> FrozenConfig:
+        """
+        Get the configuration without blocking the event loop.
+
+        Async counterpart of get_config(). When a refresh is needed, the
+        Sheets call runs in a worker thread and concurrent coroutines share
+        a single refresh.
+
+        Args:
+            refresh_if_expired: Whether to auto-refresh if cache expired (default: True)
+
+        Returns:
+            Nested read-only mapping of configuration values
+
+        Examples:
+            >>> config = await config_mgr.aget_config()
+            >>> print(config['airtable']['base_id'])
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - snapshot[0] < self._ttl:
+            return snapshot[1]
+
+        if not (self._auto_refresh and refresh_if_expired):
+            return self.get_config(refresh_if_expired=False)
+
+        lock = self._get_async_refresh_lock()
+        if self._stampede_policy == "serve_stale" and snapshot is not None and lock.locked():
+            logger.debug("Refresh already in progress, serving stale configuration")
+            return snapshot[1]
+
+        async with lock:
+            await asyncio.to_thread(self._refresh_single_flight)
+
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise ConfigurationError("Failed to load configuration")
+        return snapshot[1]
+
+    async def arefresh(self) -> None:
+        """
+        Refresh configuration from Google Sheets without blocking the event loop.
+
+        Async counterpart of refresh(); the Sheets call runs in a worker thread.
+
+        Raises:
+            ConfigurationError: If configuration cannot be loaded
+        """
+        async with self._get_async_refresh_lock():
+            await asyncio.to_thread(self.refresh)
+
+    def _get_async_refresh_lock(self) -> asyncio.Lock:
+        """
+        Return the asyncio.Lock for the running event loop.
+
+        Returns:
+            Lock used for coroutine-level single-flight refreshes
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_refresh_lock is None or self._async_refresh_lock[0] is not loop:
+            self._async_refresh_lock = (loop, asyncio.Lock())
+        return self._async_refresh_lock[1]
+
     def refresh(self) -> None:
         """
         Refresh configuration from Google Sheets.
@@ -125,29 +374,173 @@ class ConfigManager:
 
             # Initialize connector if needed
             if self._sheets_connector is None:
-                self._sheets_connector = SheetsConnector()
+                if self._shared_connector_enabled:
+                    self._sheets_connector = type(self)._get_shared_connector()
+                else:
+                    self._sheets_connector = SheetsConnector()
 
             # Read configuration from Sheets
             config_data = self._sheets_connector.get_worksheet_as_dicts(
                 self._sheets_id, self._worksheet_name
             )
 
-            # Convert to nested dictionary structure
-            config = self._parse_config(config_data)
-
-            # Apply environment variable overrides
-            config = self._apply_env_overrides(config)
-
-            # Update cache
-            self._config_cache = config
-            self._cache_timestamp = time.time()
-
-            logger.info(f"Configuration refreshed successfully ({len(config)} sections)")
+            self._update_cache(config_data)
 
         except Exception as e:
             logger.error(f"Failed to refresh configuration: {str(e)}")
             raise ConfigurationError(f"Failed to refresh configuration: {str(e)}") from e
 
+    @classmethod
+    def _get_shared_connector(cls) -> SheetsConnector:
+        """
+        Return the process-wide SheetsConnector, creating it on first use.
+
+        Returns:
+            Shared SheetsConnector instance
+        """
+        with cls._shared_connector_lock:
+            if cls._shared_connector is None:
+                cls._shared_connector = SheetsConnector()
+                logger.debug("Created shared SheetsConnector for ConfigManager")
+            return cls._shared_connector
+
+    def refresh_from_bytes(self, raw: Union[bytes, str]) -> None:
+        """
+        Refresh configuration from a JSON export of the config worksheet.
+
+        Bypasses Google Sheets entirely. The JSON must be a list of row
+        objects in the same shape as SheetsConnector.get_worksheet_as_dicts()
+        returns. Parsed with orjson when it is installed.
+
+        Args:
+            raw: JSON document as bytes or str
+
+        Raises:
+            ConfigurationError: If the JSON is invalid or not a list of rows
+
+        Examples:
+            >>> raw = b'[{"Section": "airtable", "Key": "base_id", "Value": "appXXX"}]'
+            >>> config_mgr.refresh_from_bytes(raw)
+            >>> config_mgr.get('airtable', 'base_id')
+            'appXXX'
+        """
+        try:
+            config_data = _json_loads(raw)
+        except ValueError as e:
+            raise ConfigurationError(f"Invalid configuration JSON: {str(e)}") from e
+
+        if not isinstance(config_data, list) or not all(
+            isinstance(row, dict) for row in config_data
+        ):
+            raise ConfigurationError("Configuration JSON must be a list of row objects")
+
+        self._update_cache(config_data)
+
+    def _update_cache(self, config_data: list[Dict[str, Any]]) -> None:
+        """
+        Parse worksheet rows and publish them as the cached configuration.
+
+        Args:
+            config_data: List of configuration rows as dictionaries
+        """
+        # Convert to nested dictionary structure
+        config = self._parse_config(config_data)
+
+        # Persist before env overrides so they are re-applied on load
+        if self._cache_path is not None:
+            self._write_disk_cache(config)
+
+        # Apply environment variable overrides
+        config = self._apply_env_overrides(config)
+
+        # Publish the new cache in one atomic assignment
+        self._snapshot = (time.monotonic(), _freeze(config))
+
+        logger.info(f"Configuration refreshed successfully ({len(config)} sections)")
+
+    def _load_disk_cache(self) -> None:
+        """
+        Populate the cache from cache_path if the file is within the TTL.
+
+        A missing, unreadable, or expired file is ignored and the first
+        get_config() falls through to Sheets as usual.
+        """
+        if self._cache_path is None:
+            return
+        try:
+            payload = json.loads(self._cache_path.read_text(encoding="utf-8"))
+            age = time.time() - float(payload["ts"])
+            config = payload["config"]
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable config cache {self._cache_path}: {str(e)}")
+            return
+
+        if not 0 <= age < self._ttl:
+            logger.debug(f"Config cache file is expired ({age:.0f}s old)")
+            return
+
+        # Translate the file's wall-clock age onto the monotonic clock
+        self._snapshot = (time.monotonic() - age, _freeze(self._apply_env_overrides(config)))
+        logger.debug(f"Loaded configuration from {self._cache_path} ({age:.0f}s old)")
+
+    def _write_disk_cache(self, config: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Atomically write the parsed configuration to cache_path.
+
+        Each writer uses its own temp file and os.replace(), so concurrent
+        processes never leave a partially written file. Write failures are
+        logged and do not fail the refresh.
+
+        Args:
+            config: Parsed configuration (before environment overrides)
+        """
+        if self._cache_path is None:
+            return
+        tmp_name = None
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self._cache_path.parent, prefix=f".{self._cache_path.name}.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"ts": time.time(), "config": config}, f)
+            os.replace(tmp_name, self._cache_path)
+            tmp_name = None
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write config cache {self._cache_path}: {str(e)}")
+        finally:
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    def _refresh_single_flight(self) -> None:
+        """
+        Refresh the cache, allowing only one concurrent caller to hit Sheets.
+
+        Under the "wait" policy, other callers block on the lock and then
+        reuse the freshly loaded cache. Under "serve_stale", callers that
+        already have a cached config return immediately while another
+        thread refreshes.
+        """
+        if self._stampede_policy == "serve_stale" and self._snapshot is not None:
+            if not self._refresh_lock.acquire(blocking=False):
+                logger.debug("Refresh already in progress, serving stale configuration")
+                return
+        else:
+            self._refresh_lock.acquire()
+
+        try:
+            # Another thread may have refreshed while we were waiting
+            if not self._is_cache_expired(time.monotonic()):
+                return
+            self.refresh()
+        finally:
+            self._refresh_lock.release()
+
     def get(
         self, section: str, key: str, default: Any = None
     ) -> Any:
@@ -167,12 +560,66 @@ class ConfigManager:
             >>> model = config_mgr.get('openai', 'model', default='gpt-4o')
         """
         config = self.get_config()
-        return config.get(section, {}).get(key, default)
+        return config.get(section, _EMPTY_SECTION).get(key, default)
+
+    def get_many(
+        self, pairs: Iterable[Tuple[str, str]], default: Any = None
+    ) -> Dict[Tuple[str, str], Any]:
+        """
+        Get several configuration values with a single cache check.
+
+        Args:
+            pairs: (section, key) tuples to look up
+            default: Default value for any pair that is not found
+
+        Returns:
+            Dictionary mapping each (section, key) tuple to its value or default
+
+        Examples:
+            >>> values = config_mgr.get_many([('airtable', 'base_id'), ('openai', 'model')])
+            >>> base_id = values[('airtable', 'base_id')]
+        """
+        config = self.get_config()
+        return {
+            (section, key): config.get(section, _EMPTY_SECTION).get(key, default)
+            for section, key in pairs
+        }
+
+    def get_section(self, section: str) -> Mapping[str, Any]:
+        """
+        Get all configuration values in a section.
+
+        Args:
+            section: Configuration section name
+
+        Returns:
+            Read-only mapping of key/value pairs, empty if the section is missing
+
+        Examples:
+            >>> airtable_cfg = config_mgr.get_section('airtable')
+            >>> base_id = airtable_cfg['base_id']
+        """
+        return self.get_config().get(section, _EMPTY_SECTION)
+
+    def reload_env(self) -> None:
+        """
+        Re-read CCEF_SECTION_KEY environment overrides.
+
+        Overrides are read once when the manager is created and applied on
+        every refresh. Call this after changing os.environ, then refresh()
+        to apply the new values.
+        """
+        prefix = "CCEF_"
+        self._env_overrides = {
+            name[len(prefix):]: value
+            for name, value in os.environ.items()
+            if name.startswith(prefix)
+        }
+        logger.debug(f"Loaded {len(self._env_overrides)} environment override(s)")
 
     def clear_cache(self) -> None:
         """Clear the configuration cache."""
-        self._config_cache = None
-        self._cache_timestamp = 0.0
+        self._snapshot = None
         logger.debug("Configuration cache cleared")
 
     def _is_cache_expired(self, current_time: float) -> bool:
@@ -180,13 +627,15 @@ class ConfigManager:
         Check if the cache has expired.
 
         Args:
-            current_time: Current timestamp
+            current_time: Current time.monotonic() reading
 
         Returns:
-            True if cache is expired, False otherwise
+            True if cache is expired or empty, False otherwise
         """
-        age = current_time - self._cache_timestamp
-        return age >= self._ttl
+        snapshot = self._snapshot
+        if snapshot is None:
+            return True
+        return current_time - snapshot[0] >= self._ttl
 
     def _parse_config(
         self, config_data: list[Dict[str, Any]]
@@ -204,22 +653,26 @@ class ConfigManager:
             Nested dictionary with sections and keys
         """
         config: Dict[str, Dict[str, Any]] = {}
+        # Local bindings keep attribute lookups out of the per-row loop
+        convert = _convert_value
+        section_for = config.setdefault
 
         for row in config_data:
-            section = row.get("Section", "").strip()
-            key = row.get("Key", "").strip()
-            value = row.get("Value", "")
+            section = row.get("Section") or ""
+            key = row.get("Key") or ""
+
+            # Only strip when needed; most cells are already clean
+            if section[:1].isspace() or section[-1:].isspace():
+                section = section.strip()
+            if key[:1].isspace() or key[-1:].isspace():
+                key = key.strip()
 
             if not section or not key:
                 logger.warning(f"Skipping invalid config row: {row}")
                 continue
 
-            # Create section if it doesn't exist
-            if section not in config:
-                config[section] = {}
-
-            # Store the value
-            config[section][key] = self._convert_value(value)
+            # Create the section if needed and store the value in one lookup
+            section_for(section, {})[key] = convert(row.get("Value", ""))
 
         return config
 
@@ -227,8 +680,7 @@ class ConfigManager:
         """
         Convert string values to appropriate types.
 
-        Attempts to convert to int, float, or boolean.
-        Returns original string if conversion fails.
+        Thin wrapper around the module-level _convert_value().
 
         Args:
             value: Value to convert
@@ -236,30 +688,7 @@ class ConfigManager:
         Returns:
             Converted value
         """
-        if not isinstance(value, str):
-            return value
-
-        # Try boolean
-        value_lower = value.lower()
-        if value_lower in ("true", "yes", "1"):
-            return True
-        if value_lower in ("false", "no", "0"):
-            return False
-
-        # Try integer
-        try:
-            return int(value)
-        except ValueError:
-            pass
-
-        # Try float
-        try:
-            return float(value)
-        except ValueError:
-            pass
-
-        # Return as string
-        return value
+        return _convert_value(value)
 
     def _apply_env_overrides(
         self, config: Dict[str, Dict[str, Any]]
@@ -270,20 +699,32 @@ class ConfigManager:
         Environment variables in format: CCEF_SECTION_KEY override
         corresponding config values.
 
+        Uses the overrides snapshotted by reload_env() rather than reading
+        os.environ. Overrides are rare, so the (section, key) name index is
+        only built when at least one CCEF_ variable was set.
+
         Args:
             config: Configuration dictionary
 
         Returns:
             Configuration with environment overrides applied
         """
-        for section in config:
-            for key in config[section]:
-                env_var = f"CCEF_{section.upper()}_{key.upper()}"
-                env_value = os.getenv(env_var)
-
-                if env_value is not None:
-                    config[section][key] = self._convert_value(env_value)
-                    logger.debug(f"Applied env override: {env_var}")
+        overrides = self._env_overrides
+        if not overrides:
+            return config
+
+        # SECTION_KEY -> [(section, key), ...]; a list because names that
+        # contain underscores can collide once joined
+        index: Dict[str, list[tuple[str, str]]] = {}
+        for section, values in config.items():
+            section_upper = section.upper()
+            for key in values:
+                index.setdefault(f"{section_upper}_{key.upper()}", []).append((section, key))
+
+        for name, env_value in overrides.items():
+            for section, key in index.get(name, ()):
+                config[section][key] = _convert_value(env_value)
+                logger.debug(f"Applied env override: CCEF_{name}")
 
         return config
 
@@ -295,9 +736,10 @@ class ConfigManager:
         Returns:
             Cache age in seconds, or 0 if no cache
         """
-        if self._cache_timestamp == 0:
+        snapshot = self._snapshot
+        if snapshot is None:
             return 0.0
-        return time.time() - self._cache_timestamp
+        return time.monotonic() - snapshot[0]
 
     @property
     def is_cache_valid(self) -> bool:
@@ -307,6 +749,4 @@ class ConfigManager:
         Returns:
             True if cache is valid, False otherwise
         """
-        if self._config_cache is None:
-            return False
-        return not self._is_cache_expired(time.time())
+        return not self._is_cache_expired(time.monotonic())
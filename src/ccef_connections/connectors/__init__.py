@@ -1,22 +1,20 @@
-"""Connectors for various services."""
-
-from .action_builder import ActionBuilderConnector
-from .action_network import ActionNetworkConnector
-from .airtable import AirtableConnector
-from .bigquery import BigQueryConnector
-from .geocodio import GeocodioConnector
-from .helpscout import HelpScoutConnector
-from .openai import OpenAIConnector
-from .ptv import PTVConnector
-from .roi_crm import ROICRMConnector
-from .sheets import SheetsConnector
-from .sheets_writer import SheetsWriterConnector
-from .zoom import ZoomConnector
+"""
+Connectors for various services.
+
+Each connector is imported lazily on first attribute access (PEP 562) so
+that using one connector does not pull in every other service's SDK.
+"""
+
+import importlib
+from typing import Any, Dict, List, Tuple
 
 __all__ = [
     "ActionBuilderConnector",
     "ActionNetworkConnector",
     "AirtableConnector",
+    "AsyncActionBuilderConnector",
+    "AsyncActionNetworkConnector",
+    "AsyncHelpScoutConnector",
     "BigQueryConnector",
     "GeocodioConnector",
     "HelpScoutConnector",
@@ -27,3 +25,50 @@ __all__ = [
     "SheetsWriterConnector",
     "ZoomConnector",
 ]
+
+# Public name -> (submodule, attribute) for connectors imported on first access
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "ActionBuilderConnector": (".action_builder", "ActionBuilderConnector"),
+    "ActionNetworkConnector": (".action_network", "ActionNetworkConnector"),
+    "AirtableConnector": (".airtable", "AirtableConnector"),
+    "AsyncActionBuilderConnector": (".action_builder_async", "AsyncActionBuilderConnector"),
+    "AsyncActionNetworkConnector": (".action_network_async", "AsyncActionNetworkConnector"),
+    "AsyncHelpScoutConnector": (".helpscout_async", "AsyncHelpScoutConnector"),
+    "BigQueryConnector": (".bigquery", "BigQueryConnector"),
+    "GeocodioConnector": (".geocodio", "GeocodioConnector"),
+    "HelpScoutConnector": (".helpscout", "HelpScoutConnector"),
+    "OpenAIConnector": (".openai", "OpenAIConnector"),
+    "PTVConnector": (".ptv", "PTVConnector"),
+    "ROICRMConnector": (".roi_crm", "ROICRMConnector"),
+    "SheetsConnector": (".sheets", "SheetsConnector"),
+    "SheetsWriterConnector": (".sheets_writer", "SheetsWriterConnector"),
+    "ZoomConnector": (".zoom", "ZoomConnector"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a connector class on first access.
+
+    Args:
+        name: Attribute name being looked up on the package
+
+    Returns:
+        The requested connector class
+
+    Raises:
+        AttributeError: If the name is not a known connector
+    """
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    obj = getattr(importlib.import_module(module_name, __name__), attr)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> List[str]:
+    """Include lazily exported connector names in dir() output."""
+    return sorted(set(globals()) | set(__all__))
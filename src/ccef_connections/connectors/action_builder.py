@@ -22,26 +22,245 @@ Tag update pattern (update_records workflow):
        — writes the new value via add_tags + identifiers.
   NOTE: There is no 'remove_tags' parameter in the POST body.
   Passing one causes a 500 Internal Server Error from the AB API.
+  replace_entity_tags() runs step 1 for every tagging, then step 2 once
+  with all new values, so N replacements cost N DELETEs + 1 POST.
 
 Retry policy:
   retry_action_builder_operation retries only on RateLimitError (429).
-  All other errors (including 4xx/5xx ConnectionError) fail immediately
-  so callers see the real error without waiting through backoff.
+  All other errors (ClientError for 4xx, ConnectionError for 5xx) fail
+  immediately so callers see the real error without waiting through
+  backoff.
+  Retry-After is honoured in both delta-seconds and HTTP-date form. When
+  X-RateLimit-Remaining reaches 1, the next request waits until
+  X-RateLimit-Reset instead of provoking a 429.
+  create_person, update_person, create_tag and update_connection send one
+  Idempotency-Key across all of their attempts, so a retried write is
+  never applied twice by a server that honours the header.
+  Listings retry each page request on its own rather than the whole
+  list_* call, so a throttled page never re-fetches the pages before it.
 """
 
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+import math
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from urllib.parse import parse_qs, urlsplit
 
 import requests
 
 from ..core.base import BaseConnection
+from ..core.http import create_session, json_loads
 from ..core.retry import retry_action_builder_operation
-from ..exceptions import AuthenticationError, ConnectionError, RateLimitError
+from ..exceptions import AuthenticationError, ClientError, ConnectionError, RateLimitError
 
 logger = logging.getLogger(__name__)
 
 ACTION_BUILDER_API_BASE = "https://{subdomain}.actionbuilder.org/api/rest/v1"
 
+# Records requested per page when listing; fewer pages means fewer round-trips
+DEFAULT_PER_PAGE = 100
+
+# Page size retried once when the API rejects a larger per_page with 400
+FALLBACK_PER_PAGE = 25
+
+# Default thread-pool size for bulk_* helpers
+DEFAULT_BULK_WORKERS = 8
+
+# Concurrent page requests per list_* call once total_pages is known
+DEFAULT_PAGE_WORKERS = 4
+
+# Seconds that campaign configuration reads (tags, entity/connection types) are reused
+DEFAULT_CACHE_TTL = 300.0
+
+# Upper bound on cached entries; the oldest entries are evicted first
+DEFAULT_CACHE_MAXSIZE = 1024
+
+# 4xx statuses that can succeed on retry (request timeout, too early)
+_RETRIABLE_4XX = frozenset({408, 425})
+
+# Longest pause taken when X-RateLimit-Remaining says the budget is spent
+MAX_THROTTLE_SECONDS = 60.0
+
+_T = TypeVar("_T")
+
+
+def _parse_retry_after(value: Optional[str]) -> int:
+    """
+    Convert a Retry-After header to whole seconds (delta-seconds or HTTP-date).
+
+    Args:
+        value: Raw header value, or None when absent
+
+    Returns:
+        Seconds to wait, at least 1
+    """
+    if not value:
+        return 1
+    try:
+        return max(1, math.ceil(float(value)))
+    except ValueError:
+        pass
+    try:
+        delay = parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return 1
+    return max(1, math.ceil(delay))
+
+
+def _rate_limit_state(headers: Mapping[str, str]) -> Optional[Tuple[int, float]]:
+    """
+    Read ``(remaining, reset_at)`` from X-RateLimit-* response headers.
+
+    X-RateLimit-Reset may be an epoch timestamp or seconds from now; both
+    are returned as an epoch time.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        ``(remaining, reset_at)``, or None when the headers are absent
+    """
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None:
+        return None
+    try:
+        remaining_count = int(remaining)
+        reset_value = float(reset)
+    except ValueError:
+        return None
+    now = time.time()
+    # Values this small cannot be epoch timestamps, so they are deltas
+    reset_at = reset_value if reset_value > 1e9 else now + reset_value
+    return remaining_count, reset_at
+
+
+def _throttle_delay(state: Optional[Tuple[int, float]]) -> float:
+    """Return seconds to wait before the next request, given the last rate-limit state."""
+    if state is None:
+        return 0.0
+    remaining, reset_at = state
+    if remaining > 1:
+        return 0.0
+    return min(max(0.0, reset_at - time.time()), MAX_THROTTLE_SECONDS)
+
+
+def _raise_for_status(status_code: int, text: str, headers: Mapping[str, str]) -> None:
+    """
+    Raise the library exception matching an Action Builder error response.
+
+    Shared by the sync and async connectors so both surface identical errors.
+
+    Args:
+        status_code: HTTP status code (>= 400)
+        text: Response body text
+        headers: Response headers
+
+    Raises:
+        AuthenticationError: On 401 responses
+        RateLimitError: On 429 responses
+        ClientError: On other 4xx responses, which will not succeed on retry
+        ConnectionError: On any other error status, with ``status_code`` set
+    """
+    if status_code == 401:
+        raise AuthenticationError(
+            f"Action Builder authentication failed ({status_code}): {text}"
+        )
+
+    if status_code == 429:
+        retry_after = _parse_retry_after(headers.get("Retry-After"))
+        raise RateLimitError(
+            f"Action Builder rate limit exceeded, retry after {retry_after}s",
+            retry_after=retry_after,
+        )
+
+    message = f"Action Builder API error {status_code}: {text}"
+    if 400 <= status_code < 500 and status_code not in _RETRIABLE_4XX:
+        raise ClientError(message, status_code=status_code)
+    raise ConnectionError(message, status_code=status_code)
+
+
+def _next_page(data: Mapping[str, Any], page: int) -> Optional[int]:
+    """
+    Return the page number to fetch after ``page``, or None when done.
+
+    HAL responses carry ``_links.next`` on every page but the last, which is
+    authoritative even when ``total_pages`` is stale. Responses without
+    ``_links`` fall back to comparing against ``total_pages``, stopping
+    early when the page holds fewer records than the ``per_page`` the API
+    echoed, since a short page is always the last one.
+
+    Args:
+        data: Decoded response body for ``page``
+        page: Page number that produced ``data``
+
+    Returns:
+        Next page number, or None if this was the last page
+    """
+    links = data.get("_links")
+    if isinstance(links, Mapping):
+        href = (links.get("next") or {}).get("href")
+        if not href:
+            return None
+        values = parse_qs(urlsplit(href).query).get("page")
+        next_page = int(values[0]) if values and values[0].isdigit() else page + 1
+        # Guard against a malformed link that would loop forever
+        return next_page if next_page > page else None
+    if page >= data.get("total_pages", 1):
+        return None
+    per_page = data.get("per_page")
+    embedded = data.get("_embedded")
+    if per_page and isinstance(embedded, Mapping):
+        count = sum(len(items) for items in embedded.values() if isinstance(items, list))
+        if count < per_page:
+            return None
+    return page + 1
+
+
+def _idempotent(func: Callable[..., _T]) -> Callable[..., _T]:
+    """
+    Give every attempt of a retried write the same Idempotency-Key.
+
+    Applied outside retry_action_builder_operation, so the key is chosen
+    once per call rather than once per attempt. Callers may pass their own
+    ``idempotency_key`` to make a write safe to repeat across runs.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, idempotency_key: Optional[str] = None, **kwargs: Any) -> _T:
+        return func(*args, idempotency_key=idempotency_key or uuid.uuid4().hex, **kwargs)
+
+    return wrapper
+
+
+def _modified_since_params(
+    modified_since: Optional[str], filters: Optional[Mapping[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """Build list query params from a modified_since date and extra filters."""
+    if not modified_since and not filters:
+        return None
+    params: Dict[str, Any] = dict(filters or {})
+    if modified_since:
+        params["filter"] = f"modified_date gt '{modified_since}'"
+    return params or None
+
 
 class ActionBuilderConnector(BaseConnection):
     """
@@ -50,6 +269,16 @@ class ActionBuilderConnector(BaseConnection):
     Provides access to Action Builder resources using the OSDI/HAL+JSON
     API v1.2.0 with a static API token.
 
+    Campaign configuration that rarely changes during a sync run (the
+    campaign itself, tags, entity types, connection types) is cached for
+    ``cache_ttl`` seconds, up to ``cache_maxsize`` entries.
+    create_tag/delete_tag invalidate the affected entries; call
+    invalidate_cache() after changing configuration any other way.
+
+    Args:
+        cache_ttl: Seconds to reuse configuration reads; 0 disables caching
+        cache_maxsize: Maximum number of cached reads kept at once
+
     Examples:
         >>> connector = ActionBuilderConnector()
         >>> connector.connect()
@@ -57,12 +286,28 @@ class ActionBuilderConnector(BaseConnection):
         >>> people = connector.list_people(campaign_id="abc123")
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_maxsize: int = DEFAULT_CACHE_MAXSIZE,
+    ) -> None:
         """Initialize the Action Builder connector."""
         super().__init__()
         self._api_token: Optional[str] = None
         self._subdomain: Optional[str] = None
         self._base_url: Optional[str] = None
+        self._session: Optional[requests.Session] = None
+        # Last (remaining, reset_at) seen in X-RateLimit-* headers
+        self._rate_limit: Optional[Tuple[int, float]] = None
+        # Set once the API has rejected a larger per_page; caps later listings
+        self._per_page_cap: Optional[int] = None
+        self._cache_ttl = cache_ttl
+        self._cache_maxsize = cache_maxsize
+        # (path, per_page) -> (expires_at, value); per_page is None for single GETs
+        self._cache: Dict[Tuple[str, Optional[int]], Tuple[float, Any]] = {}
+        self._cache_inflight: Dict[Tuple[str, Optional[int]], "Future[Any]"] = {}
+        self._cache_generation = 0
+        self._cache_lock = threading.Lock()
 
     def connect(self) -> None:
         """
@@ -79,6 +324,8 @@ class ActionBuilderConnector(BaseConnection):
             self._base_url = ACTION_BUILDER_API_BASE.format(
                 subdomain=self._subdomain
             )
+            self._close_session()
+            self._session = create_session(self._get_headers())
             self._is_connected = True
             logger.info("Successfully connected to Action Builder")
         except Exception as e:
@@ -88,7 +335,9 @@ class ActionBuilderConnector(BaseConnection):
             ) from e
 
     def disconnect(self) -> None:
-        """Clear the Action Builder connection."""
+        """Clear the Action Builder connection and close pooled sockets."""
+        self._close_session()
+        self.invalidate_cache()
         self._api_token = None
         self._subdomain = None
         self._base_url = None
@@ -112,6 +361,18 @@ class ActionBuilderConnector(BaseConnection):
 
     # -- HTTP helpers ---------------------------------------------------------
 
+    def _get_session(self) -> requests.Session:
+        """Return the pooled session, creating it on first use."""
+        if self._session is None:
+            self._session = create_session(self._get_headers())
+        return self._session
+
+    def _close_session(self) -> None:
+        """Close the pooled session, if one is open."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def _get_headers(self) -> Dict[str, str]:
         """Return request headers with the API token."""
         return {
@@ -125,6 +386,7 @@ class ActionBuilderConnector(BaseConnection):
         path: str,
         params: Optional[Dict[str, Any]] = None,
         json_body: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Central HTTP method with error handling.
@@ -134,115 +396,396 @@ class ActionBuilderConnector(BaseConnection):
             path: API path relative to the base URL (e.g. '/campaigns')
             params: Query parameters
             json_body: JSON request body
+            idempotency_key: Sent as the Idempotency-Key header when set
 
         Returns:
-            Parsed JSON response, or None for 204 No Content
+            Parsed JSON response, or None for 204 No Content or an empty body
 
         Raises:
             AuthenticationError: On 401 responses
             RateLimitError: On 429 responses
             ConnectionError: On other HTTP errors or network failures
         """
-        if not self._is_connected and not self._api_token:
+        if self._base_url is None:
             self.connect()
 
-        url = f"{self._base_url}{path}"
+        url = self._base_url + path
+
+        delay = _throttle_delay(self._rate_limit)
+        if delay > 0:
+            logger.debug(f"Action Builder rate limit nearly spent; pausing {delay:.1f}s")
+            time.sleep(delay)
+            self._rate_limit = None
+
+        extra: Dict[str, Any] = {}
+        if idempotency_key is not None:
+            extra["headers"] = {"Idempotency-Key": idempotency_key}
 
         try:
-            resp = requests.request(
+            resp = self._get_session().request(
                 method,
                 url,
-                headers=self._get_headers(),
                 params=params,
                 json=json_body,
                 timeout=30,
+                **extra,
             )
         except requests.RequestException as e:
             raise ConnectionError(
                 f"Action Builder API request failed: {e}"
             ) from e
 
-        if resp.status_code == 401:
-            raise AuthenticationError(
-                f"Action Builder authentication failed ({resp.status_code}): {resp.text}"
-            )
-
-        if resp.status_code == 429:
-            retry_after = int(resp.headers.get("Retry-After", 1))
-            raise RateLimitError(
-                f"Action Builder rate limit exceeded, retry after {retry_after}s",
-                retry_after=retry_after,
-            )
+        state = _rate_limit_state(resp.headers)
+        if state is not None:
+            self._rate_limit = state
 
         if resp.status_code == 204:
             return None
 
         if resp.status_code >= 400:
-            raise ConnectionError(
-                f"Action Builder API error {resp.status_code}: {resp.text}"
-            )
+            _raise_for_status(resp.status_code, resp.text, resp.headers)
+
+        return json_loads(resp.content) if resp.content else None
+
+    def _iter_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield raw response pages, prefetching the next page in the background.
+
+        As soon as page N arrives, the request for the page named by its
+        ``_links.next`` (or N+1 when the response has no HAL links) is
+        submitted to a single worker thread, so it is in flight while the
+        caller processes page N. Single-page results never start the worker.
 
-        return resp.json()
+        Args:
+            path: API path
+            params: Additional query parameters
+            per_page: Records to request per page. The API may cap this
+                silently; total_pages always reflects the effective size.
+                A 400 rejecting it falls back to FALLBACK_PER_PAGE.
+
+        Yields:
+            Each page's decoded response body, in page order
+        """
+
+        # Merge the static params once; each page gets its own small copy
+        # because the prefetch thread and retries hold on to it
+        base_params = self._base_page_params(params, per_page)
+
+        def fetch(page: int) -> Optional[Dict[str, Any]]:
+            return self._get_page(path, dict(base_params, page=page))
+
+        executor: Optional[ThreadPoolExecutor] = None
+        try:
+            page = 1
+            data = self._fetch_first_page(path, base_params, fetch)
+            requested = base_params["per_page"]
+            if data is not None and data.get("per_page", requested) < requested:
+                logger.debug(
+                    f"Action Builder capped per_page at {data['per_page']} "
+                    f"(requested {requested}) for {path}"
+                )
+            while data is not None:
+                future: Optional["Future[Optional[Dict[str, Any]]]"] = None
+                next_page = _next_page(data, page)
+                if next_page is not None:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(
+                            max_workers=1, thread_name_prefix="ab-prefetch"
+                        )
+                    future = executor.submit(fetch, next_page)
+
+                yield data
+
+                if future is None or next_page is None:
+                    break
+                page = next_page
+                data = future.result()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _base_page_params(
+        self, params: Optional[Dict[str, Any]], per_page: int
+    ) -> Dict[str, Any]:
+        """Merge static list params with per_page, honouring any learned cap."""
+        if self._per_page_cap is not None:
+            per_page = min(per_page, self._per_page_cap)
+        return {"per_page": per_page, **(params or {})}
+
+    def _fetch_first_page(
+        self,
+        path: str,
+        base_params: Dict[str, Any],
+        fetch: Callable[[int], Optional[Dict[str, Any]]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch page 1, retrying once at FALLBACK_PER_PAGE if per_page is rejected.
+
+        A 400 on page 1 with a per_page above FALLBACK_PER_PAGE is retried
+        with the smaller size. If that succeeds the cap is remembered, so
+        later listings on this connector skip the failing request. base_params
+        is updated in place so the remaining pages use the same size.
+
+        Args:
+            path: API path (for logging)
+            base_params: Shared list params including ``per_page``
+            fetch: Callable that GETs the given page number using base_params
+
+        Returns:
+            Decoded page 1 body, or None for an empty response
+        """
+        try:
+            return fetch(1)
+        except ConnectionError as e:
+            if e.status_code != 400 or base_params["per_page"] <= FALLBACK_PER_PAGE:
+                raise
+            rejected = base_params["per_page"]
+
+        base_params["per_page"] = FALLBACK_PER_PAGE
+        data = fetch(1)
+        logger.warning(
+            f"Action Builder rejected per_page={rejected} for {path}; "
+            f"using {FALLBACK_PER_PAGE} from now on"
+        )
+        self._per_page_cap = FALLBACK_PER_PAGE
+        return data
+
+    @retry_action_builder_operation
+    def _get_page(self, path: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """GET a single page, retrying it alone on 429."""
+        return self._request("GET", path, params=params)
+
+    def _iter_resources(
+        self,
+        path: str,
+        resource_key: str,
+        params: Optional[Dict[str, Any]] = None,
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield individual resources across all pages.
+
+        Only one page (plus the one being prefetched) is held in memory at a
+        time, so large campaigns can be processed in constant memory.
+
+        Args:
+            path: API path
+            resource_key: Key inside ``_embedded`` (e.g. 'osdi:people')
+            params: Additional query parameters
+            per_page: Records to request per page
+
+        Yields:
+            Each resource dict, in API order
+        """
+        for data in self._iter_pages(path, params, per_page):
+            yield from data.get("_embedded", {}).get(resource_key, ())
 
     def _paginate(
         self,
         path: str,
         resource_key: str,
         params: Optional[Dict[str, Any]] = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        max_workers: int = DEFAULT_PAGE_WORKERS,
     ) -> List[Dict[str, Any]]:
         """
         Iterate through all pages using page-based pagination.
 
+        Page 1 is fetched first to learn ``total_pages``; when the response
+        links to a next page, pages 2..total_pages are then fetched
+        concurrently on a thread pool and reassembled in page order. Every
+        page request retries 429s individually so one throttled page does
+        not restart the whole listing. If ``total_pages`` was stale and the
+        last page still links onward, the remainder is followed serially.
+
         Args:
             path: API path
             resource_key: Key inside ``_embedded`` (e.g. 'action_builder:entities')
             params: Additional query parameters
+            per_page: Records to request per page
+            max_workers: Concurrent page requests; 1 fetches pages one at a
+                time with background prefetch
 
         Returns:
             Combined list of all resources across all pages
         """
-        results: List[Dict[str, Any]] = []
-        page = 1
-
-        while True:
-            page_params: Dict[str, Any] = {"page": page, "per_page": 25}
-            if params:
-                page_params.update(params)
+        if max_workers <= 1:
+            return list(self._iter_resources(path, resource_key, params, per_page))
+
+        base_params = self._base_page_params(params, per_page)
+        first = self._fetch_first_page(
+            path,
+            base_params,
+            lambda p: self._get_page(path, dict(base_params, page=p)),
+        )
+        if first is None:
+            return []
+
+        pages: List[Optional[Dict[str, Any]]] = [first]
+        total_pages = first.get("total_pages", 1)
+        if _next_page(first, 1) is not None and total_pages > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, total_pages - 1), thread_name_prefix="ab-page"
+            ) as pool:
+                pages.extend(
+                    pool.map(
+                        lambda p: self._get_page(path, dict(base_params, page=p)),
+                        range(2, total_pages + 1),
+                    )
+                )
 
-            data = self._request("GET", path, params=page_params)
+        page = len(pages)
+        last = pages[-1]
+        next_page = _next_page(last, page) if last is not None else None
+        while next_page is not None:
+            data = self._get_page(path, dict(base_params, page=next_page))
             if data is None:
                 break
+            pages.append(data)
+            page = next_page
+            next_page = _next_page(data, page)
+
+        chunks = [
+            data.get("_embedded", {}).get(resource_key, [])
+            for data in pages
+            if data is not None
+        ]
+        # Every page is in hand, so size the result once instead of growing it
+        results: List[Dict[str, Any]] = [None] * sum(map(len, chunks))  # type: ignore[list-item]
+        offset = 0
+        for chunk in chunks:
+            results[offset : offset + len(chunk)] = chunk
+            offset += len(chunk)
+        return results
 
-            embedded = data.get("_embedded", {})
-            if resource_key in embedded:
-                results.extend(embedded[resource_key])
+    # -- Cache ----------------------------------------------------------------
 
-            total_pages = data.get("total_pages", 1)
-            if page >= total_pages:
-                break
+    def _cached(self, key: Tuple[str, Optional[int]], loader: Callable[[], _T]) -> _T:
+        """
+        Return a cached value for key, calling loader at most once per TTL.
 
-            page += 1
+        Concurrent callers asking for the same missing key wait on the first
+        caller's request instead of issuing a duplicate GET. A load that
+        overlaps invalidate_cache() is returned but not stored.
 
-        return results
+        Args:
+            key: ``(path, per_page)`` cache key
+            loader: Zero-argument callable that fetches the value
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        if self._cache_ttl <= 0:
+            return loader()
+
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            future = self._cache_inflight.get(key)
+            is_owner = future is None
+            if future is None:
+                future = Future()
+                self._cache_inflight[key] = future
+            generation = self._cache_generation
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._cache_lock:
+                self._cache_inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._cache_lock:
+            self._cache_inflight.pop(key, None)
+            if generation == self._cache_generation:
+                self._store_cached(key, value)
+        future.set_result(value)
+        return value
+
+    def _store_cached(self, key: Tuple[str, Optional[int]], value: Any) -> None:
+        """Store a value under the cache lock, evicting to stay within maxsize."""
+        now = time.monotonic()
+        self._cache.pop(key, None)
+        if len(self._cache) >= self._cache_maxsize:
+            for stale in [k for k, (expires, _) in self._cache.items() if expires <= now]:
+                del self._cache[stale]
+        while self._cache and len(self._cache) >= self._cache_maxsize:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (now + self._cache_ttl, value)
+
+    def invalidate_cache(self, prefix: Optional[str] = None) -> None:
+        """
+        Drop cached configuration reads.
+
+        Args:
+            prefix: Only drop entries whose API path starts with this prefix
+                (e.g. ``'/campaigns/abc123/tags'``); None drops everything
+
+        Examples:
+            >>> connector.invalidate_cache(f"/campaigns/{campaign_id}/tags")
+        """
+        with self._cache_lock:
+            if prefix is None:
+                self._cache.clear()
+            else:
+                for key in [k for k in self._cache if k[0].startswith(prefix)]:
+                    del self._cache[key]
+            self._cache_generation += 1
 
     # -- Campaigns ------------------------------------------------------------
 
-    @retry_action_builder_operation
-    def list_campaigns(self, modified_since: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_campaigns(
+        self, modified_since: Optional[str] = None, per_page: int = DEFAULT_PER_PAGE
+    ) -> List[Dict[str, Any]]:
         """
         List all campaigns.
 
         Args:
             modified_since: Optional ISO-8601 datetime string; filters to
                 campaigns modified after this date
+            per_page: Records to request per page
 
         Returns:
             List of campaign resources
         """
-        params: Dict[str, Any] = {}
-        if modified_since:
-            params["filter"] = f"modified_date gt '{modified_since}'"
-        return self._paginate("/campaigns", "action_builder:campaigns", params or None)
+        return self._paginate(
+            "/campaigns",
+            "action_builder:campaigns",
+            _modified_since_params(modified_since),
+            per_page=per_page,
+        )
+
+    def iter_campaigns(
+        self, modified_since: Optional[str] = None, per_page: int = DEFAULT_PER_PAGE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream campaigns one at a time instead of building a list.
+
+        Args:
+            modified_since: Optional ISO-8601 datetime string; filters to
+                campaigns modified after this date
+            per_page: Records to request per page
+
+        Yields:
+            Campaign resources
+        """
+        return self._iter_resources(
+            "/campaigns",
+            "action_builder:campaigns",
+            _modified_since_params(modified_since),
+            per_page=per_page,
+        )
 
     @retry_action_builder_operation
     def get_campaign(self, campaign_id: str) -> Dict[str, Any]:
@@ -255,25 +798,30 @@ class ActionBuilderConnector(BaseConnection):
         Returns:
             Campaign resource dict
         """
-        result = self._request("GET", f"/campaigns/{campaign_id}")
-        return result or {}
+        path = f"/campaigns/{campaign_id}"
+        return dict(self._cached((path, None), lambda: self._request("GET", path) or {}))
 
     # -- Entity Types ---------------------------------------------------------
 
-    @retry_action_builder_operation
-    def list_entity_types(self, campaign_id: str) -> List[Dict[str, Any]]:
+    def list_entity_types(
+        self, campaign_id: str, per_page: int = DEFAULT_PER_PAGE
+    ) -> List[Dict[str, Any]]:
         """
         List all entity types for a campaign (read-only).
 
         Args:
             campaign_id: Campaign UUID
+            per_page: Records to request per page
 
         Returns:
             List of entity type resources
         """
-        return self._paginate(
-            f"/campaigns/{campaign_id}/entity_types",
-            "action_builder:entity_types",
+        path = f"/campaigns/{campaign_id}/entity_types"
+        return list(
+            self._cached(
+                (path, per_page),
+                lambda: self._paginate(path, "action_builder:entity_types", per_page=per_page),
+            )
         )
 
     @retry_action_builder_operation
@@ -288,27 +836,32 @@ class ActionBuilderConnector(BaseConnection):
         Returns:
             Entity type resource dict
         """
-        result = self._request(
-            "GET", f"/campaigns/{campaign_id}/entity_types/{type_id}"
-        )
-        return result or {}
+        path = f"/campaigns/{campaign_id}/entity_types/{type_id}"
+        return dict(self._cached((path, None), lambda: self._request("GET", path) or {}))
 
     # -- Connection Types -----------------------------------------------------
 
-    @retry_action_builder_operation
-    def list_connection_types(self, campaign_id: str) -> List[Dict[str, Any]]:
+    def list_connection_types(
+        self, campaign_id: str, per_page: int = DEFAULT_PER_PAGE
+    ) -> List[Dict[str, Any]]:
         """
         List all connection types for a campaign (read-only).
 
         Args:
             campaign_id: Campaign UUID
+            per_page: Records to request per page
 
         Returns:
             List of connection type resources
         """
-        return self._paginate(
-            f"/campaigns/{campaign_id}/connection_types",
-            "action_builder:connection_types",
+        path = f"/campaigns/{campaign_id}/connection_types"
+        return list(
+            self._cached(
+                (path, per_page),
+                lambda: self._paginate(
+                    path, "action_builder:connection_types", per_page=per_page
+                ),
+            )
         )
 
     @retry_action_builder_operation
@@ -323,16 +876,17 @@ class ActionBuilderConnector(BaseConnection):
         Returns:
             Connection type resource dict
         """
-        result = self._request(
-            "GET", f"/campaigns/{campaign_id}/connection_types/{type_id}"
-        )
-        return result or {}
+        path = f"/campaigns/{campaign_id}/connection_types/{type_id}"
+        return dict(self._cached((path, None), lambda: self._request("GET", path) or {}))
 
     # -- People / Entities ----------------------------------------------------
 
-    @retry_action_builder_operation
     def list_people(
-        self, campaign_id: str, modified_since: Optional[str] = None, **filters: Any
+        self,
+        campaign_id: str,
+        modified_since: Optional[str] = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        **filters: Any,
     ) -> List[Dict[str, Any]]:
         """
         List all people/entities in a campaign.
@@ -340,18 +894,50 @@ class ActionBuilderConnector(BaseConnection):
         Args:
             campaign_id: Campaign UUID
             modified_since: Optional ISO-8601 datetime; filters by modified_date
+            per_page: Records to request per page
             **filters: Additional query parameters
 
         Returns:
             List of person/entity resources
         """
-        params: Dict[str, Any] = dict(filters)
-        if modified_since:
-            params["filter"] = f"modified_date gt '{modified_since}'"
         return self._paginate(
             f"/campaigns/{campaign_id}/people",
             "osdi:people",
-            params or None,
+            _modified_since_params(modified_since, filters),
+            per_page=per_page,
+        )
+
+    def iter_people(
+        self,
+        campaign_id: str,
+        modified_since: Optional[str] = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream people/entities one at a time instead of building a list.
+
+        Peak memory stays at roughly two pages regardless of campaign size,
+        and the next page is fetched while the caller processes this one.
+
+        Args:
+            campaign_id: Campaign UUID
+            modified_since: Optional ISO-8601 datetime; filters by modified_date
+            per_page: Records to request per page
+            **filters: Additional query parameters
+
+        Yields:
+            Person/entity resources
+
+        Examples:
+            >>> for person in connector.iter_people(campaign_id):
+            ...     sync(person)
+        """
+        return self._iter_resources(
+            f"/campaigns/{campaign_id}/people",
+            "osdi:people",
+            _modified_since_params(modified_since, filters),
+            per_page=per_page,
         )
 
     @retry_action_builder_operation
@@ -371,13 +957,18 @@ class ActionBuilderConnector(BaseConnection):
         )
         return result or {}
 
+    @_idempotent
     @retry_action_builder_operation
-    def create_person(self, campaign_id: str, **fields: Any) -> Dict[str, Any]:
+    def create_person(
+        self, campaign_id: str, *, idempotency_key: Optional[str] = None, **fields: Any
+    ) -> Dict[str, Any]:
         """
         Create a new person/entity in a campaign.
 
         Args:
             campaign_id: Campaign UUID
+            idempotency_key: Idempotency-Key shared by all retry attempts;
+                generated when omitted
             **fields: Person/entity fields to set
 
         Returns:
@@ -387,12 +978,19 @@ class ActionBuilderConnector(BaseConnection):
             "POST",
             f"/campaigns/{campaign_id}/people",
             json_body={"person": fields},
+            idempotency_key=idempotency_key,
         )
         return result or {}
 
+    @_idempotent
     @retry_action_builder_operation
     def update_person(
-        self, campaign_id: str, person_id: str, fields: Dict[str, Any]
+        self,
+        campaign_id: str,
+        person_id: str,
+        fields: Dict[str, Any],
+        *,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Update an existing person/entity.
@@ -401,6 +999,8 @@ class ActionBuilderConnector(BaseConnection):
             campaign_id: Campaign UUID
             person_id: Person/entity UUID
             fields: Fields to update
+            idempotency_key: Idempotency-Key shared by all retry attempts;
+                generated when omitted
 
         Returns:
             Updated person/entity resource
@@ -409,6 +1009,7 @@ class ActionBuilderConnector(BaseConnection):
             "PUT",
             f"/campaigns/{campaign_id}/people/{person_id}",
             json_body=fields,
+            idempotency_key=idempotency_key,
         )
         return result or {}
 
@@ -425,20 +1026,42 @@ class ActionBuilderConnector(BaseConnection):
 
     # -- Tags -----------------------------------------------------------------
 
-    @retry_action_builder_operation
-    def list_tags(self, campaign_id: str) -> List[Dict[str, Any]]:
+    def list_tags(self, campaign_id: str, per_page: int = DEFAULT_PER_PAGE) -> List[Dict[str, Any]]:
         """
         List all tags for a campaign.
 
         Args:
             campaign_id: Campaign UUID
+            per_page: Records to request per page
 
         Returns:
             List of tag resources
         """
-        return self._paginate(
+        path = f"/campaigns/{campaign_id}/tags"
+        return list(
+            self._cached(
+                (path, per_page),
+                lambda: self._paginate(path, "osdi:tags", per_page=per_page),
+            )
+        )
+
+    def iter_tags(
+        self, campaign_id: str, per_page: int = DEFAULT_PER_PAGE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream tags one at a time, always from the API (bypasses the cache).
+
+        Args:
+            campaign_id: Campaign UUID
+            per_page: Records to request per page
+
+        Yields:
+            Tag resources
+        """
+        return self._iter_resources(
             f"/campaigns/{campaign_id}/tags",
             "osdi:tags",
+            per_page=per_page,
         )
 
     @retry_action_builder_operation
@@ -453,9 +1076,10 @@ class ActionBuilderConnector(BaseConnection):
         Returns:
             Tag resource dict
         """
-        result = self._request("GET", f"/campaigns/{campaign_id}/tags/{tag_id}")
-        return result or {}
+        path = f"/campaigns/{campaign_id}/tags/{tag_id}"
+        return dict(self._cached((path, None), lambda: self._request("GET", path) or {}))
 
+    @_idempotent
     @retry_action_builder_operation
     def create_tag(
         self,
@@ -463,6 +1087,8 @@ class ActionBuilderConnector(BaseConnection):
         name: str,
         section: str,
         field_type: str,
+        *,
+        idempotency_key: Optional[str] = None,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
@@ -473,6 +1099,8 @@ class ActionBuilderConnector(BaseConnection):
             name: Tag/field name
             section: Section the tag belongs to
             field_type: Field type (e.g. 'checkbox', 'text')
+            idempotency_key: Idempotency-Key shared by all retry attempts;
+                generated when omitted
             **kwargs: Additional tag fields
 
         Returns:
@@ -485,8 +1113,12 @@ class ActionBuilderConnector(BaseConnection):
         }
         body.update(kwargs)
         result = self._request(
-            "POST", f"/campaigns/{campaign_id}/tags", json_body=body
+            "POST",
+            f"/campaigns/{campaign_id}/tags",
+            json_body=body,
+            idempotency_key=idempotency_key,
         )
+        self.invalidate_cache(f"/campaigns/{campaign_id}/tags")
         return result or {}
 
     @retry_action_builder_operation
@@ -499,11 +1131,13 @@ class ActionBuilderConnector(BaseConnection):
             tag_id: Tag UUID
         """
         self._request("DELETE", f"/campaigns/{campaign_id}/tags/{tag_id}")
+        self.invalidate_cache(f"/campaigns/{campaign_id}/tags")
 
     # -- Taggings (read + delete only) ----------------------------------------
 
-    @retry_action_builder_operation
-    def list_taggings(self, campaign_id: str, tag_id: str) -> List[Dict[str, Any]]:
+    def list_taggings(
+        self, campaign_id: str, tag_id: str, per_page: int = DEFAULT_PER_PAGE
+    ) -> List[Dict[str, Any]]:
         """
         List all taggings for a tag.
 
@@ -512,6 +1146,7 @@ class ActionBuilderConnector(BaseConnection):
         Args:
             campaign_id: Campaign UUID
             tag_id: Tag UUID
+            per_page: Records to request per page
 
         Returns:
             List of tagging resources
@@ -519,11 +1154,31 @@ class ActionBuilderConnector(BaseConnection):
         return self._paginate(
             f"/campaigns/{campaign_id}/tags/{tag_id}/taggings",
             "osdi:taggings",
+            per_page=per_page,
+        )
+
+    def iter_taggings(
+        self, campaign_id: str, tag_id: str, per_page: int = DEFAULT_PER_PAGE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the taggings for a tag one at a time instead of building a list.
+
+        Args:
+            campaign_id: Campaign UUID
+            tag_id: Tag UUID
+            per_page: Records to request per page
+
+        Yields:
+            Tagging resources
+        """
+        return self._iter_resources(
+            f"/campaigns/{campaign_id}/tags/{tag_id}/taggings",
+            "osdi:taggings",
+            per_page=per_page,
         )
 
-    @retry_action_builder_operation
     def list_person_taggings(
-        self, campaign_id: str, person_id: str
+        self, campaign_id: str, person_id: str, per_page: int = DEFAULT_PER_PAGE
     ) -> List[Dict[str, Any]]:
         """
         List all taggings for a person/entity.
@@ -531,6 +1186,7 @@ class ActionBuilderConnector(BaseConnection):
         Args:
             campaign_id: Campaign UUID
             person_id: Person/entity UUID
+            per_page: Records to request per page
 
         Returns:
             List of tagging resources
@@ -538,6 +1194,7 @@ class ActionBuilderConnector(BaseConnection):
         return self._paginate(
             f"/campaigns/{campaign_id}/people/{person_id}/taggings",
             "osdi:taggings",
+            per_page=per_page,
         )
 
     @retry_action_builder_operation
@@ -566,7 +1223,7 @@ class ActionBuilderConnector(BaseConnection):
             )
             return 'ok'
         except ConnectionError as e:
-            if "404" in str(e):
+            if e.status_code == 404:
                 logger.debug(
                     f"delete_tagging: tagging {tagging_id} already absent (404)"
                 )
@@ -575,9 +1232,8 @@ class ActionBuilderConnector(BaseConnection):
 
     # -- Connections (read + update only) -------------------------------------
 
-    @retry_action_builder_operation
     def list_connections(
-        self, campaign_id: str, person_id: str
+        self, campaign_id: str, person_id: str, per_page: int = DEFAULT_PER_PAGE
     ) -> List[Dict[str, Any]]:
         """
         List all connections for a person/entity.
@@ -587,6 +1243,7 @@ class ActionBuilderConnector(BaseConnection):
         Args:
             campaign_id: Campaign UUID
             person_id: Person/entity UUID
+            per_page: Records to request per page
 
         Returns:
             List of connection resources
@@ -594,6 +1251,7 @@ class ActionBuilderConnector(BaseConnection):
         return self._paginate(
             f"/campaigns/{campaign_id}/people/{person_id}/connections",
             "action_builder:connections",
+            per_page=per_page,
         )
 
     @retry_action_builder_operation
@@ -655,6 +1313,49 @@ class ActionBuilderConnector(BaseConnection):
         )
         return result or {}
 
+    def replace_entity_tags(
+        self,
+        campaign_id: str,
+        entity_interact_id: str,
+        taggings_to_delete: Iterable[Tuple[str, str]],
+        add_tags: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Replace tag values on an entity with one signup-helper POST.
+
+        Deletes each listed tagging, then writes every new value in a single
+        update_entity_with_tags call. Replacing N tags costs N DELETEs plus
+        one POST instead of N DELETE/POST pairs. Removals go through the
+        taggings DELETE endpoint, so the ``remove_tags`` 500 error described
+        in the module docstring does not apply. Each underlying call keeps
+        its own 429 retry.
+
+        Args:
+            campaign_id: Campaign UUID (interact_id)
+            entity_interact_id: Entity interact_id UUID (36 chars)
+            taggings_to_delete: ``(tag_id, tagging_id)`` pairs to remove;
+                taggings that are already gone (404) are skipped
+            add_tags: Tag dicts to add, each with keys
+                ``action_builder:section``, ``action_builder:field``, ``name``
+
+        Returns:
+            Response dict from the signup helper, or {} if add_tags is empty
+
+        Examples:
+            >>> connector.replace_entity_tags(
+            ...     campaign_id,
+            ...     entity_id,
+            ...     taggings_to_delete=[(status_tag_id, old_tagging_id)],
+            ...     add_tags=[{"action_builder:section": "Status",
+            ...                "action_builder:field": "Stage", "name": "Active"}],
+            ... )
+        """
+        for tag_id, tagging_id in taggings_to_delete:
+            self.delete_tagging(campaign_id, tag_id, tagging_id)
+        if not add_tags:
+            return {}
+        return self.update_entity_with_tags(campaign_id, entity_interact_id, add_tags)
+
     @retry_action_builder_operation
     def insert_entity(
         self,
@@ -861,6 +1562,7 @@ class ActionBuilderConnector(BaseConnection):
         )
         return result or {}
 
+    @_idempotent
     @retry_action_builder_operation
     def update_connection(
         self,
@@ -868,6 +1570,8 @@ class ActionBuilderConnector(BaseConnection):
         person_id: str,
         connection_id: str,
         inactive: bool,
+        *,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Update a connection's inactive status.
@@ -877,6 +1581,8 @@ class ActionBuilderConnector(BaseConnection):
             person_id: Person/entity UUID
             connection_id: Connection UUID
             inactive: True to mark the connection inactive, False to reactivate
+            idempotency_key: Idempotency-Key shared by all retry attempts;
+                generated when omitted
 
         Returns:
             Updated connection resource
@@ -885,5 +1591,194 @@ class ActionBuilderConnector(BaseConnection):
             "PUT",
             f"/campaigns/{campaign_id}/people/{person_id}/connections/{connection_id}",
             json_body={"inactive": inactive},
+            idempotency_key=idempotency_key,
         )
         return result or {}
+
+    # -- Bulk helpers (thread pool) -------------------------------------------
+
+    def _prepare_bulk(self) -> None:
+        """Connect and open the session before worker threads share it."""
+        if self._base_url is None:
+            self.connect()
+        self._get_session()
+
+    def _run_bulk(
+        self,
+        calls: Iterable[Tuple[str, Callable[..., _T], Tuple[Any, ...]]],
+        max_workers: int,
+    ) -> Dict[str, Union[_T, BaseException]]:
+        """
+        Run ``(key, func, args)`` calls on a thread pool, collecting per-key outcomes.
+
+        Args:
+            calls: Key, callable and positional args for each request
+            max_workers: Number of concurrent requests
+
+        Returns:
+            Dict mapping each key to its return value or raised exception
+        """
+        self._prepare_bulk()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ab-bulk") as pool:
+            futures = [(key, pool.submit(func, *args)) for key, func, args in calls]
+        outcomes: Dict[str, Union[_T, BaseException]] = {}
+        for key, future in futures:
+            error = future.exception()
+            outcomes[key] = error if error is not None else future.result()
+        return outcomes
+
+    def bulk_get_person_taggings(
+        self,
+        campaign_id: str,
+        person_ids: Iterable[str],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> Dict[str, Union[List[Dict[str, Any]], BaseException]]:
+        """
+        Fetch taggings for many people concurrently on a thread pool.
+
+        Each lookup is an independent list_person_taggings call with its own
+        429 retry, so the pool overlaps network latency while rate limits
+        still back off per request. A failed lookup does not stop the
+        others; its exception is returned in place of the list. Keep
+        max_workers at or below the session pool size (20) so connections
+        are reused rather than discarded.
+
+        Args:
+            campaign_id: Campaign UUID
+            person_ids: Person/entity UUIDs
+            max_workers: Number of concurrent requests
+
+        Returns:
+            Dict mapping each person_id to its list of tagging resources or
+            the exception raised for it
+
+        Examples:
+            >>> taggings = connector.bulk_get_person_taggings(campaign_id, ids)
+            >>> failed = [pid for pid, r in taggings.items() if isinstance(r, Exception)]
+        """
+        return self._run_bulk(
+            [
+                (person_id, self.list_person_taggings, (campaign_id, person_id))
+                for person_id in person_ids
+            ],
+            max_workers,
+        )
+
+    def bulk_update_entity_tags(
+        self,
+        campaign_id: str,
+        items: Iterable[Tuple[str, List[Dict[str, Any]]]],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> Dict[str, Union[Dict[str, Any], BaseException]]:
+        """
+        Apply update_entity_with_tags to many entities on a thread pool.
+
+        A failure for one entity does not stop the others; its exception is
+        returned in place of the response so callers can log or requeue just
+        the failed entities. Same contract as the async connector's
+        bulk_update_entity_tags.
+
+        Args:
+            campaign_id: Campaign UUID (interact_id)
+            items: ``(entity_interact_id, add_tags)`` pairs
+            max_workers: Number of concurrent requests
+
+        Returns:
+            Dict mapping each entity_interact_id to its API response or the
+            exception raised for it
+
+        Examples:
+            >>> results = connector.bulk_update_entity_tags(
+            ...     campaign_id, [("p1", tags), ("p2", tags)]
+            ... )
+            >>> failed = [pid for pid, r in results.items() if isinstance(r, Exception)]
+        """
+        return self._run_bulk(
+            [
+                (entity_id, self.update_entity_with_tags, (campaign_id, entity_id, add_tags))
+                for entity_id, add_tags in items
+            ],
+            max_workers,
+        )
+
+    def bulk_delete_people(
+        self,
+        campaign_id: str,
+        person_ids: Iterable[str],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> Dict[str, Optional[BaseException]]:
+        """
+        Delete many people/entities concurrently on a thread pool.
+
+        Args:
+            campaign_id: Campaign UUID
+            person_ids: Person/entity UUIDs
+            max_workers: Number of concurrent requests
+
+        Returns:
+            Dict mapping each person_id to None on success or the exception
+            raised for it
+
+        Examples:
+            >>> results = connector.bulk_delete_people(campaign_id, ids)
+            >>> failed = {pid: e for pid, e in results.items() if e is not None}
+        """
+        return self._run_bulk(
+            [(pid, self.delete_person, (campaign_id, pid)) for pid in person_ids],
+            max_workers,
+        )
+
+    def bulk_delete_tags(
+        self,
+        campaign_id: str,
+        tag_ids: Iterable[str],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> Dict[str, Optional[BaseException]]:
+        """
+        Delete many tags concurrently on a thread pool.
+
+        Args:
+            campaign_id: Campaign UUID
+            tag_ids: Tag UUIDs
+            max_workers: Number of concurrent requests
+
+        Returns:
+            Dict mapping each tag_id to None on success or the exception
+            raised for it
+        """
+        return self._run_bulk(
+            [(tag_id, self.delete_tag, (campaign_id, tag_id)) for tag_id in tag_ids],
+            max_workers,
+        )
+
+    def bulk_delete_taggings(
+        self,
+        campaign_id: str,
+        taggings: Iterable[Tuple[str, str]],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> Dict[str, Optional[BaseException]]:
+        """
+        Delete many taggings concurrently on a thread pool.
+
+        As with delete_tagging, a tagging that is already gone counts as
+        deleted.
+
+        Args:
+            campaign_id: Campaign UUID
+            taggings: ``(tag_id, tagging_id)`` pairs
+            max_workers: Number of concurrent requests
+
+        Returns:
+            Dict mapping each tagging_id to None on success or the exception
+            raised for it
+        """
+        return {
+            tagging_id: outcome if isinstance(outcome, BaseException) else None
+            for tagging_id, outcome in self._run_bulk(
+                [
+                    (tagging_id, self.delete_tagging, (campaign_id, tag_id, tagging_id))
+                    for tag_id, tagging_id in taggings
+                ],
+                max_workers,
+            ).items()
+        }
@@ -0,0 +1,654 @@
+"""
+Async Action Builder connector for CCEF connections library.
+
+asyncio/aiohttp counterpart to ActionBuilderConnector for bulk sync jobs.
+A single event loop keeps many requests in flight over one pooled
+aiohttp session, so paginated reads fetch pages 2..N concurrently once
+page 1 reports ``total_pages``, and bulk tag updates overlap their
+network latency instead of paying it once per entity.
+
+Error handling and retry policy match the sync connector: the same
+status-code mapping is used, and retry_action_builder_operation retries
+only on RateLimitError (tenacity awaits coroutines natively). Listings
+retry each page request rather than the whole list_* call.
+
+Requires the optional ``async`` extra:
+    pip install "ccef-connections[async]"
+"""
+
+import asyncio
+import logging
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from ..core.credentials import CredentialManager
+from ..core.http import json_loads
+from ..core.retry import retry_action_builder_operation
+from ..exceptions import ConnectionError
+from .action_builder import (
+    ACTION_BUILDER_API_BASE,
+    DEFAULT_PER_PAGE,
+    FALLBACK_PER_PAGE,
+    _next_page,
+    _raise_for_status,
+    _rate_limit_state,
+    _throttle_delay,
+)
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency: pip install ccef-connections[async]
+    aiohttp = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of HTTP requests in flight on one connector
+DEFAULT_CONCURRENCY = 10
+
+
+class AsyncActionBuilderConnector:
+    """
+    Async Action Builder connector for high-volume reads and tag updates.
+
+    Mirrors the read and tag-update surface of ActionBuilderConnector with
+    ``async def`` methods. A semaphore admits at most ``concurrency``
+    requests at a time, so gathering thousands of calls never opens more
+    than ``concurrency`` sockets to Action Builder, and a request's timeout
+    only starts once it is admitted.
+
+    Args:
+        concurrency: Maximum number of simultaneous HTTP requests
+
+    Raises:
+        ValueError: If concurrency is less than 1
+
+    Examples:
+        >>> async with AsyncActionBuilderConnector() as ab:
+        ...     people = await ab.list_people(campaign_id="abc123")
+        ...     results = await ab.bulk_update_entity_tags(
+        ...         "abc123", [(person_id, tags) for person_id in ids]
+        ...     )
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY) -> None:
+        """Initialize the async Action Builder connector."""
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        self._concurrency = concurrency
+        self._credential_manager = CredentialManager()
+        self._api_token: Optional[str] = None
+        self._subdomain: Optional[str] = None
+        self._base_url: Optional[str] = None
+        self._session: Optional["aiohttp.ClientSession"] = None
+        # Created inside the event loop (see _get_semaphore); asyncio
+        # primitives bind to the loop that first waits on them
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Last (remaining, reset_at) seen in X-RateLimit-* headers
+        self._rate_limit: Optional[Tuple[int, float]] = None
+        # Set once the API rejects a per_page; later listings request at most this
+        self._per_page_cap: Optional[int] = None
+        self._is_connected: bool = False
+        logger.debug(f"Initialized {self.__class__.__name__}")
+
+    async def connect(self) -> None:
+        """
+        Load credentials and open the pooled aiohttp session.
+
+        Raises:
+            ImportError: If aiohttp is not installed
+            ConnectionError: If connection setup fails
+        """
+        try:
+            creds = self._credential_manager.get_action_builder_credentials()
+            self._api_token = creds["api_token"]
+            self._subdomain = creds["subdomain"]
+            self._base_url = ACTION_BUILDER_API_BASE.format(subdomain=self._subdomain)
+        except Exception as e:
+            logger.error(f"Failed to connect to Action Builder: {str(e)}")
+            raise ConnectionError(f"Failed to connect to Action Builder: {str(e)}") from e
+
+        await self._close_session()
+        self._session = self._create_session()
+        self._semaphore = asyncio.Semaphore(self._concurrency)
+        self._is_connected = True
+        logger.info("Successfully connected to Action Builder (async)")
+
+    async def disconnect(self) -> None:
+        """Close the aiohttp session and clear the connection."""
+        await self._close_session()
+        self._semaphore = None
+        self._api_token = None
+        self._subdomain = None
+        self._base_url = None
+        self._is_connected = False
+        logger.debug("Disconnected from Action Builder (async)")
+
+    async def health_check(self) -> bool:
+        """
+        Check connection health by fetching the first page of campaigns.
+
+        Returns:
+            True if connected and API responds, False otherwise
+        """
+        if not self._is_connected or not self._api_token:
+            return False
+        try:
+            await self._request("GET", "/campaigns", params={"page": 1, "per_page": 1})
+            return True
+        except Exception:
+            return False
+
+    def is_connected(self) -> bool:
+        """
+        Check if currently connected to Action Builder.
+
+        Returns:
+            True if connected, False otherwise
+        """
+        return self._is_connected
+
+    async def __aenter__(self) -> "AsyncActionBuilderConnector":
+        """Connect on ``async with`` entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Disconnect on ``async with`` exit."""
+        await self.disconnect()
+
+    def __repr__(self) -> str:
+        """Return a short status representation."""
+        status = "connected" if self._is_connected else "disconnected"
+        return f"<{self.__class__.__name__} status={status}>"
+
+    # -- HTTP helpers ---------------------------------------------------------
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Return request headers with the API token."""
+        return {
+            "OSDI-Api-Token": self._api_token or "",
+            "Content-Type": "application/json",
+        }
+
+    def _create_session(self) -> "aiohttp.ClientSession":
+        """
+        Create the pooled aiohttp session.
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for AsyncActionBuilderConnector. "
+                "Install with: pip install ccef-connections[async]"
+            )
+
+        return aiohttp.ClientSession(
+            headers=self._get_headers(),
+            connector=aiohttp.TCPConnector(limit=self._concurrency, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the request semaphore, creating it on first use."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        return self._semaphore
+
+    async def _close_session(self) -> None:
+        """Close the aiohttp session, if one is open."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Central async HTTP method with error handling.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            path: API path relative to the base URL (e.g. '/campaigns')
+            params: Query parameters
+            json_body: JSON request body
+
+        Returns:
+            Parsed JSON response, or None for 204 No Content or an empty body
+
+        Raises:
+            AuthenticationError: On 401 responses
+            RateLimitError: On 429 responses
+            ConnectionError: On other HTTP errors or network failures
+        """
+        if self._session is None:
+            await self.connect()
+        session = self._session
+        if session is None:
+            raise ConnectionError("Action Builder session is not open")
+
+        url = f"{self._base_url}{path}"
+
+        delay = _throttle_delay(self._rate_limit)
+        if delay > 0:
+            logger.debug(f"Action Builder rate limit nearly spent; pausing {delay:.1f}s")
+            await asyncio.sleep(delay)
+            self._rate_limit = None
+
+        try:
+            # Hold a slot before sending: aiohttp counts time spent waiting for
+            # a pooled connection against ClientTimeout, so queueing on the
+            # pool instead would time out requests that were never sent
+            async with self._get_semaphore():
+                async with session.request(method, url, params=params, json=json_body) as resp:
+                    state = _rate_limit_state(resp.headers)
+                    if state is not None:
+                        self._rate_limit = state
+                    if resp.status == 204:
+                        return None
+                    if resp.status >= 400:
+                        _raise_for_status(resp.status, await resp.text(), resp.headers)
+                    body = await resp.read()
+                    return json_loads(body) if body else None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise ConnectionError(f"Action Builder API request failed: {e}") from e
+
+    async def _fetch_first_page(
+        self,
+        path: str,
+        base_params: Dict[str, Any],
+        fetch: Callable[[int], Awaitable[Optional[Dict[str, Any]]]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch page 1, retrying once at FALLBACK_PER_PAGE if per_page is rejected.
+
+        Mirrors ActionBuilderConnector._fetch_first_page: the smaller size is
+        remembered for later listings, and base_params is updated in place so
+        the remaining pages use it.
+
+        Args:
+            path: API path (for logging)
+            base_params: Shared list params including ``per_page``
+            fetch: Coroutine function that GETs the given page number
+
+        Returns:
+            Decoded page 1 body, or None for an empty response
+        """
+        try:
+            return await fetch(1)
+        except ConnectionError as e:
+            if e.status_code != 400 or base_params["per_page"] <= FALLBACK_PER_PAGE:
+                raise
+            rejected = base_params["per_page"]
+
+        base_params["per_page"] = FALLBACK_PER_PAGE
+        data = await fetch(1)
+        logger.warning(
+            f"Action Builder rejected per_page={rejected} for {path}; "
+            f"using {FALLBACK_PER_PAGE} from now on"
+        )
+        self._per_page_cap = FALLBACK_PER_PAGE
+        return data
+
+    @retry_action_builder_operation
+    async def _get_page(self, path: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """GET a single page, retrying it alone on 429."""
+        return await self._request("GET", path, params=params)
+
+    async def _paginate(
+        self,
+        path: str,
+        resource_key: str,
+        params: Optional[Dict[str, Any]] = None,
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every page, requesting pages 2..N concurrently.
+
+        Page 1 is fetched first to learn ``total_pages``; the remaining
+        pages are then gathered together, and results keep page order. If
+        ``total_pages`` was stale and the last page still links onward, the
+        remainder is followed serially, as in the sync connector. Each
+        page request retries 429s on its own, so one throttled page does
+        not restart the whole listing.
+
+        Args:
+            path: API path
+            resource_key: Key inside ``_embedded`` (e.g. 'osdi:people')
+            params: Additional query parameters
+            per_page: Records to request per page. A 400 rejecting it falls
+                back to FALLBACK_PER_PAGE, as in the sync connector.
+
+        Returns:
+            Combined list of all resources across all pages
+        """
+        if self._per_page_cap is not None:
+            per_page = min(per_page, self._per_page_cap)
+
+        # Pages are requested concurrently, so each needs its own params dict
+        base_params: Dict[str, Any] = {"per_page": per_page, **(params or {})}
+
+        async def fetch(page: int) -> Optional[Dict[str, Any]]:
+            return await self._get_page(path, dict(base_params, page=page))
+
+        first = await self._fetch_first_page(path, base_params, fetch)
+        if first is None:
+            return []
+        pages: List[Optional[Dict[str, Any]]] = [first]
+        total_pages = first.get("total_pages", 1)
+        if _next_page(first, 1) is not None and total_pages > 1:
+            pages.extend(await asyncio.gather(*(fetch(p) for p in range(2, total_pages + 1))))
+
+        # total_pages can be stale; _links.next on the last page is authoritative
+        page = len(pages)
+        last = pages[-1]
+        next_page = _next_page(last, page) if last is not None else None
+        while next_page is not None:
+            data = await fetch(next_page)
+            if data is None:
+                break
+            pages.append(data)
+            page = next_page
+            next_page = _next_page(data, page)
+
+        results: List[Dict[str, Any]] = []
+        for data in pages:
+            if data is not None:
+                results.extend(data.get("_embedded", {}).get(resource_key, []))
+        return results
+
+    # -- Campaigns ------------------------------------------------------------
+
+    async def list_campaigns(
+        self, modified_since: Optional[str] = None, per_page: int = DEFAULT_PER_PAGE
+    ) -> List[Dict[str, Any]]:
+        """
+        List all campaigns.
+
+        Args:
+            modified_since: Optional ISO-8601 datetime string; filters to
+                campaigns modified after this date
+            per_page: Records to request per page
+
+        Returns:
+            List of campaign resources
+        """
+        params: Dict[str, Any] = {}
+        if modified_since:
+            params["filter"] = f"modified_date gt '{modified_since}'"
+        return await self._paginate(
+            "/campaigns", "action_builder:campaigns", params or None, per_page=per_page
+        )
+
+    @retry_action_builder_operation
+    async def get_campaign(self, campaign_id: str) -> Dict[str, Any]:
+        """
+        Get a single campaign by ID.
+
+        Args:
+            campaign_id: Campaign UUID
+
+        Returns:
+            Campaign resource dict
+        """
+        result = await self._request("GET", f"/campaigns/{campaign_id}")
+        return result or {}
+
+    # -- People / Entities ----------------------------------------------------
+
+    async def list_people(
+        self,
+        campaign_id: str,
+        modified_since: Optional[str] = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        List all people/entities in a campaign.
+
+        Args:
+            campaign_id: Campaign UUID
+            modified_since: Optional ISO-8601 datetime; filters by modified_date
+            per_page: Records to request per page
+            **filters: Additional query parameters
+
+        Returns:
+            List of person/entity resources
+        """
+        params: Dict[str, Any] = dict(filters)
+        if modified_since:
+            params["filter"] = f"modified_date gt '{modified_since}'"
+        return await self._paginate(
+            f"/campaigns/{campaign_id}/people", "osdi:people", params or None, per_page=per_page
+        )
+
+    @retry_action_builder_operation
+    async def get_person(self, campaign_id: str, person_id: str) -> Dict[str, Any]:
+        """
+        Get a single person/entity by ID.
+
+        Args:
+            campaign_id: Campaign UUID
+            person_id: Person/entity UUID
+
+        Returns:
+            Person/entity resource dict
+        """
+        result = await self._request("GET", f"/campaigns/{campaign_id}/people/{person_id}")
+        return result or {}
+
+    # -- Tags / Taggings ------------------------------------------------------
+
+    async def list_tags(
+        self, campaign_id: str, per_page: int = DEFAULT_PER_PAGE
+    ) -> List[Dict[str, Any]]:
+        """
+        List all tags for a campaign.
+
+        Args:
+            campaign_id: Campaign UUID
+            per_page: Records to request per page
+
+        Returns:
+            List of tag resources
+        """
+        return await self._paginate(
+            f"/campaigns/{campaign_id}/tags", "osdi:tags", per_page=per_page
+        )
+
+    async def list_taggings(
+        self, campaign_id: str, tag_id: str, per_page: int = DEFAULT_PER_PAGE
+    ) -> List[Dict[str, Any]]:
+        """
+        List all taggings for a tag.
+
+        Args:
+            campaign_id: Campaign UUID
+            tag_id: Tag UUID
+            per_page: Records to request per page
+
+        Returns:
+            List of tagging resources
+        """
+        return await self._paginate(
+            f"/campaigns/{campaign_id}/tags/{tag_id}/taggings",
+            "osdi:taggings",
+            per_page=per_page,
+        )
+
+    async def list_person_taggings(
+        self, campaign_id: str, person_id: str, per_page: int = DEFAULT_PER_PAGE
+    ) -> List[Dict[str, Any]]:
+        """
+        List all taggings for a person/entity.
+
+        Args:
+            campaign_id: Campaign UUID
+            person_id: Person/entity UUID
+            per_page: Records to request per page
+
+        Returns:
+            List of tagging resources
+        """
+        return await self._paginate(
+            f"/campaigns/{campaign_id}/people/{person_id}/taggings",
+            "osdi:taggings",
+            per_page=per_page,
+        )
+
+    @retry_action_builder_operation
+    async def delete_tagging(self, campaign_id: str, tag_id: str, tagging_id: str) -> str:
+        """
+        Delete a tagging, treating 404 as success.
+
+        Args:
+            campaign_id: Campaign UUID
+            tag_id: Tag UUID
+            tagging_id: Tagging UUID
+
+        Returns:
+            'ok' if the tagging was deleted, '404' if it was already absent.
+        """
+        try:
+            await self._request(
+                "DELETE",
+                f"/campaigns/{campaign_id}/tags/{tag_id}/taggings/{tagging_id}",
+            )
+            return "ok"
+        except ConnectionError as e:
+            if e.status_code == 404:
+                logger.debug(f"delete_tagging: tagging {tagging_id} already absent (404)")
+                return "404"
+            raise
+
+    @retry_action_builder_operation
+    async def update_entity_with_tags(
+        self,
+        campaign_id: str,
+        entity_interact_id: str,
+        add_tags: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Update an existing entity's tags via the Person Signup Helper.
+
+        Args:
+            campaign_id: Campaign UUID (interact_id)
+            entity_interact_id: Entity interact_id UUID (36 chars)
+            add_tags: List of tag dicts, each with keys:
+                ``action_builder:section``, ``action_builder:field``, ``name``
+
+        Returns:
+            Response dict from the API
+        """
+        result = await self._request(
+            "POST",
+            f"/campaigns/{campaign_id}/people",
+            json_body={
+                "person": {"identifiers": [f"action_builder:{entity_interact_id}"]},
+                "add_tags": add_tags,
+            },
+        )
+        return result or {}
+
+    async def replace_entity_tags(
+        self,
+        campaign_id: str,
+        entity_interact_id: str,
+        taggings_to_delete: Iterable[Tuple[str, str]],
+        add_tags: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Replace tag values on an entity with one signup-helper POST.
+
+        The DELETEs are issued concurrently; the POST follows once they have
+        all finished. See ActionBuilderConnector.replace_entity_tags.
+
+        Args:
+            campaign_id: Campaign UUID (interact_id)
+            entity_interact_id: Entity interact_id UUID (36 chars)
+            taggings_to_delete: ``(tag_id, tagging_id)`` pairs to remove
+            add_tags: Tag dicts to add
+
+        Returns:
+            Response dict from the signup helper, or {} if add_tags is empty
+        """
+        await asyncio.gather(
+            *(
+                self.delete_tagging(campaign_id, tag_id, tagging_id)
+                for tag_id, tagging_id in taggings_to_delete
+            )
+        )
+        if not add_tags:
+            return {}
+        return await self.update_entity_with_tags(campaign_id, entity_interact_id, add_tags)
+
+    async def bulk_update_entity_tags(
+        self,
+        campaign_id: str,
+        items: Iterable[Tuple[str, List[Dict[str, Any]]]],
+    ) -> Dict[str, Union[Dict[str, Any], BaseException]]:
+        """
+        Apply update_entity_with_tags to many entities concurrently.
+
+        Each update is retried independently on 429. A failure for one entity
+        does not cancel the others; its exception is returned in place of the
+        response so callers can log or requeue just the failed entities.
+
+        Args:
+            campaign_id: Campaign UUID (interact_id)
+            items: ``(entity_interact_id, add_tags)`` pairs
+
+        Returns:
+            Dict mapping each entity_interact_id to its API response or the
+            exception raised for it
+
+        Examples:
+            >>> results = await ab.bulk_update_entity_tags(
+            ...     "abc123", [("p1", tags), ("p2", tags)]
+            ... )
+            >>> failed = [pid for pid, r in results.items() if isinstance(r, Exception)]
+        """
+        pairs = list(items)
+        outcomes = await asyncio.gather(
+            *(
+                self.update_entity_with_tags(campaign_id, entity_id, add_tags)
+                for entity_id, add_tags in pairs
+            ),
+            return_exceptions=True,
+        )
+        return {entity_id: outcome for (entity_id, _), outcome in zip(pairs, outcomes)}
+
+    # -- Connections ----------------------------------------------------------
+
+    async def list_connections(
+        self, campaign_id: str, person_id: str, per_page: int = DEFAULT_PER_PAGE
+    ) -> List[Dict[str, Any]]:
+        """
+        List all connections for a person/entity.
+
+        Args:
+            campaign_id: Campaign UUID
+            person_id: Person/entity UUID
+            per_page: Records to request per page
+
+        Returns:
+            List of connection resources
+        """
+        return await self._paginate(
+            f"/campaigns/{campaign_id}/people/{person_id}/connections",
+            "action_builder:connections",
+            per_page=per_page,
+        )
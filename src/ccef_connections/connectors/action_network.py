@@ -11,18 +11,154 @@ OSDI/HAL+JSON format with pagination via ``_links.next.href``.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
 import requests
 
 from ..core.base import BaseConnection
+from ..core.http import create_session, json_loads
 from ..core.retry import retry_action_network_operation
-from ..exceptions import AuthenticationError, ConnectionError, RateLimitError
+from ..exceptions import AuthenticationError, ClientError, ConnectionError, RateLimitError
 
 logger = logging.getLogger(__name__)
 
 ACTION_NETWORK_API_BASE = "https://actionnetwork.org/api/v2"
 
+# Default thread-pool size for bulk writes; Action Network allows roughly
+# 4 requests per second per API key
+DEFAULT_BULK_WORKERS = 4
+
+# Top-level collection name -> (API path, key inside ``_embedded``)
+_LIST_ENDPOINTS: Dict[str, Tuple[str, str]] = {
+    "people": ("/people", "osdi:people"),
+    "tags": ("/tags", "osdi:tags"),
+    "events": ("/events", "osdi:events"),
+    "petitions": ("/petitions", "osdi:petitions"),
+    "forms": ("/forms", "osdi:forms"),
+    "fundraising_pages": ("/fundraising_pages", "osdi:fundraising_pages"),
+    "lists": ("/lists", "osdi:lists"),
+    "messages": ("/messages", "osdi:messages"),
+    "wrappers": ("/wrappers", "osdi:wrappers"),
+    "custom_fields": ("/metadata", "osdi:metadata"),
+    "event_campaigns": ("/event_campaigns", "action_network:event_campaigns"),
+}
+
+# Seconds a successful health_check is trusted before probing the API again
+HEALTH_CHECK_TTL = 30.0
+
+# Maximum number of GET responses remembered for If-None-Match revalidation
+ETAG_CACHE_MAXSIZE = 256
+
+# 4xx statuses that are still worth retrying (timeouts / too early)
+_RETRIABLE_4XX = frozenset({408, 425})
+
+
+# Process-wide pooled session shared by every ActionNetworkConnector, so
+# several connectors (e.g. one per worker) reuse one DNS lookup, TLS session
+# and urllib3 pool. API keys travel as per-request headers, never on it.
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def _get_shared_session() -> requests.Session:
+    """Return the process-wide Action Network session, creating it on first use."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session
+
+
+def _raise_for_status(status_code: int, text: str, headers: Mapping[str, str]) -> None:
+    """
+    Raise the library exception matching an Action Network error response.
+
+    Shared by the sync and async connectors so both surface identical errors.
+
+    Args:
+        status_code: HTTP status code (>= 400)
+        text: Response body text
+        headers: Response headers
+
+    Raises:
+        AuthenticationError: On 401 responses
+        RateLimitError: On 429 responses
+        ClientError: On other 4xx responses, which retrying cannot fix
+        ConnectionError: On 5xx and retriable 4xx, with ``status_code`` set
+    """
+    if status_code == 401:
+        raise AuthenticationError(
+            f"Action Network authentication failed ({status_code}): {text}"
+        )
+
+    if status_code == 429:
+        retry_after = int(headers.get("Retry-After", 1))
+        raise RateLimitError(
+            f"Action Network rate limit exceeded, retry after {retry_after}s",
+            retry_after=retry_after,
+        )
+
+    if 400 <= status_code < 500 and status_code not in _RETRIABLE_4XX:
+        raise ClientError(
+            f"Action Network API error {status_code}: {text}", status_code=status_code
+        )
+
+    raise ConnectionError(
+        f"Action Network API error {status_code}: {text}", status_code=status_code
+    )
+
+
+def _next_path(data: Dict[str, Any]) -> Optional[str]:
+    """
+    Return the API path of a page's ``_links.next.href``, or None on the last page.
+
+    Absolute links are made relative to ACTION_NETWORK_API_BASE so they can
+    be passed straight back to ``_request``.
+    """
+    try:
+        href = data["_links"]["next"]["href"]
+    except (KeyError, TypeError):
+        return None
+    return href.removeprefix(ACTION_NETWORK_API_BASE) if href else None
+
+
+def _etag_key(
+    path: str, params: Optional[Dict[str, Any]]
+) -> Optional[Tuple[str, Tuple[Tuple[str, Any], ...]]]:
+    """Return the ETag cache key for a GET, or None if params are unhashable."""
+    key = (path, tuple(sorted(params.items())) if params else ())
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _person_signup_body(
+    email: str,
+    given_name: Optional[str] = None,
+    family_name: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    """Build a Person Signup Helper body (see ActionNetworkConnector.create_person)."""
+    person: Dict[str, Any] = {
+        "email_addresses": [{"address": email}],
+    }
+    if given_name:
+        person["given_name"] = given_name
+    if family_name:
+        person["family_name"] = family_name
+    person.update(kwargs)
+
+    body: Dict[str, Any] = {"person": person}
+    if tags:
+        body["add_tags"] = tags
+    return body
+
 
 class ActionNetworkConnector(BaseConnection):
     """
@@ -31,6 +167,13 @@ class ActionNetworkConnector(BaseConnection):
     Provides full CRUD access to Action Network resources using the
     OSDI/HAL+JSON API v2 with a static API key.
 
+    All connectors in a process share one pooled HTTP session by default,
+    each sending its own API key per request.
+
+    Args:
+        session: Optional requests.Session to use instead of the shared
+            one (e.g. with custom proxies). The caller owns and closes it.
+
     Examples:
         >>> connector = ActionNetworkConnector()
         >>> connector.connect()
@@ -43,10 +186,21 @@ class ActionNetworkConnector(BaseConnection):
         ... )
     """
 
-    def __init__(self) -> None:
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
         """Initialize the Action Network connector."""
         super().__init__()
         self._api_key: Optional[str] = None
+        self._session = session
+        # Per-request auth headers, built once in connect()
+        self._headers: Dict[str, str] = {}
+        # (time.monotonic() at fetch, API Entry Point body) from health_check
+        self._entry_point: Optional[Tuple[float, Dict[str, Any]]] = None
+        # GET (path, params) -> (ETag, raw body) for conditional requests. The
+        # raw bytes are decoded again on each 304, so callers never share (and
+        # mutate) a cached object. Guarded by a lock because prefetch and bulk
+        # workers share it
+        self._etags: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Tuple[str, bytes]] = {}
+        self._etag_lock = threading.Lock()
 
     def connect(self) -> None:
         """
@@ -58,6 +212,9 @@ class ActionNetworkConnector(BaseConnection):
         """
         try:
             self._api_key = self._credential_manager.get_action_network_key()
+            self._headers = self._get_headers()
+            self._entry_point = None
+            self.clear_etag_cache()
             self._is_connected = True
             logger.info("Successfully connected to Action Network")
         except Exception as e:
@@ -67,8 +224,15 @@ class ActionNetworkConnector(BaseConnection):
             ) from e
 
     def disconnect(self) -> None:
-        """Clear the Action Network connection."""
+        """
+        Clear the Action Network connection.
+
+        The shared session stays open for other connectors in the process.
+        """
+        self._entry_point = None
+        self.clear_etag_cache()
         self._api_key = None
+        self._headers = {}
         self._is_connected = False
         logger.debug("Disconnected from Action Network")
 
@@ -76,44 +240,90 @@ class ActionNetworkConnector(BaseConnection):
         """
         Check connection health by hitting the API Entry Point.
 
+        A successful probe is cached for HEALTH_CHECK_TTL seconds, so
+        frequent status checks do not each cost a round-trip. Failures are
+        never cached.
+
         Returns:
             True if connected and API responds, False otherwise
         """
         if not self._is_connected or not self._api_key:
             return False
-        try:
-            self._request("GET", "")
+        cached = self._entry_point
+        if cached is not None and time.monotonic() - cached[0] < HEALTH_CHECK_TTL:
             return True
+        try:
+            data = self._request("GET", "")
         except Exception:
+            self._entry_point = None
             return False
+        self._entry_point = (time.monotonic(), data or {})
+        return True
+
+    def clear_etag_cache(self) -> None:
+        """Forget stored ETags so the next GETs download full responses."""
+        with self._etag_lock:
+            self._etags.clear()
 
     # -- HTTP helpers ---------------------------------------------------------
 
+    def _get_session(self) -> requests.Session:
+        """Return the caller-supplied session, or the shared pooled session."""
+        if self._session is not None:
+            return self._session
+        return _get_shared_session()
+
+    def _store_etag(
+        self, key: Tuple[str, Tuple[Tuple[str, Any], ...]], etag: str, body: bytes
+    ) -> None:
+        """Remember a GET response's ETag and body, evicting the oldest entry if full."""
+        with self._etag_lock:
+            self._etags.pop(key, None)
+            while len(self._etags) >= ETAG_CACHE_MAXSIZE:
+                # Dicts keep insertion order, so the first key is the oldest entry
+                del self._etags[next(iter(self._etags))]
+            self._etags[key] = (etag, body)
+
     def _get_headers(self) -> Dict[str, str]:
-        """Return request headers with the API key."""
+        """Return per-request headers with the API key."""
         return {
             "OSDI-API-Token": self._api_key or "",
-            "Content-Type": "application/json",
+            "Content-Type": "application/hal+json",
         }
 
+    @retry_action_network_operation
     def _request(
         self,
         method: str,
         path: str,
         params: Optional[Dict[str, Any]] = None,
         json_body: Optional[Dict[str, Any]] = None,
+        conditional: bool = True,
     ) -> Optional[Dict[str, Any]]:
         """
-        Central HTTP method with error handling.
+        Central HTTP method with error handling and retry.
+
+        This is the single retry layer for the connector: 429s, 5xx and
+        network failures are retried per request (see
+        retry_action_network_operation), so a failure on one page of a
+        listing re-sends only that page. Non-retriable 4xx fail at once.
+
+        GETs are conditional: when an earlier response to the same path and
+        params carried an ETag, it is sent as If-None-Match and a 304 decodes
+        the stored body instead of downloading it again.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             path: API path relative to /api/v2 (e.g. '/people')
             params: Query parameters
             json_body: JSON request body
+            conditional: If False, neither send nor store an ETag (used by
+                streaming iterators so they stay constant-memory)
 
         Returns:
-            Parsed JSON response, or None for 204 No Content
+            Parsed JSON response (a fresh copy of the stored body on 304
+            Not Modified), or
+            None for 204 No Content or an empty body
 
         Raises:
             AuthenticationError: On 401 responses
@@ -125,13 +335,22 @@ class ActionNetworkConnector(BaseConnection):
 
         url = f"{ACTION_NETWORK_API_BASE}{path}"
 
+        headers = self._headers
+        etag_key = _etag_key(path, params) if method == "GET" and conditional else None
+        cached: Optional[Tuple[str, bytes]] = None
+        if etag_key is not None:
+            with self._etag_lock:
+                cached = self._etags.get(etag_key)
+            if cached is not None:
+                headers = {**headers, "If-None-Match": cached[0]}
+
         try:
-            resp = requests.request(
+            resp = self._get_session().request(
                 method,
                 url,
-                headers=self._get_headers(),
                 params=params,
                 json=json_body,
+                headers=headers,
                 timeout=30,
             )
         except requests.RequestException as e:
@@ -139,27 +358,94 @@ class ActionNetworkConnector(BaseConnection):
                 f"Action Network API request failed: {e}"
             ) from e
 
-        if resp.status_code == 401:
-            raise AuthenticationError(
-                f"Action Network authentication failed ({resp.status_code}): {resp.text}"
-            )
-
-        if resp.status_code == 429:
-            retry_after = int(resp.headers.get("Retry-After", 1))
-            raise RateLimitError(
-                f"Action Network rate limit exceeded, retry after {retry_after}s",
-                retry_after=retry_after,
-            )
-
         if resp.status_code == 204:
             return None
 
+        if resp.status_code == 304 and cached is not None:
+            return json_loads(cached[1]) if cached[1] else None
+
         if resp.status_code >= 400:
-            raise ConnectionError(
-                f"Action Network API error {resp.status_code}: {resp.text}"
-            )
+            _raise_for_status(resp.status_code, resp.text, resp.headers)
+
+        data = json_loads(resp.content) if resp.content else None
+        if etag_key is not None:
+            etag = resp.headers.get("ETag")
+            if etag:
+                self._store_etag(etag_key, etag, resp.content)
+        return data
+
+    def _iter_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        conditional: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield raw response pages, prefetching the next page in the background.
+
+        As soon as a page arrives, the request for its ``_links.next.href``
+        is submitted to a single worker thread, so it is in flight while the
+        caller processes the current page. Single-page results never start
+        the worker.
 
-        return resp.json()
+        Args:
+            path: Initial API path
+            params: Query parameters for the first request
+            conditional: Whether page GETs use the ETag cache
+
+        Yields:
+            Each page's decoded response body, in page order
+        """
+        executor: Optional[ThreadPoolExecutor] = None
+        try:
+            data = self._request("GET", path, params=params, conditional=conditional)
+            while data is not None:
+                future: Optional["Future[Optional[Dict[str, Any]]]"] = None
+                next_path = _next_path(data)
+                if next_path:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(
+                            max_workers=1, thread_name_prefix="an-prefetch"
+                        )
+                    future = executor.submit(
+                        self._request, "GET", next_path, conditional=conditional
+                    )
+
+                yield data
+
+                if future is None:
+                    break
+                data = future.result()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _iter_resources(
+        self,
+        path: str,
+        resource_key: str,
+        params: Optional[Dict[str, Any]] = None,
+        conditional: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield individual resources across all pages.
+
+        Only one page (plus the one being prefetched) is held in memory at a
+        time, so large exports can be processed in constant memory as long as
+        ``conditional`` is False; otherwise every page is kept in the ETag
+        cache.
+
+        Args:
+            path: Initial API path
+            resource_key: Key inside ``_embedded`` (e.g. 'osdi:people')
+            params: Query parameters for the first request
+            conditional: Whether page GETs use the ETag cache
+
+        Yields:
+            Each resource dict, in API order
+        """
+        for data in self._iter_pages(path, params, conditional):
+            yield from data.get("_embedded", {}).get(resource_key, ())
 
     def _paginate(
         self,
@@ -178,34 +464,43 @@ class ActionNetworkConnector(BaseConnection):
         Returns:
             Combined list of all resources across pages
         """
-        results: List[Dict[str, Any]] = []
-        current_path = path
-        current_params = params
+        return list(self._iter_resources(path, resource_key, params))
 
-        while True:
-            data = self._request("GET", current_path, params=current_params)
-            if data is None:
-                break
+    # -- Collections ----------------------------------------------------------
 
-            embedded = data.get("_embedded", {})
-            if resource_key in embedded:
-                results.extend(embedded[resource_key])
+    def list_resources(self, kind: str, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        List every resource in a top-level collection, paginated.
 
-            next_link = data.get("_links", {}).get("next", {}).get("href")
-            if not next_link:
-                break
+        The list_people, list_tags, ... methods delegate here; use this
+        directly when the collection is chosen at runtime.
 
-            if next_link.startswith(ACTION_NETWORK_API_BASE):
-                current_path = next_link[len(ACTION_NETWORK_API_BASE):]
-            else:
-                current_path = next_link
-            current_params = None
+        Args:
+            kind: Collection name, one of ``_LIST_ENDPOINTS`` (e.g. 'people',
+                'tags', 'custom_fields', 'event_campaigns')
+            **filters: Query parameters (e.g. filter)
+
+        Returns:
+            List of resources
+
+        Raises:
+            ValueError: If kind is not a known collection
 
-        return results
+        Examples:
+            >>> for kind in ("tags", "forms", "wrappers"):
+            ...     snapshot[kind] = connector.list_resources(kind)
+        """
+        try:
+            path, resource_key = _LIST_ENDPOINTS[kind]
+        except KeyError:
+            raise ValueError(
+                f"Unknown Action Network collection {kind!r}; "
+                f"expected one of {sorted(_LIST_ENDPOINTS)}"
+            ) from None
+        return self._paginate(path, resource_key, params=filters or None)
 
     # -- People ---------------------------------------------------------------
 
-    @retry_action_network_operation
     def list_people(self, **filters: Any) -> List[Dict[str, Any]]:
         """
         List all people, paginated.
@@ -216,9 +511,29 @@ class ActionNetworkConnector(BaseConnection):
         Returns:
             List of person resources
         """
-        return self._paginate("/people", "osdi:people", params=filters or None)
+        return self.list_resources("people", **filters)
+
+    def iter_people(self, **filters: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Stream people one at a time instead of building a list.
+
+        The next page is fetched while the caller processes this one, and
+        only about two pages are held in memory at once.
+
+        Args:
+            **filters: Query parameters (e.g. filter)
+
+        Yields:
+            Person resources
+
+        Examples:
+            >>> for person in connector.iter_people():
+            ...     load(person)
+        """
+        return self._iter_resources(
+            "/people", "osdi:people", params=filters or None, conditional=False
+        )
 
-    @retry_action_network_operation
     def get_person(self, person_id: str) -> Dict[str, Any]:
         """
         Get a single person by ID.
@@ -232,7 +547,6 @@ class ActionNetworkConnector(BaseConnection):
         result = self._request("GET", f"/people/{person_id}")
         return result or {}
 
-    @retry_action_network_operation
     def create_person(
         self,
         email: str,
@@ -257,23 +571,10 @@ class ActionNetworkConnector(BaseConnection):
         Returns:
             Created/updated person resource
         """
-        person: Dict[str, Any] = {
-            "email_addresses": [{"address": email}],
-        }
-        if given_name:
-            person["given_name"] = given_name
-        if family_name:
-            person["family_name"] = family_name
-        person.update(kwargs)
-
-        body: Dict[str, Any] = {"person": person}
-        if tags:
-            body["add_tags"] = tags
-
+        body = _person_signup_body(email, given_name, family_name, tags, **kwargs)
         result = self._request("POST", "/people", json_body=body)
         return result or {}
 
-    @retry_action_network_operation
     def update_person(
         self, person_id: str, fields: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -290,7 +591,6 @@ class ActionNetworkConnector(BaseConnection):
         result = self._request("PUT", f"/people/{person_id}", json_body=fields)
         return result or {}
 
-    @retry_action_network_operation
     def unsubscribe_person(self, person_id: str) -> Dict[str, Any]:
         """
         Unsubscribe a person from the email list associated with this API key.
@@ -316,7 +616,6 @@ class ActionNetworkConnector(BaseConnection):
         )
         return result or {}
 
-    @retry_action_network_operation
     def unsubscribe_person_by_email(self, email: str) -> Dict[str, Any]:
         """
         Unsubscribe a person by email address (no UUID needed).
@@ -349,20 +648,55 @@ class ActionNetworkConnector(BaseConnection):
         )
         return result or {}
 
+    def create_people_bulk(
+        self,
+        records: Iterable[Dict[str, Any]],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Create (or update) many people concurrently on a thread pool.
+
+        Each record is passed to create_person as keyword arguments, and
+        each POST is retried on its own in _request. A 429 backs off and
+        re-sends only that record; the rest of the batch keeps going. The
+        signup helper deduplicates by email, so a re-sent record never
+        creates a duplicate person.
+
+        Args:
+            records: create_person keyword dicts (each needs ``email``)
+            max_workers: Number of concurrent requests
+
+        Returns:
+            One entry per record, in input order: the person resource, or
+            the exception raised for that record
+
+        Examples:
+            >>> results = connector.create_people_bulk(
+            ...     [{"email": "a@example.com", "tags": ["volunteer"]}, ...]
+            ... )
+            >>> failed = [r for r in results if isinstance(r, Exception)]
+        """
+        if not self._is_connected and not self._api_key:
+            self.connect()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="an-bulk") as pool:
+            futures = [pool.submit(self.create_person, **record) for record in records]
+        outcomes: List[Union[Dict[str, Any], BaseException]] = []
+        for future in futures:
+            error = future.exception()
+            outcomes.append(error if error is not None else future.result())
+        return outcomes
+
     # -- Tags -----------------------------------------------------------------
 
-    @retry_action_network_operation
     def list_tags(self) -> List[Dict[str, Any]]:
         """List all tags, paginated."""
-        return self._paginate("/tags", "osdi:tags")
+        return self.list_resources("tags")
 
-    @retry_action_network_operation
     def get_tag(self, tag_id: str) -> Dict[str, Any]:
         """Get a single tag by ID."""
         result = self._request("GET", f"/tags/{tag_id}")
         return result or {}
 
-    @retry_action_network_operation
     def create_tag(self, name: str) -> Dict[str, Any]:
         """
         Create a new tag.
@@ -378,14 +712,18 @@ class ActionNetworkConnector(BaseConnection):
 
     # -- Taggings -------------------------------------------------------------
 
-    @retry_action_network_operation
     def list_taggings(self, tag_id: str) -> List[Dict[str, Any]]:
         """List all taggings for a tag, paginated."""
         return self._paginate(
             f"/tags/{tag_id}/taggings", "osdi:taggings"
         )
 
-    @retry_action_network_operation
+    def iter_taggings(self, tag_id: str) -> Iterator[Dict[str, Any]]:
+        """Stream taggings for a tag one at a time."""
+        return self._iter_resources(
+            f"/tags/{tag_id}/taggings", "osdi:taggings", conditional=False
+        )
+
     def add_tagging(
         self, tag_id: str, person_identifiers: List[str]
     ) -> Dict[str, Any]:
@@ -416,7 +754,6 @@ class ActionNetworkConnector(BaseConnection):
         )
         return result or {}
 
-    @retry_action_network_operation
     def delete_tagging(self, tag_id: str, tagging_id: str) -> None:
         """
         Remove a tagging.
@@ -429,18 +766,15 @@ class ActionNetworkConnector(BaseConnection):
 
     # -- Events ---------------------------------------------------------------
 
-    @retry_action_network_operation
     def list_events(self) -> List[Dict[str, Any]]:
         """List all events, paginated."""
-        return self._paginate("/events", "osdi:events")
+        return self.list_resources("events")
 
-    @retry_action_network_operation
     def get_event(self, event_id: str) -> Dict[str, Any]:
         """Get a single event by ID."""
         result = self._request("GET", f"/events/{event_id}")
         return result or {}
 
-    @retry_action_network_operation
     def create_event(
         self, title: str, start_date: Optional[str] = None, **kwargs: Any
     ) -> Dict[str, Any]:
@@ -462,7 +796,6 @@ class ActionNetworkConnector(BaseConnection):
         result = self._request("POST", "/events", json_body=body)
         return result or {}
 
-    @retry_action_network_operation
     def update_event(
         self, event_id: str, fields: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -472,14 +805,18 @@ class ActionNetworkConnector(BaseConnection):
 
     # -- Attendances ----------------------------------------------------------
 
-    @retry_action_network_operation
     def list_attendances(self, event_id: str) -> List[Dict[str, Any]]:
         """List attendances for an event, paginated."""
         return self._paginate(
             f"/events/{event_id}/attendances", "osdi:attendances"
         )
 
-    @retry_action_network_operation
+    def iter_attendances(self, event_id: str) -> Iterator[Dict[str, Any]]:
+        """Stream attendances for an event one at a time."""
+        return self._iter_resources(
+            f"/events/{event_id}/attendances", "osdi:attendances", conditional=False
+        )
+
     def get_attendance(
         self, event_id: str, attendance_id: str
     ) -> Dict[str, Any]:
@@ -489,7 +826,6 @@ class ActionNetworkConnector(BaseConnection):
         )
         return result or {}
 
-    @retry_action_network_operation
     def create_attendance(
         self, event_id: str, person_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -510,18 +846,15 @@ class ActionNetworkConnector(BaseConnection):
 
     # -- Petitions ------------------------------------------------------------
 
-    @retry_action_network_operation
     def list_petitions(self) -> List[Dict[str, Any]]:
         """List all petitions, paginated."""
-        return self._paginate("/petitions", "osdi:petitions")
+        return self.list_resources("petitions")
 
-    @retry_action_network_operation
     def get_petition(self, petition_id: str) -> Dict[str, Any]:
         """Get a single petition by ID."""
         result = self._request("GET", f"/petitions/{petition_id}")
         return result or {}
 
-    @retry_action_network_operation
     def create_petition(self, title: str, **kwargs: Any) -> Dict[str, Any]:
         """
         Create a petition.
@@ -538,7 +871,6 @@ class ActionNetworkConnector(BaseConnection):
         result = self._request("POST", "/petitions", json_body=body)
         return result or {}
 
-    @retry_action_network_operation
     def update_petition(
         self, petition_id: str, fields: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -550,14 +882,18 @@ class ActionNetworkConnector(BaseConnection):
 
     # -- Signatures -----------------------------------------------------------
 
-    @retry_action_network_operation
     def list_signatures(self, petition_id: str) -> List[Dict[str, Any]]:
         """List signatures for a petition, paginated."""
         return self._paginate(
             f"/petitions/{petition_id}/signatures", "osdi:signatures"
         )
 
-    @retry_action_network_operation
+    def iter_signatures(self, petition_id: str) -> Iterator[Dict[str, Any]]:
+        """Stream signatures for a petition one at a time."""
+        return self._iter_resources(
+            f"/petitions/{petition_id}/signatures", "osdi:signatures", conditional=False
+        )
+
     def get_signature(
         self, petition_id: str, signature_id: str
     ) -> Dict[str, Any]:
@@ -567,7 +903,6 @@ class ActionNetworkConnector(BaseConnection):
         )
         return result or {}
 
-    @retry_action_network_operation
     def create_signature(
         self, petition_id: str, person_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -588,7 +923,6 @@ class ActionNetworkConnector(BaseConnection):
         )
         return result or {}
 
-    @retry_action_network_operation
     def update_signature(
         self, petition_id: str, signature_id: str, fields: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -602,18 +936,15 @@ class ActionNetworkConnector(BaseConnection):
 
     # -- Forms ----------------------------------------------------------------
 
-    @retry_action_network_operation
     def list_forms(self) -> List[Dict[str, Any]]:
         """List all forms, paginated."""
-        return self._paginate("/forms", "osdi:forms")
+        return self.list_resources("forms")
 
-    @retry_action_network_operation
     def get_form(self, form_id: str) -> Dict[str, Any]:
         """Get a single form by ID."""
         result = self._request("GET", f"/forms/{form_id}")
         return result or {}
 
-    @retry_action_network_operation
     def create_form(self, title: str, **kwargs: Any) -> Dict[str, Any]:
         """
         Create a form.
@@ -630,7 +961,6 @@ class ActionNetworkConnector(BaseConnection):
         result = self._request("POST", "/forms", json_body=body)
         return result or {}
 
-    @retry_action_network_operation
     def update_form(
         self, form_id: str, fields: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -640,14 +970,18 @@ class ActionNetworkConnector(BaseConnection):
 
     # -- Submissions ----------------------------------------------------------
 
-    @retry_action_network_operation
     def list_submissions(self, form_id: str) -> List[Dict[str, Any]]:
         """List submissions for a form, paginated."""
         return self._paginate(
             f"/forms/{form_id}/submissions", "osdi:submissions"
         )
 
-    @retry_action_network_operation
+    def iter_submissions(self, form_id: str) -> Iterator[Dict[str, Any]]:
+        """Stream submissions for a form one at a time."""
+        return self._iter_resources(
+            f"/forms/{form_id}/submissions", "osdi:submissions", conditional=False
+        )
+
     def get_submission(
         self, form_id: str, submission_id: str
     ) -> Dict[str, Any]:
@@ -657,7 +991,6 @@ class ActionNetworkConnector(BaseConnection):
         )
         return result or {}
 
-    @retry_action_network_operation
     def create_submission(
         self, form_id: str, person_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -678,20 +1011,15 @@ class ActionNetworkConnector(BaseConnection):
 
     # -- Fundraising Pages ----------------------------------------------------
 
-    @retry_action_network_operation
     def list_fundraising_pages(self) -> List[Dict[str, Any]]:
         """List all fundraising pages, paginated."""
-        return self._paginate(
-            "/fundraising_pages", "osdi:fundraising_pages"
-        )
+        return self.list_resources("fundraising_pages")
 
-    @retry_action_network_operation
     def get_fundraising_page(self, page_id: str) -> Dict[str, Any]:
         """Get a single fundraising page by ID."""
         result = self._request("GET", f"/fundraising_pages/{page_id}")
         return result or {}
 
-    @retry_action_network_operation
     def create_fundraising_page(
         self, title: str, **kwargs: Any
     ) -> Dict[str, Any]:
@@ -712,7 +1040,6 @@ class ActionNetworkConnector(BaseConnection):
         )
         return result or {}
 
-    @retry_action_network_operation
     def update_fundraising_page(
         self, page_id: str, fields: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -724,7 +1051,6 @@ class ActionNetworkConnector(BaseConnection):
 
     # -- Donations ------------------------------------------------------------
 
-    @retry_action_network_operation
     def list_donations(
         self, fundraising_page_id: str
     ) -> List[Dict[str, Any]]:
@@ -734,7 +1060,14 @@ class ActionNetworkConnector(BaseConnection):
             "osdi:donations",
         )
 
-    @retry_action_network_operation
+    def iter_donations(self, fundraising_page_id: str) -> Iterator[Dict[str, Any]]:
+        """Stream donations for a fundraising page one at a time."""
+        return self._iter_resources(
+            f"/fundraising_pages/{fundraising_page_id}/donations",
+            "osdi:donations",
+            conditional=False,
+        )
+
     def get_donation(
         self, fundraising_page_id: str, donation_id: str
     ) -> Dict[str, Any]:
@@ -745,7 +1078,6 @@ class ActionNetworkConnector(BaseConnection):
         )
         return result or {}
 
-    @retry_action_network_operation
     def create_donation(
         self, fundraising_page_id: str, person_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -768,12 +1100,10 @@ class ActionNetworkConnector(BaseConnection):
 
     # -- Lists ----------------------------------------------------------------
 
-    @retry_action_network_operation
     def list_lists(self) -> List[Dict[str, Any]]:
         """List all lists (queries/segments), paginated."""
-        return self._paginate("/lists", "osdi:lists")
+        return self.list_resources("lists")
 
-    @retry_action_network_operation
     def get_list(self, list_id: str) -> Dict[str, Any]:
         """Get a single list by ID."""
         result = self._request("GET", f"/lists/{list_id}")
@@ -781,18 +1111,15 @@ class ActionNetworkConnector(BaseConnection):
 
     # -- Messages -------------------------------------------------------------
 
-    @retry_action_network_operation
     def list_messages(self) -> List[Dict[str, Any]]:
         """List all messages, paginated."""
-        return self._paginate("/messages", "osdi:messages")
+        return self.list_resources("messages")
 
-    @retry_action_network_operation
     def get_message(self, message_id: str) -> Dict[str, Any]:
         """Get a single message by ID."""
         result = self._request("GET", f"/messages/{message_id}")
         return result or {}
 
-    @retry_action_network_operation
     def create_message(
         self,
         subject: str,
@@ -823,18 +1150,15 @@ class ActionNetworkConnector(BaseConnection):
 
     # -- Wrappers -------------------------------------------------------------
 
-    @retry_action_network_operation
     def list_wrappers(self) -> List[Dict[str, Any]]:
         """List all email wrappers, paginated."""
-        return self._paginate("/wrappers", "osdi:wrappers")
+        return self.list_resources("wrappers")
 
-    @retry_action_network_operation
     def get_wrapper(self, wrapper_id: str) -> Dict[str, Any]:
         """Get a single wrapper by ID."""
         result = self._request("GET", f"/wrappers/{wrapper_id}")
         return result or {}
 
-    @retry_action_network_operation
     def create_wrapper(self, **kwargs: Any) -> Dict[str, Any]:
         """
         Create an email wrapper.
@@ -848,7 +1172,6 @@ class ActionNetworkConnector(BaseConnection):
         result = self._request("POST", "/wrappers", json_body=kwargs)
         return result or {}
 
-    @retry_action_network_operation
     def update_wrapper(
         self, wrapper_id: str, fields: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -860,18 +1183,15 @@ class ActionNetworkConnector(BaseConnection):
 
     # -- Custom Fields (metadata) ---------------------------------------------
 
-    @retry_action_network_operation
     def list_custom_fields(self) -> List[Dict[str, Any]]:
         """List all custom field definitions, paginated."""
-        return self._paginate("/metadata", "osdi:metadata")
+        return self.list_resources("custom_fields")
 
-    @retry_action_network_operation
     def get_custom_field(self, field_id: str) -> Dict[str, Any]:
         """Get a single custom field definition by ID."""
         result = self._request("GET", f"/metadata/{field_id}")
         return result or {}
 
-    @retry_action_network_operation
     def create_custom_field(
         self, name: str, format: str, **kwargs: Any
     ) -> Dict[str, Any]:
@@ -891,7 +1211,6 @@ class ActionNetworkConnector(BaseConnection):
         result = self._request("POST", "/metadata", json_body=body)
         return result or {}
 
-    @retry_action_network_operation
     def update_custom_field(
         self, field_id: str, fields: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -903,20 +1222,15 @@ class ActionNetworkConnector(BaseConnection):
 
     # -- Event Campaigns ------------------------------------------------------
 
-    @retry_action_network_operation
     def list_event_campaigns(self) -> List[Dict[str, Any]]:
         """List all event campaigns, paginated."""
-        return self._paginate(
-            "/event_campaigns", "action_network:event_campaigns"
-        )
+        return self.list_resources("event_campaigns")
 
-    @retry_action_network_operation
     def get_event_campaign(self, campaign_id: str) -> Dict[str, Any]:
         """Get a single event campaign by ID."""
         result = self._request("GET", f"/event_campaigns/{campaign_id}")
         return result or {}
 
-    @retry_action_network_operation
     def create_event_campaign(
         self, title: str, **kwargs: Any
     ) -> Dict[str, Any]:
@@ -937,7 +1251,6 @@ class ActionNetworkConnector(BaseConnection):
         )
         return result or {}
 
-    @retry_action_network_operation
     def update_event_campaign(
         self, campaign_id: str, fields: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -947,7 +1260,6 @@ class ActionNetworkConnector(BaseConnection):
         )
         return result or {}
 
-    @retry_action_network_operation
     def list_campaign_events(
         self, campaign_id: str
     ) -> List[Dict[str, Any]]:
@@ -956,7 +1268,6 @@ class ActionNetworkConnector(BaseConnection):
             f"/event_campaigns/{campaign_id}/events", "osdi:events"
         )
 
-    @retry_action_network_operation
     def create_campaign_event(
         self, campaign_id: str, event_data: Dict[str, Any]
     ) -> Dict[str, Any]:
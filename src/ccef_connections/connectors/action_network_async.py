@@ -0,0 +1,415 @@
+"""
+Async Action Network connector for CCEF connections library.
+
+asyncio/aiohttp counterpart to ActionNetworkConnector for bulk exports.
+Action Network paginates with ``_links.next.href``, but every page also
+reports ``total_pages``, so once page 1 has arrived pages 2..N are
+requested concurrently over one pooled aiohttp session instead of one
+round-trip at a time.
+
+Error handling and retry policy match the sync connector: the same
+status-code mapping is used, and retry_action_network_operation wraps
+``_request`` so each HTTP call is retried on its own (tenacity awaits
+coroutines natively).
+
+Requires the optional ``async`` extra:
+    pip install "ccef-connections[async]"
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from ..core.credentials import CredentialManager
+from ..core.http import json_loads
+from ..core.ratelimit import TokenBucket
+from ..core.retry import retry_action_network_operation
+from ..exceptions import ConnectionError, RateLimitError
+from .action_network import (
+    ACTION_NETWORK_API_BASE,
+    _next_path,
+    _person_signup_body,
+    _raise_for_status,
+)
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency: pip install ccef-connections[async]
+    aiohttp = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of HTTP requests in flight on one connector. Action Network
+# allows roughly 4 requests per second per API key, so stay close to that.
+DEFAULT_CONCURRENCY = 4
+
+# Action Network's documented limit: 4 requests per second per API key.
+REQUESTS_PER_SECOND = 4
+
+# One bucket per API key, shared by every async connector in the process
+_api_key_buckets: Dict[str, TokenBucket] = {}
+_api_key_buckets_lock = threading.Lock()
+
+
+def _api_key_bucket(api_key: str) -> TokenBucket:
+    """Return the process-wide TokenBucket for an Action Network API key."""
+    with _api_key_buckets_lock:
+        bucket = _api_key_buckets.get(api_key)
+        if bucket is None:
+            bucket = TokenBucket(rate=REQUESTS_PER_SECOND, capacity=REQUESTS_PER_SECOND)
+            _api_key_buckets[api_key] = bucket
+        return bucket
+
+
+class AsyncActionNetworkConnector:
+    """
+    Async Action Network connector for high-volume reads.
+
+    Mirrors the list/get surface of ActionNetworkConnector with ``async def``
+    methods. A semaphore admits at most ``concurrency`` requests at a time,
+    and a TokenBucket shared per API key paces them to Action Network's
+    4 requests per second, so gathering many calls neither opens more than
+    ``concurrency`` sockets nor sends a burst that comes back as 429s.
+
+    Args:
+        concurrency: Maximum number of simultaneous HTTP requests
+
+    Raises:
+        ValueError: If concurrency is less than 1
+
+    Examples:
+        >>> async with AsyncActionNetworkConnector() as an:
+        ...     people = await an.list_people()
+        ...     signatures = await an.list_signatures(petition_id="abc123")
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY) -> None:
+        """Initialize the async Action Network connector."""
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        self._concurrency = concurrency
+        self._credential_manager = CredentialManager()
+        self._api_key: Optional[str] = None
+        self._session: Optional["aiohttp.ClientSession"] = None
+        # Created inside the event loop (see _get_semaphore); asyncio
+        # primitives bind to the loop that first waits on them
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._is_connected: bool = False
+        logger.debug(f"Initialized {self.__class__.__name__}")
+
+    async def connect(self) -> None:
+        """
+        Load the API key and open the pooled aiohttp session.
+
+        Raises:
+            ImportError: If aiohttp is not installed
+            ConnectionError: If connection setup fails
+        """
+        try:
+            self._api_key = self._credential_manager.get_action_network_key()
+        except Exception as e:
+            logger.error(f"Failed to connect to Action Network: {str(e)}")
+            raise ConnectionError(f"Failed to connect to Action Network: {str(e)}") from e
+
+        await self._close_session()
+        self._session = self._create_session()
+        self._semaphore = asyncio.Semaphore(self._concurrency)
+        self._is_connected = True
+        logger.info("Successfully connected to Action Network (async)")
+
+    async def disconnect(self) -> None:
+        """Close the aiohttp session and clear the connection."""
+        await self._close_session()
+        self._semaphore = None
+        self._api_key = None
+        self._is_connected = False
+        logger.debug("Disconnected from Action Network (async)")
+
+    async def health_check(self) -> bool:
+        """
+        Check connection health by hitting the API Entry Point.
+
+        Returns:
+            True if connected and API responds, False otherwise
+        """
+        if not self._is_connected or not self._api_key:
+            return False
+        try:
+            await self._request("GET", "")
+            return True
+        except Exception:
+            return False
+
+    def is_connected(self) -> bool:
+        """
+        Check if currently connected to Action Network.
+
+        Returns:
+            True if connected, False otherwise
+        """
+        return self._is_connected
+
+    async def __aenter__(self) -> "AsyncActionNetworkConnector":
+        """Connect on ``async with`` entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Disconnect on ``async with`` exit."""
+        await self.disconnect()
+
+    def __repr__(self) -> str:
+        """Return a short status representation."""
+        status = "connected" if self._is_connected else "disconnected"
+        return f"<{self.__class__.__name__} status={status}>"
+
+    # -- HTTP helpers ---------------------------------------------------------
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Return session headers with the API key."""
+        return {
+            "OSDI-API-Token": self._api_key or "",
+            "Content-Type": "application/hal+json",
+        }
+
+    def _create_session(self) -> "aiohttp.ClientSession":
+        """
+        Create the pooled aiohttp session.
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for AsyncActionNetworkConnector. "
+                "Install with: pip install ccef-connections[async]"
+            )
+
+        return aiohttp.ClientSession(
+            headers=self._get_headers(),
+            connector=aiohttp.TCPConnector(limit=self._concurrency, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the request semaphore, creating it on first use."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        return self._semaphore
+
+    async def _close_session(self) -> None:
+        """Close the aiohttp session, if one is open."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @retry_action_network_operation
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Central async HTTP method with error handling and retry.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            path: API path relative to /api/v2 (e.g. '/people')
+            params: Query parameters
+            json_body: JSON request body
+
+        Returns:
+            Parsed JSON response, or None for 204 No Content or an empty body
+
+        Raises:
+            AuthenticationError: On 401 responses
+            RateLimitError: On 429 responses
+            ConnectionError: On other HTTP errors or network failures
+        """
+        if self._session is None:
+            await self.connect()
+        session = self._session
+        if session is None:
+            raise ConnectionError("Action Network session is not open")
+
+        url = f"{ACTION_NETWORK_API_BASE}{path}"
+        bucket = _api_key_bucket(self._api_key or "")
+
+        try:
+            # Hold a slot before sending: aiohttp counts time spent waiting for
+            # a pooled connection against ClientTimeout, so queueing on the
+            # pool instead would time out requests that were never sent
+            async with self._get_semaphore():
+                await bucket.acquire_async()
+                async with session.request(method, url, params=params, json=json_body) as resp:
+                    if resp.status == 204:
+                        return None
+                    if resp.status >= 400:
+                        _raise_for_status(resp.status, await resp.text(), resp.headers)
+                    body = await resp.read()
+                    return json_loads(body) if body else None
+        except RateLimitError as e:
+            # Hold back every request on this key until the server's window clears
+            if e.retry_after:
+                bucket.pause(e.retry_after)
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise ConnectionError(f"Action Network API request failed: {e}") from e
+
+    async def _paginate(
+        self,
+        path: str,
+        resource_key: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every page, requesting pages 2..N concurrently.
+
+        Page 1 is fetched first to learn ``total_pages``; the remaining
+        pages are then gathered together, and results keep page order.
+        Responses without ``total_pages`` fall back to following
+        ``_links.next.href`` one page at a time.
+
+        Args:
+            path: Initial API path
+            resource_key: Key inside ``_embedded`` (e.g. 'osdi:people')
+            params: Query parameters for the first request
+
+        Returns:
+            Combined list of all resources across pages
+        """
+        first = await self._request("GET", path, params=params)
+        if first is None:
+            return []
+        pages: List[Optional[Dict[str, Any]]] = [first]
+
+        total_pages = first.get("total_pages")
+        next_path = _next_path(first)
+        if next_path and isinstance(total_pages, int) and total_pages > 1:
+            # Pages are requested concurrently, so each needs its own params dict
+            pages.extend(
+                await asyncio.gather(
+                    *(
+                        self._request("GET", path, params=dict(params or {}, page=p))
+                        for p in range(2, total_pages + 1)
+                    )
+                )
+            )
+        else:
+            while next_path:
+                data = await self._request("GET", next_path)
+                if data is None:
+                    break
+                pages.append(data)
+                next_path = _next_path(data)
+
+        results: List[Dict[str, Any]] = []
+        for page in pages:
+            if page is not None:
+                results.extend(page.get("_embedded", {}).get(resource_key, []))
+        return results
+
+    # -- People ---------------------------------------------------------------
+
+    async def list_people(self, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        List all people.
+
+        Args:
+            **filters: Query parameters (e.g. filter)
+
+        Returns:
+            List of person resources
+        """
+        return await self._paginate("/people", "osdi:people", params=filters or None)
+
+    async def get_person(self, person_id: str) -> Dict[str, Any]:
+        """
+        Get a single person by ID.
+
+        Args:
+            person_id: Action Network person UUID
+
+        Returns:
+            Person resource dict
+        """
+        result = await self._request("GET", f"/people/{person_id}")
+        return result or {}
+
+    async def create_person(
+        self,
+        email: str,
+        given_name: Optional[str] = None,
+        family_name: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Create (or update) a person via the Person Signup Helper.
+
+        Args:
+            email: Email address (used for dedup)
+            given_name: First name
+            family_name: Last name
+            tags: List of tag names to apply
+            **kwargs: Additional person fields
+
+        Returns:
+            Created/updated person resource
+        """
+        body = _person_signup_body(email, given_name, family_name, tags, **kwargs)
+        result = await self._request("POST", "/people", json_body=body)
+        return result or {}
+
+    # -- Tags -----------------------------------------------------------------
+
+    async def list_tags(self) -> List[Dict[str, Any]]:
+        """List all tags."""
+        return await self._paginate("/tags", "osdi:tags")
+
+    async def list_taggings(self, tag_id: str) -> List[Dict[str, Any]]:
+        """List all taggings for a tag."""
+        return await self._paginate(f"/tags/{tag_id}/taggings", "osdi:taggings")
+
+    # -- Events ---------------------------------------------------------------
+
+    async def list_events(self) -> List[Dict[str, Any]]:
+        """List all events."""
+        return await self._paginate("/events", "osdi:events")
+
+    async def list_attendances(self, event_id: str) -> List[Dict[str, Any]]:
+        """List attendances for an event."""
+        return await self._paginate(f"/events/{event_id}/attendances", "osdi:attendances")
+
+    # -- Petitions ------------------------------------------------------------
+
+    async def list_petitions(self) -> List[Dict[str, Any]]:
+        """List all petitions."""
+        return await self._paginate("/petitions", "osdi:petitions")
+
+    async def list_signatures(self, petition_id: str) -> List[Dict[str, Any]]:
+        """List signatures for a petition."""
+        return await self._paginate(
+            f"/petitions/{petition_id}/signatures", "osdi:signatures"
+        )
+
+    # -- Forms ----------------------------------------------------------------
+
+    async def list_forms(self) -> List[Dict[str, Any]]:
+        """List all forms."""
+        return await self._paginate("/forms", "osdi:forms")
+
+    async def list_submissions(self, form_id: str) -> List[Dict[str, Any]]:
+        """List submissions for a form."""
+        return await self._paginate(f"/forms/{form_id}/submissions", "osdi:submissions")
+
+    # -- Donations ------------------------------------------------------------
+
+    async def list_donations(self, fundraising_page_id: str) -> List[Dict[str, Any]]:
+        """List donations for a fundraising page."""
+        return await self._paginate(
+            f"/fundraising_pages/{fundraising_page_id}/donations", "osdi:donations"
+        )
@@ -6,16 +6,137 @@ management, retry logic, and convenient methods for common operations.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from pyairtable import Api, Table
+from pyairtable import Api, Table, retry_strategy
+from requests.adapters import HTTPAdapter
 
 from ..core.base import BaseConnection
+from ..core.ratelimit import TokenBucket
 from ..core.retry import retry_airtable_operation
 from ..exceptions import ConnectionError, CredentialError
 
 logger = logging.getLogger(__name__)
 
+# Airtable accepts at most 10 records per create/update request.
+MAX_BATCH_SIZE = 10
+
+# Concurrent batch requests; Airtable allows 5 requests per second per base.
+DEFAULT_BATCH_WORKERS = 5
+
+# (connect, read) timeout in seconds for every Airtable request.
+REQUEST_TIMEOUT = (5, 30)
+
+# Airtable's documented limit: 5 requests per second per base.
+REQUESTS_PER_SECOND = 5
+
+# One bucket per base, shared by every connector and thread in the process
+_base_buckets: Dict[str, TokenBucket] = {}
+_base_buckets_lock = threading.Lock()
+
+
+def _base_bucket(base_id: str) -> TokenBucket:
+    """Return the process-wide TokenBucket for an Airtable base."""
+    with _base_buckets_lock:
+        bucket = _base_buckets.get(base_id)
+        if bucket is None:
+            bucket = TokenBucket(rate=REQUESTS_PER_SECOND, capacity=REQUESTS_PER_SECOND)
+            _base_buckets[base_id] = bucket
+        return bucket
+
+
+def _formula_value(value: Any) -> str:
+    """Render a Python number, string or bool as an Airtable formula literal."""
+    if isinstance(value, bool):
+        return "TRUE()" if value else "FALSE()"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _range_formula(field: str, low: Any, high: Any) -> str:
+    """
+    Build a formula matching ``low <= {field} < high``.
+
+    Args:
+        field: Field name to compare
+        low: Inclusive lower bound, or None for no lower bound
+        high: Exclusive upper bound, or None for no upper bound
+
+    Returns:
+        Airtable formula string, or "" when both bounds are None
+    """
+    ref = "{" + field.replace("}", "\\}") + "}"
+    terms = []
+    if low is not None:
+        terms.append(f"{ref} >= {_formula_value(low)}")
+    if high is not None:
+        terms.append(f"{ref} < {_formula_value(high)}")
+    if len(terms) == 2:
+        return f"AND({terms[0]}, {terms[1]})"
+    return terms[0] if terms else ""
+
+
+class _ThrottledAdapter(HTTPAdapter):
+    """HTTPAdapter that waits for a per-base token before each request."""
+
+    def send(self, request: Any, **kwargs: Any) -> Any:
+        # Record URLs look like /v0/{base_id}/{table}; meta calls share "meta"
+        parts = request.path_url.split("?", 1)[0].split("/")
+        _base_bucket(parts[2] if len(parts) > 2 else "").acquire()
+        return super().send(request, **kwargs)
+
+
+def _check_chunking(chunk_size: int, max_workers: int) -> None:
+    """
+    Validate batch arguments before any request or retry.
+
+    Args:
+        chunk_size: Records per request (1-10)
+        max_workers: Maximum number of requests in flight
+
+    Raises:
+        ValueError: If chunk_size or max_workers is out of range
+    """
+    if not 1 <= chunk_size <= MAX_BATCH_SIZE:
+        raise ValueError(
+            f"chunk_size must be between 1 and {MAX_BATCH_SIZE}, got {chunk_size}"
+        )
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+
+def _map_chunks(
+    func: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+    records: List[Dict[str, Any]],
+    chunk_size: int,
+    max_workers: int,
+) -> List[Dict[str, Any]]:
+    """
+    Apply func to successive chunks of records, several chunks at a time.
+
+    Args:
+        func: Callable that sends one chunk and returns its records
+        records: Records to send
+        chunk_size: Records per request (1-10)
+        max_workers: Maximum number of requests in flight
+
+    Returns:
+        Records returned by func, in input order
+    """
+    chunks = [records[i : i + chunk_size] for i in range(0, len(records), chunk_size)]
+    if len(chunks) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(chunks)), thread_name_prefix="airtable-batch"
+        ) as executor:
+            results = list(executor.map(func, chunks))
+    else:
+        results = [func(chunk) for chunk in chunks]
+    return [record for result in results for record in result]
+
 
 class AirtableConnector(BaseConnection):
     """
@@ -39,6 +160,8 @@ class AirtableConnector(BaseConnection):
         """Initialize the Airtable connector."""
         super().__init__()
         self._api: Optional[Api] = None
+        self._table_cache: Dict[Tuple[str, str], Table] = {}
+        self._connect_lock = threading.Lock()
 
     def connect(self) -> None:
         """
@@ -50,7 +173,17 @@ class AirtableConnector(BaseConnection):
         """
         try:
             api_key = self._credential_manager.get_airtable_key()
-            self._api = Api(api_key)
+            self._api = Api(api_key, timeout=REQUEST_TIMEOUT)
+            # Widen the keep-alive pool so concurrent batch requests reuse
+            # connections, keeping pyairtable's 429 retry strategy, and
+            # throttle each base to Airtable's request rate.
+            self._api.session.mount(
+                "https://",
+                _ThrottledAdapter(
+                    pool_connections=10, pool_maxsize=20, max_retries=retry_strategy()
+                ),
+            )
+            self._table_cache.clear()
             self._is_connected = True
             logger.info("Successfully connected to Airtable")
         except CredentialError:
@@ -61,8 +194,11 @@ class AirtableConnector(BaseConnection):
             raise ConnectionError(f"Failed to connect to Airtable: {str(e)}") from e
 
     def disconnect(self) -> None:
-        """Close the Airtable connection."""
+        """Close the Airtable connection and its HTTP session."""
+        if self._api is not None:
+            self._api.session.close()
         self._api = None
+        self._table_cache.clear()
         self._is_connected = False
         logger.debug("Disconnected from Airtable")
 
@@ -75,10 +211,28 @@ class AirtableConnector(BaseConnection):
         """
         return self._is_connected and self._api is not None
 
+    def _ensure_connected(self) -> None:
+        """
+        Connect on first use, once, even when called from several threads.
+
+        Raises:
+            ConnectionError: If no Api is available after connecting
+        """
+        if self._is_connected and self._api is not None:
+            return
+        with self._connect_lock:
+            if not self._is_connected or self._api is None:
+                self.connect()
+        if self._api is None:
+            raise ConnectionError("Not connected to Airtable")
+
     def get_table(self, base_id: str, table_name: str) -> Table:
         """
         Get a table instance for operations.
 
+        Table handles are cached per (base_id, table_name) until the
+        connector reconnects or disconnects.
+
         Args:
             base_id: The Airtable base ID (e.g., 'appXXX')
             table_name: The table name
@@ -94,14 +248,15 @@ class AirtableConnector(BaseConnection):
             >>> table = connector.get_table('appSBBlMCcLRWd2bk', 'Test Input')
             >>> records = table.all()
         """
-        if not self._is_connected or self._api is None:
-            self.connect()
+        self._ensure_connected()
 
-        if self._api is None:
-            raise ConnectionError("Not connected to Airtable")
-
-        logger.debug(f"Getting table: {base_id}/{table_name}")
-        return self._api.table(base_id, table_name)
+        key = (base_id, table_name)
+        table = self._table_cache.get(key)
+        if table is None:
+            logger.debug(f"Getting table: {base_id}/{table_name}")
+            table = self._api.table(base_id, table_name)
+            self._table_cache[key] = table
+        return table
 
     @retry_airtable_operation
     def get_records(
@@ -136,6 +291,71 @@ class AirtableConnector(BaseConnection):
         table = self.get_table(base_id, table_name)
         return table.all(formula=formula, max_records=max_records, view=view)
 
+    def get_records_parallel(
+        self,
+        base_id: str,
+        table_name: str,
+        partition_field: str,
+        partition_ranges: List[Tuple[Any, Any]],
+        formula: Optional[str] = None,
+        view: Optional[str] = None,
+        max_workers: int = DEFAULT_BATCH_WORKERS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get records by scanning several ranges of a field concurrently.
+
+        Airtable returns 100 records per page, so get_records on a large
+        table is a long chain of sequential requests. Splitting the scan
+        into ranges of a sortable field (an autonumber works well) lets
+        several chains run at once. The per-base rate limiter still caps
+        the total at 5 requests per second.
+
+        Args:
+            base_id: The Airtable base ID
+            table_name: The table name
+            partition_field: Numeric or text field the ranges apply to
+            partition_ranges: ``(low, high)`` pairs matching
+                ``low <= field < high``; None leaves a side open. Ranges
+                must not overlap, or records will be returned twice.
+            formula: Optional filter formula applied within every range
+            view: Optional view name to use
+            max_workers: Maximum number of ranges scanned at once
+
+        Returns:
+            List of records, grouped in the order of partition_ranges
+
+        Raises:
+            ValueError: If max_workers is less than 1
+
+        Examples:
+            >>> connector = AirtableConnector()
+            >>> records = connector.get_records_parallel(
+            ...     'appXXX', 'TableName', 'Autonumber',
+            ...     [(None, 10000), (10000, 20000), (20000, None)],
+            ... )
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        formulas = []
+        for low, high in partition_ranges:
+            range_formula = _range_formula(partition_field, low, high)
+            if formula and range_formula:
+                range_formula = f"AND({formula}, {range_formula})"
+            formulas.append(range_formula or formula)
+
+        self._ensure_connected()
+
+        def fetch(range_formula: Optional[str]) -> List[Dict[str, Any]]:
+            return self.get_records(base_id, table_name, formula=range_formula, view=view)
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, max(len(formulas), 1)),
+            thread_name_prefix="airtable-scan",
+        ) as executor:
+            results = list(executor.map(fetch, formulas))
+        return [record for result in results for record in result]
+
     @retry_airtable_operation
     def update_record(
         self, base_id: str, table_name: str, record_id: str, fields: Dict[str, Any]
@@ -162,20 +382,34 @@ class AirtableConnector(BaseConnection):
         table = self.get_table(base_id, table_name)
         return table.update(record_id, fields)
 
-    @retry_airtable_operation
     def batch_update(
-        self, base_id: str, table_name: str, records: List[Dict[str, Any]]
+        self,
+        base_id: str,
+        table_name: str,
+        records: List[Dict[str, Any]],
+        chunk_size: int = MAX_BATCH_SIZE,
+        max_workers: int = DEFAULT_BATCH_WORKERS,
     ) -> List[Dict[str, Any]]:
         """
         Update multiple records in batch with retry logic.
 
+        Records are sent in chunks of ``chunk_size`` (Airtable's per-request
+        limit is 10), with up to ``max_workers`` requests in flight. Each
+        chunk is retried on its own, so a failure does not re-send chunks
+        that succeeded.
+
         Args:
             base_id: The Airtable base ID
             table_name: The table name
             records: List of records to update (each with 'id' and 'fields')
+            chunk_size: Records per request (1-10)
+            max_workers: Maximum number of concurrent requests
 
         Returns:
-            List of updated records
+            List of updated records, in input order
+
+        Raises:
+            ValueError: If chunk_size or max_workers is out of range
 
         Examples:
             >>> connector = AirtableConnector()
@@ -185,8 +419,62 @@ class AirtableConnector(BaseConnection):
             ... ]
             >>> updated = connector.batch_update('appXXX', 'TableName', records_to_update)
         """
+        _check_chunking(chunk_size, max_workers)
         table = self.get_table(base_id, table_name)
-        return table.batch_update(records)
+        return _map_chunks(
+            lambda chunk: self._update_chunk(table, chunk), records, chunk_size, max_workers
+        )
+
+    @retry_airtable_operation
+    def _update_chunk(self, table: Table, chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Update one chunk of records with retry logic."""
+        return table.batch_update(chunk)
+
+    def batch_create(
+        self,
+        base_id: str,
+        table_name: str,
+        records: List[Dict[str, Any]],
+        chunk_size: int = MAX_BATCH_SIZE,
+        max_workers: int = DEFAULT_BATCH_WORKERS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Create multiple records in batch with retry logic.
+
+        Records are sent in chunks of ``chunk_size``, with up to
+        ``max_workers`` requests in flight. Each chunk is retried on its own,
+        so a failure never re-creates records from chunks that succeeded.
+
+        Args:
+            base_id: The Airtable base ID
+            table_name: The table name
+            records: List of field dictionaries, one per new record
+            chunk_size: Records per request (1-10)
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            List of created records, in input order
+
+        Raises:
+            ValueError: If chunk_size or max_workers is out of range
+
+        Examples:
+            >>> connector = AirtableConnector()
+            >>> created = connector.batch_create(
+            ...     'appXXX', 'TableName',
+            ...     [{'Name': 'John Doe'}, {'Name': 'Jane Doe'}],
+            ... )
+        """
+        _check_chunking(chunk_size, max_workers)
+        table = self.get_table(base_id, table_name)
+        return _map_chunks(
+            lambda chunk: self._create_chunk(table, chunk), records, chunk_size, max_workers
+        )
+
+    @retry_airtable_operation
+    def _create_chunk(self, table: Table, chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create one chunk of records with retry logic."""
+        return table.batch_create(chunk)
 
     @retry_airtable_operation
     def create_record(
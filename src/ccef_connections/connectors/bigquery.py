@@ -5,13 +5,23 @@ This module provides both READ and WRITE access to Google BigQuery for
 data warehouse operations using service account authentication.
 """
 
+import asyncio
+import datetime
+import decimal
+import functools
+import io
 import logging
-from typing import Any, Dict, List, Optional, Literal
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Literal, Tuple
 
+from google.api_core.exceptions import NotFound
 from google.cloud import bigquery
 from google.oauth2.service_account import Credentials
 
 from ..core.base import BaseConnection
+from ..core.http import json_dumps
 from ..core.retry import retry_google_operation
 from ..exceptions import ConnectionError, CredentialError, QueryError, WriteError
 
@@ -20,6 +30,141 @@ logger = logging.getLogger(__name__)
 # Type for write disposition
 WriteDisposition = Literal["append", "replace", "fail_if_exists"]
 
+# How insert_rows writes: streaming insert, load job, or chosen by row count
+InsertMode = Literal["auto", "stream", "load"]
+
+# Streaming inserts are capped at 10 MB per request, and BigQuery recommends
+# around 500 rows per request, so insert_rows splits larger inputs.
+_MAX_INSERT_ROWS = 500
+_MAX_INSERT_BYTES = 9_000_000
+
+# Number of insert batches sent concurrently by insert_rows.
+_INSERT_WORKERS = 8
+
+# In "auto" mode, insert_rows switches from streaming to a load job at this size.
+_LOAD_JOB_MIN_ROWS = 1000
+
+# load_dataframe uploads frames longer than this in row partitions, so only
+# one partition per worker is serialized to Parquet at a time.
+_LOAD_PARTITION_ROWS = 500_000
+
+# Number of load_dataframe partitions uploaded concurrently.
+_LOAD_WORKERS = 4
+
+# BigQuery allows at most 10,000 query parameters per statement.
+_MAX_QUERY_PARAMETERS = 10_000
+
+# Python types mapped to BigQuery parameter types, checked in order
+# (bool before int, datetime before date, since each subclasses the next).
+_PARAM_TYPES: Tuple[Tuple[type, str], ...] = (
+    (bool, "BOOL"),
+    (int, "INT64"),
+    (float, "FLOAT64"),
+    (decimal.Decimal, "NUMERIC"),
+    (str, "STRING"),
+    (bytes, "BYTES"),
+    (datetime.datetime, "TIMESTAMP"),
+    (datetime.date, "DATE"),
+    (datetime.time, "TIME"),
+)
+
+
+def _scalar_param_type(value: Any) -> str:
+    """
+    Return the BigQuery parameter type for a Python value.
+
+    Raises:
+        ValueError: If the value's type has no BigQuery scalar equivalent
+    """
+    for py_type, bq_type in _PARAM_TYPES:
+        if isinstance(value, py_type):
+            return bq_type
+    raise ValueError(f"Unsupported query parameter type: {type(value).__name__}")
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_full_table_id(project_id: Optional[str], table_id: str) -> str:
+    """Prefix a 'dataset.table' ID with the project; other IDs are returned as-is."""
+    parts = table_id.split(".")
+    if len(parts) == 2:
+        # Add project if not present
+        return f"{project_id}.{table_id}"
+    return table_id
+
+
+# Queries run at once by query_async / query_aio on one connector.
+_QUERY_WORKERS = 8
+
+# Seconds a get_table lookup is reused by insert_rows and table_exists.
+_TABLE_CACHE_TTL = 300.0
+
+# table_exists looks tables up with the client's own retry, which skips
+# permanent errors such as Forbidden, capped at this many seconds.
+_TABLE_EXISTS_DEADLINE = 5.0
+
+# Seconds table_exists remembers that a table was not found. Shorter than
+# _TABLE_CACHE_TTL because tables are often created right after the check.
+_MISSING_TABLE_TTL = 60.0
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Encode row values that JSON has no type for, as BigQuery expects them.
+
+    Passed as ``default`` to json_dumps so orjson and the standard library
+    accept the same rows: dates and times become ISO 8601 strings and
+    Decimals become strings, which keeps NUMERIC values exact.
+
+    Raises:
+        TypeError: If the value has no JSON encoding
+    """
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _to_json_row(value: Any) -> Any:
+    """
+    Return a row with date, time and Decimal values encoded by _json_default.
+
+    Streaming inserts are serialized by the BigQuery client with the
+    standard library, so rows are normalised before they are sent.
+    """
+    if isinstance(value, dict):
+        return {k: _to_json_row(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json_row(v) for v in value]
+    if isinstance(value, (datetime.date, datetime.time, decimal.Decimal)):
+        return _json_default(value)
+    return value
+
+
+def _insert_batches(
+    rows: List[Dict[str, Any]],
+) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    Split rows into streaming-insert batches within the row and byte limits.
+
+    Args:
+        rows: Rows to insert
+
+    Yields:
+        (offset, batch) tuples, where offset is the index of the batch's
+        first row in ``rows``
+    """
+    start = 0
+    size = 0
+    for i, row in enumerate(rows):
+        row_size = len(json_dumps(row, default=_json_default))
+        if i > start and (i - start >= _MAX_INSERT_ROWS or size + row_size > _MAX_INSERT_BYTES):
+            yield start, rows[start:i]
+            start, size = i, 0
+        size += row_size
+    if start < len(rows):
+        yield start, rows[start:]
+
 
 class BigQueryConnector(BaseConnection):
     """
@@ -54,6 +199,11 @@ class BigQueryConnector(BaseConnection):
         super().__init__()
         self._project_id = project_id
         self._credentials: Optional[Credentials] = None
+        self._bqstorage_client: Any = None
+        self._table_cache: Dict[str, Tuple[float, bigquery.Table]] = {}
+        self._missing_tables: Dict[str, float] = {}
+        self._query_executor: Optional[ThreadPoolExecutor] = None
+        self._connect_lock = threading.Lock()
 
     def connect(self) -> None:
         """
@@ -95,7 +245,15 @@ class BigQueryConnector(BaseConnection):
         """Close the BigQuery connection."""
         if self._client:
             self._client.close()
+        if self._bqstorage_client is not None:
+            self._bqstorage_client.transport.close()
+        if self._query_executor is not None:
+            self._query_executor.shutdown(wait=False)
         self._client = None
+        self._bqstorage_client = None
+        self._query_executor = None
+        self._table_cache.clear()
+        self._missing_tables.clear()
         self._credentials = None
         self._is_connected = False
         logger.debug("Disconnected from BigQuery")
@@ -115,14 +273,23 @@ class BigQueryConnector(BaseConnection):
         sql: str,
         params: Optional[List[Any]] = None,
         timeout: Optional[float] = None,
+        page_size: Optional[int] = None,
+        use_cache: bool = True,
     ) -> bigquery.table.RowIterator:
         """
         Execute a SQL query.
 
+        Identical queries within 24 hours are answered from BigQuery's
+        results cache unless ``use_cache`` is False, which skips slot
+        allocation and bytes billed.
+
         Args:
             sql: SQL query string
             params: Optional query parameters for parameterized queries
             timeout: Query timeout in seconds
+            page_size: Maximum rows per result page (default: BigQuery's
+                own limit of about 10 MB per page)
+            use_cache: Whether to use cached results from an identical query
 
         Returns:
             RowIterator with query results
@@ -136,27 +303,176 @@ class BigQueryConnector(BaseConnection):
             >>> for row in results:
             ...     print(row['column_name'])
         """
-        if not self._is_connected or self._client is None:
-            self.connect()
-
-        if self._client is None:
-            raise ConnectionError("Not connected to BigQuery")
+        self._ensure_connected()
 
         try:
             logger.debug(f"Executing query: {sql[:100]}...")
-            job_config = bigquery.QueryJobConfig()
+            job_config = bigquery.QueryJobConfig(
+                use_query_cache=use_cache, priority=bigquery.QueryPriority.INTERACTIVE
+            )
 
             if params:
                 job_config.query_parameters = params
 
             query_job = self._client.query(sql, job_config=job_config, timeout=timeout)
-            results = query_job.result()
+            results = query_job.result(page_size=page_size)
             logger.debug(f"Query completed: {results.total_rows} rows")
             return results
         except Exception as e:
             logger.error(f"Query failed: {str(e)}")
             raise QueryError(f"Query failed: {str(e)}") from e
 
+    @retry_google_operation
+    def estimate_query_bytes(self, sql: str, params: Optional[List[Any]] = None) -> int:
+        """
+        Dry-run a query and return how many bytes it would process.
+
+        Nothing is executed or billed; use this to check cost before
+        running a large query.
+
+        Args:
+            sql: SQL query string
+            params: Optional query parameters
+
+        Returns:
+            Bytes the query would process (0 if it would be served from cache)
+
+        Raises:
+            QueryError: If the query is invalid
+
+        Examples:
+            >>> connector = BigQueryConnector(project_id='your-project')
+            >>> if connector.estimate_query_bytes(sql) < 10 * 1024**3:
+            ...     results = connector.query(sql)
+        """
+        self._ensure_connected()
+
+        try:
+            job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=True)
+            if params:
+                job_config.query_parameters = params
+            query_job = self._client.query(sql, job_config=job_config)
+            return query_job.total_bytes_processed or 0
+        except Exception as e:
+            logger.error(f"Dry run failed: {str(e)}")
+            raise QueryError(f"Dry run failed: {str(e)}") from e
+
+    def query_async(
+        self,
+        sql: str,
+        params: Optional[List[Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> "Future[bigquery.table.RowIterator]":
+        """
+        Start a query without blocking and return a Future for its results.
+
+        The query runs through query() (with its retry and error handling)
+        on a thread pool shared by this connector, so up to 8 queries run at
+        once. Start several, then collect them with ``future.result()``.
+
+        Args:
+            sql: SQL query string
+            params: Optional query parameters
+            timeout: Query timeout in seconds
+
+        Returns:
+            concurrent.futures.Future resolving to the RowIterator
+
+        Examples:
+            >>> connector = BigQueryConnector(project_id='your-project')
+            >>> futures = [connector.query_async(sql) for sql in queries]
+            >>> results = [f.result() for f in futures]
+        """
+        self._ensure_connected()
+        with self._connect_lock:
+            if self._query_executor is None:
+                self._query_executor = ThreadPoolExecutor(
+                    max_workers=_QUERY_WORKERS, thread_name_prefix="bq-query"
+                )
+            executor = self._query_executor
+        return executor.submit(self.query, sql, params, timeout)
+
+    async def query_aio(
+        self,
+        sql: str,
+        params: Optional[List[Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> bigquery.table.RowIterator:
+        """
+        Await a query from asyncio code without blocking the event loop.
+
+        Fan out several queries with ``asyncio.gather``; they share the
+        query_async thread pool.
+
+        Args:
+            sql: SQL query string
+            params: Optional query parameters
+            timeout: Query timeout in seconds
+
+        Returns:
+            RowIterator with query results
+
+        Raises:
+            QueryError: If query execution fails
+
+        Examples:
+            >>> people, events = await asyncio.gather(
+            ...     connector.query_aio("SELECT * FROM dataset.people"),
+            ...     connector.query_aio("SELECT * FROM dataset.events"),
+            ... )
+        """
+        return await asyncio.wrap_future(self.query_async(sql, params, timeout))
+
+    def iter_query(
+        self,
+        sql: str,
+        params: Optional[List[Any]] = None,
+        timeout: Optional[float] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator[bigquery.Row]:
+        """
+        Execute a SQL query and yield rows, prefetching the next result page.
+
+        While the caller works through one page of rows, the next page is
+        downloaded on a single background thread, so network time overlaps
+        with row processing instead of adding to it.
+
+        Args:
+            sql: SQL query string
+            params: Optional query parameters
+            timeout: Query timeout in seconds
+            page_size: Maximum rows per result page
+
+        Yields:
+            bigquery.Row objects, in result order
+
+        Raises:
+            QueryError: If query execution or fetching a result page fails
+
+        Examples:
+            >>> connector = BigQueryConnector(project_id='your-project')
+            >>> for row in connector.iter_query("SELECT * FROM dataset.big_table"):
+            ...     process(row)
+        """
+        results = self.query(sql, params, timeout, page_size=page_size)
+        pages = iter(results.pages)
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bq-prefetch")
+        try:
+            future: "Future[Any]" = executor.submit(next, pages, None)
+            while True:
+                try:
+                    page = future.result()
+                except Exception as e:
+                    logger.error(f"Fetching query results failed: {str(e)}")
+                    raise QueryError(f"Query failed: {str(e)}") from e
+                if page is None:
+                    break
+                rows = list(page)
+                future = executor.submit(next, pages, None)
+                yield from rows
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     @retry_google_operation
     def query_to_dataframe(
         self,
@@ -167,6 +483,11 @@ class BigQueryConnector(BaseConnection):
         """
         Execute a SQL query and return results as a pandas DataFrame.
 
+        When ``google-cloud-bigquery-storage`` is installed (the ``bqstorage``
+        extra), results are downloaded as Arrow record batches through the
+        BigQuery Storage Read API using one read client kept for the life of
+        the connection. Otherwise they are paged through the REST API.
+
         Args:
             sql: SQL query string
             params: Optional query parameters
@@ -193,51 +514,130 @@ class BigQueryConnector(BaseConnection):
             )
 
         results = self.query(sql, params, timeout)
-        df = results.to_dataframe()
+        df = results.to_dataframe(
+            bqstorage_client=self._get_bqstorage_client(),
+            create_bqstorage_client=False,
+        )
         logger.debug(f"Converted query results to DataFrame: {len(df)} rows")
         return df
 
-    @retry_google_operation
+    def query_to_arrow(
+        self,
+        sql: str,
+        params: Optional[List[Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Execute a SQL query and return results as a pyarrow Table.
+
+        Skips the pandas conversion done by query_to_dataframe, so strings
+        stay in Arrow buffers instead of being boxed as Python objects.
+        Downloads use the Storage Read API when the ``bqstorage`` extra is
+        installed, as in query_to_dataframe. The query is retried by query();
+        a failed download is not retried, since that would rerun the query.
+
+        Args:
+            sql: SQL query string
+            params: Optional query parameters
+            timeout: Query timeout in seconds
+
+        Returns:
+            pyarrow.Table with query results
+
+        Raises:
+            QueryError: If query execution fails
+            ImportError: If pyarrow is not installed
+
+        Examples:
+            >>> connector = BigQueryConnector(project_id='your-project')
+            >>> table = connector.query_to_arrow("SELECT id, name FROM dataset.table")
+            >>> ids = table.column("id").to_pylist()
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for query_to_arrow. "
+                "Install with: pip install ccef-connections[pandas]"
+            )
+
+        results = self.query(sql, params, timeout)
+        table = results.to_arrow(
+            bqstorage_client=self._get_bqstorage_client(),
+            create_bqstorage_client=False,
+        )
+        logger.debug(f"Converted query results to Arrow: {table.num_rows} rows")
+        return table
+
     def table_exists(self, table_id: str) -> bool:
         """
         Check if a table exists.
 
+        Found tables are cached with the table metadata; missing tables are
+        remembered for 60 seconds. Creating a table through this connector
+        (load_dataframe or execute_dml) clears the missing entry. Transient
+        errors are retried for at most 5 seconds; other errors raise at once.
+
         Args:
             table_id: Table ID in format 'dataset.table' or 'project.dataset.table'
 
         Returns:
             True if table exists, False otherwise
 
+        Raises:
+            google.api_core.exceptions.GoogleAPIError: On errors other than
+                the table not existing (e.g. permission denied)
+
         Examples:
             >>> connector = BigQueryConnector(project_id='your-project')
             >>> if connector.table_exists('dataset.table'):
             ...     print("Table exists")
         """
-        if not self._is_connected or self._client is None:
-            self.connect()
+        self._ensure_connected()
 
-        if self._client is None:
-            raise ConnectionError("Not connected to BigQuery")
+        full_table_id = self._get_full_table_id(table_id)
+        missing_since = self._missing_tables.get(full_table_id)
+        if missing_since is not None and time.monotonic() - missing_since < _MISSING_TABLE_TTL:
+            return False
 
         try:
-            full_table_id = self._get_full_table_id(table_id)
-            self._client.get_table(full_table_id)
-            logger.debug(f"Table exists: {table_id}")
-            return True
-        except Exception:
+            self._get_table_cached(
+                full_table_id, retry=bigquery.DEFAULT_RETRY.with_deadline(_TABLE_EXISTS_DEADLINE)
+            )
+        except NotFound:
             logger.debug(f"Table does not exist: {table_id}")
+            self._missing_tables[full_table_id] = time.monotonic()
             return False
+        logger.debug(f"Table exists: {table_id}")
+        self._missing_tables.pop(full_table_id, None)
+        return True
 
-    @retry_google_operation
     def insert_rows(
-        self, table_id: str, rows: List[Dict[str, Any]]
+        self, table_id: str, rows: List[Dict[str, Any]], mode: InsertMode = "auto"
     ) -> None:
         """
-        Insert rows into a table using streaming insert.
+        Insert rows into a table using streaming insert or a load job.
+
+        Streaming sends rows in batches of at most 500 rows and about 9 MB,
+        with up to 8 batches in flight at once. Row errors from every batch
+        are collected into a single WriteError, with ``index`` values
+        relative to ``rows``. Each batch is retried on its own when the
+        request fails; batches BigQuery answered with row errors are not
+        resent, so rows that were accepted are never inserted twice.
+
+        A load job uploads the rows as one newline-delimited JSON file and
+        appends them atomically. Load jobs are free, unlike streaming
+        inserts, but each table allows only 1,500 per day, so small frequent
+        writes should keep streaming.
+
+        In both modes date, datetime and time values are sent as ISO 8601
+        strings and Decimals as strings, whether or not orjson is installed.
 
         Args:
             table_id: Table ID in format 'dataset.table' or 'project.dataset.table'
             rows: List of dictionaries representing rows to insert
+            mode: 'stream', 'load', or 'auto' to use a load job for 1,000 or
+                more rows and streaming otherwise
 
         Raises:
             WriteError: If insert fails
@@ -250,16 +650,35 @@ class BigQueryConnector(BaseConnection):
             ... ]
             >>> connector.insert_rows('dataset.users', rows)
         """
-        if not self._is_connected or self._client is None:
-            self.connect()
-
-        if self._client is None:
-            raise ConnectionError("Not connected to BigQuery")
+        self._ensure_connected()
 
         try:
             full_table_id = self._get_full_table_id(table_id)
-            table = self._client.get_table(full_table_id)
-            errors = self._client.insert_rows_json(table, rows)
+            table = self._get_table_cached(full_table_id)
+
+            if mode == "load" or (mode == "auto" and len(rows) >= _LOAD_JOB_MIN_ROWS):
+                # Encode before the retried call: a row that cannot be
+                # serialized fails the same way on every attempt
+                data = b"\n".join(json_dumps(row, default=_json_default) for row in rows)
+                self._load_rows(table, data)
+                logger.info(f"Successfully loaded {len(rows)} rows into {table_id}")
+                return
+
+            def insert_batch(batch: Tuple[int, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+                offset, batch_rows = batch
+                batch_errors = self._insert_batch(table, batch_rows)
+                return [{**e, "index": e.get("index", 0) + offset} for e in batch_errors]
+
+            batches = list(_insert_batches(rows))
+            if len(batches) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(_INSERT_WORKERS, len(batches)),
+                    thread_name_prefix="bq-insert",
+                ) as executor:
+                    results = list(executor.map(insert_batch, batches))
+            else:
+                results = [insert_batch(batch) for batch in batches]
+            errors = [e for batch_errors in results for e in batch_errors]
 
             if errors:
                 error_msg = f"Insert failed with errors: {errors}"
@@ -268,12 +687,56 @@ class BigQueryConnector(BaseConnection):
 
             logger.info(f"Successfully inserted {len(rows)} rows into {table_id}")
         except WriteError:
+            # The schema may have changed; look the table up again next time
+            self._table_cache.pop(self._get_full_table_id(table_id), None)
             raise
         except Exception as e:
+            self._table_cache.pop(self._get_full_table_id(table_id), None)
             logger.error(f"Insert failed: {str(e)}")
             raise WriteError(f"Insert failed: {str(e)}") from e
 
     @retry_google_operation
+    def _insert_batch(
+        self, table: bigquery.Table, rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Stream one batch of rows, retrying only if the request itself fails.
+
+        Row errors are returned rather than raised: BigQuery has already
+        accepted or rejected every row in the batch, and a retry would
+        insert the accepted rows again under new insert IDs.
+
+        Args:
+            table: Destination table
+            rows: At most one insert request's worth of rows
+
+        Returns:
+            Row errors reported by BigQuery, with ``index`` relative to ``rows``
+        """
+        return self._client.insert_rows_json(table, [_to_json_row(row) for row in rows])
+
+    @retry_google_operation
+    def _load_rows(self, table: bigquery.Table, data: bytes) -> None:
+        """
+        Append rows to a table with a newline-delimited JSON load job.
+
+        A load job is atomic, so retrying a failed one cannot duplicate rows.
+
+        Args:
+            table: Destination table; its schema is used for the load
+            data: Rows encoded as newline-delimited JSON
+
+        Raises:
+            google.api_core.exceptions.GoogleAPIError: If the load job fails
+        """
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            schema=table.schema,
+        )
+        job = self._client.load_table_from_file(io.BytesIO(data), table, job_config=job_config)
+        job.result()  # Wait for job to complete
+
     def load_dataframe(
         self,
         df: Any,
@@ -283,6 +746,14 @@ class BigQueryConnector(BaseConnection):
         """
         Load a pandas DataFrame into a BigQuery table.
 
+        The frame is uploaded as Parquet (via pyarrow), and the table is
+        created if it does not exist. Frames longer than 500,000 rows are
+        uploaded in row partitions to bound memory: the first partition is
+        loaded with ``if_exists``, then the rest are appended concurrently.
+        Each partition is a separate load job retried on its own, so a
+        partition that keeps failing is reported without reloading those
+        that succeeded, but it can leave them in the table.
+
         Args:
             df: pandas DataFrame to load
             table_id: Table ID in format 'dataset.table' or 'project.dataset.table'
@@ -290,7 +761,7 @@ class BigQueryConnector(BaseConnection):
 
         Raises:
             WriteError: If load fails
-            ImportError: If pandas is not installed
+            ImportError: If pandas or pyarrow is not installed
 
         Examples:
             >>> import pandas as pd
@@ -305,12 +776,15 @@ class BigQueryConnector(BaseConnection):
                 "pandas is required for load_dataframe. "
                 "Install with: pip install ccef-connections[pandas]"
             )
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for load_dataframe. "
+                "Install with: pip install ccef-connections[pandas]"
+            )
 
-        if not self._is_connected or self._client is None:
-            self.connect()
-
-        if self._client is None:
-            raise ConnectionError("Not connected to BigQuery")
+        self._ensure_connected()
 
         try:
             full_table_id = self._get_full_table_id(table_id)
@@ -322,14 +796,38 @@ class BigQueryConnector(BaseConnection):
                 "fail_if_exists": bigquery.WriteDisposition.WRITE_EMPTY,
             }
 
-            job_config = bigquery.LoadJobConfig(
-                write_disposition=write_disposition_map[if_exists]
-            )
-
-            job = self._client.load_table_from_dataframe(
-                df, full_table_id, job_config=job_config
-            )
-            job.result()  # Wait for job to complete
+            # The first partition creates or truncates the table, so it must
+            # finish before the remaining partitions are appended
+            partitioned = len(df) > _LOAD_PARTITION_ROWS
+            first = df.iloc[:_LOAD_PARTITION_ROWS] if partitioned else df
+            self._load_dataframe_part(first, full_table_id, write_disposition_map[if_exists])
+            self._table_cache.pop(full_table_id, None)
+            self._missing_tables.pop(full_table_id, None)
+
+            if partitioned:
+                starts = range(_LOAD_PARTITION_ROWS, len(df), _LOAD_PARTITION_ROWS)
+                with ThreadPoolExecutor(
+                    max_workers=_LOAD_WORKERS, thread_name_prefix="bq-load"
+                ) as executor:
+                    futures = {
+                        start: executor.submit(
+                            self._load_dataframe_part,
+                            df.iloc[start : start + _LOAD_PARTITION_ROWS],
+                            full_table_id,
+                            bigquery.WriteDisposition.WRITE_APPEND,
+                        )
+                        for start in starts
+                    }
+                errors = []
+                for start, future in futures.items():
+                    error = future.exception()
+                    if error is not None:
+                        errors.append(f"partition at row {start}: {error}")
+                if errors:
+                    raise WriteError(
+                        f"{len(errors)} of {len(futures) + 1} partitions failed: "
+                        + "; ".join(errors)
+                    )
 
             logger.info(f"Successfully loaded {len(df)} rows into {table_id}")
         except Exception as e:
@@ -337,12 +835,38 @@ class BigQueryConnector(BaseConnection):
             raise WriteError(f"Load failed: {str(e)}") from e
 
     @retry_google_operation
-    def execute_dml(self, sql: str) -> int:
+    def _load_dataframe_part(self, part: Any, full_table_id: str, write_disposition: str) -> None:
+        """
+        Load one DataFrame partition with a Parquet load job.
+
+        Args:
+            part: pandas DataFrame (or slice) to upload
+            full_table_id: Table ID in format 'project.dataset.table'
+            write_disposition: BigQuery write disposition for this job
+
+        Raises:
+            google.api_core.exceptions.GoogleAPIError: If the load job fails
+        """
+        # Upload as columnar, compressed Parquet rather than row-encoded CSV
+        parquet_options = bigquery.ParquetOptions()
+        parquet_options.enable_list_inference = True
+        job_config = bigquery.LoadJobConfig(
+            write_disposition=write_disposition,
+            create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED,
+            source_format=bigquery.SourceFormat.PARQUET,
+            parquet_options=parquet_options,
+        )
+        job = self._client.load_table_from_dataframe(part, full_table_id, job_config=job_config)
+        job.result()  # Wait for job to complete
+
+    @retry_google_operation
+    def execute_dml(self, sql: str, params: Optional[List[Any]] = None) -> int:
         """
         Execute a DML statement (UPDATE, DELETE, etc.).
 
         Args:
             sql: DML SQL statement
+            params: Optional query parameters for parameterized statements
 
         Returns:
             Number of affected rows
@@ -357,16 +881,19 @@ class BigQueryConnector(BaseConnection):
             ... )
             >>> print(f"Updated {rows_affected} rows")
         """
-        if not self._is_connected or self._client is None:
-            self.connect()
-
-        if self._client is None:
-            raise ConnectionError("Not connected to BigQuery")
+        self._ensure_connected()
 
         try:
             logger.debug(f"Executing DML: {sql[:100]}...")
-            query_job = self._client.query(sql)
+            if params:
+                job_config = bigquery.QueryJobConfig(query_parameters=params)
+                query_job = self._client.query(sql, job_config=job_config)
+            else:
+                query_job = self._client.query(sql)
             query_job.result()  # Wait for job to complete
+            # DML/DDL may alter or drop any table, so drop cached metadata
+            self._table_cache.clear()
+            self._missing_tables.clear()
             rows_affected = query_job.num_dml_affected_rows or 0
             logger.info(f"DML completed: {rows_affected} rows affected")
             return rows_affected
@@ -374,6 +901,132 @@ class BigQueryConnector(BaseConnection):
             logger.error(f"DML failed: {str(e)}")
             raise QueryError(f"DML failed: {str(e)}") from e
 
+    def execute_dml_many(
+        self, template: str, rows: List[Dict[str, Any]], batch_size: int = 500
+    ) -> int:
+        """
+        Insert many rows with multi-row ``INSERT ... VALUES`` statements.
+
+        Rows are bound as query parameters and sent ``batch_size`` at a
+        time, so N rows cost one query job per batch instead of N jobs.
+        Batches are shrunk if needed to stay under BigQuery's 10,000
+        parameter limit, and each batch is retried on its own.
+
+        Args:
+            template: Statement up to and including VALUES, e.g.
+                ``"INSERT INTO dataset.users (name, age) VALUES"``; its column
+                list must match the order of the keys in ``rows[0]``
+            rows: Rows to insert; every row must have the same keys
+            batch_size: Maximum rows per statement
+
+        Returns:
+            Total number of rows inserted
+
+        Raises:
+            ValueError: If rows have differing keys, a value has no BigQuery
+                type, or batch_size is less than 1
+            QueryError: If a statement fails
+
+        Examples:
+            >>> connector = BigQueryConnector(project_id='your-project')
+            >>> connector.execute_dml_many(
+            ...     "INSERT INTO dataset.users (name, age) VALUES",
+            ...     [{'name': 'John', 'age': 30}, {'name': 'Jane', 'age': 25}],
+            ... )
+            2
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        if not rows:
+            return 0
+
+        columns = list(rows[0])
+        batch_size = min(batch_size, _MAX_QUERY_PARAMETERS // max(len(columns), 1))
+
+        # Render every statement before running any, so bad input fails cleanly
+        statements: List[Tuple[str, List[Any]]] = []
+        for start in range(0, len(rows), batch_size):
+            tuples: List[str] = []
+            params: List[Any] = []
+            for i, row in enumerate(rows[start : start + batch_size], start):
+                if row.keys() != rows[0].keys():
+                    raise ValueError(f"Row {i} keys {list(row)} do not match {columns}")
+                placeholders = []
+                for j, column in enumerate(columns):
+                    value = row[column]
+                    if value is None:
+                        placeholders.append("NULL")
+                        continue
+                    name = f"p{i}_{j}"
+                    params.append(
+                        bigquery.ScalarQueryParameter(name, _scalar_param_type(value), value)
+                    )
+                    placeholders.append(f"@{name}")
+                tuples.append(f"({', '.join(placeholders)})")
+            statements.append((f"{template} {', '.join(tuples)}", params))
+
+        return sum(self.execute_dml(sql, params) for sql, params in statements)
+
+    def _ensure_connected(self) -> None:
+        """
+        Connect on first use, once, even when called from several threads.
+
+        Raises:
+            ConnectionError: If no client is available after connecting
+        """
+        if self._is_connected and self._client is not None:
+            return
+        with self._connect_lock:
+            if not self._is_connected or self._client is None:
+                self.connect()
+        if self._client is None:
+            raise ConnectionError("Not connected to BigQuery")
+
+    def _get_table_cached(
+        self, full_table_id: str, retry: Any = bigquery.DEFAULT_RETRY
+    ) -> bigquery.Table:
+        """
+        Return table metadata, reusing a lookup made within the cache TTL.
+
+        Args:
+            full_table_id: Table ID in format 'project.dataset.table'
+            retry: google.api_core Retry used for the get_table request
+
+        Returns:
+            bigquery.Table for the table
+
+        Raises:
+            google.api_core.exceptions.NotFound: If the table does not exist
+        """
+        cached = self._table_cache.get(full_table_id)
+        if cached is not None and time.monotonic() - cached[0] < _TABLE_CACHE_TTL:
+            return cached[1]
+        table = self._client.get_table(full_table_id, retry=retry)
+        self._table_cache[full_table_id] = (time.monotonic(), table)
+        return table
+
+    def _get_bqstorage_client(self) -> Any:
+        """
+        Return the BigQuery Storage read client, creating it on first use.
+
+        Returns:
+            BigQueryReadClient, or None if google-cloud-bigquery-storage is
+            not installed (query results then fall back to the REST API)
+        """
+        if self._bqstorage_client is None:
+            try:
+                from google.cloud import bigquery_storage
+            except ImportError:
+                logger.debug(
+                    "google-cloud-bigquery-storage not installed; "
+                    "install ccef-connections[bqstorage] for faster downloads"
+                )
+                return None
+            self._bqstorage_client = bigquery_storage.BigQueryReadClient(
+                credentials=self._credentials
+            )
+        return self._bqstorage_client
+
     def _get_full_table_id(self, table_id: str) -> str:
         """
         Get full table ID including project.
@@ -384,11 +1037,7 @@ class BigQueryConnector(BaseConnection):
         Returns:
             Full table ID in format 'project.dataset.table'
         """
-        parts = table_id.split(".")
-        if len(parts) == 2:
-            # Add project if not present
-            return f"{self._project_id}.{table_id}"
-        return table_id
+        return _resolve_full_table_id(self._project_id, table_id)
 
     @property
     def project_id(self) -> Optional[str]:
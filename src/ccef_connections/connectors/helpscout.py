@@ -9,20 +9,178 @@ Uses OAuth2 Client Credentials flow with direct HTTP via the requests library.
 """
 
 import logging
+import random
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 import requests
 
 from ..core.base import BaseConnection
+from ..core.http import create_session
+from ..core.ratelimit import TokenBucket
 from ..core.retry import retry_helpscout_operation
 from ..exceptions import AuthenticationError, ConnectionError, RateLimitError
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
 HELPSCOUT_TOKEN_URL = "https://api.helpscout.net/v2/oauth2/token"
 HELPSCOUT_API_BASE = "https://api.helpscout.net/v2"
 
+# HelpScout allows 400 API requests per minute per account. Every connector in
+# the process using the same app draws from one bucket, so concurrent pages and
+# tight write loops wait in-process instead of collecting 429s. A 429 pauses
+# only that app's bucket for the server's Retry-After.
+REQUESTS_PER_MINUTE = 400
+
+# One bucket per app_id, shared by the sync and async connectors
+_app_buckets: Dict[str, TokenBucket] = {}
+_app_buckets_lock = threading.Lock()
+
+
+def _app_bucket(app_id: str) -> TokenBucket:
+    """Return the process-wide TokenBucket for a HelpScout app."""
+    with _app_buckets_lock:
+        bucket = _app_buckets.get(app_id)
+        if bucket is None:
+            bucket = TokenBucket(rate=REQUESTS_PER_MINUTE / 60, capacity=10)
+            _app_buckets[app_id] = bucket
+        return bucket
+
+
+# _request waits out a 429 inline when Retry-After is at most this many
+# seconds, and retries 429s and 5xx responses up to MAX_INLINE_RETRIES
+# times before raising to the caller (and its retry decorator). A 5xx may
+# arrive after the server acted, so only idempotent methods retry it inline;
+# a POST reply or note is never re-sent here.
+MAX_INLINE_RETRY_AFTER = 30
+MAX_INLINE_RETRIES = 3
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "PATCH", "DELETE"})
+
+# Concurrent page requests per list_* call once page.totalPages is known.
+# HelpScout allows 400 requests per minute, so keep this small.
+DEFAULT_PAGE_WORKERS = 4
+
+# The background refresher replaces the token this many seconds before it
+# expires, and re-checks at least this often (also the back-off after a
+# failed refresh).
+_TOKEN_REFRESH_SKEW = 300.0
+_TOKEN_REFRESH_POLL = 60.0
+
+# Requests treat a token this close to expiry as already expired and replace
+# it before sending, rather than letting the API refuse it with a 401 that
+# costs a wasted round-trip.
+_TOKEN_EXPIRY_MARGIN = 60.0
+
+# Process-wide cache of client-credentials tokens keyed by (app_id,
+# app_secret) -> (access_token, expires_at), so connectors created per task
+# reuse a token instead of each POSTing to the token endpoint.
+_token_cache: Dict[Tuple[str, str], Tuple[str, float]] = {}
+_token_cache_lock = threading.Lock()
+
+
+def _next_path(data: Dict[str, Any]) -> Optional[str]:
+    """Return the API path of a page's ``_links.next`` link, or None on the last page."""
+    next_link = data.get("_links", {}).get("next", {}).get("href")
+    if not next_link:
+        return None
+    # next_link is a full URL; extract the path portion
+    if next_link.startswith(HELPSCOUT_API_BASE):
+        return str(next_link[len(HELPSCOUT_API_BASE) :])
+    return str(next_link)
+
+
+def _token_request_body(app_id: str, app_secret: str) -> Dict[str, str]:
+    """Build the form body for a client-credentials token request."""
+    return {
+        "grant_type": "client_credentials",
+        "client_id": app_id,
+        "client_secret": app_secret,
+    }
+
+
+def _cached_token(key: Tuple[str, str], held_token: Optional[str]) -> Optional[Tuple[str, float]]:
+    """
+    Return a cached (access_token, expires_at) worth reusing, if any.
+
+    A token is skipped if it is the one the caller already holds (it is
+    being replaced) or if it expires within the background refresh window.
+    """
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if (
+        cached is not None
+        and cached[0] != held_token
+        and cached[1] - _TOKEN_REFRESH_SKEW > time.time()
+    ):
+        return cached
+    return None
+
+
+def _store_token(key: Tuple[str, str], data: Dict[str, Any]) -> Tuple[str, float]:
+    """Cache a token endpoint response and return its (access_token, expires_at)."""
+    # Expire slightly early to avoid edge cases
+    token = (str(data["access_token"]), time.time() + data.get("expires_in", 172800) - 60)
+    with _token_cache_lock:
+        _token_cache[key] = token
+    return token
+
+
+def _reply_body(
+    text: str, customer_id: int, draft: bool, extra: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the request body for a conversation reply."""
+    body: Dict[str, Any] = {
+        "customer": {"id": customer_id},
+        "text": text,
+        "draft": draft,
+    }
+    body.update(extra)
+    return body
+
+
+def _status_body(status: str) -> Dict[str, Any]:
+    """
+    Build the JSON Patch body that sets a conversation's status.
+
+    Raises:
+        ValueError: If status is not a valid value
+    """
+    valid_statuses = ("active", "pending", "closed")
+    if status not in valid_statuses:
+        raise ValueError(
+            f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}"
+        )
+    return {"op": "replace", "path": "/status", "value": status}
+
+
+def _embedded_items(data: Dict[str, Any], resource_key: Optional[str]) -> List[Dict[str, Any]]:
+    """Return a page's resources from ``_embedded[resource_key]``, or its first key."""
+    embedded = data.get("_embedded", {})
+    if resource_key and resource_key in embedded:
+        return list(embedded[resource_key])
+    for key in embedded:
+        # Use the first key in _embedded
+        return list(embedded[key])
+    return []
+
+
+def _conversation_params(
+    mailbox_id: int, status: Optional[str], tag: Optional[str], extra: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the /conversations query parameters for list/iter_conversations."""
+    params: Dict[str, Any] = {"mailbox": mailbox_id}
+    if status:
+        params["status"] = status
+    if tag:
+        params["tag"] = tag
+    params.update(extra)
+    return params
+
 
 class HelpScoutConnector(BaseConnection):
     """
@@ -31,6 +189,11 @@ class HelpScoutConnector(BaseConnection):
     Provides access to HelpScout mailboxes and conversations using
     OAuth2 Client Credentials authentication.
 
+    Args:
+        http2: Send requests over HTTP/2 with httpx instead of requests, so
+            concurrent page fetches multiplex over one connection. Requires
+            the ``http2`` extra.
+
     Examples:
         >>> connector = HelpScoutConnector()
         >>> connector.connect()
@@ -38,16 +201,30 @@ class HelpScoutConnector(BaseConnection):
         >>> conversations = connector.list_conversations(mailbox_id=12345)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, http2: bool = False) -> None:
         """Initialize the HelpScout connector."""
         super().__init__()
         self._access_token: Optional[str] = None
         self._token_expires_at: float = 0.0
+        self._http2 = http2
+        self._session: Optional[Union[requests.Session, "httpx.Client"]] = None
+        # Transport exceptions wrapped in ConnectionError; httpx's are added
+        # when the HTTP/2 client is created
+        self._transport_errors: Tuple[Type[Exception], ...] = (requests.RequestException,)
+        # Serializes token fetches so concurrent callers never refresh twice
+        self._token_lock = threading.Lock()
+        # This app's shared bucket, looked up on first request
+        self._rate_limiter: Optional[TokenBucket] = None
+        self._stop_event = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
 
     def connect(self) -> None:
         """
         Establish connection to HelpScout by obtaining an OAuth2 token.
 
+        Also starts a daemon thread that renews the token shortly before it
+        expires, so requests do not pay for the token round-trip.
+
         Raises:
             CredentialError: If HelpScout credentials are missing or invalid
             AuthenticationError: If OAuth2 token request fails
@@ -55,8 +232,10 @@ class HelpScoutConnector(BaseConnection):
         """
         try:
             creds = self._credential_manager.get_helpscout_credentials()
-            self._fetch_token(creds["app_id"], creds["app_secret"])
+            with self._token_lock:
+                self._fetch_token(creds["app_id"], creds["app_secret"])
             self._is_connected = True
+            self._start_refresh_thread()
             logger.info("Successfully connected to HelpScout")
         except AuthenticationError:
             logger.error("Failed to connect to HelpScout: authentication failed")
@@ -66,9 +245,12 @@ class HelpScoutConnector(BaseConnection):
             raise ConnectionError(f"Failed to connect to HelpScout: {str(e)}") from e
 
     def disconnect(self) -> None:
-        """Clear the HelpScout connection and token."""
+        """Stop token refresh, close the pooled session, and clear the token."""
+        self._stop_refresh_thread()
+        self._close_session()
         self._access_token = None
         self._token_expires_at = 0.0
+        self._rate_limiter = None
         self._is_connected = False
         logger.debug("Disconnected from HelpScout")
 
@@ -95,6 +277,10 @@ class HelpScoutConnector(BaseConnection):
         """
         Fetch an OAuth2 access token using client credentials.
 
+        A token cached by any connector for the same credentials is reused
+        if it is not the one this connector already holds (which callers
+        are replacing) and is valid past the background refresh window.
+
         Args:
             app_id: HelpScout OAuth2 application ID
             app_secret: HelpScout OAuth2 application secret
@@ -102,17 +288,18 @@ class HelpScoutConnector(BaseConnection):
         Raises:
             AuthenticationError: If token request fails
         """
+        key = (app_id, app_secret)
+        cached = _cached_token(key, self._access_token)
+        if cached is not None:
+            self._access_token, self._token_expires_at = cached
+            logger.debug("Reusing cached HelpScout OAuth2 token")
+            return
+
         try:
-            resp = requests.post(
-                HELPSCOUT_TOKEN_URL,
-                data={
-                    "grant_type": "client_credentials",
-                    "client_id": app_id,
-                    "client_secret": app_secret,
-                },
-                timeout=30,
+            resp = self._get_session().post(
+                HELPSCOUT_TOKEN_URL, data=_token_request_body(app_id, app_secret), timeout=30
             )
-        except requests.RequestException as e:
+        except self._transport_errors as e:
             raise ConnectionError(f"Failed to reach HelpScout token endpoint: {e}") from e
 
         if resp.status_code != 200:
@@ -120,18 +307,119 @@ class HelpScoutConnector(BaseConnection):
                 f"HelpScout OAuth2 token request failed ({resp.status_code}): {resp.text}"
             )
 
-        data = resp.json()
-        self._access_token = data["access_token"]
-        # Expire slightly early to avoid edge cases
-        self._token_expires_at = time.time() + data.get("expires_in", 172800) - 60
+        self._access_token, self._token_expires_at = _store_token(key, resp.json())
         logger.debug("HelpScout OAuth2 token obtained")
 
-    def _refresh_token_if_needed(self) -> None:
-        """Re-fetch the OAuth2 token if it has expired."""
-        if time.time() >= self._token_expires_at:
-            logger.debug("HelpScout token expired, refreshing")
+    def _ensure_fresh_token(self) -> None:
+        """Re-fetch the OAuth2 token if it expires within _TOKEN_EXPIRY_MARGIN."""
+        if time.time() < self._token_expires_at - _TOKEN_EXPIRY_MARGIN:
+            return
+        with self._token_lock:
+            # Another thread may have refreshed while we waited for the lock
+            if time.time() >= self._token_expires_at - _TOKEN_EXPIRY_MARGIN:
+                logger.debug("HelpScout token expiring, refreshing")
+                creds = self._credential_manager.get_helpscout_credentials()
+                self._fetch_token(creds["app_id"], creds["app_secret"])
+
+    def _replace_rejected_token(self, rejected_token: Optional[str]) -> None:
+        """
+        Fetch a new token after a 401, unless another thread already has.
+
+        Args:
+            rejected_token: The access token the API refused
+        """
+        with self._token_lock:
+            if self._access_token == rejected_token:
+                creds = self._credential_manager.get_helpscout_credentials()
+                self._fetch_token(creds["app_id"], creds["app_secret"])
+
+    def _start_refresh_thread(self) -> None:
+        """Start the background token refresher, if it is not already running."""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._stop_event = threading.Event()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop, name="HelpScout-token-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def _stop_refresh_thread(self) -> None:
+        """Stop the background token refresher, if one is running."""
+        self._stop_event.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=5)
+            self._refresh_thread = None
+
+    def _refresh_loop(self) -> None:
+        """
+        Renew the token shortly before it expires until disconnect() is called.
+
+        Failures are logged and retried after _TOKEN_REFRESH_POLL seconds;
+        requests fall back to refreshing inline if the token does expire.
+        """
+        while True:
+            delay = self._token_expires_at - _TOKEN_REFRESH_SKEW - time.time()
+            if self._stop_event.wait(max(_TOKEN_REFRESH_POLL, delay)):
+                return
+            if time.time() < self._token_expires_at - _TOKEN_REFRESH_SKEW:
+                continue
+            try:
+                creds = self._credential_manager.get_helpscout_credentials()
+                with self._token_lock:
+                    self._fetch_token(creds["app_id"], creds["app_secret"])
+                logger.debug("HelpScout token renewed in background")
+            except Exception as e:
+                logger.warning(f"Background HelpScout token refresh failed: {str(e)}")
+
+    def _get_session(self) -> Union[requests.Session, "httpx.Client"]:
+        """
+        Return the pooled session, creating it on first use.
+
+        The Authorization header is sent per request rather than stored on
+        the session, so a refreshed token takes effect immediately.
+
+        Raises:
+            ImportError: If http2 was requested and httpx[http2] is not installed
+        """
+        if self._session is None:
+            self._session = self._create_http2_client() if self._http2 else create_session()
+        return self._session
+
+    def _create_http2_client(self) -> "httpx.Client":
+        """
+        Create an HTTP/2 httpx client; it accepts the same call arguments as requests.
+
+        Raises:
+            ImportError: If httpx or its h2 dependency is not installed
+        """
+        try:
+            import h2  # noqa: F401
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "httpx[http2] is required for HelpScoutConnector(http2=True). "
+                "Install with: pip install ccef-connections[http2]"
+            )
+
+        self._transport_errors = (requests.RequestException, httpx.HTTPError)
+        return httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            timeout=30,
+        )
+
+    def _close_session(self) -> None:
+        """Close the pooled session, if one is open."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _get_rate_limiter(self) -> TokenBucket:
+        """Return the shared rate limiter for this connector's HelpScout app."""
+        if self._rate_limiter is None:
             creds = self._credential_manager.get_helpscout_credentials()
-            self._fetch_token(creds["app_id"], creds["app_secret"])
+            self._rate_limiter = _app_bucket(creds["app_id"])
+        return self._rate_limiter
 
     def _get_headers(self) -> Dict[str, str]:
         """
@@ -140,7 +428,7 @@ class HelpScoutConnector(BaseConnection):
         Returns:
             Dict with Authorization and Content-Type headers
         """
-        self._refresh_token_if_needed()
+        self._ensure_fresh_token()
         return {
             "Authorization": f"Bearer {self._access_token}",
             "Content-Type": "application/json",
@@ -176,44 +464,63 @@ class HelpScoutConnector(BaseConnection):
             self.connect()
 
         url = f"{HELPSCOUT_API_BASE}{path}"
+        rate_limiter = self._get_rate_limiter()
+        refreshed = False
+        attempt = 0
 
-        try:
-            resp = requests.request(
-                method,
-                url,
-                headers=self._get_headers(),
-                params=params,
-                json=json_body,
-                timeout=30,
-            )
-        except requests.RequestException as e:
-            raise ConnectionError(f"HelpScout API request failed: {e}") from e
-
-        # Auto-refresh on 401 and retry once
-        if resp.status_code == 401:
-            logger.debug("Received 401, refreshing token and retrying")
-            self._token_expires_at = 0.0  # Force refresh
+        while True:
+            headers = self._get_headers()
             try:
-                resp = requests.request(
+                # A 429 pauses the limiter, so this also waits out Retry-After
+                rate_limiter.acquire()
+                resp = self._get_session().request(
                     method,
                     url,
-                    headers=self._get_headers(),
+                    headers=headers,
                     params=params,
                     json=json_body,
                     timeout=30,
                 )
-            except requests.RequestException as e:
-                raise ConnectionError(f"HelpScout API request failed on retry: {e}") from e
+            except self._transport_errors as e:
+                raise ConnectionError(f"HelpScout API request failed: {e}") from e
 
+            # Auto-refresh on 401 and retry once. The background refresher should
+            # make this rare, so log it where it will be noticed.
             if resp.status_code == 401:
-                raise AuthenticationError("HelpScout authentication failed after token refresh")
+                if refreshed:
+                    raise AuthenticationError(
+                        "HelpScout authentication failed after token refresh"
+                    )
+                logger.warning("HelpScout returned 401, refreshing token and retrying")
+                self._replace_rejected_token(headers["Authorization"][len("Bearer ") :])
+                refreshed = True
+                continue
+
+            if resp.status_code == 429:
+                retry_after = int(resp.headers.get("X-RateLimit-Retry-After", 10))
+                rate_limiter.pause(retry_after)
+                if retry_after <= MAX_INLINE_RETRY_AFTER and attempt < MAX_INLINE_RETRIES:
+                    attempt += 1
+                    logger.debug(f"HelpScout 429, retrying in {retry_after}s")
+                    continue
+                raise RateLimitError(
+                    f"HelpScout rate limit exceeded, retry after {retry_after}s",
+                    retry_after=retry_after,
+                )
 
-        if resp.status_code == 429:
-            retry_after = int(resp.headers.get("X-RateLimit-Retry-After", 10))
-            raise RateLimitError(
-                f"HelpScout rate limit exceeded, retry after {retry_after}s",
-                retry_after=retry_after,
-            )
+            if (
+                resp.status_code >= 500
+                and method.upper() in _IDEMPOTENT_METHODS
+                and attempt < MAX_INLINE_RETRIES
+            ):
+                # Full-jitter exponential backoff: up to 1s, 2s, 4s
+                delay = random.uniform(0, 2.0**attempt)
+                attempt += 1
+                logger.debug(f"HelpScout {resp.status_code}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            break
 
         if resp.status_code in (201, 204):
             return None
@@ -230,50 +537,94 @@ class HelpScoutConnector(BaseConnection):
         path: str,
         params: Optional[Dict[str, Any]] = None,
         resource_key: Optional[str] = None,
+        max_workers: int = DEFAULT_PAGE_WORKERS,
     ) -> List[Dict[str, Any]]:
         """
-        Generic pagination helper that follows _links.next across pages.
+        Generic pagination helper that collects every page.
+
+        Page 1 is fetched first to learn ``page.totalPages``; pages
+        2..totalPages are then fetched concurrently and reassembled in page
+        order. Responses without a page count, or a last page that still
+        links onward, are followed one ``_links.next`` at a time.
 
         Args:
             path: Initial API path
             params: Query parameters for the first request
             resource_key: Key in _embedded that contains the resource list
                 (e.g., 'conversations', 'mailboxes', 'threads')
+            max_workers: Concurrent page requests; 1 follows links serially
 
         Returns:
             Combined list of all resources across pages
         """
-        results: List[Dict[str, Any]] = []
-        current_path = path
-        current_params = params
+        first = self._request("GET", path, params=params)
+        if first is None:
+            return []
+        pages: List[Optional[Dict[str, Any]]] = [first]
+
+        page_info = first.get("page", {})
+        total_pages = page_info.get("totalPages", 1)
+        if (
+            max_workers > 1
+            and _next_path(first)
+            and page_info.get("number", 1) == 1
+            and total_pages > 1
+        ):
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, total_pages - 1),
+                thread_name_prefix="helpscout-page",
+            ) as pool:
+                pages.extend(
+                    pool.map(
+                        lambda n: self._request("GET", path, params=dict(params or {}, page=n)),
+                        range(2, total_pages + 1),
+                    )
+                )
 
-        while True:
-            data = self._request("GET", current_path, params=current_params)
+        last = pages[-1]
+        next_path = _next_path(last) if last is not None else None
+        while next_path:
+            # params are encoded in the next URL
+            data = self._request("GET", next_path)
             if data is None:
                 break
+            pages.append(data)
+            next_path = _next_path(data)
 
-            embedded = data.get("_embedded", {})
-            if resource_key and resource_key in embedded:
-                results.extend(embedded[resource_key])
-            elif embedded:
-                # Use the first key in _embedded
-                for key in embedded:
-                    results.extend(embedded[key])
-                    break
-
-            # Follow next page link
-            next_link = data.get("_links", {}).get("next", {}).get("href")
-            if not next_link:
-                break
+        results: List[Dict[str, Any]] = []
+        for data in pages:
+            if data is not None:
+                results.extend(_embedded_items(data, resource_key))
+        return results
 
-            # next_link is a full URL; extract the path portion
-            if next_link.startswith(HELPSCOUT_API_BASE):
-                current_path = next_link[len(HELPSCOUT_API_BASE):]
-            else:
-                current_path = next_link
-            current_params = None  # params are encoded in the next URL
+    def _iter_paginate(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        resource_key: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield resources page by page, following _links.next.
 
-        return results
+        Only one page is held at a time, so memory stays flat however many
+        pages there are, and the first resource arrives after one request.
+
+        Args:
+            path: Initial API path
+            params: Query parameters for the first request
+            resource_key: Key in _embedded that contains the resource list
+
+        Yields:
+            Each resource dict, in API order
+        """
+        next_path: Optional[str] = path
+        while next_path:
+            data = self._request("GET", next_path, params=params)
+            if data is None:
+                return
+            yield from _embedded_items(data, resource_key)
+            next_path = _next_path(data)
+            params = None  # params are encoded in the next URL
 
     # ── Mailboxes ─────────────────────────────────────────────────────
 
@@ -294,6 +645,15 @@ class HelpScoutConnector(BaseConnection):
         """
         return self._paginate("/mailboxes", resource_key="mailboxes")
 
+    def iter_mailboxes(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream mailboxes one at a time instead of building a list.
+
+        Yields:
+            Mailbox dicts
+        """
+        return self._iter_paginate("/mailboxes", resource_key="mailboxes")
+
     # ── Conversations (read) ──────────────────────────────────────────
 
     @retry_helpscout_operation
@@ -321,14 +681,38 @@ class HelpScoutConnector(BaseConnection):
             ...     mailbox_id=12345, status='active'
             ... )
         """
-        params: Dict[str, Any] = {"mailbox": mailbox_id}
-        if status:
-            params["status"] = status
-        if tag:
-            params["tag"] = tag
-        params.update(kwargs)
+        params = _conversation_params(mailbox_id, status, tag, kwargs)
         return self._paginate("/conversations", params=params, resource_key="conversations")
 
+    def iter_conversations(
+        self,
+        mailbox_id: int,
+        status: Optional[str] = None,
+        tag: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream conversations one at a time instead of building a list.
+
+        Pages are requested as the iterator is consumed, so processing can
+        start after the first page of a large mailbox.
+
+        Args:
+            mailbox_id: The mailbox ID to query
+            status: Filter by status ('active', 'pending', 'closed', 'all')
+            tag: Filter by tag name
+            **kwargs: Additional query parameters (e.g., sortField)
+
+        Yields:
+            Conversation dicts
+
+        Examples:
+            >>> for conversation in connector.iter_conversations(12345, status='active'):
+            ...     process(conversation)
+        """
+        params = _conversation_params(mailbox_id, status, tag, kwargs)
+        return self._iter_paginate("/conversations", params=params, resource_key="conversations")
+
     @retry_helpscout_operation
     def get_conversation(self, conversation_id: int) -> Dict[str, Any]:
         """
@@ -367,6 +751,21 @@ class HelpScoutConnector(BaseConnection):
             resource_key="threads",
         )
 
+    def iter_threads(self, conversation_id: int) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the threads (messages) of a conversation one at a time.
+
+        Args:
+            conversation_id: The conversation ID
+
+        Yields:
+            Thread dicts with message content
+        """
+        return self._iter_paginate(
+            f"/conversations/{conversation_id}/threads",
+            resource_key="threads",
+        )
+
     # ── Conversations (write) ─────────────────────────────────────────
 
     @retry_helpscout_operation
@@ -396,12 +795,7 @@ class HelpScoutConnector(BaseConnection):
             ...     customer_id=12345,
             ... )
         """
-        body: Dict[str, Any] = {
-            "customer": {"id": customer_id},
-            "text": text,
-            "draft": draft,
-        }
-        body.update(kwargs)
+        body = _reply_body(text, customer_id, draft, kwargs)
         self._request("POST", f"/conversations/{conversation_id}/reply", json_body=body)
 
     @retry_helpscout_operation
@@ -439,14 +833,7 @@ class HelpScoutConnector(BaseConnection):
         Examples:
             >>> connector.update_conversation_status(98765, 'closed')
         """
-        valid_statuses = ("active", "pending", "closed")
-        if status not in valid_statuses:
-            raise ValueError(
-                f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}"
-            )
         self._request(
-            "PATCH",
-            f"/conversations/{conversation_id}",
-            json_body={"op": "replace", "path": "/status", "value": status},
+            "PATCH", f"/conversations/{conversation_id}", json_body=_status_body(status)
         )
 
@@ -0,0 +1,555 @@
+"""
+Async HelpScout connector for CCEF connections library.
+
+asyncio/aiohttp counterpart to HelpScoutConnector for batch work such as
+replying to or closing many conversations. One pooled aiohttp session
+keeps up to ``concurrency`` requests in flight, so N writes cost about
+ceil(N / concurrency) round-trips instead of N, and paginated reads fetch
+pages 2..N together once page 1 reports ``page.totalPages``.
+
+Quota and credentials are shared with the sync connector: requests draw
+from the same per-app rate limiter, and OAuth2 tokens come from the
+same token cache. Each ``_request`` is retried on its own by
+retry_helpscout_operation (tenacity awaits coroutines natively).
+
+Requires the optional ``async`` extra:
+    pip install "ccef-connections[async]"
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..core.credentials import CredentialManager
+from ..core.http import json_loads
+from ..core.ratelimit import TokenBucket
+from ..core.retry import retry_helpscout_operation
+from ..exceptions import AuthenticationError, ConnectionError, RateLimitError
+from .helpscout import (
+    HELPSCOUT_API_BASE,
+    HELPSCOUT_TOKEN_URL,
+    _TOKEN_EXPIRY_MARGIN,
+    _app_bucket,
+    _cached_token,
+    _conversation_params,
+    _embedded_items,
+    _next_path,
+    _reply_body,
+    _status_body,
+    _store_token,
+    _token_request_body,
+)
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency: pip install ccef-connections[async]
+    aiohttp = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of HTTP requests in flight on one connector
+DEFAULT_CONCURRENCY = 8
+
+
+class AsyncHelpScoutConnector:
+    """
+    Async HelpScout connector for concurrent reads and batch writes.
+
+    Mirrors the surface of HelpScoutConnector with ``async def`` methods,
+    plus reply_many and close_many for fanning writes out across many
+    conversations. A semaphore admits at most ``concurrency`` requests at a
+    time, so a request's timeout only starts once it is admitted.
+
+    Args:
+        concurrency: Maximum number of simultaneous HTTP requests
+
+    Raises:
+        ValueError: If concurrency is less than 1
+
+    Examples:
+        >>> async with AsyncHelpScoutConnector() as hs:
+        ...     conversations = await hs.list_conversations(12345, status="active")
+        ...     results = await hs.close_many([c["id"] for c in conversations])
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY) -> None:
+        """Initialize the async HelpScout connector."""
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        self._concurrency = concurrency
+        self._credential_manager = CredentialManager()
+        self._access_token: Optional[str] = None
+        self._token_expires_at: float = 0.0
+        self._session: Optional["aiohttp.ClientSession"] = None
+        # asyncio primitives bind to the running loop, so they are created in
+        # connect() (or on first use, for the semaphore)
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # This app's bucket, shared with HelpScoutConnector; looked up on first request
+        self._rate_limiter: Optional[TokenBucket] = None
+        self._is_connected: bool = False
+        logger.debug(f"Initialized {self.__class__.__name__}")
+
+    async def connect(self) -> None:
+        """
+        Open the pooled aiohttp session and obtain an OAuth2 token.
+
+        Raises:
+            ImportError: If aiohttp is not installed
+            AuthenticationError: If OAuth2 token request fails
+            ConnectionError: If connection setup fails
+        """
+        await self._close_session()
+        self._session = self._create_session()
+        self._token_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(self._concurrency)
+        try:
+            await self._fetch_token()
+        except AuthenticationError:
+            logger.error("Failed to connect to HelpScout: authentication failed")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to connect to HelpScout: {str(e)}")
+            raise ConnectionError(f"Failed to connect to HelpScout: {str(e)}") from e
+        self._is_connected = True
+        logger.info("Successfully connected to HelpScout (async)")
+
+    async def disconnect(self) -> None:
+        """Close the aiohttp session and clear the token."""
+        await self._close_session()
+        self._semaphore = None
+        self._access_token = None
+        self._token_expires_at = 0.0
+        self._rate_limiter = None
+        self._is_connected = False
+        logger.debug("Disconnected from HelpScout (async)")
+
+    async def health_check(self) -> bool:
+        """
+        Check connection health by calling GET /v2/users/me.
+
+        Returns:
+            True if connected and token is valid, False otherwise
+        """
+        if not self._is_connected or not self._access_token:
+            return False
+        try:
+            await self._request("GET", "/users/me")
+            return True
+        except Exception:
+            return False
+
+    def is_connected(self) -> bool:
+        """
+        Check if currently connected to HelpScout.
+
+        Returns:
+            True if connected, False otherwise
+        """
+        return self._is_connected
+
+    async def __aenter__(self) -> "AsyncHelpScoutConnector":
+        """Connect on ``async with`` entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Disconnect on ``async with`` exit."""
+        await self.disconnect()
+
+    def __repr__(self) -> str:
+        """Return a short status representation."""
+        status = "connected" if self._is_connected else "disconnected"
+        return f"<{self.__class__.__name__} status={status}>"
+
+    # -- Token management -----------------------------------------------------
+
+    async def _fetch_token(self) -> None:
+        """
+        Obtain an OAuth2 token, reusing one cached by any HelpScout connector.
+
+        Raises:
+            AuthenticationError: If token request fails
+            ConnectionError: If the token endpoint cannot be reached
+        """
+        creds = self._credential_manager.get_helpscout_credentials()
+        key = (creds["app_id"], creds["app_secret"])
+        cached = _cached_token(key, self._access_token)
+        if cached is not None:
+            self._access_token, self._token_expires_at = cached
+            logger.debug("Reusing cached HelpScout OAuth2 token")
+            return
+
+        session = self._session
+        if session is None:
+            raise ConnectionError("HelpScout session is not open")
+
+        try:
+            async with session.post(
+                HELPSCOUT_TOKEN_URL, data=_token_request_body(*key)
+            ) as resp:
+                if resp.status != 200:
+                    raise AuthenticationError(
+                        f"HelpScout OAuth2 token request failed ({resp.status}): "
+                        f"{await resp.text()}"
+                    )
+                data = json_loads(await resp.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise ConnectionError(f"Failed to reach HelpScout token endpoint: {e}") from e
+
+        self._access_token, self._token_expires_at = _store_token(key, data)
+        logger.debug("HelpScout OAuth2 token obtained")
+
+    async def _refresh_token(self, stale_token: Optional[str]) -> None:
+        """
+        Replace stale_token, unless another coroutine already has.
+
+        Args:
+            stale_token: The expired or rejected access token
+        """
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        async with self._token_lock:
+            if self._access_token == stale_token:
+                await self._fetch_token()
+
+    async def _get_headers(self) -> Dict[str, str]:
+        """
+        Return authorization headers, refreshing the token if it is about to expire.
+
+        Returns:
+            Dict with Authorization and Content-Type headers
+        """
+        if time.time() >= self._token_expires_at - _TOKEN_EXPIRY_MARGIN:
+            logger.debug("HelpScout token expiring, refreshing")
+            await self._refresh_token(self._access_token)
+        return {
+            "Authorization": f"Bearer {self._access_token}",
+            "Content-Type": "application/json",
+        }
+
+    # -- HTTP helpers ---------------------------------------------------------
+
+    def _create_session(self) -> "aiohttp.ClientSession":
+        """
+        Create the pooled aiohttp session.
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for AsyncHelpScoutConnector. "
+                "Install with: pip install ccef-connections[async]"
+            )
+
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self._concurrency, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the request semaphore, creating it on first use."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        return self._semaphore
+
+    def _get_rate_limiter(self) -> TokenBucket:
+        """Return the shared rate limiter for this connector's HelpScout app."""
+        if self._rate_limiter is None:
+            creds = self._credential_manager.get_helpscout_credentials()
+            self._rate_limiter = _app_bucket(creds["app_id"])
+        return self._rate_limiter
+
+    async def _close_session(self) -> None:
+        """Close the aiohttp session, if one is open."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @retry_helpscout_operation
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Central async HTTP method with auth headers and auto-refresh on 401.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, PATCH, DELETE)
+            path: API path relative to /v2 (e.g., '/mailboxes')
+            params: Query parameters
+            json_body: JSON request body
+
+        Returns:
+            Parsed JSON response, or None for 201/204 or an empty body
+
+        Raises:
+            AuthenticationError: If authentication fails after a token refresh
+            RateLimitError: If rate limited by the API
+            ConnectionError: If the request fails
+        """
+        if self._session is None:
+            await self.connect()
+        session = self._session
+        if session is None:
+            raise ConnectionError("HelpScout session is not open")
+
+        url = f"{HELPSCOUT_API_BASE}{path}"
+        rate_limiter = self._get_rate_limiter()
+
+        refreshed = False
+        while True:
+            headers = await self._get_headers()
+            try:
+                # Hold a slot before sending: aiohttp counts time spent waiting
+                # for a pooled connection against ClientTimeout, so queueing on
+                # the pool instead would time out requests that were never sent
+                async with self._get_semaphore():
+                    await rate_limiter.acquire_async()
+                    async with session.request(
+                        method, url, headers=headers, params=params, json=json_body
+                    ) as resp:
+                        if resp.status == 401 and not refreshed:
+                            logger.warning(
+                                "HelpScout returned 401, refreshing token and retrying"
+                            )
+                            rejected = headers["Authorization"][len("Bearer ") :]
+                        elif resp.status == 401:
+                            raise AuthenticationError(
+                                "HelpScout authentication failed after token refresh"
+                            )
+                        elif resp.status == 429:
+                            retry_after = int(resp.headers.get("X-RateLimit-Retry-After", 10))
+                            rate_limiter.pause(retry_after)
+                            raise RateLimitError(
+                                f"HelpScout rate limit exceeded, retry after {retry_after}s",
+                                retry_after=retry_after,
+                            )
+                        elif resp.status in (201, 204):
+                            return None
+                        elif resp.status >= 400:
+                            raise ConnectionError(
+                                f"HelpScout API error {resp.status}: {await resp.text()}"
+                            )
+                        else:
+                            body = await resp.read()
+                            return json_loads(body) if body else None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise ConnectionError(f"HelpScout API request failed: {e}") from e
+
+            # Only a first 401 gets here; refresh outside the slot and retry once
+            await self._refresh_token(rejected)
+            refreshed = True
+
+    async def _paginate(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        resource_key: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every page, requesting pages 2..N concurrently.
+
+        Page 1 is fetched first to learn ``page.totalPages``; the remaining
+        pages are then gathered together, and results keep page order.
+        Responses without a page count fall back to following
+        ``_links.next`` one page at a time.
+
+        Args:
+            path: Initial API path
+            params: Query parameters for the first request
+            resource_key: Key in _embedded that contains the resource list
+
+        Returns:
+            Combined list of all resources across pages
+        """
+        first = await self._request("GET", path, params=params)
+        if first is None:
+            return []
+        pages: List[Optional[Dict[str, Any]]] = [first]
+
+        page_info = first.get("page", {})
+        total_pages = page_info.get("totalPages", 1)
+        next_path = _next_path(first)
+        if next_path and page_info.get("number", 1) == 1 and total_pages > 1:
+            # Pages are requested concurrently, so each needs its own params dict
+            pages.extend(
+                await asyncio.gather(
+                    *(
+                        self._request("GET", path, params=dict(params or {}, page=n))
+                        for n in range(2, total_pages + 1)
+                    )
+                )
+            )
+        else:
+            while next_path:
+                data = await self._request("GET", next_path)
+                if data is None:
+                    break
+                pages.append(data)
+                next_path = _next_path(data)
+
+        results: List[Dict[str, Any]] = []
+        for data in pages:
+            if data is not None:
+                results.extend(_embedded_items(data, resource_key))
+        return results
+
+    # -- Mailboxes ------------------------------------------------------------
+
+    async def list_mailboxes(self) -> List[Dict[str, Any]]:
+        """List all available HelpScout mailboxes."""
+        return await self._paginate("/mailboxes", resource_key="mailboxes")
+
+    # -- Conversations (read) -------------------------------------------------
+
+    async def list_conversations(
+        self,
+        mailbox_id: int,
+        status: Optional[str] = None,
+        tag: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        List conversations from a mailbox with optional filters.
+
+        Args:
+            mailbox_id: The mailbox ID to query
+            status: Filter by status ('active', 'pending', 'closed', 'all')
+            tag: Filter by tag name
+            **kwargs: Additional query parameters (e.g., sortField)
+
+        Returns:
+            List of conversation dicts
+        """
+        params = _conversation_params(mailbox_id, status, tag, kwargs)
+        return await self._paginate("/conversations", params=params, resource_key="conversations")
+
+    async def get_conversation(self, conversation_id: int) -> Dict[str, Any]:
+        """
+        Get a single conversation by ID.
+
+        Args:
+            conversation_id: The conversation ID
+
+        Returns:
+            Conversation dict
+        """
+        result = await self._request("GET", f"/conversations/{conversation_id}")
+        return result or {}
+
+    async def list_threads(self, conversation_id: int) -> List[Dict[str, Any]]:
+        """List all threads (messages) in a conversation."""
+        return await self._paginate(
+            f"/conversations/{conversation_id}/threads", resource_key="threads"
+        )
+
+    # -- Conversations (write) ------------------------------------------------
+
+    async def reply_to_conversation(
+        self,
+        conversation_id: int,
+        text: str,
+        customer_id: int,
+        draft: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Reply to a conversation.
+
+        Args:
+            conversation_id: The conversation ID
+            text: Reply body (HTML supported)
+            customer_id: Customer ID (required by the HelpScout API)
+            draft: If True, save as draft instead of sending
+            **kwargs: Additional fields (cc, bcc, attachments, etc.)
+        """
+        body = _reply_body(text, customer_id, draft, kwargs)
+        await self._request("POST", f"/conversations/{conversation_id}/reply", json_body=body)
+
+    async def add_note(self, conversation_id: int, text: str) -> None:
+        """
+        Add an internal note to a conversation.
+
+        Args:
+            conversation_id: The conversation ID
+            text: Note body (HTML supported)
+        """
+        await self._request(
+            "POST", f"/conversations/{conversation_id}/notes", json_body={"text": text}
+        )
+
+    async def update_conversation_status(self, conversation_id: int, status: str) -> None:
+        """
+        Update the status of a conversation.
+
+        Args:
+            conversation_id: The conversation ID
+            status: New status ('active', 'pending', or 'closed')
+
+        Raises:
+            ValueError: If status is not a valid value
+        """
+        await self._request(
+            "PATCH", f"/conversations/{conversation_id}", json_body=_status_body(status)
+        )
+
+    async def reply_many(
+        self, items: Iterable[Tuple[int, str, int]], draft: bool = False
+    ) -> List[Optional[BaseException]]:
+        """
+        Reply to many conversations concurrently.
+
+        A failure for one reply does not cancel the others; its exception
+        is returned in place of None so callers can log or requeue just the
+        failed replies. Outcomes are a list in input order rather than a
+        dict, since one conversation may receive several replies.
+
+        Args:
+            items: ``(conversation_id, text, customer_id)`` triples
+            draft: If True, save every reply as a draft
+
+        Returns:
+            One entry per item, in order: None on success or the exception
+            raised for it
+
+        Examples:
+            >>> items = [(101, "Thanks!", 55), (102, "Thanks!", 56)]
+            >>> results = await hs.reply_many(items)
+            >>> failed = [item for item, error in zip(items, results) if error is not None]
+        """
+        return await asyncio.gather(
+            *(
+                self.reply_to_conversation(conversation_id, text, customer_id, draft=draft)
+                for conversation_id, text, customer_id in items
+            ),
+            return_exceptions=True,
+        )
+
+    async def close_many(
+        self, conversation_ids: Iterable[int]
+    ) -> Dict[int, Optional[BaseException]]:
+        """
+        Close many conversations concurrently.
+
+        A conversation ID listed more than once is closed once per entry
+        and its dict entry holds the last outcome.
+
+        Args:
+            conversation_ids: IDs of the conversations to close
+
+        Returns:
+            Dict mapping each conversation_id to None on success or the
+            exception raised for it
+        """
+        ids = list(conversation_ids)
+        outcomes = await asyncio.gather(
+            *(self.update_conversation_status(cid, "closed") for cid in ids),
+            return_exceptions=True,
+        )
+        return dict(zip(ids, outcomes))
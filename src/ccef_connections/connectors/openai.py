@@ -7,7 +7,7 @@ management and support for structured outputs.
 
 import logging
 import os
-from typing import Any, Optional, Type
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
 
 from langchain_core.prompts import ChatPromptTemplate
 from langchain.chat_models import init_chat_model
@@ -44,6 +44,12 @@ class OpenAIConnector(BaseConnection):
         """Initialize the OpenAI connector."""
         super().__init__()
         self._api_key: Optional[str] = None
+        # Chat models keyed by (model, temperature, sorted kwargs), and
+        # prompt | structured-model chains keyed by (model, temperature,
+        # response_model). Building either compiles pydantic schemas, which
+        # dominates the cost of small calls made in a loop.
+        self._model_cache: Dict[Tuple[Any, ...], Any] = {}
+        self._chain_cache: Dict[Tuple[Any, ...], Any] = {}
 
     def connect(self) -> None:
         """
@@ -68,8 +74,10 @@ class OpenAIConnector(BaseConnection):
             raise ConnectionError(f"Failed to connect to OpenAI: {str(e)}") from e
 
     def disconnect(self) -> None:
-        """Clean up OpenAI connection."""
+        """Clean up OpenAI connection and drop cached models."""
         self._api_key = None
+        self._model_cache.clear()
+        self._chain_cache.clear()
         self._is_connected = False
         logger.debug("Disconnected from OpenAI")
 
@@ -91,6 +99,10 @@ class OpenAIConnector(BaseConnection):
         """
         Get a configured chat model instance.
 
+        Models are cached per connector, so repeated calls with the same
+        arguments return the same instance. Unhashable kwargs values skip
+        the cache.
+
         Args:
             model: Model name (default: "gpt-4o")
             temperature: Temperature for generation (default: 0.1)
@@ -110,10 +122,21 @@ class OpenAIConnector(BaseConnection):
         if not self._is_connected:
             self.connect()
 
+        key: Optional[Tuple[Any, ...]] = (model, temperature, tuple(sorted(kwargs.items())))
+        try:
+            llm = self._model_cache.get(key)
+        except TypeError:
+            # An unhashable kwargs value (e.g. a dict) cannot be a cache key
+            key = None
+            llm = None
+        if llm is not None:
+            return llm
+
         logger.debug(f"Creating chat model: {model} (temperature={temperature})")
-        return init_chat_model(
-            model, model_provider="openai", temperature=temperature, **kwargs
-        )
+        llm = init_chat_model(model, model_provider="openai", temperature=temperature, **kwargs)
+        if key is not None:
+            self._model_cache[key] = llm
+        return llm
 
     @retry_openai_operation
     def invoke_with_structured_output(
@@ -128,7 +151,8 @@ class OpenAIConnector(BaseConnection):
         Invoke the model with structured output.
 
         This is a convenience method that wraps the common pattern of using
-        structured outputs with Pydantic models.
+        structured outputs with Pydantic models. The prompt | model chain is
+        built once per (model, temperature, response_model) and reused.
 
         Args:
             model: Model name (e.g., "gpt-4o")
@@ -155,19 +179,84 @@ class OpenAIConnector(BaseConnection):
             ... )
             >>> print(result.sentiment, result.summary)
         """
-        llm = self.get_chat_model(model, temperature=temperature)
-        structured_llm = llm.with_structured_output(response_model)
-
-        prompt_template = ChatPromptTemplate.from_messages(
-            [("system", "{system_prompt}"), ("human", "{user_content}")]
-        )
-
-        chain = prompt_template | structured_llm
+        chain = self._structured_chain(model, temperature, response_model)
         result = chain.invoke({"system_prompt": system_prompt, "user_content": user_content})
 
         logger.debug(f"Received structured output: {type(result).__name__}")
         return result
 
+    async def abatch_with_structured_output(
+        self,
+        model: str,
+        system_prompt: str,
+        user_contents: Sequence[str],
+        response_model: Type[BaseModel],
+        temperature: float = 0.1,
+        max_concurrency: int = 10,
+    ) -> List[BaseModel]:
+        """
+        Invoke the model with structured output for many inputs concurrently.
+
+        Runs the same chain as invoke_with_structured_output() through
+        LangChain's abatch(), so N items take about N / max_concurrency
+        round-trips instead of N. Each request is still retried by the
+        OpenAI client; the batch as a whole is not retried, and the first
+        failure is raised.
+
+        Args:
+            model: Model name (e.g., "gpt-4o")
+            system_prompt: System prompt shared by every item
+            user_contents: User message content, one per item
+            response_model: Pydantic model class for structured output
+            temperature: Temperature for generation
+            max_concurrency: Maximum requests in flight at once
+
+        Returns:
+            One response_model instance per item, in input order
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+
+        Examples:
+            >>> results = await connector.abatch_with_structured_output(
+            ...     "gpt-4o",
+            ...     "Classify the email as spam or not.",
+            ...     [email["body"] for email in emails],
+            ...     Classification,
+            ... )
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        if not user_contents:
+            return []
+
+        chain = self._structured_chain(model, temperature, response_model)
+        inputs = [
+            {"system_prompt": system_prompt, "user_content": content} for content in user_contents
+        ]
+        results = await chain.abatch(inputs, config={"max_concurrency": max_concurrency})
+
+        logger.debug(f"Received {len(results)} structured outputs: {response_model.__name__}")
+        return results
+
+    def _structured_chain(
+        self, model: str, temperature: float, response_model: Type[BaseModel]
+    ) -> Any:
+        """Return the cached prompt | structured-model chain, building it on first use."""
+        key = (model, temperature, response_model)
+        chain = self._chain_cache.get(key)
+        if chain is None:
+            llm = self.get_chat_model(model, temperature=temperature)
+            structured_llm = llm.with_structured_output(response_model)
+
+            prompt_template = ChatPromptTemplate.from_messages(
+                [("system", "{system_prompt}"), ("human", "{user_content}")]
+            )
+
+            chain = prompt_template | structured_llm
+            self._chain_cache[key] = chain
+        return chain
+
     def create_prompt_template(self, messages: list) -> ChatPromptTemplate:
         """
         Create a chat prompt template.
@@ -2,6 +2,8 @@
 
 from .base import BaseConnection
 from .credentials import CredentialManager, get_credential
+from .http import create_session, json_dumps, json_loads
+from .ratelimit import TokenBucket
 from .retry import (
     retry_with_backoff,
     retry_action_network_operation,
@@ -16,6 +18,10 @@ __all__ = [
     "BaseConnection",
     "CredentialManager",
     "get_credential",
+    "create_session",
+    "json_dumps",
+    "json_loads",
+    "TokenBucket",
     "retry_with_backoff",
     "retry_action_network_operation",
     "retry_airtable_operation",
@@ -0,0 +1,79 @@
+"""
+Shared HTTP session helpers for CCEF connections.
+
+Connectors that talk to REST APIs reuse a pooled requests.Session so that
+repeated calls to the same host keep their TCP/TLS connection alive
+instead of performing a new handshake on every request.
+
+Sessions advertise ``Accept-Encoding: gzip, deflate`` and decompress in C;
+with the ``speedups`` extra installed, urllib3 also advertises and decodes
+Brotli (``br``). The header is deliberately left to requests, since
+advertising ``br`` without a decoder would break responses.
+
+json_loads decodes response bodies with orjson when the ``speedups`` extra
+is installed, falling back to the standard library. It accepts the raw
+``resp.content`` bytes, which skips requests' charset detection. json_dumps
+is the matching compact encoder and always returns UTF-8 bytes.
+"""
+
+import json
+import logging
+from typing import Any, Callable, Mapping, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+
+    json_loads: Callable[[Union[bytes, str]], Any] = orjson.loads
+
+    def json_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Encode obj as compact JSON bytes."""
+        return orjson.dumps(obj, default=default)
+
+except ImportError:  # optional speedup: pip install ccef-connections[speedups]
+    json_loads = json.loads
+
+    def json_dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Encode obj as compact JSON bytes."""
+        text = json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False)
+        return text.encode("utf-8")
+
+logger = logging.getLogger(__name__)
+
+
+def create_session(
+    headers: Optional[Mapping[str, str]] = None,
+    pool_connections: int = 10,
+    pool_maxsize: int = 20,
+) -> requests.Session:
+    """
+    Create a requests.Session with a keep-alive connection pool.
+
+    Retries are left to the connector's tenacity decorators, so the adapter
+    is mounted with ``max_retries=0``.
+
+    Args:
+        headers: Default headers sent with every request on this session
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum connections kept alive per host; raise this when
+            issuing requests from several threads at once
+
+    Returns:
+        Configured requests.Session
+
+    Examples:
+        >>> session = create_session({"Authorization": "Bearer abc"})
+        >>> resp = session.get("https://api.example.com/items", timeout=30)
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if headers:
+        session.headers.update(headers)
+    logger.debug(f"Created HTTP session (pool_maxsize={pool_maxsize})")
+    return session
@@ -0,0 +1,91 @@
+"""
+Client-side rate limiting for CCEF connections.
+
+Retrying after a 429 wastes a round-trip, and when several threads share
+one API quota they tend to exhaust it together. A TokenBucket shared by
+those threads spaces requests out before they are sent instead.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``;
+    each acquire() spends one token, blocking until one is available.
+
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum tokens held, i.e. the largest burst allowed
+
+    Raises:
+        ValueError: If rate or capacity is not positive
+
+    Examples:
+        >>> bucket = TokenBucket(rate=5, capacity=5)
+        >>> bucket.acquire()  # returns at once while tokens remain
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a full bucket."""
+        if rate <= 0 or capacity <= 0:
+            raise ValueError(
+                f"rate and capacity must be positive, got rate={rate}, capacity={capacity}"
+            )
+        self._rate = float(rate)
+        self._capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        """Take a token if one is available; otherwise return seconds until one is."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self._rate
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one has refilled if the bucket is empty."""
+        while True:
+            wait = self._take()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Take one token like acquire(), but wait with asyncio.sleep."""
+        while True:
+            wait = self._take()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Grant no tokens for the next ``seconds``, e.g. after a server 429.
+
+        Every thread sharing the bucket then waits out the server's
+        Retry-After instead of sending requests that would also be refused.
+
+        Args:
+            seconds: How long to hold back requests
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            # With t tokens the next one is granted after (1 - t) / rate seconds
+            self._tokens = min(self._tokens, 1 - seconds * self._rate)
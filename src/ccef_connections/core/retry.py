@@ -6,21 +6,30 @@ with intelligent backoff strategies tailored to different API rate limits.
 """
 
 import logging
+import random
 from typing import Callable, Type, Tuple
 
 from tenacity import (
     retry,
     stop_after_attempt,
     wait_exponential,
+    wait_random_exponential,
     retry_if_exception_type,
+    retry_if_not_exception_type,
+    retry_base,
     before_sleep_log,
 )
 
-from ..exceptions import RateLimitError, ConnectionError
+from ..exceptions import ClientError, RateLimitError, ConnectionError
 
 logger = logging.getLogger(__name__)
 
 
+def _retry_unless_client_error(exceptions: Tuple[Type[BaseException], ...]) -> retry_base:
+    """Retry on the given exception types, except a non-retriable ClientError."""
+    return retry_if_exception_type(exceptions) & retry_if_not_exception_type(ClientError)
+
+
 def retry_with_backoff(
     max_attempts: int = 3,
     min_wait: float = 1.0,
@@ -50,7 +59,7 @@ def retry_with_backoff(
     return retry(
         stop=stop_after_attempt(max_attempts),
         wait=wait_exponential(multiplier=multiplier, min=min_wait, max=max_wait),
-        retry=retry_if_exception_type(exceptions),
+        retry=_retry_unless_client_error(exceptions),
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
     )
@@ -61,7 +70,10 @@ def retry_airtable_operation(func: Callable) -> Callable:
     Decorator for Airtable operations with rate limit handling.
 
     Airtable has a rate limit of 5 requests per second per base.
-    This decorator implements exponential backoff with appropriate timing.
+    This decorator implements full-jitter exponential backoff (a random
+    wait between 0 and the exponential cap) so threads that fail together
+    do not retry together. AirtableConnector also throttles each base with
+    a shared TokenBucket, and pyairtable honours Retry-After on 429.
 
     Args:
         func: The function to decorate
@@ -76,8 +88,8 @@ def retry_airtable_operation(func: Callable) -> Callable:
     """
     return retry(
         stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1.5, min=0.2, max=10.0),
-        retry=retry_if_exception_type((ConnectionError, RateLimitError, Exception)),
+        wait=wait_random_exponential(multiplier=1.5, max=10.0),
+        retry=_retry_unless_client_error((ConnectionError, RateLimitError, Exception)),
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
     )(func)
@@ -103,7 +115,7 @@ def retry_openai_operation(func: Callable) -> Callable:
     return retry(
         stop=stop_after_attempt(5),
         wait=wait_exponential(multiplier=2.0, min=1.0, max=60.0),
-        retry=retry_if_exception_type((ConnectionError, RateLimitError, Exception)),
+        retry=_retry_unless_client_error((ConnectionError, RateLimitError, Exception)),
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
     )(func)
@@ -114,7 +126,8 @@ def retry_google_operation(func: Callable) -> Callable:
     Decorator for Google API operations (Sheets, BigQuery) with retry logic.
 
     Google APIs have various rate limits depending on the service.
-    This implements a conservative retry strategy.
+    This implements a conservative retry strategy with full-jitter
+    exponential backoff, so concurrent callers spread their retries out.
 
     Args:
         func: The function to decorate
@@ -129,8 +142,8 @@ def retry_google_operation(func: Callable) -> Callable:
     """
     return retry(
         stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=2.0, min=1.0, max=60.0),
-        retry=retry_if_exception_type((ConnectionError, RateLimitError, Exception)),
+        wait=wait_random_exponential(multiplier=2.0, max=60.0),
+        retry=_retry_unless_client_error((ConnectionError, RateLimitError, Exception)),
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
     )(func)
@@ -157,7 +170,7 @@ def retry_helpscout_operation(func: Callable) -> Callable:
     return retry(
         stop=stop_after_attempt(5),
         wait=wait_exponential(multiplier=2.0, min=1.0, max=60.0),
-        retry=retry_if_exception_type((ConnectionError, RateLimitError, Exception)),
+        retry=_retry_unless_client_error((ConnectionError, RateLimitError, Exception)),
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
     )(func)
@@ -184,18 +197,44 @@ def retry_zoom_operation(func: Callable) -> Callable:
     return retry(
         stop=stop_after_attempt(5),
         wait=wait_exponential(multiplier=2.0, min=1.0, max=60.0),
-        retry=retry_if_exception_type((ConnectionError, RateLimitError, Exception)),
+        retry=_retry_unless_client_error((ConnectionError, RateLimitError, Exception)),
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
     )(func)
 
 
+# Full-jitter exponential backoff for Action Network's transient errors
+_an_backoff = wait_random_exponential(multiplier=1.0, max=30.0)
+
+
+def _wait_for_an_rate_limit(retry_state) -> float:
+    """
+    Wait out an Action Network 429, jittered so parallel callers spread out.
+
+    A RateLimitError with retry_after waits that long plus up to
+    ``min(retry_after, 2)`` random seconds. Anything else uses full-jitter
+    exponential backoff capped at 30s.
+    """
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, RateLimitError) and exc.retry_after:
+        delay = float(exc.retry_after)
+        return delay + random.uniform(0, min(delay, 2.0))
+    return _an_backoff(retry_state)
+
+
 def retry_action_network_operation(func: Callable) -> Callable:
     """
     Decorator for Action Network API operations with retry logic.
 
     Action Network has a rate limit of 4 requests per second.
-    This implements exponential backoff with 5 attempts.
+    This retries up to 5 attempts, honouring Retry-After on 429 and using
+    full-jitter exponential backoff otherwise, so concurrent workers do
+    not retry in lockstep. Only transient failures (RateLimitError and
+    ConnectionError from 5xx or the network) are retried; authentication
+    failures and non-retriable 4xx responses (ClientError) fail immediately.
+
+    ActionNetworkConnector applies this to ``_request``, so each HTTP call
+    is retried on its own rather than whole listings.
 
     Args:
         func: The function to decorate
@@ -210,8 +249,8 @@ def retry_action_network_operation(func: Callable) -> Callable:
     """
     return retry(
         stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=2.0, min=1.0, max=60.0),
-        retry=retry_if_exception_type((ConnectionError, RateLimitError, Exception)),
+        wait=_wait_for_an_rate_limit,
+        retry=_retry_unless_client_error((ConnectionError, RateLimitError)),
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
     )(func)
@@ -238,7 +277,7 @@ def retry_ptv_operation(func: Callable) -> Callable:
     return retry(
         stop=stop_after_attempt(5),
         wait=wait_exponential(multiplier=2.0, min=1.0, max=60.0),
-        retry=retry_if_exception_type((ConnectionError, RateLimitError)),
+        retry=_retry_unless_client_error((ConnectionError, RateLimitError)),
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
     )(func)
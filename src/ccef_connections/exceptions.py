@@ -5,6 +5,8 @@ This module defines a hierarchy of exceptions used throughout the library
 to provide clear, actionable error messages for connection failures.
 """
 
+from typing import Optional
+
 
 class CCEFConnectionError(Exception):
     """Base exception for all CCEF connection errors."""
@@ -21,6 +23,27 @@ class CredentialError(CCEFConnectionError):
 class ConnectionError(CCEFConnectionError):
     """Raised when a connection cannot be established."""
 
+    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+        """
+        Initialize ConnectionError.
+
+        Args:
+            message: Error message
+            status_code: HTTP status code when the failure was an API error
+                response; None for network failures and non-HTTP errors
+        """
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class ClientError(ConnectionError):
+    """
+    Raised for 4xx API responses that will not succeed on retry.
+
+    Subclasses ConnectionError so existing handlers keep working; retry
+    decorators skip it so bad requests fail without backoff.
+    """
+
     pass
 
 
@@ -0,0 +1,65 @@
+"""Fake aiohttp session and response shared by the async connector tests."""
+
+import json
+
+
+class FakeResponse:
+    """Minimal stand-in for aiohttp.ClientResponse used as a context manager."""
+
+    def __init__(self, status=200, json_data=None, text="", headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._json = json_data
+        self._text = text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def text(self):
+        return self._text
+
+    async def read(self):
+        return json.dumps(self._json).encode() if self._json is not None else b""
+
+
+class FakeSession:
+    """
+    Records requests and replays responses chosen by callbacks.
+
+    ``calls`` holds (method, url, params, json) tuples and ``headers`` the
+    per-request headers, in the same order. ``post`` serves OAuth token
+    requests from ``token_responder``.
+    """
+
+    def __init__(self, responder, token_responder=None):
+        self.calls = []
+        self.headers = []
+        self.token_calls = []
+        self._responder = responder
+        self._token_responder = token_responder
+        self.closed = False
+
+    def request(self, method, url, headers=None, params=None, json=None):
+        self.calls.append((method, url, params, json))
+        self.headers.append(headers)
+        result = self._responder(method, url, params, json)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    def post(self, url, data=None):
+        self.token_calls.append((url, data))
+        return self._token_responder()
+
+    async def close(self):
+        self.closed = True
+
+
+def use_session(connector, responder, token_responder=None):
+    """Attach a FakeSession to an async connector and return it."""
+    session = FakeSession(responder, token_responder)
+    connector._session = session
+    return session
@@ -1,16 +1,27 @@
 """Tests for the Action Builder connector."""
 
-from unittest.mock import MagicMock, patch
+import json
+import threading
+import time
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 import requests
 
 from ccef_connections.connectors.action_builder import (
     ACTION_BUILDER_API_BASE,
+    DEFAULT_PER_PAGE,
+    FALLBACK_PER_PAGE,
     ActionBuilderConnector,
+    _modified_since_params,
+    _next_page,
+    _parse_retry_after,
+    _rate_limit_state,
+    _throttle_delay,
 )
 from ccef_connections.exceptions import (
     AuthenticationError,
+    ClientError,
     ConnectionError,
     CredentialError,
     RateLimitError,
@@ -39,15 +50,16 @@ def _make_response(status_code=200, json_data=None, text="", headers=None):
     resp.text = text
     resp.headers = headers or {}
     resp.json.return_value = json_data or {}
+    resp.content = json.dumps(json_data or {}).encode()
     return resp
 
 
-def _page(resource_key, items, page=1, total_pages=1):
-    """Build a page-based HAL body."""
+def _page(resource_key, items, page=1, total_pages=1, per_page=None):
+    """Build a page-based HAL body; per_page defaults to a full page of items."""
     return {
         "_embedded": {resource_key: items},
         "page": page,
-        "per_page": 25,
+        "per_page": len(items) if per_page is None else per_page,
         "total_pages": total_pages,
     }
 
@@ -110,6 +122,8 @@ class TestConnect:
         assert connector._api_token == FAKE_API_TOKEN
         assert connector._subdomain == FAKE_SUBDOMAIN
         assert connector._base_url == FAKE_BASE_URL
+        assert connector._session is not None
+        assert connector._session.headers["OSDI-Api-Token"] == FAKE_API_TOKEN
 
     def test_connect_missing_credentials(self):
         c = ActionBuilderConnector()
@@ -135,6 +149,13 @@ class TestDisconnect:
         assert connected._subdomain is None
         assert connected._base_url is None
 
+    def test_disconnect_closes_session(self, connected):
+        session = MagicMock()
+        connected._session = session
+        connected.disconnect()
+        session.close.assert_called_once()
+        assert connected._session is None
+
 
 # ==========================================================================
 # Health Check
@@ -145,14 +166,14 @@ class TestHealthCheck:
     def test_not_connected(self, connector):
         assert connector.health_check() is False
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_success(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("action_builder:campaigns", [])
         )
         assert connected.health_check() is True
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_failure(self, mock_req, connected):
         mock_req.side_effect = requests.ConnectionError("down")
         assert connected.health_check() is False
@@ -164,7 +185,7 @@ class TestHealthCheck:
 
 
 class TestRequest:
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_get_success(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"ok": True})
         result = connected._request("GET", "/campaigns")
@@ -172,16 +193,31 @@ class TestRequest:
         mock_req.assert_called_once_with(
             "GET",
             f"{FAKE_BASE_URL}/campaigns",
-            headers={
-                "OSDI-Api-Token": FAKE_API_TOKEN,
-                "Content-Type": "application/json",
-            },
             params=None,
             json=None,
             timeout=30,
         )
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_decodes_raw_content(self, mock_req, connected):
+        resp = _make_response(200, {"_embedded": {"osdi:people": [{"id": "1"}]}})
+        mock_req.return_value = resp
+        result = connected._request("GET", "/campaigns/x/people")
+        assert result == {"_embedded": {"osdi:people": [{"id": "1"}]}}
+        resp.json.assert_not_called()
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_session_reused_across_requests(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, {"ok": True})
+        connected._request("GET", "/campaigns")
+        session = connected._session
+        connected._request("GET", "/campaigns")
+        assert connected._session is session
+        assert session.headers["OSDI-Api-Token"] == FAKE_API_TOKEN
+        assert session.headers["Content-Type"] == "application/json"
+        assert mock_req.call_count == 2
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_put_with_body(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": "abc"})
         body = {"inactive": True}
@@ -193,13 +229,13 @@ class TestRequest:
         assert result == {"id": "abc"}
         assert mock_req.call_args.kwargs["json"] == body
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_401_raises_auth_error(self, mock_req, connected):
         mock_req.return_value = _make_response(401, text="Unauthorized")
         with pytest.raises(AuthenticationError, match="401"):
             connected._request("GET", "/campaigns")
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_429_raises_rate_limit_error(self, mock_req, connected):
         mock_req.return_value = _make_response(
             429, text="Too Many Requests", headers={"Retry-After": "2"}
@@ -207,7 +243,7 @@ class TestRequest:
         with pytest.raises(RateLimitError, match="rate limit"):
             connected._request("GET", "/campaigns")
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_429_retry_after_header(self, mock_req, connected):
         mock_req.return_value = _make_response(
             429, text="Too Many Requests", headers={"Retry-After": "5"}
@@ -216,19 +252,82 @@ class TestRequest:
             connected._request("GET", "/campaigns")
         assert exc_info.value.retry_after == 5
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_429_retry_after_http_date(self, mock_req, connected):
+        mock_req.return_value = _make_response(
+            429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:30 GMT"}
+        )
+        with patch("ccef_connections.connectors.action_builder.time.time") as clock:
+            clock.return_value = 1445412500.0  # 10s before the date above
+            with pytest.raises(RateLimitError) as exc_info:
+                connected._request("GET", "/campaigns")
+        assert exc_info.value.retry_after == 10
+
+    def test_parse_retry_after_fallbacks(self):
+        assert _parse_retry_after(None) == 1
+        assert _parse_retry_after("garbage") == 1
+        assert _parse_retry_after("2.5") == 3
+        assert _parse_retry_after("0") == 1
+
+    @patch("ccef_connections.connectors.action_builder.time.sleep")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_pauses_when_rate_limit_budget_spent(self, mock_req, mock_sleep, connected):
+        mock_req.return_value = _make_response(
+            200,
+            {"ok": True},
+            headers={"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": "5"},
+        )
+        connected._request("GET", "/campaigns")
+        mock_sleep.assert_not_called()
+        connected._request("GET", "/campaigns")
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args.args[0] <= 5
+
+    @patch("ccef_connections.connectors.action_builder.time.sleep")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_no_pause_while_budget_remains(self, mock_req, mock_sleep, connected):
+        mock_req.return_value = _make_response(
+            200,
+            {"ok": True},
+            headers={"X-RateLimit-Remaining": "40", "X-RateLimit-Reset": "5"},
+        )
+        for _ in range(3):
+            connected._request("GET", "/campaigns")
+        mock_sleep.assert_not_called()
+
+    def test_rate_limit_state_parsing(self):
+        assert _rate_limit_state({}) is None
+        assert _rate_limit_state({"X-RateLimit-Remaining": "x", "X-RateLimit-Reset": "1"}) is None
+        remaining, reset_at = _rate_limit_state(
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1700000000"}
+        )
+        assert (remaining, reset_at) == (0, 1700000000.0)
+        assert _throttle_delay((0, time.time() + 3600)) == 60.0
+        assert _throttle_delay((5, time.time() + 3600)) == 0.0
+        assert _throttle_delay(None) == 0.0
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_404_raises_connection_error(self, mock_req, connected):
         mock_req.return_value = _make_response(404, text="Not Found")
         with pytest.raises(ConnectionError, match="404"):
             connected._request("GET", "/campaigns/nope")
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @pytest.mark.parametrize("status,expected", [(400, True), (404, True), (408, False)])
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_4xx_client_error_split(self, mock_req, connected, status, expected):
+        mock_req.return_value = _make_response(status, text="nope")
+        with pytest.raises(ConnectionError) as exc_info:
+            connected._request("GET", "/campaigns")
+        assert isinstance(exc_info.value, ClientError) is expected
+        assert exc_info.value.status_code == status
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_500_raises_connection_error(self, mock_req, connected):
         mock_req.return_value = _make_response(500, text="Internal Server Error")
         with pytest.raises(ConnectionError, match="500"):
             connected._request("GET", "/campaigns")
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_204_returns_none(self, mock_req, connected):
         mock_req.return_value = _make_response(204)
         result = connected._request(
@@ -236,19 +335,41 @@ class TestRequest:
         )
         assert result is None
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_empty_body_returns_none(self, mock_req, connected):
+        resp = _make_response(200)
+        resp.content = b""
+        mock_req.return_value = resp
+        assert connected._request("POST", f"/campaigns/{CAMPAIGN_ID}/people") is None
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_network_error(self, mock_req, connected):
         mock_req.side_effect = requests.ConnectionError("DNS failure")
         with pytest.raises(ConnectionError, match="request failed"):
             connected._request("GET", "/campaigns")
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_auto_connect_when_not_connected(self, mock_req, connector):
         mock_req.return_value = _make_response(200, {"ok": True})
         result = connector._request("GET", "/campaigns")
         assert result == {"ok": True}
         assert connector.is_connected()
 
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_connects_when_token_set_but_base_url_missing(self, mock_req, connector):
+        connector._api_token = FAKE_API_TOKEN
+        mock_req.return_value = _make_response(200, {"ok": True})
+        connector._request("GET", "/campaigns")
+        assert mock_req.call_args.args[1] == f"{FAKE_BASE_URL}/campaigns"
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_does_not_reconnect_once_connected(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, {"ok": True})
+        with patch.object(connected, "connect") as mock_connect:
+            connected._request("GET", "/campaigns")
+            connected._request("GET", "/campaigns")
+        mock_connect.assert_not_called()
+
 
 # ==========================================================================
 # _paginate
@@ -256,7 +377,7 @@ class TestRequest:
 
 
 class TestPaginate:
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_single_page(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200,
@@ -265,7 +386,7 @@ class TestPaginate:
         result = connected._paginate("/campaigns", "action_builder:campaigns")
         assert len(result) == 2
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_multi_page(self, mock_req, connected):
         page1 = _page("action_builder:campaigns", [{"id": "1"}], page=1, total_pages=2)
         page2 = _page("action_builder:campaigns", [{"id": "2"}], page=2, total_pages=2)
@@ -278,7 +399,7 @@ class TestPaginate:
         assert result[0]["id"] == "1"
         assert result[1]["id"] == "2"
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_empty_page(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200,
@@ -287,13 +408,13 @@ class TestPaginate:
         result = connected._paginate("/campaigns", "action_builder:campaigns")
         assert result == []
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_none_response(self, mock_req, connected):
         mock_req.return_value = _make_response(204)
         result = connected._paginate("/campaigns", "action_builder:campaigns")
         assert result == []
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_passes_extra_params(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("action_builder:entities", [])
@@ -307,6 +428,267 @@ class TestPaginate:
         assert "filter" in call_params
         assert call_params["page"] == 1
 
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_each_page_gets_own_params(self, mock_req, connected):
+        mock_req.side_effect = [
+            _make_response(200, _page("osdi:people", [], page=n, total_pages=2)) for n in (1, 2)
+        ]
+        params = {"filter": "x"}
+        connected._paginate("/p", "osdi:people", params=params)
+        sent = [c.kwargs["params"] for c in mock_req.call_args_list]
+        assert [p["page"] for p in sent] == [1, 2]
+        assert all(p["filter"] == "x" for p in sent)
+        assert params == {"filter": "x"}
+
+    def test_modified_since_params(self):
+        assert _modified_since_params(None) is None
+        assert _modified_since_params(None, {}) is None
+        assert _modified_since_params(None, {"status": "a"}) == {"status": "a"}
+        assert _modified_since_params("2026-01-01") == {
+            "filter": "modified_date gt '2026-01-01'"
+        }
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_default_per_page(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, _page("osdi:tags", []))
+        connected.list_tags(CAMPAIGN_ID)
+        assert mock_req.call_args.kwargs["params"]["per_page"] == DEFAULT_PER_PAGE == 100
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_per_page_override(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, _page("osdi:people", []))
+        connected.list_people(CAMPAIGN_ID, per_page=10, status="active")
+        call_params = mock_req.call_args.kwargs["params"]
+        assert call_params["per_page"] == 10
+        assert call_params["status"] == "active"
+
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_rejected_per_page_falls_back_and_is_remembered(self, mock_req, connected):
+        mock_req.side_effect = [
+            _make_response(400, text="per_page too large"),
+            _make_response(200, _page("osdi:tags", [{"id": "1"}])),
+            _make_response(200, _page("osdi:people", [])),
+        ]
+        assert connected._paginate("/t", "osdi:tags") == [{"id": "1"}]
+        connected._paginate("/p", "osdi:people")
+        sent = [c.kwargs["params"]["per_page"] for c in mock_req.call_args_list]
+        assert sent == [DEFAULT_PER_PAGE, FALLBACK_PER_PAGE, FALLBACK_PER_PAGE]
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_other_400_is_not_masked(self, mock_req, connected):
+        mock_req.return_value = _make_response(400, text="bad filter")
+        with pytest.raises(ConnectionError, match="400"):
+            list(connected._iter_pages("/p", params={"filter": "?"}))
+        assert mock_req.call_count == 2
+        assert connected._per_page_cap is None
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_remaining_pages_fetched_concurrently_in_order(self, mock_req, connected):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def respond(method, url, params=None, **kwargs):
+            page = params["page"]
+            if page > 1:
+                # Pages 2-4 must all be in flight at once to pass the barrier
+                barrier.wait()
+            return _make_response(
+                200, _page("osdi:people", [{"id": str(page)}], page=page, total_pages=4)
+            )
+
+        mock_req.side_effect = respond
+        result = connected._paginate("/p", "osdi:people", max_workers=3)
+        assert [r["id"] for r in result] == ["1", "2", "3", "4"]
+        assert mock_req.call_count == 4
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_uneven_pages_flattened_in_order(self, mock_req, connected):
+        sizes = {1: 3, 2: 0, 3: 2}
+
+        def respond(method, url, params=None, **kwargs):
+            page = params["page"]
+            items = [{"id": f"{page}-{i}"} for i in range(sizes[page])]
+            return _make_response(200, _page("osdi:people", items, page=page, total_pages=3))
+
+        mock_req.side_effect = respond
+        result = connected._paginate("/p", "osdi:people")
+        assert [r["id"] for r in result] == ["1-0", "1-1", "1-2", "3-0", "3-1"]
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_concurrent_page_retries_429_alone(self, mock_req, connected):
+        responses = {
+            1: [_make_response(200, _page("osdi:people", [{"id": "1"}], 1, 3))],
+            2: [
+                _make_response(429, headers={"Retry-After": "1"}),
+                _make_response(200, _page("osdi:people", [{"id": "2"}], 2, 3)),
+            ],
+            3: [_make_response(200, _page("osdi:people", [{"id": "3"}], 3, 3))],
+        }
+        mock_req.side_effect = lambda m, u, params=None, **kw: responses[params["page"]].pop(0)
+        with patch.object(ActionBuilderConnector._get_page.retry, "sleep"):
+            result = connected._paginate("/p", "osdi:people")
+        assert [r["id"] for r in result] == ["1", "2", "3"]
+        assert mock_req.call_count == 4
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_throttled_page_does_not_restart_listing(self, mock_req, connected):
+        def respond(method, url, params=None, **kwargs):
+            if params["page"] == 2:
+                return _make_response(429, headers={"Retry-After": "1"})
+            return _make_response(200, _page("osdi:people", [{"id": "1"}], 1, 2))
+
+        mock_req.side_effect = respond
+        with patch.object(ActionBuilderConnector._get_page.retry, "sleep"):
+            with pytest.raises(RateLimitError):
+                connected.list_people(CAMPAIGN_ID)
+        pages = [c.kwargs["params"]["page"] for c in mock_req.call_args_list]
+        assert pages == [1, 2, 2, 2, 2, 2]
+
+
+class TestIterPages:
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_next_page_requested_before_current_is_consumed(self, mock_req, connected):
+        pages = [
+            _page("osdi:people", [{"id": str(n)}], page=n, total_pages=3) for n in (1, 2, 3)
+        ]
+        mock_req.side_effect = [_make_response(200, p) for p in pages]
+        it = connected._iter_pages("/campaigns/x/people")
+        first = next(it)
+        assert first["page"] == 1
+        # Page 2 was submitted before page 1 was handed to the caller
+        for _ in range(100):
+            if mock_req.call_count >= 2:
+                break
+            time.sleep(0.01)
+        assert mock_req.call_count == 2
+        assert [p["page"] for p in it] == [2, 3]
+        assert mock_req.call_count == 3
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_single_page_skips_worker(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, _page("osdi:people", []))
+        with patch(
+            "ccef_connections.connectors.action_builder.ThreadPoolExecutor"
+        ) as mock_pool:
+            assert len(list(connected._iter_pages("/campaigns/x/people"))) == 1
+        mock_pool.assert_not_called()
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_prefetch_error_surfaces_to_caller(self, mock_req, connected):
+        mock_req.side_effect = [
+            _make_response(200, _page("osdi:people", [], page=1, total_pages=2)),
+            _make_response(500, text="boom"),
+        ]
+        it = connected._iter_pages("/campaigns/x/people")
+        next(it)
+        with pytest.raises(ConnectionError, match="500"):
+            next(it)
+
+
+class TestNextLink:
+    @staticmethod
+    def _hal(page, next_href=None, total_pages=99):
+        body = _page("osdi:people", [{"id": str(page)}], page=page, total_pages=total_pages)
+        body["_links"] = {"self": {"href": "x"}}
+        if next_href:
+            body["_links"]["next"] = {"href": next_href}
+        return body
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_follows_next_link_page(self, mock_req, connected):
+        mock_req.side_effect = [
+            _make_response(200, self._hal(1, f"{FAKE_BASE_URL}/p?page=2&per_page=100")),
+            _make_response(200, self._hal(2)),
+        ]
+        result = connected._paginate("/p", "osdi:people", params={"filter": "f"}, max_workers=1)
+        assert [r["id"] for r in result] == ["1", "2"]
+        second = mock_req.call_args_list[1].kwargs["params"]
+        assert second["page"] == 2
+        assert second["filter"] == "f"
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_missing_next_link_stops_despite_stale_total(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, self._hal(1, total_pages=5))
+        assert len(connected._paginate("/p", "osdi:people")) == 1
+        assert mock_req.call_count == 1
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_concurrent_fetch_follows_link_past_stale_total(self, mock_req, connected):
+        def respond(method, url, params=None, **kwargs):
+            page = params["page"]
+            href = f"/p?page={page + 1}" if page < 3 else None
+            return _make_response(200, self._hal(page, href, total_pages=2))
+
+        mock_req.side_effect = respond
+        result = connected._paginate("/p", "osdi:people")
+        assert [r["id"] for r in result] == ["1", "2", "3"]
+        assert mock_req.call_count == 3
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_underfull_page_ends_listing_without_links(self, mock_req, connected):
+        mock_req.return_value = _make_response(
+            200, _page("osdi:people", [{"id": "1"}], page=1, total_pages=3, per_page=100)
+        )
+        assert len(connected._paginate("/p", "osdi:people")) == 1
+        assert mock_req.call_count == 1
+
+    def test_underfull_page_helper(self):
+        short = _page("osdi:people", [{}], page=1, total_pages=3, per_page=25)
+        assert _next_page(short, 1) is None
+        assert _next_page(dict(short, _links={"next": {"href": "/p?page=2"}}), 1) == 2
+        assert _next_page(_page("osdi:people", [{}] * 25, 1, 3, per_page=25), 1) == 2
+
+    def test_next_page_helper(self):
+        assert _next_page({"_links": {"next": {"href": "/p?per_page=5"}}}, 3) == 4
+        assert _next_page({"_links": {"next": {"href": "/p?page=1"}}}, 3) is None
+        assert _next_page({"total_pages": 2}, 1) == 2
+        assert _next_page({"total_pages": 2}, 2) is None
+
+
+class TestIterResources:
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_iter_people_streams_across_pages(self, mock_req, connected):
+        mock_req.side_effect = [
+            _make_response(
+                200, _page("osdi:people", [{"id": "1"}, {"id": "2"}], page=1, total_pages=2)
+            ),
+            _make_response(200, _page("osdi:people", [{"id": "3"}], page=2, total_pages=2)),
+        ]
+        it = connected.iter_people(CAMPAIGN_ID, modified_since="2026-01-01")
+        assert [p["id"] for p in it] == ["1", "2", "3"]
+        assert "modified_date gt" in mock_req.call_args.kwargs["params"]["filter"]
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_iter_is_lazy(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, _page("osdi:tags", []))
+        it = connected.iter_tags(CAMPAIGN_ID)
+        mock_req.assert_not_called()
+        assert list(it) == []
+        mock_req.assert_called_once()
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_iter_campaigns_and_taggings(self, mock_req, connected):
+        mock_req.side_effect = [
+            _make_response(200, _page("action_builder:campaigns", [{"id": CAMPAIGN_ID}])),
+            _make_response(200, _page("osdi:taggings", [{"id": TAGGING_ID}])),
+        ]
+        assert [c["id"] for c in connected.iter_campaigns()] == [CAMPAIGN_ID]
+        assert [t["id"] for t in connected.iter_taggings(CAMPAIGN_ID, TAG_ID)] == [TAGGING_ID]
+        assert mock_req.call_args.args[1].endswith(f"/tags/{TAG_ID}/taggings")
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_iter_retries_single_page_on_429(self, mock_req, connected):
+        mock_req.side_effect = [
+            _make_response(200, _page("osdi:people", [{"id": "1"}], page=1, total_pages=2)),
+            _make_response(429, headers={"Retry-After": "1"}),
+            _make_response(200, _page("osdi:people", [{"id": "2"}], page=2, total_pages=2)),
+        ]
+        with patch.object(ActionBuilderConnector._get_page.retry, "sleep"):
+            result = [p["id"] for p in connected.iter_people(CAMPAIGN_ID)]
+        assert result == ["1", "2"]
+        pages = [c.kwargs["params"]["page"] for c in mock_req.call_args_list]
+        assert pages == [1, 2, 2]
+
 
 # ==========================================================================
 # Campaigns
@@ -314,7 +696,7 @@ class TestPaginate:
 
 
 class TestCampaigns:
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_list_campaigns(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200,
@@ -324,7 +706,7 @@ class TestCampaigns:
         assert len(result) == 1
         assert result[0]["id"] == CAMPAIGN_ID
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_list_campaigns_modified_since(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("action_builder:campaigns", [])
@@ -334,7 +716,7 @@ class TestCampaigns:
         assert "filter" in call_params
         assert "modified_date gt" in call_params["filter"]
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_get_campaign(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CAMPAIGN_ID, "name": "Test"})
         result = connected.get_campaign(CAMPAIGN_ID)
@@ -342,7 +724,6 @@ class TestCampaigns:
         mock_req.assert_called_once_with(
             "GET",
             f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}",
-            headers=connected._get_headers(),
             params=None,
             json=None,
             timeout=30,
@@ -355,7 +736,7 @@ class TestCampaigns:
 
 
 class TestEntityTypes:
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_list_entity_types(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200,
@@ -365,7 +746,7 @@ class TestEntityTypes:
         assert len(result) == 1
         assert result[0]["id"] == TYPE_ID
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_get_entity_type(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": TYPE_ID})
         result = connected.get_entity_type(CAMPAIGN_ID, TYPE_ID)
@@ -373,7 +754,6 @@ class TestEntityTypes:
         mock_req.assert_called_once_with(
             "GET",
             f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/entity_types/{TYPE_ID}",
-            headers=connected._get_headers(),
             params=None,
             json=None,
             timeout=30,
@@ -386,7 +766,7 @@ class TestEntityTypes:
 
 
 class TestConnectionTypes:
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_list_connection_types(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200,
@@ -395,7 +775,7 @@ class TestConnectionTypes:
         result = connected.list_connection_types(CAMPAIGN_ID)
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_get_connection_type(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": TYPE_ID})
         result = connected.get_connection_type(CAMPAIGN_ID, TYPE_ID)
@@ -403,7 +783,6 @@ class TestConnectionTypes:
         mock_req.assert_called_once_with(
             "GET",
             f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/connection_types/{TYPE_ID}",
-            headers=connected._get_headers(),
             params=None,
             json=None,
             timeout=30,
@@ -416,7 +795,7 @@ class TestConnectionTypes:
 
 
 class TestPeople:
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_list_people(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200,
@@ -426,7 +805,7 @@ class TestPeople:
         assert len(result) == 1
         assert result[0]["id"] == PERSON_ID
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_list_people_modified_since(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:people", [])
@@ -436,7 +815,7 @@ class TestPeople:
         assert "filter" in call_params
         assert "modified_date gt" in call_params["filter"]
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_get_person(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": PERSON_ID})
         result = connected.get_person(CAMPAIGN_ID, PERSON_ID)
@@ -444,13 +823,12 @@ class TestPeople:
         mock_req.assert_called_once_with(
             "GET",
             f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/people/{PERSON_ID}",
-            headers=connected._get_headers(),
             params=None,
             json=None,
             timeout=30,
         )
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_create_person(self, mock_req, connected):
         mock_req.return_value = _make_response(
             201, {"id": PERSON_ID, "given_name": "Jane"}
@@ -462,7 +840,7 @@ class TestPeople:
         call_json = mock_req.call_args.kwargs["json"]
         assert call_json == {"person": {"given_name": "Jane", "family_name": "Doe"}}
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_update_person(self, mock_req, connected):
         updated = {"id": PERSON_ID, "given_name": "Updated"}
         mock_req.return_value = _make_response(200, updated)
@@ -473,20 +851,47 @@ class TestPeople:
         mock_req.assert_called_once_with(
             "PUT",
             f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/people/{PERSON_ID}",
-            headers=connected._get_headers(),
             params=None,
             json={"given_name": "Updated"},
             timeout=30,
+            headers={"Idempotency-Key": ANY},
         )
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_write_retries_reuse_idempotency_key(self, mock_req, connected):
+        mock_req.side_effect = [
+            _make_response(429, headers={"Retry-After": "1"}),
+            _make_response(201, {"id": PERSON_ID}),
+        ]
+        with patch.object(ActionBuilderConnector.create_person.retry, "sleep"):
+            connected.create_person(CAMPAIGN_ID, given_name="Jane")
+        keys = [c.kwargs["headers"]["Idempotency-Key"] for c in mock_req.call_args_list]
+        assert len(keys) == 2 and keys[0] == keys[1]
+        assert mock_req.call_args.kwargs["json"] == {"person": {"given_name": "Jane"}}
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_caller_supplied_idempotency_key(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
+        connected.update_connection(
+            CAMPAIGN_ID, PERSON_ID, CONNECTION_ID, inactive=True, idempotency_key="k1"
+        )
+        connected.create_tag(CAMPAIGN_ID, "n", "s", "text", idempotency_key="k2")
+        sent = [c.kwargs["headers"]["Idempotency-Key"] for c in mock_req.call_args_list]
+        assert sent == ["k1", "k2"]
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_reads_send_no_idempotency_key(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, {"id": PERSON_ID})
+        connected.get_person(CAMPAIGN_ID, PERSON_ID)
+        assert "headers" not in mock_req.call_args.kwargs
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_delete_person(self, mock_req, connected):
         mock_req.return_value = _make_response(204)
         connected.delete_person(CAMPAIGN_ID, PERSON_ID)
         mock_req.assert_called_once_with(
             "DELETE",
             f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/people/{PERSON_ID}",
-            headers=connected._get_headers(),
             params=None,
             json=None,
             timeout=30,
@@ -499,7 +904,7 @@ class TestPeople:
 
 
 class TestTags:
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_list_tags(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200,
@@ -509,7 +914,7 @@ class TestTags:
         assert len(result) == 1
         assert result[0]["id"] == TAG_ID
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_get_tag(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": TAG_ID, "name": "Voter"})
         result = connected.get_tag(CAMPAIGN_ID, TAG_ID)
@@ -517,13 +922,12 @@ class TestTags:
         mock_req.assert_called_once_with(
             "GET",
             f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/tags/{TAG_ID}",
-            headers=connected._get_headers(),
             params=None,
             json=None,
             timeout=30,
         )
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_create_tag(self, mock_req, connected):
         created = {"id": TAG_ID, "name": "Volunteer"}
         mock_req.return_value = _make_response(201, created)
@@ -539,27 +943,153 @@ class TestTags:
         assert call_json["section"] == "Status"
         assert call_json["field_type"] == "checkbox"
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_delete_tag(self, mock_req, connected):
         mock_req.return_value = _make_response(204)
         connected.delete_tag(CAMPAIGN_ID, TAG_ID)
         mock_req.assert_called_once_with(
             "DELETE",
             f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/tags/{TAG_ID}",
-            headers=connected._get_headers(),
             params=None,
             json=None,
             timeout=30,
         )
 
 
+class TestConfigCache:
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_list_tags_reused_within_ttl(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, _page("osdi:tags", [{"id": TAG_ID}]))
+        first = connected.list_tags(CAMPAIGN_ID)
+        second = connected.list_tags(CAMPAIGN_ID)
+        assert first == second == [{"id": TAG_ID}]
+        assert mock_req.call_count == 1
+        # Callers get their own list, so mutating it cannot corrupt the cache
+        first.clear()
+        assert connected.list_tags(CAMPAIGN_ID) == [{"id": TAG_ID}]
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_per_page_is_part_of_key(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, _page("osdi:tags", []))
+        connected.list_tags(CAMPAIGN_ID)
+        connected.list_tags(CAMPAIGN_ID, per_page=10)
+        assert mock_req.call_count == 2
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_get_entity_and_connection_type_cached(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, {"id": TYPE_ID})
+        for _ in range(2):
+            connected.get_entity_type(CAMPAIGN_ID, TYPE_ID)
+            connected.get_connection_type(CAMPAIGN_ID, TYPE_ID)
+        assert mock_req.call_count == 2
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_get_campaign_cached(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, {"id": CAMPAIGN_ID})
+        assert connected.get_campaign(CAMPAIGN_ID) == {"id": CAMPAIGN_ID}
+        assert connected.get_campaign(CAMPAIGN_ID) == {"id": CAMPAIGN_ID}
+        assert mock_req.call_count == 1
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_maxsize_evicts_oldest(self, mock_req, connected):
+        connected._cache_maxsize = 2
+        mock_req.return_value = _make_response(200, {"id": TAG_ID})
+        for tag in ("a", "b", "c"):
+            connected.get_tag(CAMPAIGN_ID, tag)
+        assert len(connected._cache) == 2
+        connected.get_tag(CAMPAIGN_ID, "c")
+        assert mock_req.call_count == 3
+        connected.get_tag(CAMPAIGN_ID, "a")
+        assert mock_req.call_count == 4
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_entry_expires_after_ttl(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, {"id": TAG_ID})
+        with patch("ccef_connections.connectors.action_builder.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            connected.get_tag(CAMPAIGN_ID, TAG_ID)
+            clock.return_value = 1000.0 + connected._cache_ttl + 1
+            connected.get_tag(CAMPAIGN_ID, TAG_ID)
+        assert mock_req.call_count == 2
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_create_and_delete_tag_invalidate(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, _page("osdi:tags", []))
+        connected.list_tags(CAMPAIGN_ID)
+        connected.create_tag(CAMPAIGN_ID, name="n", section="s", field_type="text")
+        connected.list_tags(CAMPAIGN_ID)
+        connected.delete_tag(CAMPAIGN_ID, TAG_ID)
+        connected.list_tags(CAMPAIGN_ID)
+        methods = [c.args[0] for c in mock_req.call_args_list]
+        assert methods == ["GET", "POST", "GET", "DELETE", "GET"]
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_invalidate_prefix_keeps_other_entries(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, _page("osdi:tags", []))
+        connected.list_tags(CAMPAIGN_ID)
+        connected.list_entity_types(CAMPAIGN_ID)
+        connected.invalidate_cache(f"/campaigns/{CAMPAIGN_ID}/tags")
+        connected.list_tags(CAMPAIGN_ID)
+        connected.list_entity_types(CAMPAIGN_ID)
+        assert mock_req.call_count == 3
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_zero_ttl_disables_cache(self, mock_req, connected):
+        connected._cache_ttl = 0
+        mock_req.return_value = _make_response(200, _page("osdi:tags", []))
+        connected.list_tags(CAMPAIGN_ID)
+        connected.list_tags(CAMPAIGN_ID)
+        assert mock_req.call_count == 2
+
+    def test_disconnect_clears_cache(self, connected):
+        connected._cache[("/campaigns/x/tags", 100)] = (float("inf"), [])
+        connected.disconnect()
+        assert connected._cache == {}
+
+    def test_concurrent_misses_share_one_load(self, connected):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return ["value"]
+
+        results = []
+        owner = threading.Thread(
+            target=lambda: results.append(connected._cached(("/k", None), loader))
+        )
+        owner.start()
+        started.wait(5)
+        waiter = threading.Thread(
+            target=lambda: results.append(connected._cached(("/k", None), loader))
+        )
+        waiter.start()
+        time.sleep(0.05)
+        release.set()
+        owner.join(5)
+        waiter.join(5)
+        assert calls == [1]
+        assert results == [["value"], ["value"]]
+
+    def test_load_overlapping_invalidate_is_not_stored(self, connected):
+        def loader():
+            connected.invalidate_cache()
+            return "stale"
+
+        assert connected._cached(("/k", None), loader) == "stale"
+        assert ("/k", None) not in connected._cache
+
+
 # ==========================================================================
 # Taggings
 # ==========================================================================
 
 
 class TestTaggings:
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_list_taggings(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200,
@@ -569,7 +1099,7 @@ class TestTaggings:
         assert len(result) == 1
         assert result[0]["id"] == TAGGING_ID
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_list_taggings_url(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:taggings", [])
@@ -578,7 +1108,7 @@ class TestTaggings:
         call_url = mock_req.call_args.args[1]
         assert f"/campaigns/{CAMPAIGN_ID}/tags/{TAG_ID}/taggings" in call_url
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_list_person_taggings(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200,
@@ -587,7 +1117,7 @@ class TestTaggings:
         result = connected.list_person_taggings(CAMPAIGN_ID, PERSON_ID)
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_list_person_taggings_url(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:taggings", [])
@@ -596,19 +1126,30 @@ class TestTaggings:
         call_url = mock_req.call_args.args[1]
         assert f"/campaigns/{CAMPAIGN_ID}/people/{PERSON_ID}/taggings" in call_url
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_delete_tagging(self, mock_req, connected):
         mock_req.return_value = _make_response(204)
         connected.delete_tagging(CAMPAIGN_ID, TAG_ID, TAGGING_ID)
         mock_req.assert_called_once_with(
             "DELETE",
             f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/tags/{TAG_ID}/taggings/{TAGGING_ID}",
-            headers=connected._get_headers(),
             params=None,
             json=None,
             timeout=30,
         )
 
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_delete_tagging_404_is_success(self, mock_req, connected):
+        mock_req.return_value = _make_response(404, text="Not Found")
+        assert connected.delete_tagging(CAMPAIGN_ID, TAG_ID, TAGGING_ID) == "404"
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_delete_tagging_404_in_body_still_raises(self, mock_req, connected):
+        mock_req.return_value = _make_response(500, text="upstream returned 404")
+        with pytest.raises(ConnectionError) as exc_info:
+            connected.delete_tagging(CAMPAIGN_ID, TAG_ID, TAGGING_ID)
+        assert exc_info.value.status_code == 500
+
 
 # ==========================================================================
 # Connections
@@ -616,7 +1157,7 @@ class TestTaggings:
 
 
 class TestConnections:
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_list_connections(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200,
@@ -626,7 +1167,7 @@ class TestConnections:
         assert len(result) == 1
         assert result[0]["id"] == CONNECTION_ID
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_list_connections_url(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("action_builder:connections", [])
@@ -637,7 +1178,7 @@ class TestConnections:
             f"/campaigns/{CAMPAIGN_ID}/people/{PERSON_ID}/connections" in call_url
         )
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_get_connection(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         result = connected.get_connection(CAMPAIGN_ID, PERSON_ID, CONNECTION_ID)
@@ -645,13 +1186,12 @@ class TestConnections:
         mock_req.assert_called_once_with(
             "GET",
             f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/people/{PERSON_ID}/connections/{CONNECTION_ID}",
-            headers=connected._get_headers(),
             params=None,
             json=None,
             timeout=30,
         )
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_update_connection_inactive_true(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, {"id": CONNECTION_ID, "inactive": True}
@@ -663,7 +1203,7 @@ class TestConnections:
         call_json = mock_req.call_args.kwargs["json"]
         assert call_json == {"inactive": True}
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_update_connection_reactivate(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, {"id": CONNECTION_ID, "inactive": False}
@@ -691,7 +1231,7 @@ SAMPLE_ADD_TAGS = [
 
 
 class TestUpdateEntityWithTags:
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_posts_with_identifiers(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": PERSON_ID})
         connected.update_entity_with_tags(
@@ -702,7 +1242,7 @@ class TestUpdateEntityWithTags:
             f"action_builder:{ENTITY_INTERACT_ID}"
         ]
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_posts_add_tags(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": PERSON_ID})
         connected.update_entity_with_tags(
@@ -711,7 +1251,7 @@ class TestUpdateEntityWithTags:
         call_json = mock_req.call_args.kwargs["json"]
         assert call_json["add_tags"] == SAMPLE_ADD_TAGS
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_posts_to_people_endpoint(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": PERSON_ID})
         connected.update_entity_with_tags(
@@ -720,7 +1260,7 @@ class TestUpdateEntityWithTags:
         call_url = mock_req.call_args.args[1]
         assert call_url == f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/people"
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_returns_dict(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": PERSON_ID})
         result = connected.update_entity_with_tags(
@@ -728,7 +1268,7 @@ class TestUpdateEntityWithTags:
         )
         assert isinstance(result, dict)
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_returns_empty_dict_on_204(self, mock_req, connected):
         mock_req.return_value = _make_response(204)
         result = connected.update_entity_with_tags(
@@ -736,7 +1276,7 @@ class TestUpdateEntityWithTags:
         )
         assert result == {}
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_remove_tags_not_in_body(self, mock_req, connected):
         """remove_tags is not a valid AB API parameter — must never appear in POST body."""
         mock_req.return_value = _make_response(200, {"id": PERSON_ID})
@@ -747,13 +1287,145 @@ class TestUpdateEntityWithTags:
         assert "remove_tags" not in call_json
 
 
+# ==========================================================================
+# replace_entity_tags
+# ==========================================================================
+
+
+class TestReplaceEntityTags:
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_deletes_then_single_post(self, mock_req, connected):
+        mock_req.side_effect = [
+            _make_response(204),
+            _make_response(404, text="Not Found"),
+            _make_response(200, {"id": PERSON_ID}),
+        ]
+        new_tags = SAMPLE_ADD_TAGS * 2
+        result = connected.replace_entity_tags(
+            CAMPAIGN_ID,
+            ENTITY_INTERACT_ID,
+            [(TAG_ID, "tagging-a"), (TAG_ID, "tagging-b")],
+            new_tags,
+        )
+        assert result == {"id": PERSON_ID}
+        methods = [c.args[0] for c in mock_req.call_args_list]
+        assert methods == ["DELETE", "DELETE", "POST"]
+        assert mock_req.call_args_list[1].args[1].endswith("/taggings/tagging-b")
+        body = mock_req.call_args.kwargs["json"]
+        assert body["add_tags"] == new_tags
+        assert "remove_tags" not in body
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_no_add_tags_skips_post(self, mock_req, connected):
+        mock_req.return_value = _make_response(204)
+        result = connected.replace_entity_tags(
+            CAMPAIGN_ID, ENTITY_INTERACT_ID, [(TAG_ID, TAGGING_ID)], []
+        )
+        assert result == {}
+        assert mock_req.call_count == 1
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_delete_failure_stops_before_post(self, mock_req, connected):
+        mock_req.return_value = _make_response(500, text="boom")
+        with pytest.raises(ConnectionError):
+            connected.replace_entity_tags(
+                CAMPAIGN_ID, ENTITY_INTERACT_ID, [(TAG_ID, TAGGING_ID)], SAMPLE_ADD_TAGS
+            )
+        assert mock_req.call_count == 1
+
+
+# ==========================================================================
+# Bulk helpers
+# ==========================================================================
+
+
+class TestBulkHelpers:
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_bulk_get_person_taggings(self, mock_req, connected):
+        def respond(method, url, **kwargs):
+            person = url.split("/people/")[1].split("/")[0]
+            return _make_response(200, _page("osdi:taggings", [{"person": person}]))
+
+        mock_req.side_effect = respond
+        result = connected.bulk_get_person_taggings(CAMPAIGN_ID, ["a", "b", "c"], max_workers=3)
+        assert list(result) == ["a", "b", "c"]
+        assert result["b"] == [{"person": "b"}]
+        assert mock_req.call_count == 3
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_bulk_get_person_taggings_collects_errors(self, mock_req, connected):
+        def respond(method, url, **kwargs):
+            if "/people/bad/" in url:
+                return _make_response(500, text="boom")
+            return _make_response(200, _page("osdi:taggings", [{"id": "t"}]))
+
+        mock_req.side_effect = respond
+        result = connected.bulk_get_person_taggings(CAMPAIGN_ID, ["a", "bad", "b"])
+        assert result["a"] == result["b"] == [{"id": "t"}]
+        assert isinstance(result["bad"], ConnectionError)
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_bulk_update_entity_tags_collects_errors(self, mock_req, connected):
+        def respond(method, url, json=None, **kwargs):
+            entity = json["person"]["identifiers"][0].split(":")[1]
+            if entity == "bad":
+                return _make_response(500, text="boom")
+            return _make_response(200, {"id": entity})
+
+        mock_req.side_effect = respond
+        result = connected.bulk_update_entity_tags(
+            CAMPAIGN_ID, [("p1", SAMPLE_ADD_TAGS), ("bad", SAMPLE_ADD_TAGS), ("p2", [])]
+        )
+        assert result["p1"] == {"id": "p1"}
+        assert result["p2"] == {"id": "p2"}
+        assert isinstance(result["bad"], ConnectionError)
+        assert result["bad"].status_code == 500
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_bulk_delete_people_reports_per_id(self, mock_req, connected):
+        def respond(method, url, **kwargs):
+            if url.endswith("/bad"):
+                return _make_response(500, text="boom")
+            return _make_response(204)
+
+        mock_req.side_effect = respond
+        result = connected.bulk_delete_people(CAMPAIGN_ID, ["p1", "bad", "p2"])
+        assert result["p1"] is None and result["p2"] is None
+        assert isinstance(result["bad"], ConnectionError)
+        assert {c.args[0] for c in mock_req.call_args_list} == {"DELETE"}
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_bulk_delete_tags_invalidates_cache(self, mock_req, connected):
+        mock_req.return_value = _make_response(204)
+        with patch.object(connected, "invalidate_cache") as mock_invalidate:
+            result = connected.bulk_delete_tags(CAMPAIGN_ID, ["t1", "t2"])
+        assert result == {"t1": None, "t2": None}
+        assert mock_invalidate.call_count == 2
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_bulk_delete_taggings_treats_404_as_deleted(self, mock_req, connected):
+        def respond(method, url, **kwargs):
+            return _make_response(404 if url.endswith("/gone") else 204, text="Not Found")
+
+        mock_req.side_effect = respond
+        result = connected.bulk_delete_taggings(CAMPAIGN_ID, [(TAG_ID, "tg1"), (TAG_ID, "gone")])
+        assert result == {"tg1": None, "gone": None}
+
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
+    def test_bulk_connects_once_before_fanning_out(self, mock_req, connector):
+        mock_req.return_value = _make_response(200, _page("osdi:taggings", []))
+        with patch.object(connector, "connect", wraps=connector.connect) as mock_connect:
+            connector.bulk_get_person_taggings(CAMPAIGN_ID, ["a", "b", "c", "d"])
+        mock_connect.assert_called_once()
+
+
 # ==========================================================================
 # append_note
 # ==========================================================================
 
 
 class TestAppendNote:
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_posts_to_people_endpoint(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": PERSON_ID})
         connected.append_note(
@@ -764,7 +1436,7 @@ class TestAppendNote:
         call_url = mock_req.call_args.args[1]
         assert call_url == f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/people"
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_sends_identifiers(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": PERSON_ID})
         connected.append_note(
@@ -777,7 +1449,7 @@ class TestAppendNote:
             f"action_builder:{ENTITY_INTERACT_ID}"
         ]
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_sends_note_tag_with_all_fields(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": PERSON_ID})
         connected.append_note(
@@ -793,7 +1465,7 @@ class TestAppendNote:
         assert tags[0]["name"] == "Called"
         assert tags[0]["action_builder:note_response"] == "Spoke about upcoming event"
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_returns_dict(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": PERSON_ID})
         result = connected.append_note(
@@ -804,7 +1476,7 @@ class TestAppendNote:
         assert isinstance(result, dict)
         assert result["id"] == PERSON_ID
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_returns_empty_dict_on_204(self, mock_req, connected):
         mock_req.return_value = _make_response(204)
         result = connected.append_note(
@@ -814,7 +1486,7 @@ class TestAppendNote:
         )
         assert result == {}
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_no_remove_tags_in_body(self, mock_req, connected):
         """remove_tags must never appear — it causes 500 from the AB API."""
         mock_req.return_value = _make_response(200, {"id": PERSON_ID})
@@ -843,7 +1515,7 @@ SAMPLE_CONNECTION_TAGS = [
 
 
 class TestCreateConnection:
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_posts_to_connections_endpoint(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.create_connection(CAMPAIGN_ID, PERSON_ID, CONNECTED_PERSON_ID)
@@ -853,20 +1525,20 @@ class TestCreateConnection:
             f"/people/{PERSON_ID}/connections"
         )
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_uses_post_method(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.create_connection(CAMPAIGN_ID, PERSON_ID, CONNECTED_PERSON_ID)
         assert mock_req.call_args.args[0] == "POST"
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_sends_connected_person_id(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.create_connection(CAMPAIGN_ID, PERSON_ID, CONNECTED_PERSON_ID)
         call_json = mock_req.call_args.kwargs["json"]
         assert call_json["connection"]["person_id"] == CONNECTED_PERSON_ID
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_with_tags(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.create_connection(
@@ -876,14 +1548,14 @@ class TestCreateConnection:
         call_json = mock_req.call_args.kwargs["json"]
         assert call_json["add_tags"] == SAMPLE_CONNECTION_TAGS
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_without_tags_omits_add_tags(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.create_connection(CAMPAIGN_ID, PERSON_ID, CONNECTED_PERSON_ID)
         call_json = mock_req.call_args.kwargs["json"]
         assert "add_tags" not in call_json
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_empty_tags_list_omits_add_tags(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.create_connection(
@@ -892,7 +1564,7 @@ class TestCreateConnection:
         call_json = mock_req.call_args.kwargs["json"]
         assert "add_tags" not in call_json
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_returns_dict(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         result = connected.create_connection(
@@ -901,7 +1573,7 @@ class TestCreateConnection:
         assert isinstance(result, dict)
         assert result["id"] == CONNECTION_ID
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_returns_empty_dict_on_204(self, mock_req, connected):
         mock_req.return_value = _make_response(204)
         result = connected.create_connection(
@@ -909,7 +1581,7 @@ class TestCreateConnection:
         )
         assert result == {}
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_no_remove_tags_in_body(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.create_connection(
@@ -926,7 +1598,7 @@ class TestCreateConnection:
 
 
 class TestUpdateConnectionWithTags:
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_posts_to_connections_endpoint(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.update_connection_with_tags(
@@ -938,7 +1610,7 @@ class TestUpdateConnectionWithTags:
             f"/people/{PERSON_ID}/connections"
         )
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_uses_post_method(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.update_connection_with_tags(
@@ -946,7 +1618,7 @@ class TestUpdateConnectionWithTags:
         )
         assert mock_req.call_args.args[0] == "POST"
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_sends_connected_person_id(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.update_connection_with_tags(
@@ -955,7 +1627,7 @@ class TestUpdateConnectionWithTags:
         call_json = mock_req.call_args.kwargs["json"]
         assert call_json["connection"]["person_id"] == CONNECTED_PERSON_ID
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_sends_add_tags(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.update_connection_with_tags(
@@ -964,7 +1636,7 @@ class TestUpdateConnectionWithTags:
         call_json = mock_req.call_args.kwargs["json"]
         assert call_json["add_tags"] == SAMPLE_CONNECTION_TAGS
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_returns_dict(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         result = connected.update_connection_with_tags(
@@ -973,7 +1645,7 @@ class TestUpdateConnectionWithTags:
         assert isinstance(result, dict)
         assert result["id"] == CONNECTION_ID
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_returns_empty_dict_on_204(self, mock_req, connected):
         mock_req.return_value = _make_response(204)
         result = connected.update_connection_with_tags(
@@ -981,7 +1653,7 @@ class TestUpdateConnectionWithTags:
         )
         assert result == {}
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_no_remove_tags_in_body(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.update_connection_with_tags(
@@ -997,7 +1669,7 @@ class TestUpdateConnectionWithTags:
 
 
 class TestAppendConnectionNote:
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_posts_to_connections_endpoint(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.append_connection_note(
@@ -1011,7 +1683,7 @@ class TestAppendConnectionNote:
             f"/people/{PERSON_ID}/connections"
         )
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_sends_connection_person_id(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.append_connection_note(
@@ -1022,7 +1694,7 @@ class TestAppendConnectionNote:
         call_json = mock_req.call_args.kwargs["json"]
         assert call_json["connection"]["person_id"] == CONNECTED_PERSON_ID
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_sends_note_tag_with_all_fields(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.append_connection_note(
@@ -1038,7 +1710,7 @@ class TestAppendConnectionNote:
         assert tags[0]["name"] == "Follow-up"
         assert tags[0]["action_builder:note_response"] == "Discussed partnership"
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_returns_dict(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         result = connected.append_connection_note(
@@ -1049,7 +1721,7 @@ class TestAppendConnectionNote:
         assert isinstance(result, dict)
         assert result["id"] == CONNECTION_ID
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_returns_empty_dict_on_204(self, mock_req, connected):
         mock_req.return_value = _make_response(204)
         result = connected.append_connection_note(
@@ -1059,7 +1731,7 @@ class TestAppendConnectionNote:
         )
         assert result == {}
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_no_remove_tags_in_body(self, mock_req, connected):
         """remove_tags must never appear — it causes 500 from the AB API."""
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
@@ -1071,7 +1743,7 @@ class TestAppendConnectionNote:
         call_json = mock_req.call_args.kwargs["json"]
         assert "remove_tags" not in call_json
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_uses_post_method(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": CONNECTION_ID})
         connected.append_connection_note(
@@ -1094,7 +1766,7 @@ SAMPLE_PERSON_DATA = {
 
 
 class TestInsertEntity:
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_insert_with_tags_no_identifiers(self, mock_req, connected):
         mock_req.return_value = _make_response(201, {"id": PERSON_ID})
         connected.insert_entity(CAMPAIGN_ID, SAMPLE_PERSON_DATA, SAMPLE_ADD_TAGS)
@@ -1102,34 +1774,34 @@ class TestInsertEntity:
         assert call_json["person"] == SAMPLE_PERSON_DATA
         assert "identifiers" not in call_json["person"]
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_insert_with_tags_included(self, mock_req, connected):
         mock_req.return_value = _make_response(201, {"id": PERSON_ID})
         connected.insert_entity(CAMPAIGN_ID, SAMPLE_PERSON_DATA, SAMPLE_ADD_TAGS)
         call_json = mock_req.call_args.kwargs["json"]
         assert call_json["add_tags"] == SAMPLE_ADD_TAGS
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_insert_without_tags_omits_add_tags(self, mock_req, connected):
         mock_req.return_value = _make_response(201, {"id": PERSON_ID})
         connected.insert_entity(CAMPAIGN_ID, SAMPLE_PERSON_DATA)
         call_json = mock_req.call_args.kwargs["json"]
         assert "add_tags" not in call_json
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_posts_to_people_endpoint(self, mock_req, connected):
         mock_req.return_value = _make_response(201, {"id": PERSON_ID})
         connected.insert_entity(CAMPAIGN_ID, SAMPLE_PERSON_DATA)
         call_url = mock_req.call_args.args[1]
         assert call_url == f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/people"
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_returns_dict(self, mock_req, connected):
         mock_req.return_value = _make_response(201, {"id": PERSON_ID})
         result = connected.insert_entity(CAMPAIGN_ID, SAMPLE_PERSON_DATA)
         assert isinstance(result, dict)
 
-    @patch("ccef_connections.connectors.action_builder.requests.request")
+    @patch("ccef_connections.connectors.action_builder.requests.Session.request")
     def test_insert_with_empty_tags_list_omits_add_tags(self, mock_req, connected):
         mock_req.return_value = _make_response(201, {"id": PERSON_ID})
         connected.insert_entity(CAMPAIGN_ID, SAMPLE_PERSON_DATA, [])
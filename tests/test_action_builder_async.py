@@ -0,0 +1,321 @@
+"""Tests for the async Action Builder connector."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from ccef_connections.connectors.action_builder import (  # noqa: E402
+    ACTION_BUILDER_API_BASE,
+    DEFAULT_PER_PAGE,
+    FALLBACK_PER_PAGE,
+)
+from ccef_connections.connectors.action_builder_async import (  # noqa: E402
+    AsyncActionBuilderConnector,
+)
+from ccef_connections.exceptions import (  # noqa: E402
+    AuthenticationError,
+    ConnectionError,
+    RateLimitError,
+)
+
+from ._async_fakes import FakeResponse, use_session  # noqa: E402
+
+
+# -- helpers ----------------------------------------------------------------
+
+FAKE_API_TOKEN = "test-token-123"
+FAKE_SUBDOMAIN = "testorg"
+FAKE_CREDS = {"api_token": FAKE_API_TOKEN, "subdomain": FAKE_SUBDOMAIN}
+FAKE_BASE_URL = ACTION_BUILDER_API_BASE.format(subdomain=FAKE_SUBDOMAIN)
+
+CAMPAIGN_ID = "campaign-uuid-1"
+
+
+def _page(resource_key, items, page=1, total_pages=1, per_page=None):
+    """Build a page-based HAL body; per_page defaults to a full page of items."""
+    return {
+        "_embedded": {resource_key: items},
+        "page": page,
+        "per_page": len(items) if per_page is None else per_page,
+        "total_pages": total_pages,
+    }
+
+
+@pytest.fixture
+def connected():
+    """Return an async connector wired to a fake session."""
+    c = AsyncActionBuilderConnector()
+    c._credential_manager = MagicMock()
+    c._credential_manager.get_action_builder_credentials.return_value = FAKE_CREDS
+    c._api_token = FAKE_API_TOKEN
+    c._subdomain = FAKE_SUBDOMAIN
+    c._base_url = FAKE_BASE_URL
+    c._is_connected = True
+    return c
+
+
+# ==========================================================================
+# Lifecycle
+# ==========================================================================
+
+
+class TestLifecycle:
+    def test_rejects_bad_concurrency(self):
+        with pytest.raises(ValueError, match="concurrency"):
+            AsyncActionBuilderConnector(concurrency=0)
+
+    def test_connect_opens_pooled_session(self, connected):
+        async def run():
+            await connected.connect()
+            session = connected._session
+            assert isinstance(session, aiohttp.ClientSession)
+            assert session.headers["OSDI-Api-Token"] == FAKE_API_TOKEN
+            assert session.connector.limit == 10
+            await connected.disconnect()
+            assert session.closed
+            assert connected._session is None
+            assert not connected.is_connected()
+
+        asyncio.run(run())
+
+    def test_connect_wraps_credential_errors(self):
+        c = AsyncActionBuilderConnector()
+        c._credential_manager = MagicMock()
+        c._credential_manager.get_action_builder_credentials.side_effect = KeyError("x")
+        with pytest.raises(ConnectionError, match="Failed to connect"):
+            asyncio.run(c.connect())
+
+    def test_repr(self, connected):
+        assert repr(connected) == "<AsyncActionBuilderConnector status=connected>"
+
+
+# ==========================================================================
+# _request
+# ==========================================================================
+
+
+class TestRequest:
+    def test_get_success(self, connected):
+        session = use_session(connected, lambda *a: FakeResponse(200, {"ok": True}))
+        result = asyncio.run(connected._request("GET", "/campaigns"))
+        assert result == {"ok": True}
+        assert session.calls == [("GET", f"{FAKE_BASE_URL}/campaigns", None, None)]
+
+    def test_204_returns_none(self, connected):
+        use_session(connected, lambda *a: FakeResponse(204))
+        assert asyncio.run(connected._request("DELETE", "/x")) is None
+
+    def test_401_raises_auth_error(self, connected):
+        use_session(connected, lambda *a: FakeResponse(401, text="Unauthorized"))
+        with pytest.raises(AuthenticationError, match="401"):
+            asyncio.run(connected._request("GET", "/campaigns"))
+
+    def test_429_raises_rate_limit(self, connected):
+        use_session(connected, lambda *a: FakeResponse(429, headers={"Retry-After": "3"}))
+        with pytest.raises(RateLimitError) as exc_info:
+            asyncio.run(connected._request("GET", "/campaigns"))
+        assert exc_info.value.retry_after == 3
+
+    def test_pauses_when_rate_limit_budget_spent(self, connected):
+        headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"}
+        use_session(connected, lambda *a: FakeResponse(200, {}, headers=headers))
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            asyncio.run(connected._request("GET", "/campaigns"))
+            mock_sleep.assert_not_called()
+            asyncio.run(connected._request("GET", "/campaigns"))
+        mock_sleep.assert_awaited_once()
+
+    def test_500_raises_connection_error(self, connected):
+        use_session(connected, lambda *a: FakeResponse(500, text="boom"))
+        with pytest.raises(ConnectionError, match="500"):
+            asyncio.run(connected._request("GET", "/campaigns"))
+
+    def test_client_error_wrapped(self, connected):
+        use_session(connected, lambda *a: aiohttp.ClientConnectionError("down"))
+        with pytest.raises(ConnectionError, match="request failed"):
+            asyncio.run(connected._request("GET", "/campaigns"))
+
+    def test_in_flight_requests_bounded_by_concurrency(self, connected):
+        """Requests past the limit wait for a slot before they are sent."""
+        connected._concurrency = 2
+        in_flight = [0]
+        peak = [0]
+
+        class _SlowResponse(FakeResponse):
+            async def __aenter__(self):
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+                await asyncio.sleep(0.01)
+                return self
+
+            async def __aexit__(self, *exc):
+                in_flight[0] -= 1
+                return False
+
+        use_session(connected, lambda *a: _SlowResponse(200, {}))
+
+        async def run():
+            await asyncio.gather(*(connected._request("GET", "/campaigns") for _ in range(6)))
+
+        asyncio.run(run())
+        assert peak[0] == 2
+
+
+# ==========================================================================
+# Pagination
+# ==========================================================================
+
+
+def _paged_people(total_pages):
+    def responder(method, url, params, json):
+        page = params["page"]
+        return FakeResponse(
+            200, _page("osdi:people", [{"id": f"p{page}"}], page, total_pages)
+        )
+
+    return responder
+
+
+class TestPagination:
+    def test_single_page(self, connected):
+        session = use_session(connected, _paged_people(1))
+        result = asyncio.run(connected.list_people(CAMPAIGN_ID))
+        assert result == [{"id": "p1"}]
+        assert len(session.calls) == 1
+
+    def test_multi_page_keeps_order(self, connected):
+        session = use_session(connected, _paged_people(4))
+        result = asyncio.run(connected.list_people(CAMPAIGN_ID, modified_since="2026-01-01"))
+        assert [r["id"] for r in result] == ["p1", "p2", "p3", "p4"]
+        assert sorted(call[2]["page"] for call in session.calls) == [1, 2, 3, 4]
+        assert all("modified_date gt" in call[2]["filter"] for call in session.calls)
+
+    def test_per_page_threaded_through(self, connected):
+        session = use_session(connected, _paged_people(1))
+        asyncio.run(connected.list_people(CAMPAIGN_ID, per_page=50))
+        assert session.calls[0][2]["per_page"] == 50
+
+    def test_follows_next_link_past_stale_total_pages(self, connected):
+        def responder(method, url, params, json):
+            page = params["page"]
+            body = _page("osdi:people", [{"id": f"p{page}"}], page, total_pages=2)
+            if page < 3:
+                href = f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/people?page={page + 1}"
+                body["_links"] = {"next": {"href": href}}
+            else:
+                body["_links"] = {}
+            return FakeResponse(200, body)
+
+        session = use_session(connected, responder)
+        result = asyncio.run(connected.list_people(CAMPAIGN_ID))
+        assert [r["id"] for r in result] == ["p1", "p2", "p3"]
+        assert [call[2]["page"] for call in session.calls] == [1, 2, 3]
+
+    def test_rejected_per_page_falls_back_and_is_remembered(self, connected):
+        responses = [
+            FakeResponse(400, text="per_page too large"),
+            FakeResponse(200, _page("osdi:tags", [{"id": "1"}])),
+            FakeResponse(200, _page("osdi:people", [])),
+        ]
+        session = use_session(connected, lambda *a: responses.pop(0))
+
+        assert asyncio.run(connected.list_tags(CAMPAIGN_ID)) == [{"id": "1"}]
+        asyncio.run(connected.list_people(CAMPAIGN_ID))
+
+        sent = [call[2]["per_page"] for call in session.calls]
+        assert sent == [DEFAULT_PER_PAGE, FALLBACK_PER_PAGE, FALLBACK_PER_PAGE]
+
+    def test_other_400_is_not_masked(self, connected):
+        session = use_session(connected, lambda *a: FakeResponse(400, text="bad filter"))
+        with pytest.raises(ConnectionError, match="400"):
+            asyncio.run(connected.list_people(CAMPAIGN_ID))
+        assert len(session.calls) == 2
+        assert connected._per_page_cap is None
+
+    def test_list_taggings_and_connections(self, connected):
+        def responder(method, url, params, json):
+            key = "osdi:taggings" if "/taggings" in url else "action_builder:connections"
+            return FakeResponse(200, _page(key, [{"url": url}]))
+
+        session = use_session(connected, responder)
+
+        async def run():
+            return await asyncio.gather(
+                connected.list_taggings(CAMPAIGN_ID, "t1"),
+                connected.list_connections(CAMPAIGN_ID, "p1"),
+            )
+
+        taggings, connections = asyncio.run(run())
+        assert taggings == [{"url": f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/tags/t1/taggings"}]
+        assert connections == [
+            {"url": f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/people/p1/connections"}
+        ]
+        assert len(session.calls) == 2
+
+    def test_throttled_page_retried_alone(self, connected):
+        throttled = []
+
+        def responder(method, url, params, json):
+            page = params["page"]
+            if page == 2 and not throttled:
+                throttled.append(True)
+                return FakeResponse(429, headers={"Retry-After": "1"})
+            return FakeResponse(200, _page("osdi:people", [{"id": f"p{page}"}], page, 3))
+
+        session = use_session(connected, responder)
+        with patch.object(
+            AsyncActionBuilderConnector._get_page.retry, "sleep", new_callable=AsyncMock
+        ):
+            result = asyncio.run(connected.list_people(CAMPAIGN_ID))
+
+        assert [r["id"] for r in result] == ["p1", "p2", "p3"]
+        assert sorted(call[2]["page"] for call in session.calls) == [1, 2, 2, 3]
+
+
+# ==========================================================================
+# Tags
+# ==========================================================================
+
+
+class TestTags:
+    def test_delete_tagging_404_is_success(self, connected):
+        use_session(connected, lambda *a: FakeResponse(404, text="Not Found"))
+        assert asyncio.run(connected.delete_tagging(CAMPAIGN_ID, "t", "tg")) == "404"
+
+    def test_update_entity_with_tags_body(self, connected):
+        session = use_session(connected, lambda *a: FakeResponse(200, {"id": "p1"}))
+        tags = [{"action_builder:section": "S", "action_builder:field": "F", "name": "N"}]
+        result = asyncio.run(connected.update_entity_with_tags(CAMPAIGN_ID, "p1", tags))
+        assert result == {"id": "p1"}
+        method, url, _, body = session.calls[0]
+        assert method == "POST"
+        assert url == f"{FAKE_BASE_URL}/campaigns/{CAMPAIGN_ID}/people"
+        assert body == {"person": {"identifiers": ["action_builder:p1"]}, "add_tags": tags}
+
+    def test_replace_entity_tags(self, connected):
+        session = use_session(connected, lambda m, *a: FakeResponse(204 if m == "DELETE" else 200))
+        asyncio.run(
+            connected.replace_entity_tags(CAMPAIGN_ID, "p1", [("t", "a"), ("t", "b")], [{}])
+        )
+        assert [c[0] for c in session.calls] == ["DELETE", "DELETE", "POST"]
+
+    def test_bulk_update_collects_results_and_errors(self, connected):
+        def responder(method, url, params, json):
+            entity = json["person"]["identifiers"][0].split(":")[1]
+            if entity == "bad":
+                return FakeResponse(500, text="boom")
+            return FakeResponse(200, {"id": entity})
+
+        session = use_session(connected, responder)
+        results = asyncio.run(
+            connected.bulk_update_entity_tags(
+                CAMPAIGN_ID, [("p1", []), ("bad", []), ("p2", [])]
+            )
+        )
+        assert results["p1"] == {"id": "p1"}
+        assert results["p2"] == {"id": "p2"}
+        assert isinstance(results["bad"], ConnectionError)
+        assert len(session.calls) == 3
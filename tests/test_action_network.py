@@ -1,5 +1,7 @@
 """Tests for the Action Network connector."""
 
+import json
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,10 +9,14 @@ import requests
 
 from ccef_connections.connectors.action_network import (
     ACTION_NETWORK_API_BASE,
+    ETAG_CACHE_MAXSIZE,
+    HEALTH_CHECK_TTL,
     ActionNetworkConnector,
+    _next_path,
 )
 from ccef_connections.exceptions import (
     AuthenticationError,
+    ClientError,
     ConnectionError,
     CredentialError,
     RateLimitError,
@@ -29,6 +35,7 @@ def _make_response(status_code=200, json_data=None, text="", headers=None):
     resp.text = text
     resp.headers = headers or {}
     resp.json.return_value = json_data or {}
+    resp.content = json.dumps(json_data or {}).encode()
     return resp
 
 
@@ -55,11 +62,17 @@ def connector():
         yield c
 
 
+@pytest.fixture(autouse=True)
+def no_retry_sleep():
+    """Skip tenacity back-off sleeps so retried requests do not slow the suite."""
+    with patch.object(ActionNetworkConnector._request.retry, "sleep") as mock_sleep:
+        yield mock_sleep
+
+
 @pytest.fixture
 def connected(connector):
     """Return a connector that is already connected."""
-    connector._api_key = FAKE_API_KEY
-    connector._is_connected = True
+    connector.connect()
     return connector
 
 
@@ -92,6 +105,30 @@ class TestConnect:
         connector.connect()
         assert connector.is_connected()
         assert connector._api_key == FAKE_API_KEY
+        assert connector._headers["OSDI-API-Token"] == FAKE_API_KEY
+
+    def test_connectors_share_one_session(self, connector):
+        other = ActionNetworkConnector()
+        assert connector._get_session() is other._get_session()
+        assert "OSDI-API-Token" not in connector._get_session().headers
+
+    def test_session_override(self, connector):
+        session = MagicMock()
+        c = ActionNetworkConnector(session=session)
+        assert c._get_session() is session
+        assert connector._get_session() is not session
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_each_connector_sends_its_own_key(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, {})
+        other = ActionNetworkConnector()
+        other._credential_manager = MagicMock()
+        other._credential_manager.get_action_network_key.return_value = "other-key"
+        other.connect()
+        connected._request("GET", "/people")
+        other._request("GET", "/people")
+        sent = [c.kwargs["headers"]["OSDI-API-Token"] for c in mock_req.call_args_list]
+        assert sent == [FAKE_API_KEY, "other-key"]
 
     def test_connect_missing_credentials(self):
         c = ActionNetworkConnector()
@@ -106,6 +143,16 @@ class TestConnect:
         assert not connected.is_connected()
         assert connected._api_key is None
 
+    def test_disconnect_leaves_shared_session_open(self, connected):
+        session = MagicMock()
+        with patch(
+            "ccef_connections.connectors.action_network._get_shared_session",
+            return_value=session,
+        ):
+            connected.disconnect()
+        session.close.assert_not_called()
+        assert connected._headers == {}
+
 
 # ==========================================================================
 # Health Check
@@ -116,16 +163,41 @@ class TestHealthCheck:
     def test_not_connected(self, connector):
         assert connector.health_check() is False
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_success(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"motd": "Welcome"})
         assert connected.health_check() is True
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_failure(self, mock_req, connected):
         mock_req.side_effect = requests.ConnectionError("down")
         assert connected.health_check() is False
 
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_success_cached_within_ttl(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, {"motd": "Welcome"})
+        assert connected.health_check() is True
+        assert connected.health_check() is True
+        assert mock_req.call_count == 1
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_cache_expires_after_ttl(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, {"motd": "Welcome"})
+        with patch("ccef_connections.connectors.action_network.time.monotonic") as clock:
+            clock.return_value = 100.0
+            connected.health_check()
+            clock.return_value = 100.0 + HEALTH_CHECK_TTL
+            connected.health_check()
+        assert mock_req.call_count == 2
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_disconnect_clears_cache(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, {"motd": "Welcome"})
+        connected.health_check()
+        connected.disconnect()
+        assert connected._entry_point is None
+        assert connected.health_check() is False
+
 
 # ==========================================================================
 # _request – HTTP layer
@@ -133,7 +205,7 @@ class TestHealthCheck:
 
 
 class TestRequest:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_success(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"ok": True})
         result = connected._request("GET", "/people")
@@ -141,16 +213,16 @@ class TestRequest:
         mock_req.assert_called_once_with(
             "GET",
             f"{ACTION_NETWORK_API_BASE}/people",
+            params=None,
+            json=None,
             headers={
                 "OSDI-API-Token": FAKE_API_KEY,
                 "Content-Type": "application/hal+json",
             },
-            params=None,
-            json=None,
             timeout=30,
         )
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_post_with_body(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": "abc"})
         body = {"name": "Test"}
@@ -159,13 +231,13 @@ class TestRequest:
         call_kwargs = mock_req.call_args
         assert call_kwargs.kwargs["json"] == body
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_401_raises_auth_error(self, mock_req, connected):
         mock_req.return_value = _make_response(401, text="Unauthorized")
         with pytest.raises(AuthenticationError, match="401"):
             connected._request("GET", "/people")
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_429_raises_rate_limit_error(self, mock_req, connected):
         mock_req.return_value = _make_response(
             429, text="Too Many Requests", headers={"Retry-After": "2"}
@@ -173,31 +245,70 @@ class TestRequest:
         with pytest.raises(RateLimitError, match="rate limit"):
             connected._request("GET", "/people")
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_404_raises_connection_error(self, mock_req, connected):
         mock_req.return_value = _make_response(404, text="Not Found")
         with pytest.raises(ConnectionError, match="404"):
             connected._request("GET", "/people/nope")
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_401_is_not_retried(self, mock_req, connected):
+        mock_req.return_value = _make_response(401, text="Unauthorized")
+        with pytest.raises(AuthenticationError):
+            connected.list_tags()
+        assert mock_req.call_count == 1
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_4xx_is_client_error_and_not_retried(self, mock_req, connected):
+        mock_req.return_value = _make_response(422, text="Unprocessable")
+        with pytest.raises(ClientError) as exc_info:
+            connected.get_person("abc")
+        assert exc_info.value.status_code == 422
+        assert mock_req.call_count == 1
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_5xx_is_retried(self, mock_req, connected, no_retry_sleep):
+        mock_req.side_effect = [
+            _make_response(503, text="Unavailable"),
+            _make_response(200, {"id": "abc"}),
+        ]
+        assert connected.get_person("abc") == {"id": "abc"}
+        assert mock_req.call_count == 2
+        no_retry_sleep.assert_called_once()
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_500_raises_connection_error(self, mock_req, connected):
         mock_req.return_value = _make_response(500, text="Internal Server Error")
         with pytest.raises(ConnectionError, match="500"):
             connected._request("GET", "/people")
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_204_returns_none(self, mock_req, connected):
         mock_req.return_value = _make_response(204)
         result = connected._request("DELETE", "/tags/x/taggings/y")
         assert result is None
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_decodes_body_with_json_loads(self, mock_req, connected):
+        resp = _make_response(200, {"given_name": "Jane"})
+        mock_req.return_value = resp
+        assert connected._request("GET", "/people/1") == {"given_name": "Jane"}
+        resp.json.assert_not_called()
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_empty_body_returns_none(self, mock_req, connected):
+        resp = _make_response(200)
+        resp.content = b""
+        mock_req.return_value = resp
+        assert connected._request("POST", "/people") is None
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_network_error(self, mock_req, connected):
         mock_req.side_effect = requests.ConnectionError("DNS failure")
         with pytest.raises(ConnectionError, match="request failed"):
             connected._request("GET", "/people")
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_auto_connect_when_not_connected(self, mock_req, connector):
         mock_req.return_value = _make_response(200, {"ok": True})
         result = connector._request("GET", "/people")
@@ -205,13 +316,89 @@ class TestRequest:
         assert connector.is_connected()
 
 
+
+class TestConditionalGet:
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_304_returns_stored_body(self, mock_req, connected):
+        mock_req.side_effect = [
+            _make_response(200, {"name": "volunteer"}, headers={"ETag": '"v1"'}),
+            _make_response(304),
+        ]
+        first = connected.get_tag("t1")
+        second = connected.get_tag("t1")
+        assert first == second == {"name": "volunteer"}
+        assert "If-None-Match" not in mock_req.call_args_list[0].kwargs["headers"]
+        assert mock_req.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_new_etag_replaces_stored_body(self, mock_req, connected):
+        mock_req.side_effect = [
+            _make_response(200, {"v": 1}, headers={"ETag": '"v1"'}),
+            _make_response(200, {"v": 2}, headers={"ETag": '"v2"'}),
+            _make_response(304),
+        ]
+        connected.get_tag("t1")
+        assert connected.get_tag("t1") == {"v": 2}
+        assert connected.get_tag("t1") == {"v": 2}
+        assert mock_req.call_args_list[2].kwargs["headers"]["If-None-Match"] == '"v2"'
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_304_returns_fresh_copy(self, mock_req, connected):
+        """Mutating a returned body does not change later 304 responses."""
+        mock_req.side_effect = [
+            _make_response(200, {"name": "volunteer"}, headers={"ETag": '"v1"'}),
+            _make_response(304),
+            _make_response(304),
+        ]
+        connected.get_tag("t1")["name"] = "changed"
+        connected.get_tag("t1")["name"] = "changed again"
+        assert connected.get_tag("t1") == {"name": "volunteer"}
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_streams_skip_etag_cache(self, mock_req, connected):
+        mock_req.return_value = _make_response(
+            200, _page("osdi:people", [{"id": 1}]), headers={"ETag": "e"}
+        )
+        list(connected.iter_people())
+        list(connected.iter_people())
+        assert connected._etags == {}
+        assert all("If-None-Match" not in c.kwargs["headers"] for c in mock_req.call_args_list)
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_keyed_by_params_and_get_only(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, _page("osdi:people", []), headers={"ETag": "e"})
+        connected.list_people(filter="a")
+        connected.list_people(filter="b")
+        connected.create_person(email="a@b.com")
+        connected.create_person(email="a@b.com")
+        assert all("If-None-Match" not in c.kwargs["headers"] for c in mock_req.call_args_list)
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_disconnect_and_clear_forget_etags(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, {}, headers={"ETag": "e"})
+        connected.get_tag("t1")
+        connected.clear_etag_cache()
+        connected.get_tag("t1")
+        assert "If-None-Match" not in mock_req.call_args.kwargs["headers"]
+        connected.disconnect()
+        assert connected._etags == {}
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_cache_is_bounded(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, {}, headers={"ETag": "e"})
+        for n in range(ETAG_CACHE_MAXSIZE + 5):
+            connected.get_tag(f"t{n}")
+        assert len(connected._etags) == ETAG_CACHE_MAXSIZE
+        assert ("/tags/t0", ()) not in connected._etags
+
+
 # ==========================================================================
 # _paginate
 # ==========================================================================
 
 
 class TestPaginate:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_single_page(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:people", [{"id": "1"}, {"id": "2"}])
@@ -219,7 +406,7 @@ class TestPaginate:
         result = connected._paginate("/people", "osdi:people")
         assert len(result) == 2
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_multi_page(self, mock_req, connected):
         page1 = _page(
             "osdi:people",
@@ -236,26 +423,138 @@ class TestPaginate:
         assert result[0]["id"] == "1"
         assert result[1]["id"] == "2"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_empty_page(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"_embedded": {}, "_links": {}})
         result = connected._paginate("/people", "osdi:people")
         assert result == []
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_none_response(self, mock_req, connected):
         mock_req.return_value = _make_response(204)
         result = connected._paginate("/people", "osdi:people")
         assert result == []
 
 
+class TestNextPath:
+    @pytest.mark.parametrize(
+        "data,expected",
+        [
+            (
+                {"_links": {"next": {"href": f"{ACTION_NETWORK_API_BASE}/people?page=2"}}},
+                "/people?page=2",
+            ),
+            ({"_links": {"next": {"href": "/people?page=3"}}}, "/people?page=3"),
+            ({"_links": {"self": {"href": "x"}}}, None),
+            ({"_links": {"next": {"href": ""}}}, None),
+            ({}, None),
+        ],
+    )
+    def test_next_path(self, data, expected):
+        assert _next_path(data) == expected
+
+
+class TestIterResources:
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_prefetches_next_page_before_yielding(self, mock_req, connected):
+        page1 = _page(
+            "osdi:people",
+            [{"id": "1"}],
+            next_href=f"{ACTION_NETWORK_API_BASE}/people?page=2",
+        )
+        page2 = _page("osdi:people", [{"id": "2"}])
+        requested = []
+
+        def respond(method, url, **kwargs):
+            requested.append(url)
+            return _make_response(200, page1 if len(requested) == 1 else page2)
+
+        mock_req.side_effect = respond
+        pages = connected._iter_pages("/people")
+        assert next(pages) is not None
+        # Page 2 is requested while the caller still holds page 1
+        for _ in range(100):
+            if len(requested) == 2:
+                break
+            time.sleep(0.01)
+        assert requested == [
+            f"{ACTION_NETWORK_API_BASE}/people",
+            f"{ACTION_NETWORK_API_BASE}/people?page=2",
+        ]
+        assert list(pages) == [page2]
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_iter_people_streams_in_order(self, mock_req, connected):
+        page1 = _page(
+            "osdi:people",
+            [{"id": "1"}, {"id": "2"}],
+            next_href=f"{ACTION_NETWORK_API_BASE}/people?page=2",
+        )
+        mock_req.side_effect = [
+            _make_response(200, page1),
+            _make_response(200, _page("osdi:people", [{"id": "3"}])),
+        ]
+        result = connected.iter_people(filter="x")
+        assert not isinstance(result, list)
+        assert [p["id"] for p in result] == ["1", "2", "3"]
+        assert mock_req.call_args_list[0].kwargs["params"] == {"filter": "x"}
+        assert mock_req.call_args_list[1].kwargs["params"] is None
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_iter_retries_failed_page(self, mock_req, connected):
+        page1 = _page(
+            "osdi:signatures",
+            [{"id": "s1"}],
+            next_href=f"{ACTION_NETWORK_API_BASE}/petitions/p/signatures?page=2",
+        )
+        mock_req.side_effect = [
+            _make_response(200, page1),
+            _make_response(429, headers={"Retry-After": "1"}),
+            _make_response(200, _page("osdi:signatures", [{"id": "s2"}])),
+        ]
+        result = list(connected.iter_signatures("p"))
+        assert [s["id"] for s in result] == ["s1", "s2"]
+        assert mock_req.call_count == 3
+
+
+# ==========================================================================
+# list_resources
+# ==========================================================================
+
+
+class TestListResources:
+    @pytest.mark.parametrize(
+        "kind,path,key",
+        [
+            ("custom_fields", "/metadata", "osdi:metadata"),
+            ("event_campaigns", "/event_campaigns", "action_network:event_campaigns"),
+            ("wrappers", "/wrappers", "osdi:wrappers"),
+        ],
+    )
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_dispatches_by_kind(self, mock_req, connected, kind, path, key):
+        mock_req.return_value = _make_response(200, _page(key, [{"id": "x"}]))
+        assert connected.list_resources(kind) == [{"id": "x"}]
+        assert mock_req.call_args.args[1] == f"{ACTION_NETWORK_API_BASE}{path}"
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_passes_filters(self, mock_req, connected):
+        mock_req.return_value = _make_response(200, _page("osdi:people", []))
+        connected.list_resources("people", filter="x")
+        assert mock_req.call_args.kwargs["params"] == {"filter": "x"}
+
+    def test_unknown_kind(self, connected):
+        with pytest.raises(ValueError, match="Unknown Action Network collection 'nope'"):
+            connected.list_resources("nope")
+
+
 # ==========================================================================
 # People
 # ==========================================================================
 
 
 class TestPeople:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_people(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:people", [{"given_name": "Jane"}])
@@ -264,7 +563,7 @@ class TestPeople:
         assert len(result) == 1
         assert result[0]["given_name"] == "Jane"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_people_with_filters(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:people", [])
@@ -275,7 +574,7 @@ class TestPeople:
             "filter": "email_address eq 'a@b.com'"
         }
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_person(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, {"given_name": "Jane", "family_name": "Doe"}
@@ -283,7 +582,7 @@ class TestPeople:
         result = connected.get_person("abc-123")
         assert result["given_name"] == "Jane"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_person_basic(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"identifiers": ["an:1"]})
         result = connected.create_person(email="a@b.com")
@@ -292,7 +591,7 @@ class TestPeople:
         assert body["person"]["email_addresses"] == [{"address": "a@b.com"}]
         assert "add_tags" not in body
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_person_with_name_and_tags(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"identifiers": ["an:2"]})
         connected.create_person(
@@ -306,7 +605,7 @@ class TestPeople:
         assert body["person"]["family_name"] == "Doe"
         assert body["add_tags"] == ["volunteer", "2024"]
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_person_with_kwargs(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {})
         connected.create_person(
@@ -316,7 +615,7 @@ class TestPeople:
         body = mock_req.call_args.kwargs["json"]
         assert body["person"]["postal_addresses"] == [{"postal_code": "20001"}]
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_update_person(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"given_name": "Janet"})
         result = connected.update_person("abc-123", {"given_name": "Janet"})
@@ -324,13 +623,51 @@ class TestPeople:
         assert mock_req.call_args.args[0] == "PUT"
 
 
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_create_people_bulk_keeps_order_and_errors(self, mock_req, connected):
+        def respond(method, url, json=None, **kwargs):
+            email = json["person"]["email_addresses"][0]["address"]
+            if email == "bad@b.com":
+                return _make_response(500, text="boom")
+            return _make_response(200, {"email": email})
+
+        mock_req.side_effect = respond
+        records = [
+            {"email": "a@b.com", "tags": ["t"]},
+            {"email": "bad@b.com"},
+            {"email": "c@b.com"},
+        ]
+        results = connected.create_people_bulk(records, max_workers=2)
+        assert results[0] == {"email": "a@b.com"}
+        assert isinstance(results[1], ConnectionError)
+        assert results[2] == {"email": "c@b.com"}
+
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
+    def test_create_people_bulk_resends_only_rate_limited_record(self, mock_req, connected):
+        limited = []
+
+        def respond(method, url, json=None, **kwargs):
+            email = json["person"]["email_addresses"][0]["address"]
+            if email == "slow@b.com" and not limited:
+                limited.append(email)
+                return _make_response(429, headers={"Retry-After": "1"})
+            return _make_response(200, {"email": email})
+
+        mock_req.side_effect = respond
+        results = connected.create_people_bulk(
+            [{"email": "a@b.com"}, {"email": "slow@b.com"}]
+        )
+        assert results == [{"email": "a@b.com"}, {"email": "slow@b.com"}]
+        assert mock_req.call_count == 3
+
+
 # ==========================================================================
 # Unsubscribe
 # ==========================================================================
 
 
 class TestUnsubscribe:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_unsubscribe_person_by_id(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200,
@@ -346,14 +683,14 @@ class TestUnsubscribe:
         body = mock_req.call_args.kwargs["json"]
         assert body == {"email_addresses": [{"status": "unsubscribed"}]}
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_unsubscribe_person_by_id_sends_correct_url(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {})
         connected.unsubscribe_person("d91b4b2e-ae0e-4cd3-9ed7-deadbeef")
         url = mock_req.call_args.args[1]
         assert url.endswith("/people/d91b4b2e-ae0e-4cd3-9ed7-deadbeef")
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_unsubscribe_person_by_email(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200,
@@ -375,7 +712,7 @@ class TestUnsubscribe:
             },
         }
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_unsubscribe_person_by_email_uses_signup_helper(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {})
         connected.unsubscribe_person_by_email("test@example.com")
@@ -390,7 +727,7 @@ class TestUnsubscribe:
 
 
 class TestTags:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_tags(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:tags", [{"name": "volunteer"}])
@@ -398,13 +735,13 @@ class TestTags:
         result = connected.list_tags()
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_tag(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"name": "volunteer"})
         result = connected.get_tag("tag-1")
         assert result["name"] == "volunteer"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_tag(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"name": "new-tag"})
         result = connected.create_tag("new-tag")
@@ -419,7 +756,7 @@ class TestTags:
 
 
 class TestTaggings:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_taggings(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:taggings", [{"id": "t1"}])
@@ -427,7 +764,7 @@ class TestTaggings:
         result = connected.list_taggings("tag-1")
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_add_tagging_single(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": "tagging-1"})
         result = connected.add_tagging(
@@ -440,7 +777,7 @@ class TestTaggings:
             "https://actionnetwork.org/api/v2/people/abc-123"
         )
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_add_tagging_multiple(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {})
         connected.add_tagging(
@@ -454,7 +791,7 @@ class TestTaggings:
         assert isinstance(body["_links"]["osdi:person"], list)
         assert len(body["_links"]["osdi:person"]) == 2
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_delete_tagging(self, mock_req, connected):
         mock_req.return_value = _make_response(204)
         connected.delete_tagging("tag-1", "tagging-1")
@@ -467,7 +804,7 @@ class TestTaggings:
 
 
 class TestEvents:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_events(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:events", [{"title": "Rally"}])
@@ -475,13 +812,13 @@ class TestEvents:
         result = connected.list_events()
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_event(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "Rally"})
         result = connected.get_event("ev-1")
         assert result["title"] == "Rally"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_event(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "Rally"})
         result = connected.create_event("Rally", start_date="2026-03-01T10:00:00Z")
@@ -489,7 +826,7 @@ class TestEvents:
         assert body["title"] == "Rally"
         assert body["start_date"] == "2026-03-01T10:00:00Z"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_update_event(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "Updated"})
         result = connected.update_event("ev-1", {"title": "Updated"})
@@ -503,7 +840,7 @@ class TestEvents:
 
 
 class TestAttendances:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_attendances(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:attendances", [{"id": "a1"}])
@@ -511,13 +848,13 @@ class TestAttendances:
         result = connected.list_attendances("ev-1")
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_attendance(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": "a1"})
         result = connected.get_attendance("ev-1", "a1")
         assert result["id"] == "a1"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_attendance(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": "a2"})
         person = {"person": {"email_addresses": [{"address": "a@b.com"}]}}
@@ -531,7 +868,7 @@ class TestAttendances:
 
 
 class TestPetitions:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_petitions(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:petitions", [{"title": "Save the Park"}])
@@ -539,13 +876,13 @@ class TestPetitions:
         result = connected.list_petitions()
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_petition(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "Save the Park"})
         result = connected.get_petition("pet-1")
         assert result["title"] == "Save the Park"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_petition(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "New Petition"})
         result = connected.create_petition("New Petition", description="Test")
@@ -553,7 +890,7 @@ class TestPetitions:
         assert body["title"] == "New Petition"
         assert body["description"] == "Test"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_update_petition(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "Updated"})
         result = connected.update_petition("pet-1", {"title": "Updated"})
@@ -566,7 +903,7 @@ class TestPetitions:
 
 
 class TestSignatures:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_signatures(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:signatures", [{"id": "s1"}])
@@ -574,20 +911,20 @@ class TestSignatures:
         result = connected.list_signatures("pet-1")
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_signature(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": "s1"})
         result = connected.get_signature("pet-1", "s1")
         assert result["id"] == "s1"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_signature(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": "s2"})
         person = {"person": {"email_addresses": [{"address": "a@b.com"}]}}
         result = connected.create_signature("pet-1", person)
         assert result["id"] == "s2"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_update_signature(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": "s1"})
         result = connected.update_signature("pet-1", "s1", {"comments": "updated"})
@@ -600,7 +937,7 @@ class TestSignatures:
 
 
 class TestForms:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_forms(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:forms", [{"title": "Signup"}])
@@ -608,19 +945,19 @@ class TestForms:
         result = connected.list_forms()
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_form(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "Signup"})
         result = connected.get_form("form-1")
         assert result["title"] == "Signup"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_form(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "New Form"})
         result = connected.create_form("New Form")
         assert result["title"] == "New Form"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_update_form(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "Updated"})
         result = connected.update_form("form-1", {"title": "Updated"})
@@ -633,7 +970,7 @@ class TestForms:
 
 
 class TestSubmissions:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_submissions(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:submissions", [{"id": "sub1"}])
@@ -641,13 +978,13 @@ class TestSubmissions:
         result = connected.list_submissions("form-1")
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_submission(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": "sub1"})
         result = connected.get_submission("form-1", "sub1")
         assert result["id"] == "sub1"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_submission(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": "sub2"})
         person = {"person": {"email_addresses": [{"address": "a@b.com"}]}}
@@ -661,7 +998,7 @@ class TestSubmissions:
 
 
 class TestFundraisingPages:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_fundraising_pages(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:fundraising_pages", [{"title": "Donate"}])
@@ -669,19 +1006,19 @@ class TestFundraisingPages:
         result = connected.list_fundraising_pages()
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_fundraising_page(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "Donate"})
         result = connected.get_fundraising_page("fp-1")
         assert result["title"] == "Donate"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_fundraising_page(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "New Page"})
         result = connected.create_fundraising_page("New Page")
         assert result["title"] == "New Page"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_update_fundraising_page(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "Updated"})
         result = connected.update_fundraising_page("fp-1", {"title": "Updated"})
@@ -694,7 +1031,7 @@ class TestFundraisingPages:
 
 
 class TestDonations:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_donations(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:donations", [{"id": "d1"}])
@@ -702,13 +1039,13 @@ class TestDonations:
         result = connected.list_donations("fp-1")
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_donation(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": "d1"})
         result = connected.get_donation("fp-1", "d1")
         assert result["id"] == "d1"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_donation(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": "d2"})
         data = {
@@ -725,7 +1062,7 @@ class TestDonations:
 
 
 class TestLists:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_lists(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:lists", [{"name": "Active Volunteers"}])
@@ -733,7 +1070,7 @@ class TestLists:
         result = connected.list_lists()
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_list(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"name": "Active Volunteers"})
         result = connected.get_list("list-1")
@@ -746,7 +1083,7 @@ class TestLists:
 
 
 class TestMessages:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_messages(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:messages", [{"subject": "Hello"}])
@@ -754,13 +1091,13 @@ class TestMessages:
         result = connected.list_messages()
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_message(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"subject": "Hello"})
         result = connected.get_message("msg-1")
         assert result["subject"] == "Hello"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_message(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"subject": "Hello"})
         result = connected.create_message(
@@ -780,7 +1117,7 @@ class TestMessages:
 
 
 class TestWrappers:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_wrappers(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:wrappers", [{"id": "w1"}])
@@ -788,13 +1125,13 @@ class TestWrappers:
         result = connected.list_wrappers()
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_wrapper(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": "w1"})
         result = connected.get_wrapper("w1")
         assert result["id"] == "w1"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_wrapper(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": "w2"})
         result = connected.create_wrapper(header="<h1>Hi</h1>", footer="<p>Bye</p>")
@@ -802,7 +1139,7 @@ class TestWrappers:
         assert body["header"] == "<h1>Hi</h1>"
         assert body["footer"] == "<p>Bye</p>"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_update_wrapper(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"id": "w1"})
         result = connected.update_wrapper("w1", {"header": "<h1>Updated</h1>"})
@@ -815,7 +1152,7 @@ class TestWrappers:
 
 
 class TestCustomFields:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_custom_fields(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:metadata", [{"name": "district"}])
@@ -823,20 +1160,20 @@ class TestCustomFields:
         result = connected.list_custom_fields()
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_custom_field(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"name": "district"})
         result = connected.get_custom_field("cf-1")
         assert result["name"] == "district"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_custom_field(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"name": "district"})
         result = connected.create_custom_field("district", "text")
         body = mock_req.call_args.kwargs["json"]
         assert body == {"name": "district", "format": "text"}
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_update_custom_field(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"name": "district"})
         result = connected.update_custom_field("cf-1", {"name": "district_v2"})
@@ -849,7 +1186,7 @@ class TestCustomFields:
 
 
 class TestEventCampaigns:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_event_campaigns(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200,
@@ -858,26 +1195,26 @@ class TestEventCampaigns:
         result = connected.list_event_campaigns()
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_get_event_campaign(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "Campaign 1"})
         result = connected.get_event_campaign("ec-1")
         assert result["title"] == "Campaign 1"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_event_campaign(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "New Campaign"})
         result = connected.create_event_campaign("New Campaign")
         body = mock_req.call_args.kwargs["json"]
         assert body["title"] == "New Campaign"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_update_event_campaign(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "Updated"})
         result = connected.update_event_campaign("ec-1", {"title": "Updated"})
         assert mock_req.call_args.args[0] == "PUT"
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_list_campaign_events(self, mock_req, connected):
         mock_req.return_value = _make_response(
             200, _page("osdi:events", [{"title": "Event in Campaign"}])
@@ -885,7 +1222,7 @@ class TestEventCampaigns:
         result = connected.list_campaign_events("ec-1")
         assert len(result) == 1
 
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_create_campaign_event(self, mock_req, connected):
         mock_req.return_value = _make_response(200, {"title": "New Event"})
         result = connected.create_campaign_event(
@@ -900,7 +1237,7 @@ class TestEventCampaigns:
 
 
 class TestContextManager:
-    @patch("ccef_connections.connectors.action_network.requests.request")
+    @patch("ccef_connections.connectors.action_network.requests.Session.request")
     def test_context_manager(self, mock_req, connector):
         mock_req.return_value = _make_response(200, {"motd": "Welcome"})
         with connector as c:
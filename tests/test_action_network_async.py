@@ -0,0 +1,270 @@
+"""Tests for the async Action Network connector."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from ccef_connections.connectors.action_network import ACTION_NETWORK_API_BASE  # noqa: E402
+from ccef_connections.connectors.action_network_async import (  # noqa: E402
+    AsyncActionNetworkConnector,
+)
+from ccef_connections.exceptions import (  # noqa: E402
+    AuthenticationError,
+    ConnectionError,
+    RateLimitError,
+)
+
+from ._async_fakes import FakeResponse, use_session  # noqa: E402
+
+
+# -- helpers ----------------------------------------------------------------
+
+FAKE_API_KEY = "test-an-key"
+
+
+def _page(resource_key, items, next_href=None, total_pages=None):
+    """Build a HAL page, optionally with a next link and total_pages."""
+    body = {"_embedded": {resource_key: items}, "_links": {}}
+    if next_href:
+        body["_links"]["next"] = {"href": next_href}
+    if total_pages is not None:
+        body["total_pages"] = total_pages
+    return body
+
+
+@pytest.fixture(autouse=True)
+def no_retry_sleep():
+    """Skip tenacity back-off sleeps so retried requests do not slow the suite."""
+    with patch.object(
+        AsyncActionNetworkConnector._request.retry, "sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.fixture(autouse=True)
+def rate_limiter():
+    """Replace the per-key rate limiter so tests never wait on it."""
+    limiter = MagicMock()
+    limiter.acquire_async = AsyncMock()
+    with patch(
+        "ccef_connections.connectors.action_network_async._api_key_bucket",
+        return_value=limiter,
+    ):
+        yield limiter
+
+
+@pytest.fixture
+def connected():
+    """Return an async connector wired to a fake session."""
+    c = AsyncActionNetworkConnector()
+    c._credential_manager = MagicMock()
+    c._credential_manager.get_action_network_key.return_value = FAKE_API_KEY
+    c._api_key = FAKE_API_KEY
+    c._is_connected = True
+    return c
+
+
+# ==========================================================================
+# Lifecycle
+# ==========================================================================
+
+
+class TestLifecycle:
+    def test_rejects_bad_concurrency(self):
+        with pytest.raises(ValueError, match="concurrency"):
+            AsyncActionNetworkConnector(concurrency=0)
+
+    def test_connect_opens_pooled_session(self, connected):
+        async def run():
+            await connected.connect()
+            session = connected._session
+            assert isinstance(session, aiohttp.ClientSession)
+            assert session.headers["OSDI-API-Token"] == FAKE_API_KEY
+            assert session.connector.limit == 4
+            await connected.disconnect()
+            assert session.closed
+            assert connected._session is None
+            assert not connected.is_connected()
+
+        asyncio.run(run())
+
+    def test_connect_wraps_credential_errors(self):
+        c = AsyncActionNetworkConnector()
+        c._credential_manager = MagicMock()
+        c._credential_manager.get_action_network_key.side_effect = KeyError("x")
+        with pytest.raises(ConnectionError, match="Failed to connect"):
+            asyncio.run(c.connect())
+
+    def test_repr(self, connected):
+        assert repr(connected) == "<AsyncActionNetworkConnector status=connected>"
+
+
+# ==========================================================================
+# _request
+# ==========================================================================
+
+
+class TestRequest:
+    def test_get_success(self, connected):
+        session = use_session(connected, lambda *a: FakeResponse(200, {"ok": True}))
+        result = asyncio.run(connected._request("GET", "/people"))
+        assert result == {"ok": True}
+        assert session.calls == [("GET", f"{ACTION_NETWORK_API_BASE}/people", None, None)]
+
+    def test_204_returns_none(self, connected):
+        use_session(connected, lambda *a: FakeResponse(204))
+        assert asyncio.run(connected._request("DELETE", "/x")) is None
+
+    def test_401_raises_auth_error(self, connected):
+        use_session(connected, lambda *a: FakeResponse(401, text="Unauthorized"))
+        with pytest.raises(AuthenticationError, match="401"):
+            asyncio.run(connected._request("GET", "/people"))
+
+    def test_429_raises_rate_limit(self, connected, rate_limiter):
+        use_session(connected, lambda *a: FakeResponse(429, headers={"Retry-After": "3"}))
+        with pytest.raises(RateLimitError) as exc_info:
+            asyncio.run(connected._request("GET", "/people"))
+        assert exc_info.value.retry_after == 3
+        rate_limiter.pause.assert_called_with(3)
+
+    def test_requests_paced_by_rate_limiter(self, connected, rate_limiter):
+        use_session(connected, lambda *a: FakeResponse(200, {}))
+        asyncio.run(connected._request("GET", "/people"))
+        rate_limiter.acquire_async.assert_awaited_once()
+
+    def test_in_flight_requests_bounded_by_concurrency(self, connected):
+        """Requests past the limit wait for a slot before they are sent."""
+        connected._concurrency = 2
+        in_flight = [0]
+        peak = [0]
+
+        class _SlowResponse(FakeResponse):
+            async def __aenter__(self):
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+                await asyncio.sleep(0.01)
+                return self
+
+            async def __aexit__(self, *exc):
+                in_flight[0] -= 1
+                return False
+
+        use_session(connected, lambda *a: _SlowResponse(200, {}))
+
+        async def run():
+            await asyncio.gather(*(connected._request("GET", "/people") for _ in range(6)))
+
+        asyncio.run(run())
+        assert peak[0] == 2
+
+    def test_500_raises_connection_error(self, connected):
+        use_session(connected, lambda *a: FakeResponse(500, text="boom"))
+        with pytest.raises(ConnectionError, match="500") as exc_info:
+            asyncio.run(connected._request("GET", "/people"))
+        assert exc_info.value.status_code == 500
+
+    def test_client_error_wrapped(self, connected):
+        use_session(connected, lambda *a: aiohttp.ClientConnectionError("down"))
+        with pytest.raises(ConnectionError, match="request failed"):
+            asyncio.run(connected._request("GET", "/people"))
+
+    def test_retries_only_the_failed_page(self, connected, no_retry_sleep):
+        responses = {
+            1: [FakeResponse(200, _page("osdi:people", [{"id": 1}], "/people?page=2", 2))],
+            2: [
+                FakeResponse(429, headers={"Retry-After": "1"}),
+                FakeResponse(200, _page("osdi:people", [{"id": 2}])),
+            ],
+        }
+        session = use_session(
+            connected, lambda m, u, params, j: responses[(params or {}).get("page", 1)].pop(0)
+        )
+        assert asyncio.run(connected.list_people()) == [{"id": 1}, {"id": 2}]
+        assert len(session.calls) == 3
+        no_retry_sleep.assert_awaited_once()
+
+    def test_401_not_retried(self, connected):
+        session = use_session(connected, lambda *a: FakeResponse(401, text="Unauthorized"))
+        with pytest.raises(AuthenticationError):
+            asyncio.run(connected.list_tags())
+        assert len(session.calls) == 1
+
+
+# ==========================================================================
+# Pagination
+# ==========================================================================
+
+
+class TestPagination:
+    def test_single_page(self, connected):
+        session = use_session(
+            connected, lambda *a: FakeResponse(200, _page("osdi:tags", [{"id": 1}]))
+        )
+        assert asyncio.run(connected.list_tags()) == [{"id": 1}]
+        assert len(session.calls) == 1
+
+    def test_total_pages_fetched_concurrently_in_order(self, connected):
+        def responder(method, url, params, json):
+            page = (params or {}).get("page", 1)
+            next_href = f"{ACTION_NETWORK_API_BASE}/people?page={page + 1}"
+            return FakeResponse(
+                200, _page("osdi:people", [{"id": f"p{page}"}], next_href, total_pages=3)
+            )
+
+        session = use_session(connected, responder)
+        result = asyncio.run(connected.list_people(filter="x"))
+        assert [r["id"] for r in result] == ["p1", "p2", "p3"]
+        assert [c[2] for c in session.calls] == [
+            {"filter": "x"},
+            {"filter": "x", "page": 2},
+            {"filter": "x", "page": 3},
+        ]
+
+    def test_follows_next_links_without_total_pages(self, connected):
+        pages = {
+            f"{ACTION_NETWORK_API_BASE}/forms/f1/submissions": _page(
+                "osdi:submissions", [{"id": 1}], f"{ACTION_NETWORK_API_BASE}/forms/f1/s?page=2"
+            ),
+            f"{ACTION_NETWORK_API_BASE}/forms/f1/s?page=2": _page("osdi:submissions", [{"id": 2}]),
+        }
+        session = use_session(connected, lambda m, url, *a: FakeResponse(200, pages[url]))
+        result = asyncio.run(connected.list_submissions("f1"))
+        assert result == [{"id": 1}, {"id": 2}]
+        assert len(session.calls) == 2
+
+    def test_gather_across_resources(self, connected):
+        def responder(method, url, params, json):
+            key = "osdi:signatures" if "/signatures" in url else "osdi:attendances"
+            return FakeResponse(200, _page(key, [{"url": url}]))
+
+        use_session(connected, responder)
+
+        async def run():
+            return await asyncio.gather(
+                connected.list_signatures("pet1"), connected.list_attendances("ev1")
+            )
+
+        signatures, attendances = asyncio.run(run())
+        assert signatures == [{"url": f"{ACTION_NETWORK_API_BASE}/petitions/pet1/signatures"}]
+        assert attendances == [{"url": f"{ACTION_NETWORK_API_BASE}/events/ev1/attendances"}]
+
+
+# ==========================================================================
+# People
+# ==========================================================================
+
+
+class TestPeople:
+    def test_create_person_body(self, connected):
+        session = use_session(connected, lambda *a: FakeResponse(200, {"id": "p1"}))
+        result = asyncio.run(
+            connected.create_person("a@b.com", given_name="Jane", tags=["volunteer"])
+        )
+        assert result == {"id": "p1"}
+        assert session.calls[0][3] == {
+            "person": {"email_addresses": [{"address": "a@b.com"}], "given_name": "Jane"},
+            "add_tags": ["volunteer"],
+        }
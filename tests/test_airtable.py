@@ -1,10 +1,12 @@
 """Tests for the Airtable connector."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch, PropertyMock
 
 import pytest
 
-from ccef_connections.connectors.airtable import AirtableConnector
+from ccef_connections.connectors.airtable import REQUEST_TIMEOUT, AirtableConnector
 from ccef_connections.exceptions import ConnectionError, CredentialError
 
 
@@ -63,6 +65,33 @@ class TestInit:
 
 
 class TestConnect:
+    def test_connect_mounts_pooled_adapter(self, connector):
+        connector.connect()
+
+        adapter = connector._api.session.get_adapter("https://api.airtable.com")
+        assert adapter._pool_maxsize == 20
+        assert adapter.max_retries.status_forcelist == (429,)
+        assert connector._api.timeout == REQUEST_TIMEOUT
+
+    def test_requests_throttled_per_base(self, connector):
+        connector.connect()
+        adapter = connector._api.session.get_adapter("https://api.airtable.com")
+        request = MagicMock(path_url="/v0/appABC123/Tasks?pageSize=100")
+
+        with patch("ccef_connections.connectors.airtable._base_bucket") as mock_bucket:
+            with patch("requests.adapters.HTTPAdapter.send") as mock_send:
+                adapter.send(request, timeout=REQUEST_TIMEOUT)
+
+        mock_bucket.assert_called_once_with("appABC123")
+        mock_bucket.return_value.acquire.assert_called_once()
+        mock_send.assert_called_once_with(request, timeout=REQUEST_TIMEOUT)
+
+    def test_base_buckets_shared_across_connectors(self):
+        from ccef_connections.connectors.airtable import _base_bucket
+
+        assert _base_bucket("appABC123") is _base_bucket("appABC123")
+        assert _base_bucket("appABC123") is not _base_bucket("appOTHER")
+
     @patch("ccef_connections.connectors.airtable.Api")
     def test_connect_success(self, mock_api_cls, connector):
         mock_api_instance = MagicMock()
@@ -72,7 +101,7 @@ class TestConnect:
 
         assert connector.is_connected()
         assert connector._api is mock_api_instance
-        mock_api_cls.assert_called_once_with(FAKE_API_KEY)
+        mock_api_cls.assert_called_once_with(FAKE_API_KEY, timeout=REQUEST_TIMEOUT)
         connector._credential_manager.get_airtable_key.assert_called_once()
 
     def test_connect_missing_credentials(self):
@@ -127,6 +156,13 @@ class TestDisconnect:
         assert connected_connector._api is None
         assert connected_connector._is_connected is False
 
+    def test_disconnect_closes_session(self, connected_connector):
+        session = connected_connector._api.session
+
+        connected_connector.disconnect()
+
+        session.close.assert_called_once()
+
     def test_disconnect_when_already_disconnected(self, connector):
         """Disconnect on a never-connected connector should not raise."""
         connector.disconnect()
@@ -190,7 +226,7 @@ class TestGetTable:
 
         assert connector.is_connected()
         assert result is mock_table
-        mock_api_cls.assert_called_once_with(FAKE_API_KEY)
+        mock_api_cls.assert_called_once_with(FAKE_API_KEY, timeout=REQUEST_TIMEOUT)
         mock_api_instance.table.assert_called_once_with("appABC123", "MyTable")
 
     def test_get_table_does_not_reconnect_if_already_connected(self, connected_connector):
@@ -204,6 +240,22 @@ class TestGetTable:
         mock_connect.assert_not_called()
         assert result is mock_table
 
+    @patch("ccef_connections.connectors.airtable.Api")
+    def test_concurrent_first_calls_connect_once(self, mock_api_cls, connector):
+        """Threads racing on first use should share a single connect()."""
+        real_connect = connector.connect
+
+        def slow_connect():
+            time.sleep(0.05)
+            real_connect()
+
+        with patch.object(connector, "connect", side_effect=slow_connect) as mock_connect:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda _: connector.get_table("appABC123", "T"), range(8)))
+
+        mock_connect.assert_called_once()
+        mock_api_cls.assert_called_once()
+
     def test_get_table_raises_when_connect_fails(self, connector):
         """If auto-connect fails, the error should propagate."""
         connector._credential_manager.get_airtable_key.side_effect = CredentialError(
@@ -218,6 +270,24 @@ class TestGetTable:
 
         connected_connector._api.table.assert_called_once_with("appXYZ789", "Contacts")
 
+    def test_get_table_caches_per_base_and_table(self, connected_connector):
+        connected_connector._api.table.side_effect = lambda base, name: MagicMock()
+
+        first = connected_connector.get_table("appABC123", "MyTable")
+        again = connected_connector.get_table("appABC123", "MyTable")
+        other = connected_connector.get_table("appABC123", "Other")
+
+        assert first is again
+        assert other is not first
+        assert connected_connector._api.table.call_count == 2
+
+    def test_disconnect_clears_table_cache(self, connected_connector):
+        connected_connector.get_table("appABC123", "MyTable")
+
+        connected_connector.disconnect()
+
+        assert connected_connector._table_cache == {}
+
 
 # -- get_records -------------------------------------------------------------
 
@@ -318,6 +388,53 @@ class TestGetRecords:
         assert result == [{"id": "rec1"}]
 
 
+# -- get_records_parallel ----------------------------------------------------
+
+
+class TestGetRecordsParallel:
+    def test_scans_each_range_and_keeps_order(self, connected_connector):
+        mock_table = MagicMock()
+        mock_table.all.side_effect = lambda formula, **kw: [{"formula": formula}]
+        connected_connector._api.table.return_value = mock_table
+
+        result = connected_connector.get_records_parallel(
+            "appABC123", "Data", "Auto", [(None, 100), (100, 200), (200, None)]
+        )
+
+        assert [r["formula"] for r in result] == [
+            "{Auto} < 100",
+            "AND({Auto} >= 100, {Auto} < 200)",
+            "{Auto} >= 200",
+        ]
+        assert mock_table.all.call_count == 3
+
+    def test_combines_with_filter_formula_and_view(self, connected_connector):
+        mock_table = MagicMock()
+        mock_table.all.return_value = []
+        connected_connector._api.table.return_value = mock_table
+
+        connected_connector.get_records_parallel(
+            "appABC123",
+            "Data",
+            "Name",
+            [("A", 'M"')],
+            formula="{Status} = 'open'",
+            view="Grid",
+        )
+
+        mock_table.all.assert_called_once_with(
+            formula='AND({Status} = \'open\', AND({Name} >= "A", {Name} < "M\\""))',
+            max_records=None,
+            view="Grid",
+        )
+
+    def test_rejects_bad_max_workers(self, connected_connector):
+        with pytest.raises(ValueError, match="max_workers"):
+            connected_connector.get_records_parallel(
+                "appABC123", "Data", "Auto", [(0, 1)], max_workers=0
+            )
+
+
 # -- update_record -----------------------------------------------------------
 
 
@@ -385,7 +502,7 @@ class TestBatchUpdate:
         result = connected_connector.batch_update("appABC123", "Tasks", [])
 
         assert result == []
-        mock_table.batch_update.assert_called_once_with([])
+        mock_table.batch_update.assert_not_called()
 
     def test_batch_update_multiple_records(self, connected_connector):
         mock_table = MagicMock()
@@ -409,6 +526,78 @@ class TestBatchUpdate:
 
         connected_connector._api.table.assert_called_once_with("appXYZ", "BatchTable")
 
+    def test_batch_update_chunks_at_ten(self, connected_connector):
+        mock_table = MagicMock()
+        mock_table.batch_update.side_effect = lambda chunk: list(chunk)
+        connected_connector._api.table.return_value = mock_table
+        records = [{"id": f"rec{i}", "fields": {"Index": i}} for i in range(25)]
+
+        result = connected_connector.batch_update("appABC123", "Data", records)
+
+        assert result == records
+        sizes = sorted(len(c.args[0]) for c in mock_table.batch_update.call_args_list)
+        assert sizes == [5, 10, 10]
+
+    def test_batch_update_custom_chunk_size_serial(self, connected_connector):
+        mock_table = MagicMock()
+        mock_table.batch_update.side_effect = lambda chunk: list(chunk)
+        connected_connector._api.table.return_value = mock_table
+        records = [{"id": f"rec{i}", "fields": {}} for i in range(5)]
+
+        connected_connector.batch_update(
+            "appABC123", "Data", records, chunk_size=2, max_workers=1
+        )
+
+        assert [c.args[0] for c in mock_table.batch_update.call_args_list] == [
+            records[0:2], records[2:4], records[4:5]
+        ]
+
+    @pytest.mark.parametrize("kwargs", [{"chunk_size": 0}, {"chunk_size": 11}, {"max_workers": 0}])
+    def test_batch_update_rejects_bad_arguments(self, connected_connector, kwargs):
+        """Bad arguments fail at once, before any request or retry."""
+        with pytest.raises(ValueError):
+            connected_connector.batch_update("appABC123", "Data", [{"id": "r"}], **kwargs)
+        connected_connector._api.table.assert_not_called()
+
+
+# -- batch_create ------------------------------------------------------------
+
+
+class TestBatchCreate:
+    def test_batch_create_chunks_and_keeps_order(self, connected_connector):
+        mock_table = MagicMock()
+        mock_table.batch_create.side_effect = lambda chunk: [
+            {"id": f"rec{f['n']}", "fields": f} for f in chunk
+        ]
+        connected_connector._api.table.return_value = mock_table
+        fields = [{"n": i} for i in range(23)]
+
+        result = connected_connector.batch_create("appABC123", "Data", fields)
+
+        assert [r["id"] for r in result] == [f"rec{i}" for i in range(23)]
+        assert mock_table.batch_create.call_count == 3
+
+    def test_batch_create_retries_only_failed_chunk(self, connected_connector):
+        mock_table = MagicMock()
+        failed = []
+
+        def create(chunk):
+            if chunk[0]["n"] == 10 and not failed:
+                failed.append(chunk)
+                raise Exception("503 Service Unavailable")
+            return [{"id": "rec", "fields": f} for f in chunk]
+
+        mock_table.batch_create.side_effect = create
+        connected_connector._api.table.return_value = mock_table
+
+        with patch.object(AirtableConnector._create_chunk.retry, "sleep"):
+            result = connected_connector.batch_create(
+                "appABC123", "Data", [{"n": i} for i in range(30)]
+            )
+
+        assert len(result) == 30
+        assert mock_table.batch_create.call_count == 4
+
 
 # -- create_record -----------------------------------------------------------
 
@@ -524,12 +713,19 @@ class TestRetryDecoratorIntegration:
     def test_update_record_has_retry(self):
         assert hasattr(AirtableConnector.update_record, "retry")
 
-    def test_batch_update_has_retry(self):
-        assert hasattr(AirtableConnector.batch_update, "retry")
+    def test_batch_update_retries_per_chunk(self):
+        """batch_update retries each chunk, so bad arguments are never retried."""
+        assert not hasattr(AirtableConnector.batch_update, "retry")
+        assert hasattr(AirtableConnector._update_chunk, "retry")
 
     def test_create_record_has_retry(self):
         assert hasattr(AirtableConnector.create_record, "retry")
 
+    def test_batch_create_retries_per_chunk(self):
+        """batch_create retries each chunk, not the whole call, to avoid duplicates."""
+        assert not hasattr(AirtableConnector.batch_create, "retry")
+        assert hasattr(AirtableConnector._create_chunk, "retry")
+
     def test_get_table_has_no_retry(self):
         """get_table should NOT have retry logic."""
         assert not hasattr(AirtableConnector.get_table, "retry")
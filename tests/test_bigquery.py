@@ -1,8 +1,15 @@
 """Tests for the BigQuery connector."""
 
-from unittest.mock import MagicMock, PropertyMock, patch, call
+import asyncio
+import datetime
+import decimal
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import ANY, MagicMock, PropertyMock, patch, call
 
 import pytest
+from google.cloud import bigquery
 from tenacity import stop_after_attempt
 
 from ccef_connections.connectors.bigquery import BigQueryConnector
@@ -16,8 +23,9 @@ from ccef_connections.exceptions import (
 
 # Disable tenacity retries on all @retry_google_operation-decorated methods
 # so that tests fail fast instead of retrying with exponential backoff.
-for _method_name in ("query", "query_to_dataframe", "table_exists",
-                      "insert_rows", "load_dataframe", "execute_dml"):
+for _method_name in ("query", "query_to_dataframe", "insert_rows",
+                      "_insert_batch", "_load_rows", "load_dataframe",
+                      "_load_dataframe_part", "execute_dml", "estimate_query_bytes"):
     _method = getattr(BigQueryConnector, _method_name)
     if hasattr(_method, "retry"):
         _method.retry.stop = stop_after_attempt(1)
@@ -289,6 +297,32 @@ class TestQuery:
         assert call_kwargs[1]["job_config"] is mock_job_config
         assert mock_job_config.query_parameters == params
 
+    def test_query_uses_results_cache_by_default(self, connected_connector):
+        connected_connector.query("SELECT 1")
+        job_config = connected_connector._client.query.call_args.kwargs["job_config"]
+        assert job_config.use_query_cache is True
+        assert job_config.priority == "INTERACTIVE"
+
+        connected_connector.query("SELECT 1", use_cache=False)
+        job_config = connected_connector._client.query.call_args.kwargs["job_config"]
+        assert job_config.use_query_cache is False
+
+    def test_estimate_query_bytes_dry_runs(self, connected_connector):
+        connected_connector._client.query.return_value.total_bytes_processed = 2048
+
+        result = connected_connector.estimate_query_bytes("SELECT * FROM dataset.t")
+
+        assert result == 2048
+        job_config = connected_connector._client.query.call_args.kwargs["job_config"]
+        assert job_config.dry_run is True
+        connected_connector._client.query.return_value.result.assert_not_called()
+
+    def test_estimate_query_bytes_invalid_sql(self, connected_connector):
+        connected_connector._client.query.side_effect = Exception("Syntax error")
+
+        with pytest.raises(QueryError, match="Dry run failed.*Syntax error"):
+            connected_connector.estimate_query_bytes("SELEC")
+
     def test_query_failure_raises_query_error(self, connected_connector):
         mock_job = MagicMock()
         mock_job.result.side_effect = Exception("Syntax error in SQL")
@@ -316,6 +350,156 @@ class TestQuery:
         assert result is mock_results
         assert connector_with_project.is_connected()
 
+    @patch("ccef_connections.connectors.bigquery.bigquery.Client")
+    @patch("ccef_connections.connectors.bigquery.Credentials.from_service_account_info")
+    def test_concurrent_first_queries_connect_once(
+        self, mock_from_sa, mock_client_cls, connector_with_project
+    ):
+        """Threads racing on first use should share a single connect()."""
+        real_connect = connector_with_project.connect
+
+        def slow_connect():
+            time.sleep(0.05)
+            real_connect()
+
+        with patch.object(
+            connector_with_project, "connect", side_effect=slow_connect
+        ) as mock_connect:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda _: connector_with_project.query("SELECT 1"), range(8)))
+
+        mock_connect.assert_called_once()
+        mock_client_cls.assert_called_once()
+        assert mock_client_cls.return_value.query.call_count == 8
+
+
+# -- Concurrent queries -------------------------------------------------------
+
+
+class TestQueryAsync:
+    @patch("ccef_connections.connectors.bigquery.BigQueryConnector.query")
+    def test_query_async_returns_future(self, mock_query, connected_connector):
+        mock_query.side_effect = lambda sql, params, timeout: f"rows:{sql}"
+
+        futures = [connected_connector.query_async(f"SELECT {i}") for i in range(3)]
+
+        assert [f.result(timeout=5) for f in futures] == [
+            "rows:SELECT 0", "rows:SELECT 1", "rows:SELECT 2"
+        ]
+        assert connected_connector._query_executor is not None
+
+    @patch("ccef_connections.connectors.bigquery.BigQueryConnector.query")
+    def test_query_async_propagates_errors(self, mock_query, connected_connector):
+        mock_query.side_effect = QueryError("Query failed: bad")
+
+        future = connected_connector.query_async("SELECT bad")
+
+        with pytest.raises(QueryError, match="bad"):
+            future.result(timeout=5)
+
+    @patch("ccef_connections.connectors.bigquery.BigQueryConnector.query")
+    def test_query_aio_gathers(self, mock_query, connected_connector):
+        mock_query.side_effect = lambda sql, params, timeout: sql
+
+        async def run():
+            return await asyncio.gather(
+                connected_connector.query_aio("SELECT a"),
+                connected_connector.query_aio("SELECT b"),
+            )
+
+        assert asyncio.run(run()) == ["SELECT a", "SELECT b"]
+
+    @patch("ccef_connections.connectors.bigquery.BigQueryConnector.query")
+    def test_concurrent_first_calls_share_one_pool(self, mock_query, connected_connector):
+        """Threads racing on the first query_async should create a single pool."""
+        real_executor = ThreadPoolExecutor
+
+        def slow_executor(*args, **kwargs):
+            time.sleep(0.05)
+            return real_executor(*args, **kwargs)
+
+        with patch(
+            "ccef_connections.connectors.bigquery.ThreadPoolExecutor", side_effect=slow_executor
+        ) as mock_executor:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                futures = list(
+                    pool.map(lambda i: connected_connector.query_async(f"SELECT {i}"), range(8))
+                )
+
+        assert len([f.result(timeout=5) for f in futures]) == 8
+        mock_executor.assert_called_once()
+        connected_connector.disconnect()
+
+    def test_disconnect_shuts_down_query_pool(self, connected_connector):
+        executor = MagicMock()
+        connected_connector._query_executor = executor
+
+        connected_connector.disconnect()
+
+        executor.shutdown.assert_called_once_with(wait=False)
+        assert connected_connector._query_executor is None
+
+
+# -- Iter Query ---------------------------------------------------------------
+
+
+class TestIterQuery:
+    def test_query_passes_page_size(self, connected_connector):
+        mock_job = MagicMock()
+        connected_connector._client.query.return_value = mock_job
+
+        connected_connector.query("SELECT 1", page_size=500)
+
+        mock_job.result.assert_called_once_with(page_size=500)
+
+    @patch("ccef_connections.connectors.bigquery.BigQueryConnector.query")
+    def test_iter_query_yields_rows_in_order(self, mock_query, connected_connector):
+        mock_query.return_value.pages = [[1, 2], [3], [4, 5]]
+
+        rows = list(connected_connector.iter_query("SELECT x", page_size=2))
+
+        assert rows == [1, 2, 3, 4, 5]
+        mock_query.assert_called_once_with("SELECT x", None, None, page_size=2)
+
+    @patch("ccef_connections.connectors.bigquery.BigQueryConnector.query")
+    def test_iter_query_prefetches_next_page(self, mock_query, connected_connector):
+        fetched = []
+
+        def pages():
+            for page in ([1, 2], [3, 4]):
+                fetched.append(page)
+                yield page
+
+        mock_query.return_value.pages = pages()
+        rows = connected_connector.iter_query("SELECT x")
+
+        assert next(rows) == 1
+        for _ in range(100):
+            if len(fetched) == 2:
+                break
+            time.sleep(0.01)
+        assert len(fetched) == 2
+        assert list(rows) == [2, 3, 4]
+
+    @patch("ccef_connections.connectors.bigquery.BigQueryConnector.query")
+    def test_iter_query_empty_result(self, mock_query, connected_connector):
+        mock_query.return_value.pages = []
+
+        assert list(connected_connector.iter_query("SELECT x")) == []
+
+    @patch("ccef_connections.connectors.bigquery.BigQueryConnector.query")
+    def test_iter_query_wraps_page_errors(self, mock_query, connected_connector):
+        def pages():
+            yield [1, 2]
+            raise Exception("page token expired")
+
+        mock_query.return_value.pages = pages()
+        rows = connected_connector.iter_query("SELECT x")
+
+        assert next(rows) == 1
+        with pytest.raises(QueryError, match="page token expired"):
+            list(rows)
+
 
 # -- Query to DataFrame -------------------------------------------------------
 
@@ -355,6 +539,38 @@ class TestQueryToDataframe:
             "SELECT * FROM dataset.table WHERE x = @x", params, 60.0
         )
 
+    @patch("ccef_connections.connectors.bigquery.BigQueryConnector.query")
+    def test_query_to_dataframe_uses_storage_read_client(self, mock_query, connected_connector):
+        mock_storage = MagicMock()
+        mock_query.return_value.to_dataframe.return_value = []
+
+        with patch.dict("sys.modules", {"google.cloud.bigquery_storage": mock_storage}):
+            connected_connector.query_to_dataframe("SELECT 1")
+            connected_connector.query_to_dataframe("SELECT 2")
+
+        read_client = mock_storage.BigQueryReadClient.return_value
+        mock_storage.BigQueryReadClient.assert_called_once_with(
+            credentials=connected_connector._credentials
+        )
+        mock_query.return_value.to_dataframe.assert_called_with(
+            bqstorage_client=read_client, create_bqstorage_client=False
+        )
+
+        connected_connector.disconnect()
+        read_client.transport.close.assert_called_once()
+        assert connected_connector._bqstorage_client is None
+
+    @patch("ccef_connections.connectors.bigquery.BigQueryConnector.query")
+    def test_query_to_dataframe_falls_back_to_rest(self, mock_query, connected_connector):
+        mock_query.return_value.to_dataframe.return_value = []
+
+        with patch.dict("sys.modules", {"google.cloud.bigquery_storage": None}):
+            connected_connector.query_to_dataframe("SELECT 1")
+
+        mock_query.return_value.to_dataframe.assert_called_once_with(
+            bqstorage_client=None, create_bqstorage_client=False
+        )
+
     def test_query_to_dataframe_no_pandas_raises_import_error(
         self, connected_connector
     ):
@@ -364,6 +580,42 @@ class TestQueryToDataframe:
                 connected_connector.query_to_dataframe("SELECT 1")
 
 
+# -- Query to Arrow -----------------------------------------------------------
+
+
+class TestQueryToArrow:
+    @patch("ccef_connections.connectors.bigquery.BigQueryConnector.query")
+    def test_query_to_arrow_skips_pandas(self, mock_query, connected_connector):
+        mock_table = MagicMock(num_rows=3)
+        mock_query.return_value.to_arrow.return_value = mock_table
+
+        with patch.dict("sys.modules", {"google.cloud.bigquery_storage": None}):
+            result = connected_connector.query_to_arrow("SELECT 1", timeout=30.0)
+
+        assert result is mock_table
+        mock_query.assert_called_once_with("SELECT 1", None, 30.0)
+        mock_query.return_value.to_arrow.assert_called_once_with(
+            bqstorage_client=None, create_bqstorage_client=False
+        )
+        mock_query.return_value.to_dataframe.assert_not_called()
+
+    @patch("ccef_connections.connectors.bigquery.BigQueryConnector.query")
+    def test_query_to_arrow_runs_query_once(self, mock_query, connected_connector):
+        """Only query() retries, so a failed download does not resend the query."""
+        mock_query.return_value.to_arrow.side_effect = Exception("download failed")
+
+        with pytest.raises(Exception, match="download failed"):
+            connected_connector.query_to_arrow("SELECT 1")
+
+        mock_query.assert_called_once()
+        assert not hasattr(BigQueryConnector.query_to_arrow, "retry")
+
+    def test_query_to_arrow_no_pyarrow_raises_import_error(self, connected_connector):
+        with patch.dict("sys.modules", {"pyarrow": None}):
+            with pytest.raises(ImportError, match="pyarrow is required"):
+                connected_connector.query_to_arrow("SELECT 1")
+
+
 # -- Table Exists -------------------------------------------------------------
 
 
@@ -375,7 +627,7 @@ class TestTableExists:
 
         assert result is True
         connected_connector._client.get_table.assert_called_once_with(
-            "my-explicit-project.dataset.my_table"
+            "my-explicit-project.dataset.my_table", retry=ANY
         )
 
     def test_table_exists_false(self, connected_connector):
@@ -394,7 +646,7 @@ class TestTableExists:
 
         assert result is True
         connected_connector._client.get_table.assert_called_once_with(
-            "other-project.dataset.my_table"
+            "other-project.dataset.my_table", retry=ANY
         )
 
     @patch("ccef_connections.connectors.bigquery.bigquery.Client")
@@ -427,7 +679,7 @@ class TestInsertRows:
         connected_connector.insert_rows("dataset.users", rows)
 
         connected_connector._client.get_table.assert_called_once_with(
-            "my-explicit-project.dataset.users"
+            "my-explicit-project.dataset.users", retry=bigquery.DEFAULT_RETRY
         )
         connected_connector._client.insert_rows_json.assert_called_once_with(
             mock_table, rows
@@ -458,9 +710,161 @@ class TestInsertRows:
         connected_connector.insert_rows("other-project.dataset.users", [{"a": 1}])
 
         connected_connector._client.get_table.assert_called_once_with(
-            "other-project.dataset.users"
+            "other-project.dataset.users", retry=bigquery.DEFAULT_RETRY
         )
 
+    def test_insert_rows_splits_into_batches(self, connected_connector):
+        mock_table = MagicMock()
+        connected_connector._client.get_table.return_value = mock_table
+        connected_connector._client.insert_rows_json.return_value = []
+
+        rows = [{"id": i} for i in range(1201)]
+        connected_connector.insert_rows("dataset.users", rows, mode="stream")
+
+        connected_connector._client.get_table.assert_called_once()
+        sent = [c.args[1] for c in connected_connector._client.insert_rows_json.call_args_list]
+        assert sorted(len(batch) for batch in sent) == [201, 500, 500]
+        assert sorted(r["id"] for batch in sent for r in batch) == list(range(1201))
+
+    def test_insert_rows_batch_errors_use_input_index(self, connected_connector):
+        connected_connector._client.get_table.return_value = MagicMock()
+
+        def insert(table, batch):
+            if batch[0]["id"] == 500:
+                return [{"index": 3, "errors": [{"reason": "invalid"}]}]
+            return []
+
+        connected_connector._client.insert_rows_json.side_effect = insert
+
+        with pytest.raises(WriteError, match="'index': 503"):
+            connected_connector.insert_rows(
+                "dataset.users", [{"id": i} for i in range(1000)], mode="stream"
+            )
+
+    def test_insert_rows_retries_failed_batch_only(self, connected_connector):
+        """A batch whose request fails is resent alone; row errors are not retried."""
+        connected_connector._client.get_table.return_value = MagicMock()
+        starts = []
+        failed = []
+
+        def insert(table, batch):
+            starts.append(batch[0]["id"])
+            if batch[0]["id"] == 500 and not failed:
+                failed.append(True)
+                raise Exception("connection reset")
+            if batch[0]["id"] == 500:
+                return [{"index": 0, "errors": [{"reason": "invalid"}]}]
+            return []
+
+        connected_connector._client.insert_rows_json.side_effect = insert
+
+        with patch.object(BigQueryConnector._insert_batch.retry, "stop", stop_after_attempt(3)):
+            with patch.object(BigQueryConnector._insert_batch.retry, "sleep"):
+                with pytest.raises(WriteError, match="'index': 500"):
+                    connected_connector.insert_rows(
+                        "dataset.users", [{"id": i} for i in range(999)], mode="stream"
+                    )
+
+        assert sorted(starts) == [0, 500, 500]
+
+    @patch("ccef_connections.connectors.bigquery.bigquery.LoadJobConfig")
+    def test_insert_rows_auto_uses_load_job_for_large_inputs(
+        self, mock_job_config_cls, connected_connector
+    ):
+        mock_table = MagicMock()
+        connected_connector._client.get_table.return_value = mock_table
+        rows = [{"id": i} for i in range(1000)]
+
+        connected_connector.insert_rows("dataset.users", rows)
+
+        connected_connector._client.insert_rows_json.assert_not_called()
+        call_args = connected_connector._client.load_table_from_file.call_args
+        assert call_args.args[1] is mock_table
+        lines = call_args.args[0].getvalue().decode().split("\n")
+        assert [json.loads(line) for line in lines] == rows
+        assert mock_job_config_cls.call_args.kwargs["schema"] is mock_table.schema
+        connected_connector._client.load_table_from_file.return_value.result.assert_called_once()
+
+    @patch("ccef_connections.connectors.bigquery.bigquery.LoadJobConfig")
+    def test_insert_rows_explicit_modes(self, mock_job_config_cls, connected_connector):
+        connected_connector._client.insert_rows_json.return_value = []
+
+        connected_connector.insert_rows("dataset.users", [{"id": 1}], mode="load")
+        assert connected_connector._client.load_table_from_file.call_count == 1
+
+        connected_connector.insert_rows("dataset.users", [{"id": 1}])
+        connected_connector._client.insert_rows_json.assert_called_once()
+
+    def test_insert_rows_load_job_failure_raises_write_error(self, connected_connector):
+        job = connected_connector._client.load_table_from_file.return_value
+        job.result.side_effect = Exception("Provided Schema does not match")
+
+        with patch("ccef_connections.connectors.bigquery.bigquery.LoadJobConfig"):
+            with pytest.raises(WriteError, match="Schema does not match"):
+                connected_connector.insert_rows("dataset.users", [{"id": 1}], mode="load")
+
+    def test_insert_rows_load_encoding_error_not_retried(self, connected_connector):
+        """A row that cannot be encoded fails once, before any load job starts."""
+        with patch.object(BigQueryConnector._load_rows.retry, "stop", stop_after_attempt(5)):
+            with patch.object(BigQueryConnector._load_rows.retry, "sleep") as mock_sleep:
+                with pytest.raises(WriteError, match="Insert failed"):
+                    connected_connector.insert_rows(
+                        "dataset.users", [{"id": 1, "tags": {"a", "b"}}], mode="load"
+                    )
+
+        mock_sleep.assert_not_called()
+        connected_connector._client.load_table_from_file.assert_not_called()
+
+    @pytest.mark.parametrize("orjson_installed", [True, False])
+    def test_insert_rows_normalises_dates_and_decimals(
+        self, orjson_installed, connected_connector
+    ):
+        """Both modes accept the same rows with or without orjson."""
+        from ccef_connections.connectors import bigquery as bq
+
+        def stdlib_dumps(obj, default=None):
+            return json.dumps(obj, default=default, separators=(",", ":")).encode()
+
+        rows = [{
+            "day": datetime.date(2026, 1, 2),
+            "at": datetime.datetime(2026, 1, 2, 3, 4, 5),
+            "amount": decimal.Decimal("12.30"),
+            "nested": [{"when": datetime.time(6, 7)}],
+        }]
+        expected = [{
+            "day": "2026-01-02",
+            "at": "2026-01-02T03:04:05",
+            "amount": "12.30",
+            "nested": [{"when": "06:07:00"}],
+        }]
+        connected_connector._client.insert_rows_json.return_value = []
+        dumps = bq.json_dumps if orjson_installed else stdlib_dumps
+
+        with patch.object(bq, "json_dumps", dumps):
+            with patch("ccef_connections.connectors.bigquery.bigquery.LoadJobConfig"):
+                connected_connector.insert_rows("dataset.users", rows, mode="load")
+            connected_connector.insert_rows("dataset.users", rows, mode="stream")
+
+        body = connected_connector._client.load_table_from_file.call_args.args[0].getvalue()
+        assert [json.loads(line) for line in body.decode().split("\n")] == expected
+        assert connected_connector._client.insert_rows_json.call_args.args[1] == expected
+
+    def test_insert_batches_respect_byte_limit(self):
+        from ccef_connections.connectors import bigquery as bq
+
+        rows = [{"blob": "x" * 100} for _ in range(10)]
+        with patch.object(bq, "_MAX_INSERT_BYTES", 350):
+            batches = list(bq._insert_batches(rows))
+
+        assert [(offset, len(batch)) for offset, batch in batches] == [
+            (0, 3), (3, 3), (6, 3), (9, 1)
+        ]
+
+    def test_insert_batches_empty(self):
+        from ccef_connections.connectors.bigquery import _insert_batches
+
+        assert list(_insert_batches([])) == []
+
     @patch("ccef_connections.connectors.bigquery.bigquery.Client")
     @patch("ccef_connections.connectors.bigquery.Credentials.from_service_account_info")
     def test_insert_rows_auto_connects(
@@ -477,6 +881,91 @@ class TestInsertRows:
         assert connector_with_project.is_connected()
 
 
+# -- Table metadata cache -----------------------------------------------------
+
+
+class TestTableCache:
+    def test_get_table_reused_across_calls(self, connected_connector):
+        connected_connector._client.insert_rows_json.return_value = []
+
+        connected_connector.table_exists("dataset.users")
+        connected_connector.insert_rows("dataset.users", [{"a": 1}])
+        connected_connector.insert_rows("dataset.users", [{"a": 2}])
+
+        connected_connector._client.get_table.assert_called_once_with(
+            "my-explicit-project.dataset.users", retry=ANY
+        )
+
+    def test_get_table_refetched_after_ttl(self, connected_connector):
+        with patch("ccef_connections.connectors.bigquery.time.monotonic") as mock_time:
+            mock_time.return_value = 1000.0
+            connected_connector.table_exists("dataset.users")
+            mock_time.return_value = 1299.0
+            connected_connector.table_exists("dataset.users")
+            assert connected_connector._client.get_table.call_count == 1
+            mock_time.return_value = 1301.0
+            connected_connector.table_exists("dataset.users")
+
+        assert connected_connector._client.get_table.call_count == 2
+
+    def test_missing_table_cached_briefly(self, connected_connector):
+        from google.cloud.exceptions import NotFound
+
+        connected_connector._client.get_table.side_effect = [NotFound("nope"), MagicMock()]
+
+        with patch("ccef_connections.connectors.bigquery.time.monotonic") as mock_time:
+            mock_time.return_value = 1000.0
+            assert connected_connector.table_exists("dataset.users") is False
+            mock_time.return_value = 1059.0
+            assert connected_connector.table_exists("dataset.users") is False
+            assert connected_connector._client.get_table.call_count == 1
+            mock_time.return_value = 1061.0
+            assert connected_connector.table_exists("dataset.users") is True
+
+    def test_table_exists_propagates_other_errors(self, connected_connector):
+        from google.api_core.exceptions import Forbidden
+
+        connected_connector._client.get_table.side_effect = Forbidden("denied")
+
+        with pytest.raises(Forbidden):
+            connected_connector.table_exists("dataset.users")
+        assert connected_connector._missing_tables == {}
+        connected_connector._client.get_table.assert_called_once()
+        assert connected_connector._client.get_table.call_args.kwargs["retry"].timeout == 5.0
+
+    @patch("ccef_connections.connectors.bigquery.bigquery.LoadJobConfig")
+    def test_load_dataframe_forgets_missing_table(self, mock_job_config_cls, connected_connector):
+        from google.cloud.exceptions import NotFound
+
+        connected_connector._client.get_table.side_effect = [NotFound("nope"), MagicMock()]
+        mock_df = MagicMock()
+        mock_df.__len__ = MagicMock(return_value=1)
+
+        assert connected_connector.table_exists("dataset.users") is False
+        connected_connector.load_dataframe(mock_df, "dataset.users")
+        assert connected_connector.table_exists("dataset.users") is True
+
+    def test_write_error_invalidates_cache(self, connected_connector):
+        connected_connector._client.insert_rows_json.return_value = [
+            {"index": 0, "errors": [{"reason": "invalid"}]}
+        ]
+
+        with pytest.raises(WriteError):
+            connected_connector.insert_rows("dataset.users", [{"a": 1}])
+        connected_connector.table_exists("dataset.users")
+
+        assert connected_connector._client.get_table.call_count == 2
+
+    def test_execute_dml_and_disconnect_clear_cache(self, connected_connector):
+        connected_connector.table_exists("dataset.users")
+        connected_connector.execute_dml("ALTER TABLE dataset.users ADD COLUMN x INT64")
+        assert connected_connector._table_cache == {}
+
+        connected_connector.table_exists("dataset.users")
+        connected_connector.disconnect()
+        assert connected_connector._table_cache == {}
+
+
 # -- Load DataFrame -----------------------------------------------------------
 
 
@@ -540,6 +1029,84 @@ class TestLoadDataframe:
         with pytest.raises(WriteError, match="Load failed.*Schema mismatch"):
             connected_connector.load_dataframe(mock_df, "dataset.table")
 
+    def test_load_dataframe_uploads_parquet(self, connected_connector):
+        from google.cloud import bigquery
+
+        mock_df = MagicMock()
+        mock_df.__len__ = MagicMock(return_value=1)
+
+        connected_connector.load_dataframe(mock_df, "dataset.table")
+
+        job_config = connected_connector._client.load_table_from_dataframe.call_args.kwargs[
+            "job_config"
+        ]
+        assert job_config.source_format == bigquery.SourceFormat.PARQUET
+        assert job_config.create_disposition == bigquery.CreateDisposition.CREATE_IF_NEEDED
+        assert job_config.parquet_options.enable_list_inference is True
+
+    @patch("ccef_connections.connectors.bigquery._LOAD_PARTITION_ROWS", 2)
+    def test_load_dataframe_partitions_large_frames(self, connected_connector):
+        pd = pytest.importorskip("pandas")
+        from google.cloud import bigquery
+
+        df = pd.DataFrame({"n": range(5)})
+        connected_connector.load_dataframe(df, "dataset.table", if_exists="replace")
+
+        calls = connected_connector._client.load_table_from_dataframe.call_args_list
+        assert [list(c.args[0]["n"]) for c in calls] == [[0, 1], [2, 3], [4]]
+        dispositions = [c.kwargs["job_config"].write_disposition for c in calls]
+        assert dispositions == [
+            bigquery.WriteDisposition.WRITE_TRUNCATE,
+            bigquery.WriteDisposition.WRITE_APPEND,
+            bigquery.WriteDisposition.WRITE_APPEND,
+        ]
+
+    @patch("ccef_connections.connectors.bigquery._LOAD_PARTITION_ROWS", 2)
+    def test_load_dataframe_partition_errors_aggregated(self, connected_connector):
+        pd = pytest.importorskip("pandas")
+
+        def load(part, table_id, job_config):
+            job = MagicMock()
+            if part.index[0] > 0:
+                job.result.side_effect = Exception(f"bad rows at {part.index[0]}")
+            return job
+
+        connected_connector._client.load_table_from_dataframe.side_effect = load
+
+        with pytest.raises(WriteError, match="2 of 3 partitions failed") as exc_info:
+            connected_connector.load_dataframe(pd.DataFrame({"n": range(5)}), "dataset.table")
+        assert "partition at row 2: bad rows at 2" in str(exc_info.value)
+        assert "partition at row 4: bad rows at 4" in str(exc_info.value)
+
+    @patch("ccef_connections.connectors.bigquery._LOAD_PARTITION_ROWS", 2)
+    def test_load_dataframe_retries_failed_partition_only(self, connected_connector):
+        """A failing partition is retried alone; loaded partitions are not resent."""
+        pd = pytest.importorskip("pandas")
+        starts = []
+
+        def load(part, table_id, job_config):
+            starts.append(part.index[0])
+            job = MagicMock()
+            if part.index[0] == 2:
+                job.result.side_effect = Exception("backend error")
+            return job
+
+        connected_connector._client.load_table_from_dataframe.side_effect = load
+
+        retry = BigQueryConnector._load_dataframe_part.retry
+        with patch.object(retry, "stop", stop_after_attempt(3)), patch.object(retry, "sleep"):
+            with pytest.raises(WriteError, match="1 of 3 partitions failed"):
+                connected_connector.load_dataframe(
+                    pd.DataFrame({"n": range(5)}), "dataset.table"
+                )
+
+        assert sorted(starts) == [0, 2, 2, 2, 4]
+
+    def test_load_dataframe_no_pyarrow_raises_import_error(self, connected_connector):
+        with patch.dict("sys.modules", {"pyarrow": None}):
+            with pytest.raises(ImportError, match="pyarrow is required"):
+                connected_connector.load_dataframe(MagicMock(), "dataset.table")
+
     def test_load_dataframe_no_pandas_raises_import_error(self, connected_connector):
         mock_df = MagicMock()
         with patch.dict("sys.modules", {"pandas": None}):
@@ -652,6 +1219,61 @@ class TestExecuteDml:
         assert connector_with_project.is_connected()
 
 
+class TestExecuteDmlMany:
+    def test_renders_multi_row_insert(self, connected_connector):
+        job = connected_connector._client.query.return_value
+        job.num_dml_affected_rows = 2
+
+        result = connected_connector.execute_dml_many(
+            "INSERT INTO dataset.users (name, age) VALUES",
+            [{"name": "Jane", "age": 30}, {"age": None, "name": "John"}],
+        )
+
+        assert result == 2
+        sql = connected_connector._client.query.call_args.args[0]
+        assert sql == "INSERT INTO dataset.users (name, age) VALUES (@p0_0, @p0_1), (@p1_0, NULL)"
+        job_config = connected_connector._client.query.call_args.kwargs["job_config"]
+        assert [(p.name, p.type_, p.value) for p in job_config.query_parameters] == [
+            ("p0_0", "STRING", "Jane"),
+            ("p0_1", "INT64", 30),
+            ("p1_0", "STRING", "John"),
+        ]
+
+    def test_one_job_per_batch(self, connected_connector):
+        job = connected_connector._client.query.return_value
+        job.num_dml_affected_rows = 2
+
+        result = connected_connector.execute_dml_many(
+            "INSERT INTO dataset.t (x) VALUES", [{"x": i} for i in range(5)], batch_size=2
+        )
+
+        assert connected_connector._client.query.call_count == 3
+        assert result == 6
+
+    def test_batches_respect_parameter_limit(self, connected_connector):
+        connected_connector._client.query.return_value.num_dml_affected_rows = 0
+        row = {f"c{i}": i for i in range(40)}
+
+        connected_connector.execute_dml_many("INSERT INTO dataset.t VALUES", [row] * 300)
+
+        assert connected_connector._client.query.call_count == 2
+
+    def test_rejects_mismatched_rows_before_running(self, connected_connector):
+        with pytest.raises(ValueError, match="Row 1 keys"):
+            connected_connector.execute_dml_many(
+                "INSERT INTO dataset.t (a) VALUES", [{"a": 1}, {"b": 2}]
+            )
+        connected_connector._client.query.assert_not_called()
+
+    def test_rejects_unsupported_types(self, connected_connector):
+        with pytest.raises(ValueError, match="Unsupported query parameter type: list"):
+            connected_connector.execute_dml_many("INSERT INTO dataset.t (a) VALUES", [{"a": [1]}])
+
+    def test_empty_rows(self, connected_connector):
+        assert connected_connector.execute_dml_many("INSERT INTO dataset.t VALUES", []) == 0
+        connected_connector._client.query.assert_not_called()
+
+
 # -- _get_full_table_id -------------------------------------------------------
 
 
@@ -681,6 +1303,16 @@ class TestGetFullTableId:
         result = connected_connector._get_full_table_id("a.b.c.d")
         assert result == "a.b.c.d"
 
+    def test_resolution_cached_per_project(self):
+        from ccef_connections.connectors.bigquery import _resolve_full_table_id
+
+        _resolve_full_table_id.cache_clear()
+        assert _resolve_full_table_id("p1", "ds.t") == "p1.ds.t"
+        assert _resolve_full_table_id("p1", "ds.t") == "p1.ds.t"
+        assert _resolve_full_table_id("p2", "ds.t") == "p2.ds.t"
+        info = _resolve_full_table_id.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
 
 # -- project_id property ------------------------------------------------------
 
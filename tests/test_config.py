@@ -1,11 +1,14 @@
 """Tests for the ConfigManager configuration management module."""
 
+import asyncio
+import json
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from ccef_connections.config import ConfigManager
+from ccef_connections.config import ConfigManager, _convert_value
 from ccef_connections.exceptions import ConfigurationError
 
 
@@ -37,6 +40,14 @@ EXPECTED_PARSED = {
 # ── Fixtures ─────────────────────────────────────────────────────────
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_connector():
+    """Reset the process-wide SheetsConnector between tests."""
+    ConfigManager._shared_connector = None
+    yield
+    ConfigManager._shared_connector = None
+
+
 @pytest.fixture
 def mock_sheets_connector():
     """Create a mock SheetsConnector."""
@@ -73,10 +84,8 @@ def auto_manager(mock_sheets_connector):
 def loaded_manager(manager, mock_sheets_connector):
     """Create a ConfigManager that already has cached config loaded."""
     manager._sheets_connector = mock_sheets_connector
-    manager._config_cache = EXPECTED_PARSED.copy()
-    manager._config_cache["airtable"] = EXPECTED_PARSED["airtable"].copy()
-    manager._config_cache["openai"] = EXPECTED_PARSED["openai"].copy()
-    manager._cache_timestamp = time.time()
+    config = {section: values.copy() for section, values in EXPECTED_PARSED.items()}
+    manager._snapshot = (time.monotonic(), config)
     return manager
 
 
@@ -114,16 +123,28 @@ class TestInit:
 
     def test_initial_cache_is_none(self):
         mgr = ConfigManager(sheets_id="id")
-        assert mgr._config_cache is None
+        assert mgr._snapshot is None
 
-    def test_initial_cache_timestamp_is_zero(self):
+    def test_initial_cache_age_is_zero(self):
         mgr = ConfigManager(sheets_id="id")
-        assert mgr._cache_timestamp == 0.0
+        assert mgr.cache_age == 0.0
 
     def test_initial_sheets_connector_is_none(self):
         mgr = ConfigManager(sheets_id="id")
         assert mgr._sheets_connector is None
 
+    def test_stores_stampede_policy_default(self):
+        mgr = ConfigManager(sheets_id="id")
+        assert mgr._stampede_policy == "wait"
+
+    def test_stores_stampede_policy_serve_stale(self):
+        mgr = ConfigManager(sheets_id="id", stampede_policy="serve_stale")
+        assert mgr._stampede_policy == "serve_stale"
+
+    def test_invalid_stampede_policy_raises(self):
+        with pytest.raises(ValueError, match="Invalid stampede_policy"):
+            ConfigManager(sheets_id="id", stampede_policy="bogus")
+
 
 # ── get_config() ─────────────────────────────────────────────────────
 
@@ -136,7 +157,7 @@ class TestGetConfig:
 
     def test_no_cache_refresh_if_expired_false_raises(self, auto_manager):
         """get_config(refresh_if_expired=False) with no cache and auto_refresh=True raises."""
-        auto_manager._config_cache = None
+        auto_manager._snapshot = None
         with pytest.raises(ConfigurationError, match="No configuration available"):
             auto_manager.get_config(refresh_if_expired=False)
 
@@ -149,8 +170,7 @@ class TestGetConfig:
     def test_triggers_refresh_when_cache_expired(self, auto_manager, mock_sheets_connector):
         """get_config() triggers refresh when cache has expired."""
         # Set an old timestamp so the cache appears expired
-        auto_manager._config_cache = {"old": {"key": "value"}}
-        auto_manager._cache_timestamp = time.time() - 999
+        auto_manager._snapshot = (time.monotonic() - 999, {"old": {"key": "value"}})
 
         result = auto_manager.get_config()
 
@@ -169,8 +189,7 @@ class TestGetConfig:
 
     def test_returns_expired_cache_when_auto_refresh_disabled(self, manager):
         """get_config() returns expired cache when auto_refresh is disabled."""
-        manager._config_cache = {"stale": {"key": "old_value"}}
-        manager._cache_timestamp = time.time() - 999
+        manager._snapshot = (time.monotonic() - 999, {"stale": {"key": "old_value"}})
 
         result = manager.get_config()
 
@@ -185,8 +204,7 @@ class TestGetConfig:
 
     def test_does_not_refresh_when_cache_valid(self, auto_manager, mock_sheets_connector):
         """get_config() does not call refresh when cache is still valid."""
-        auto_manager._config_cache = EXPECTED_PARSED
-        auto_manager._cache_timestamp = time.time()
+        auto_manager._snapshot = (time.monotonic(), EXPECTED_PARSED)
 
         auto_manager.get_config()
 
@@ -210,6 +228,35 @@ class TestRefresh:
         mock_cls.assert_called_once()
         assert mgr._sheets_connector is mock_instance
 
+    @patch("ccef_connections.config.SheetsConnector")
+    def test_shares_connector_across_instances(self, mock_cls):
+        """Managers with shared_connector=True reuse one SheetsConnector."""
+        mock_cls.return_value.get_worksheet_as_dicts.return_value = SAMPLE_SHEETS_DATA
+
+        first = ConfigManager(sheets_id="sheet-a")
+        second = ConfigManager(sheets_id="sheet-b")
+        first.refresh()
+        second.refresh()
+
+        mock_cls.assert_called_once()
+        assert first._sheets_connector is second._sheets_connector
+
+    @patch("ccef_connections.config.SheetsConnector")
+    def test_shared_connector_opt_out(self, mock_cls):
+        """shared_connector=False gives each manager its own SheetsConnector."""
+        mock_cls.side_effect = lambda: MagicMock(
+            get_worksheet_as_dicts=MagicMock(return_value=SAMPLE_SHEETS_DATA)
+        )
+
+        first = ConfigManager(sheets_id="sheet-a", shared_connector=False)
+        second = ConfigManager(sheets_id="sheet-b", shared_connector=False)
+        first.refresh()
+        second.refresh()
+
+        assert mock_cls.call_count == 2
+        assert first._sheets_connector is not second._sheets_connector
+        assert ConfigManager._shared_connector is None
+
     def test_reads_from_sheets_connector(self, auto_manager, mock_sheets_connector):
         """refresh() reads from SheetsConnector with correct arguments."""
         auto_manager.refresh()
@@ -222,18 +269,18 @@ class TestRefresh:
         """refresh() stores the parsed config in the cache."""
         auto_manager.refresh()
 
-        assert auto_manager._config_cache is not None
-        assert "airtable" in auto_manager._config_cache
-        assert "openai" in auto_manager._config_cache
-        assert auto_manager._config_cache["airtable"]["base_id"] == "appXXX123"
+        assert auto_manager._snapshot is not None
+        assert "airtable" in auto_manager._snapshot[1]
+        assert "openai" in auto_manager._snapshot[1]
+        assert auto_manager._snapshot[1]["airtable"]["base_id"] == "appXXX123"
 
     def test_updates_cache_timestamp(self, auto_manager, mock_sheets_connector):
         """refresh() updates the cache timestamp."""
-        before = time.time()
+        before = time.monotonic()
         auto_manager.refresh()
-        after = time.time()
+        after = time.monotonic()
 
-        assert before <= auto_manager._cache_timestamp <= after
+        assert before <= auto_manager._snapshot[0] <= after
 
     def test_failure_raises_configuration_error(self, auto_manager, mock_sheets_connector):
         """refresh() raises ConfigurationError when Sheets read fails."""
@@ -252,6 +299,33 @@ class TestRefresh:
 
         assert exc_info.value.__cause__ is original
 
+    def test_publishes_new_snapshot(self, loaded_manager, mock_sheets_connector):
+        """refresh() swaps in a new (timestamp, config) pair; held snapshots are untouched."""
+        old = loaded_manager._snapshot
+        old_config = old[1]
+
+        loaded_manager.refresh()
+
+        assert loaded_manager._snapshot is not old
+        assert old[1] is old_config
+        assert loaded_manager._snapshot[0] >= old[0]
+
+    def test_cached_config_is_read_only(self, auto_manager, mock_sheets_connector):
+        """refresh() publishes a config that cannot be mutated by callers."""
+        auto_manager.refresh()
+        config = auto_manager.get_config()
+
+        with pytest.raises(TypeError):
+            config["airtable"] = {}
+        with pytest.raises(TypeError):
+            config["airtable"]["base_id"] = "changed"
+        assert auto_manager.get("airtable", "base_id") == "appXXX123"
+
+    def test_get_config_returns_same_object(self, auto_manager, mock_sheets_connector):
+        """Reads share the cached mapping rather than copying it."""
+        auto_manager.refresh()
+        assert auto_manager.get_config() is auto_manager.get_config()
+
     def test_reuses_existing_connector(self, auto_manager, mock_sheets_connector):
         """refresh() reuses the existing SheetsConnector on subsequent calls."""
         auto_manager.refresh()
@@ -274,6 +348,344 @@ class TestRefresh:
         mock_instance.get_worksheet_as_dicts.assert_called_once_with("test-id", "Settings")
 
 
+# ── refresh_from_bytes() ─────────────────────────────────────────────
+
+
+class TestRefreshFromBytes:
+    def test_loads_rows_from_bytes(self, manager):
+        """refresh_from_bytes() parses a JSON row list into the cache."""
+        manager.refresh_from_bytes(json.dumps(SAMPLE_SHEETS_DATA).encode())
+
+        assert manager.get_config() == EXPECTED_PARSED
+        assert manager.is_cache_valid is True
+
+    def test_accepts_str(self, manager):
+        """refresh_from_bytes() also accepts a JSON string."""
+        manager.refresh_from_bytes(json.dumps(SAMPLE_SHEETS_DATA))
+
+        assert manager.get("openai", "max_tokens") == 4096
+
+    def test_does_not_touch_sheets(self, auto_manager, mock_sheets_connector):
+        """refresh_from_bytes() never calls the SheetsConnector."""
+        auto_manager.refresh_from_bytes(json.dumps(SAMPLE_SHEETS_DATA))
+
+        mock_sheets_connector.get_worksheet_as_dicts.assert_not_called()
+
+    def test_applies_env_overrides(self, manager):
+        """Environment overrides apply to configs loaded from bytes."""
+        with patch.dict("os.environ", {"CCEF_AIRTABLE_BASE_ID": "env_base"}):
+            manager.reload_env()
+            manager.refresh_from_bytes(json.dumps(SAMPLE_SHEETS_DATA))
+
+        assert manager.get("airtable", "base_id") == "env_base"
+
+    def test_invalid_json_raises(self, manager):
+        with pytest.raises(ConfigurationError, match="Invalid configuration JSON"):
+            manager.refresh_from_bytes(b"{not json")
+
+    @pytest.mark.parametrize("raw", [b'{"Section": "a"}', b"[1, 2]"])
+    def test_wrong_shape_raises(self, manager, raw):
+        with pytest.raises(ConfigurationError, match="list of row objects"):
+            manager.refresh_from_bytes(raw)
+
+
+# ── Stampede protection ──────────────────────────────────────────────
+
+
+class TestStampedeProtection:
+    def _slow_connector(self, started, release):
+        """Connector whose first fetch blocks until `release` is set."""
+        mock = MagicMock()
+
+        def fetch(*args):
+            started.set()
+            release.wait(timeout=5)
+            return SAMPLE_SHEETS_DATA
+
+        mock.get_worksheet_as_dicts.side_effect = fetch
+        return mock
+
+    def test_wait_policy_single_fetch_for_concurrent_callers(self):
+        """Concurrent get_config() calls on an expired cache trigger one Sheets fetch."""
+        started, release = threading.Event(), threading.Event()
+        mgr = ConfigManager(sheets_id="test-id", ttl=300)
+        mgr._sheets_connector = self._slow_connector(started, release)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(mgr.get_config()))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        started.wait(timeout=5)
+        release.set()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert mgr._sheets_connector.get_worksheet_as_dicts.call_count == 1
+        assert len(results) == 5
+        assert all(r["airtable"]["base_id"] == "appXXX123" for r in results)
+
+    def test_serve_stale_returns_expired_cache_during_refresh(self):
+        """With serve_stale, callers get the stale cache while another thread refreshes."""
+        started, release = threading.Event(), threading.Event()
+        mgr = ConfigManager(sheets_id="test-id", ttl=300, stampede_policy="serve_stale")
+        mgr._sheets_connector = self._slow_connector(started, release)
+        mgr._snapshot = (time.monotonic() - 999, {"stale": {"key": "old"}})
+
+        refresher = threading.Thread(target=mgr.get_config)
+        refresher.start()
+        started.wait(timeout=5)
+
+        assert mgr.get_config() == {"stale": {"key": "old"}}
+
+        release.set()
+        refresher.join(timeout=5)
+        assert mgr._sheets_connector.get_worksheet_as_dicts.call_count == 1
+        assert "airtable" in mgr.get_config()
+
+    def test_serve_stale_blocks_when_no_cache(self, mock_sheets_connector):
+        """With serve_stale and an empty cache, callers still wait for the first load."""
+        mgr = ConfigManager(sheets_id="test-id", stampede_policy="serve_stale")
+        mgr._sheets_connector = mock_sheets_connector
+
+        result = mgr.get_config()
+
+        assert result["airtable"]["base_id"] == "appXXX123"
+
+    def test_lock_released_after_refresh_failure(self, auto_manager, mock_sheets_connector):
+        """A failed refresh releases the lock so later calls can retry."""
+        mock_sheets_connector.get_worksheet_as_dicts.side_effect = Exception("API error")
+
+        with pytest.raises(ConfigurationError):
+            auto_manager.get_config()
+
+        assert not auto_manager._refresh_lock.locked()
+
+
+# ── Async API ────────────────────────────────────────────────────────
+
+
+class TestAsync:
+    def test_aget_config_loads_when_empty(self, auto_manager, mock_sheets_connector):
+        """aget_config() refreshes an empty cache and returns the config."""
+        result = asyncio.run(auto_manager.aget_config())
+
+        assert result["airtable"]["base_id"] == "appXXX123"
+        mock_sheets_connector.get_worksheet_as_dicts.assert_called_once()
+
+    def test_aget_config_returns_cache_when_valid(self, loaded_manager, mock_sheets_connector):
+        result = asyncio.run(loaded_manager.aget_config())
+
+        assert result["openai"]["model"] == "gpt-4o"
+        mock_sheets_connector.get_worksheet_as_dicts.assert_not_called()
+
+    def test_aget_config_without_auto_refresh_raises(self, manager):
+        with pytest.raises(ConfigurationError, match="No configuration available"):
+            asyncio.run(manager.aget_config())
+
+    def test_aget_config_concurrent_single_fetch(self, auto_manager, mock_sheets_connector):
+        """Concurrent aget_config() calls share one Sheets fetch."""
+
+        async def run():
+            return await asyncio.gather(*(auto_manager.aget_config() for _ in range(5)))
+
+        results = asyncio.run(run())
+
+        assert mock_sheets_connector.get_worksheet_as_dicts.call_count == 1
+        assert all(r is results[0] for r in results)
+
+    def test_aget_config_serve_stale_skips_waiting(self, mock_sheets_connector):
+        """With serve_stale, coroutines get the stale cache while a refresh is in flight."""
+        mgr = ConfigManager(sheets_id="id", stampede_policy="serve_stale")
+        mgr._sheets_connector = mock_sheets_connector
+        mgr._snapshot = (time.monotonic() - 999, {"stale": {"key": "old"}})
+
+        async def run():
+            lock = mgr._get_async_refresh_lock()
+            async with lock:
+                return await mgr.aget_config()
+
+        assert asyncio.run(run()) == {"stale": {"key": "old"}}
+        mock_sheets_connector.get_worksheet_as_dicts.assert_not_called()
+
+    def test_arefresh_updates_cache(self, auto_manager, mock_sheets_connector):
+        asyncio.run(auto_manager.arefresh())
+
+        assert auto_manager._snapshot[1]["airtable"]["base_id"] == "appXXX123"
+
+    def test_arefresh_failure_raises(self, auto_manager, mock_sheets_connector):
+        mock_sheets_connector.get_worksheet_as_dicts.side_effect = Exception("API error")
+
+        with pytest.raises(ConfigurationError, match="Failed to refresh configuration"):
+            asyncio.run(auto_manager.arefresh())
+
+    def test_async_lock_recreated_per_event_loop(self, auto_manager, mock_sheets_connector):
+        """The manager can be used from successive event loops."""
+        asyncio.run(auto_manager.arefresh())
+        asyncio.run(auto_manager.arefresh())
+
+        assert mock_sheets_connector.get_worksheet_as_dicts.call_count == 2
+
+
+# ── Background refresh ───────────────────────────────────────────────
+
+
+class TestBackgroundRefresh:
+    def test_no_thread_by_default(self):
+        """No refresh thread is started unless background_refresh=True."""
+        mgr = ConfigManager(sheets_id="id")
+        assert mgr._refresh_thread is None
+
+    def test_starts_daemon_thread(self):
+        """background_refresh=True starts a daemon thread that close() stops."""
+        mgr = ConfigManager(sheets_id="id", background_refresh=True)
+        thread = mgr._refresh_thread
+        try:
+            assert thread is not None
+            assert thread.daemon is True
+            assert thread.is_alive()
+        finally:
+            mgr.close()
+        assert not thread.is_alive()
+        assert mgr._refresh_thread is None
+
+    def test_context_manager_closes(self):
+        """Exiting the context manager stops the refresh thread."""
+        with ConfigManager(sheets_id="id", background_refresh=True) as mgr:
+            thread = mgr._refresh_thread
+        assert not thread.is_alive()
+
+    def test_close_without_thread_is_noop(self, manager):
+        """close() is safe when no background thread is running."""
+        manager.close()
+        assert manager._refresh_thread is None
+
+    def test_refresh_loop_refreshes_until_stopped(self, manager, mock_sheets_connector):
+        """_refresh_loop() refreshes on each interval and exits when stopped."""
+        manager._sheets_connector = mock_sheets_connector
+        waits = iter([False, False, True])
+        with patch.object(manager._stop_event, "wait", side_effect=lambda t: next(waits)):
+            manager._refresh_loop()
+
+        assert mock_sheets_connector.get_worksheet_as_dicts.call_count == 2
+        assert manager._snapshot[1]["airtable"]["base_id"] == "appXXX123"
+
+    def test_refresh_loop_keeps_last_good_config_on_failure(
+        self, loaded_manager, mock_sheets_connector
+    ):
+        """A failed background refresh leaves the previous cache in place."""
+        mock_sheets_connector.get_worksheet_as_dicts.side_effect = Exception("API error")
+        waits = iter([False, True])
+        with patch.object(loaded_manager._stop_event, "wait", side_effect=lambda t: next(waits)):
+            loaded_manager._refresh_loop()
+
+        assert loaded_manager._snapshot[1]["airtable"]["base_id"] == "appXXX123"
+
+    def test_refresh_loop_interval_is_fraction_of_ttl(self, manager):
+        """The refresh interval is 80% of the TTL, with a 1 second floor."""
+        manager._stop_event.set()
+        with patch.object(manager._stop_event, "wait", return_value=True) as mock_wait:
+            manager._refresh_loop()
+        mock_wait.assert_called_once_with(240.0)
+
+        short = ConfigManager(sheets_id="id", ttl=0)
+        with patch.object(short._stop_event, "wait", return_value=True) as mock_wait:
+            short._refresh_loop()
+        mock_wait.assert_called_once_with(1.0)
+
+
+# ── Disk cache ───────────────────────────────────────────────────────
+
+
+class TestDiskCache:
+    def test_no_cache_path_by_default(self):
+        mgr = ConfigManager(sheets_id="id")
+        assert mgr._cache_path is None
+
+    def test_refresh_writes_cache_file(self, tmp_path, mock_sheets_connector):
+        """refresh() persists the parsed config and a wall-clock timestamp."""
+        path = tmp_path / "config.json"
+        mgr = ConfigManager(sheets_id="id", cache_path=path)
+        mgr._sheets_connector = mock_sheets_connector
+
+        before = time.time()
+        mgr.refresh()
+
+        payload = json.loads(path.read_text())
+        assert payload["config"] == EXPECTED_PARSED
+        assert payload["ts"] >= before
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_fresh_file_skips_first_sheets_fetch(self, tmp_path, mock_sheets_connector):
+        """A cache file within the TTL is served without calling Sheets."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"ts": time.time() - 10, "config": EXPECTED_PARSED}))
+
+        mgr = ConfigManager(sheets_id="id", ttl=300, cache_path=str(path))
+        mgr._sheets_connector = mock_sheets_connector
+
+        assert mgr.get_config() == EXPECTED_PARSED
+        mock_sheets_connector.get_worksheet_as_dicts.assert_not_called()
+        assert 9.0 <= mgr.cache_age <= 12.0
+
+    def test_expired_file_is_ignored(self, tmp_path, mock_sheets_connector):
+        """A cache file older than the TTL is ignored."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"ts": time.time() - 999, "config": {"old": {"k": 1}}}))
+
+        mgr = ConfigManager(sheets_id="id", ttl=300, cache_path=path)
+        mgr._sheets_connector = mock_sheets_connector
+
+        assert mgr._snapshot is None
+        assert mgr.get_config()["airtable"]["base_id"] == "appXXX123"
+        mock_sheets_connector.get_worksheet_as_dicts.assert_called_once()
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        """An unreadable cache file is ignored rather than raising."""
+        path = tmp_path / "config.json"
+        path.write_text("{not json")
+
+        mgr = ConfigManager(sheets_id="id", cache_path=path)
+
+        assert mgr._snapshot is None
+
+    def test_env_overrides_applied_on_load(self, tmp_path):
+        """Environment overrides are applied to config loaded from disk."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"ts": time.time(), "config": {"airtable": {"base_id": "x"}}}))
+
+        with patch.dict("os.environ", {"CCEF_AIRTABLE_BASE_ID": "from_env"}):
+            mgr = ConfigManager(sheets_id="id", cache_path=path)
+
+        assert mgr._snapshot[1]["airtable"]["base_id"] == "from_env"
+
+    def test_env_overrides_not_persisted(self, tmp_path, mock_sheets_connector):
+        """The cache file stores Sheets values, not environment overrides."""
+        path = tmp_path / "config.json"
+        mgr = ConfigManager(sheets_id="id", cache_path=path)
+        mgr._sheets_connector = mock_sheets_connector
+
+        with patch.dict("os.environ", {"CCEF_AIRTABLE_BASE_ID": "from_env"}):
+            mgr.reload_env()
+            mgr.refresh()
+
+        assert mgr._snapshot[1]["airtable"]["base_id"] == "from_env"
+        assert json.loads(path.read_text())["config"]["airtable"]["base_id"] == "appXXX123"
+
+    def test_write_failure_does_not_fail_refresh(self, tmp_path, mock_sheets_connector):
+        """A failed cache write is logged and the refresh still succeeds."""
+        mgr = ConfigManager(sheets_id="id", cache_path=tmp_path / "config.json")
+        mgr._sheets_connector = mock_sheets_connector
+
+        with patch("ccef_connections.config.os.replace", side_effect=OSError("disk full")):
+            mgr.refresh()
+
+        assert mgr._snapshot[1]["airtable"]["base_id"] == "appXXX123"
+        assert list(tmp_path.iterdir()) == []
+
+
 # ── get() ────────────────────────────────────────────────────────────
 
 
@@ -304,19 +716,57 @@ class TestGet:
         mock_sheets_connector.get_worksheet_as_dicts.assert_called_once()
 
 
+# ── get_many() / get_section() ───────────────────────────────────────
+
+
+class TestGetMany:
+    def test_returns_values_keyed_by_pair(self, loaded_manager):
+        result = loaded_manager.get_many([("airtable", "base_id"), ("openai", "model")])
+        assert result == {("airtable", "base_id"): "appXXX123", ("openai", "model"): "gpt-4o"}
+
+    def test_missing_pairs_use_default(self, loaded_manager):
+        result = loaded_manager.get_many(
+            [("airtable", "nope"), ("nosection", "k")], default="fallback"
+        )
+        assert result == {("airtable", "nope"): "fallback", ("nosection", "k"): "fallback"}
+
+    def test_single_cache_check(self, loaded_manager):
+        """get_many() calls get_config() once regardless of how many pairs."""
+        with patch.object(loaded_manager, "get_config", wraps=loaded_manager.get_config) as spy:
+            loaded_manager.get_many([("airtable", "base_id")] * 10)
+        spy.assert_called_once()
+
+    def test_accepts_generator(self, loaded_manager):
+        pairs = ((s, "model") for s in ["openai"])
+        assert loaded_manager.get_many(pairs) == {("openai", "model"): "gpt-4o"}
+
+    def test_triggers_refresh_when_no_cache(self, auto_manager, mock_sheets_connector):
+        result = auto_manager.get_many([("airtable", "base_id")])
+        assert result == {("airtable", "base_id"): "appXXX123"}
+        mock_sheets_connector.get_worksheet_as_dicts.assert_called_once()
+
+
+class TestGetSection:
+    def test_returns_section(self, loaded_manager):
+        assert loaded_manager.get_section("openai") == EXPECTED_PARSED["openai"]
+
+    def test_missing_section_returns_empty(self, loaded_manager):
+        assert loaded_manager.get_section("nosection") == {}
+
+
 # ── clear_cache() ────────────────────────────────────────────────────
 
 
 class TestClearCache:
     def test_clears_config_cache(self, loaded_manager):
-        """clear_cache() sets config cache to None."""
+        """clear_cache() drops the cached snapshot."""
         loaded_manager.clear_cache()
-        assert loaded_manager._config_cache is None
+        assert loaded_manager._snapshot is None
 
-    def test_resets_cache_timestamp(self, loaded_manager):
-        """clear_cache() resets cache timestamp to 0."""
+    def test_resets_cache_age(self, loaded_manager):
+        """clear_cache() resets cache age to 0."""
         loaded_manager.clear_cache()
-        assert loaded_manager._cache_timestamp == 0.0
+        assert loaded_manager.cache_age == 0.0
 
     def test_subsequent_get_config_raises_without_auto_refresh(self, loaded_manager):
         """After clear_cache(), get_config() raises when auto_refresh is disabled."""
@@ -392,6 +842,24 @@ class TestParseConfig:
         assert "airtable" in result
         assert "base_id" in result["airtable"]
 
+    def test_whitespace_only_section_skipped(self, manager):
+        """_parse_config() skips rows whose Section is only whitespace."""
+        data = [
+            {"Section": "   ", "Key": "k", "Value": "v"},
+            {"Section": "valid", "Key": "\tk2\n", "Value": "v2"},
+        ]
+        result = manager._parse_config(data)
+
+        assert result == {"valid": {"k2": "v2"}}
+
+    def test_none_section_or_key_skipped(self, manager):
+        """_parse_config() treats None Section/Key cells as empty."""
+        data = [
+            {"Section": None, "Key": "k", "Value": "v"},
+            {"Section": "valid", "Key": None, "Value": "v"},
+        ]
+        assert manager._parse_config(data) == {}
+
     def test_multiple_rows_same_section(self, manager):
         """_parse_config() groups multiple keys under the same section."""
         data = [
@@ -492,7 +960,25 @@ class TestConvertValue:
         result = manager._convert_value("1e5")
         assert result == 100000.0
 
+    def test_explicit_plus_sign(self, manager):
+        assert manager._convert_value("+5") == 5
+        assert manager._convert_value("+1.5") == 1.5
+
+    def test_scientific_notation_with_signed_exponent(self, manager):
+        assert manager._convert_value("2.5E-3") == 0.0025
+
+    def test_number_with_surrounding_whitespace(self, manager):
+        assert manager._convert_value(" 42 ") == 42
+
     # -- Strings (no conversion) --
+    @pytest.mark.parametrize("input_val", ["nan", "inf", "Infinity", "1_000"])
+    def test_float_keywords_and_underscores_stay_strings(self, manager, input_val):
+        assert manager._convert_value(input_val) == input_val
+
+    @pytest.mark.parametrize("input_val", ["1.2.3", "12abc", "-", "e5", "1e"])
+    def test_number_like_strings_stay_strings(self, manager, input_val):
+        assert manager._convert_value(input_val) == input_val
+
     def test_plain_string(self, manager):
         assert manager._convert_value("hello world") == "hello world"
 
@@ -525,6 +1011,11 @@ class TestConvertValue:
     def test_non_string_list(self, manager):
         assert manager._convert_value([1, 2, 3]) == [1, 2, 3]
 
+    # -- Module-level function --
+    @pytest.mark.parametrize("input_val", ["yes", "0", "42", "3.14", "text", None])
+    def test_method_matches_module_function(self, manager, input_val):
+        assert manager._convert_value(input_val) == _convert_value(input_val)
+
 
 # ── _apply_env_overrides() ───────────────────────────────────────────
 
@@ -534,6 +1025,7 @@ class TestApplyEnvOverrides:
         """Environment variable CCEF_SECTION_KEY overrides config value."""
         config = {"airtable": {"base_id": "original"}}
         with patch.dict("os.environ", {"CCEF_AIRTABLE_BASE_ID": "env_override"}):
+            manager.reload_env()
             result = manager._apply_env_overrides(config)
 
         assert result["airtable"]["base_id"] == "env_override"
@@ -542,6 +1034,7 @@ class TestApplyEnvOverrides:
         """Environment variable values are converted via _convert_value."""
         config = {"openai": {"max_tokens": 100}}
         with patch.dict("os.environ", {"CCEF_OPENAI_MAX_TOKENS": "true"}):
+            manager.reload_env()
             result = manager._apply_env_overrides(config)
 
         assert result["openai"]["max_tokens"] is True
@@ -550,6 +1043,7 @@ class TestApplyEnvOverrides:
         """Environment variable numeric strings are converted to numbers."""
         config = {"openai": {"temperature": 0.7}}
         with patch.dict("os.environ", {"CCEF_OPENAI_TEMPERATURE": "0.9"}):
+            manager.reload_env()
             result = manager._apply_env_overrides(config)
 
         assert result["openai"]["temperature"] == 0.9
@@ -558,6 +1052,7 @@ class TestApplyEnvOverrides:
         """Config values are preserved when no matching env var exists."""
         config = {"airtable": {"base_id": "appXXX"}}
         with patch.dict("os.environ", {}, clear=True):
+            manager.reload_env()
             result = manager._apply_env_overrides(config)
 
         assert result["airtable"]["base_id"] == "appXXX"
@@ -566,6 +1061,7 @@ class TestApplyEnvOverrides:
         """Env var name uses uppercased section and key."""
         config = {"mySection": {"myKey": "original"}}
         with patch.dict("os.environ", {"CCEF_MYSECTION_MYKEY": "overridden"}):
+            manager.reload_env()
             result = manager._apply_env_overrides(config)
 
         assert result["mySection"]["myKey"] == "overridden"
@@ -580,6 +1076,7 @@ class TestApplyEnvOverrides:
             "CCEF_AIRTABLE_TABLE_NAME": "new_table",
         }
         with patch.dict("os.environ", env):
+            manager.reload_env()
             result = manager._apply_env_overrides(config)
 
         assert result["airtable"]["base_id"] == "new_base"
@@ -596,6 +1093,7 @@ class TestApplyEnvOverrides:
             "CCEF_OPENAI_MODEL": "gpt-4o",
         }
         with patch.dict("os.environ", env):
+            manager.reload_env()
             result = manager._apply_env_overrides(config)
 
         assert result["airtable"]["base_id"] == "new_base"
@@ -605,16 +1103,58 @@ class TestApplyEnvOverrides:
         """_apply_env_overrides with empty config returns empty dict."""
         config = {}
         with patch.dict("os.environ", {"CCEF_SECTION_KEY": "val"}):
+            manager.reload_env()
             result = manager._apply_env_overrides(config)
 
         assert result == {}
 
+    def test_underscore_in_section_name(self, manager):
+        """Sections and keys containing underscores are matched correctly."""
+        config = {"google_sheets": {"sheet_id": "original"}}
+        with patch.dict("os.environ", {"CCEF_GOOGLE_SHEETS_SHEET_ID": "overridden"}):
+            manager.reload_env()
+            result = manager._apply_env_overrides(config)
+
+        assert result["google_sheets"]["sheet_id"] == "overridden"
+
+    def test_unrelated_env_vars_ignored(self, manager):
+        """Env vars without the CCEF_ prefix, or not matching a key, are ignored."""
+        config = {"airtable": {"base_id": "original"}}
+        env = {"AIRTABLE_BASE_ID": "nope", "CCEF_AIRTABLE_OTHER": "nope"}
+        with patch.dict("os.environ", env, clear=True):
+            manager.reload_env()
+            result = manager._apply_env_overrides(config)
+
+        assert result == {"airtable": {"base_id": "original"}}
+
+    def test_overrides_snapshotted_at_init(self, mock_sheets_connector):
+        """Env vars set after construction are ignored until reload_env()."""
+        with patch.dict("os.environ", {"CCEF_AIRTABLE_BASE_ID": "at_init"}):
+            mgr = ConfigManager(sheets_id="id")
+        mgr._sheets_connector = mock_sheets_connector
+
+        with patch.dict("os.environ", {"CCEF_AIRTABLE_BASE_ID": "later"}):
+            mgr.refresh()
+            assert mgr.get("airtable", "base_id") == "at_init"
+
+            mgr.reload_env()
+            mgr.refresh()
+            assert mgr.get("airtable", "base_id") == "later"
+
+    def test_refresh_does_not_read_environ(self, auto_manager, mock_sheets_connector):
+        """refresh() uses the snapshot instead of scanning os.environ."""
+        with patch("ccef_connections.config.os.environ") as mock_environ:
+            auto_manager.refresh()
+
+        mock_environ.items.assert_not_called()
+
     def test_env_override_integrated_in_refresh(self, auto_manager, mock_sheets_connector):
         """Environment overrides are applied during refresh()."""
         with patch.dict("os.environ", {"CCEF_AIRTABLE_BASE_ID": "env_base_override"}):
+            auto_manager.reload_env()
             auto_manager.refresh()
 
-        assert auto_manager._config_cache["airtable"]["base_id"] == "env_base_override"
+        assert auto_manager._snapshot[1]["airtable"]["base_id"] == "env_base_override"
 
 
 # ── cache_age property ───────────────────────────────────────────────
@@ -627,13 +1167,13 @@ class TestCacheAge:
 
     def test_cache_age_increases_over_time(self, loaded_manager):
         """cache_age returns a positive value after cache is populated."""
-        # The loaded_manager fixture sets _cache_timestamp to time.time()
+        # The loaded_manager fixture stamps its snapshot with time.monotonic()
         # so cache_age should be very small but >= 0
         assert loaded_manager.cache_age >= 0.0
 
     def test_cache_age_reflects_elapsed_time(self, manager):
         """cache_age reflects the time elapsed since cache was set."""
-        manager._cache_timestamp = time.time() - 60  # 60 seconds ago
+        manager._snapshot = (time.monotonic() - 60, {})  # 60 seconds ago
 
         age = manager.cache_age
         assert 59.0 <= age <= 62.0  # small tolerance for test execution
@@ -658,19 +1198,17 @@ class TestIsCacheValid:
 
     def test_invalid_when_cache_expired(self, loaded_manager):
         """is_cache_valid returns False when cache timestamp is beyond TTL."""
-        loaded_manager._cache_timestamp = time.time() - 999
+        loaded_manager._snapshot = (time.monotonic() - 999, loaded_manager._snapshot[1])
         assert loaded_manager.is_cache_valid is False
 
     def test_valid_just_before_expiry(self, manager):
         """is_cache_valid returns True when cache is just under TTL."""
-        manager._config_cache = {"section": {"key": "value"}}
-        manager._cache_timestamp = time.time() - (manager._ttl - 1)
+        manager._snapshot = (time.monotonic() - (manager._ttl - 1), {"section": {"key": "value"}})
         assert manager.is_cache_valid is True
 
     def test_invalid_at_exact_expiry(self, manager):
         """is_cache_valid returns False when cache age exactly equals TTL."""
-        manager._config_cache = {"section": {"key": "value"}}
-        manager._cache_timestamp = time.time() - manager._ttl
+        manager._snapshot = (time.monotonic() - manager._ttl, {"section": {"key": "value"}})
         assert manager.is_cache_valid is False
 
     def test_invalid_after_clear(self, loaded_manager):
@@ -685,28 +1223,28 @@ class TestIsCacheValid:
 class TestIsCacheExpired:
     def test_not_expired_within_ttl(self, manager):
         """Cache is not expired when age is less than TTL."""
-        manager._cache_timestamp = 1000.0
+        manager._snapshot = (1000.0, {})
         assert manager._is_cache_expired(1100.0) is False  # 100s < 300s TTL
 
     def test_expired_at_ttl_boundary(self, manager):
         """Cache is expired when age exactly equals TTL."""
-        manager._cache_timestamp = 1000.0
+        manager._snapshot = (1000.0, {})
         assert manager._is_cache_expired(1300.0) is True  # 300s == 300s TTL
 
     def test_expired_beyond_ttl(self, manager):
         """Cache is expired when age exceeds TTL."""
-        manager._cache_timestamp = 1000.0
+        manager._snapshot = (1000.0, {})
         assert manager._is_cache_expired(2000.0) is True  # 1000s > 300s TTL
 
     def test_not_expired_at_zero_age(self, manager):
         """Cache is not expired when current_time equals cache_timestamp."""
-        manager._cache_timestamp = 1000.0
+        manager._snapshot = (1000.0, {})
         assert manager._is_cache_expired(1000.0) is False
 
     def test_respects_custom_ttl(self):
         """_is_cache_expired() respects the custom TTL value."""
         mgr = ConfigManager(sheets_id="id", ttl=10)
-        mgr._cache_timestamp = 1000.0
+        mgr._snapshot = (1000.0, {})
 
         assert mgr._is_cache_expired(1009.0) is False  # 9s < 10s
         assert mgr._is_cache_expired(1010.0) is True   # 10s == 10s
@@ -728,7 +1266,7 @@ class TestTTLExpiration:
         assert first_result is not None
 
         # Simulate time passing beyond TTL
-        mgr._cache_timestamp = time.time() - 2
+        mgr._snapshot = (time.monotonic() - 2, mgr._snapshot[1])
 
         # Next get_config should trigger another refresh
         mgr.get_config()
@@ -1,5 +1,6 @@
 """Tests for the core modules: exceptions, base connection, credentials, and retry."""
 
+import importlib.util
 import json
 from unittest.mock import MagicMock, patch, patch as _patch
 
@@ -8,6 +9,7 @@ import pytest
 from ccef_connections.exceptions import (
     AuthenticationError,
     CCEFConnectionError,
+    ClientError,
     ConfigurationError,
     ConnectionError,
     CredentialError,
@@ -17,7 +19,10 @@ from ccef_connections.exceptions import (
 )
 from ccef_connections.core.base import BaseConnection
 from ccef_connections.core.credentials import CredentialManager
+from ccef_connections.core.http import create_session, json_dumps, json_loads
+from ccef_connections.core.ratelimit import TokenBucket
 from ccef_connections.core.retry import (
+    _wait_for_an_rate_limit,
     retry_airtable_operation,
     retry_google_operation,
     retry_helpscout_operation,
@@ -65,6 +70,7 @@ class TestExceptions:
         [
             CredentialError,
             ConnectionError,
+            ClientError,
             AuthenticationError,
             RateLimitError,
             ConfigurationError,
@@ -82,6 +88,17 @@ class TestExceptions:
         assert str(err) == "rate limited"
         assert err.retry_after == 30
 
+    def test_connection_error_stores_status_code(self):
+        """ConnectionError carries an optional HTTP status code."""
+        assert ConnectionError("api error", status_code=404).status_code == 404
+        assert ConnectionError("network down").status_code is None
+
+    def test_client_error_is_connection_error(self):
+        """ClientError is caught by existing ConnectionError handlers."""
+        err = ClientError("bad request", status_code=400)
+        assert isinstance(err, ConnectionError)
+        assert err.status_code == 400
+
     def test_rate_limit_error_retry_after_defaults_to_none(self):
         """RateLimitError.retry_after defaults to None when not provided."""
         err = RateLimitError("rate limited")
@@ -390,6 +407,47 @@ class TestCredentialManager:
                 cm.get_helpscout_credentials()
 
 
+# ── HTTP Session ─────────────────────────────────────────────────────
+
+
+class TestCreateSession:
+    """Test the pooled session factory."""
+
+    def test_sets_default_headers(self):
+        """Headers passed in become session defaults."""
+        session = create_session({"X-Token": "abc"})
+        assert session.headers["X-Token"] == "abc"
+        session.close()
+
+    def test_mounts_pooled_adapter_without_retries(self):
+        """The https adapter uses the requested pool size and no urllib3 retries."""
+        session = create_session(pool_maxsize=7)
+        adapter = session.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 7
+        assert adapter.max_retries.total == 0
+        session.close()
+
+    def test_advertises_only_decodable_encodings(self):
+        """Compression is negotiated, and br only when a Brotli decoder exists."""
+        session = create_session({"X-Token": "abc"})
+        encodings = session.headers["Accept-Encoding"]
+        assert "gzip" in encodings
+        if importlib.util.find_spec("brotli") is None and (
+            importlib.util.find_spec("brotlicffi") is None
+        ):
+            assert "br" not in encodings.split(", ")
+        session.close()
+
+    def test_json_loads_accepts_bytes(self):
+        """json_loads decodes raw response bytes with or without orjson."""
+        assert json_loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_json_dumps_returns_compact_bytes(self):
+        """json_dumps encodes to compact UTF-8 bytes and honours default."""
+        assert json_dumps({"a": [1, 2], "b": "é"}) == '{"a":[1,2],"b":"é"}'.encode()
+        assert json_dumps({"s": {1}}, default=sorted) == b'{"s":[1]}'
+
+
 # ── Retry Decorators ─────────────────────────────────────────────────
 
 
@@ -442,6 +500,21 @@ class TestRetry:
 
         assert call_count == 1
 
+    def test_retry_with_backoff_does_not_retry_client_error(self):
+        """ClientError fails immediately even though it is a ConnectionError."""
+        call_count = 0
+
+        @retry_with_backoff(max_attempts=3, min_wait=0.01, max_wait=0.02)
+        def bad_request():
+            nonlocal call_count
+            call_count += 1
+            raise ClientError("400", status_code=400)
+
+        with pytest.raises(ClientError):
+            bad_request()
+
+        assert call_count == 1
+
     # ── Service-specific decorators ──────────────────────────────────
 
     def test_retry_airtable_operation_retries_and_succeeds(self):
@@ -597,3 +670,159 @@ class TestRetry:
         result = generic_failure()
         assert result == "recovered"
         assert call_count == 2
+
+    @pytest.mark.parametrize("retry_after,low,high", [(1, 1.0, 2.0), (10, 10.0, 12.0)])
+    def test_action_network_wait_jitters_retry_after(self, retry_after, low, high):
+        """A 429 waits Retry-After plus up to min(Retry-After, 2)s of jitter."""
+        state = MagicMock()
+        state.outcome.exception.return_value = RateLimitError("slow", retry_after=retry_after)
+        waits = {_wait_for_an_rate_limit(state) for _ in range(50)}
+        assert all(low <= w <= high for w in waits)
+        assert len(waits) > 1
+
+    def test_action_network_wait_full_jitter_backoff(self):
+        """Other errors use full-jitter exponential backoff capped at 30s."""
+        state = MagicMock()
+        state.outcome.exception.return_value = ConnectionError("boom")
+        state.attempt_number = 10
+        waits = [_wait_for_an_rate_limit(state) for _ in range(50)]
+        assert all(0 <= w <= 30 for w in waits)
+        assert len(set(waits)) > 1
+
+    @pytest.mark.parametrize(
+        "decorator,cap", [(retry_airtable_operation, 10.0), (retry_google_operation, 60.0)]
+    )
+    def test_airtable_and_google_waits_use_full_jitter(self, decorator, cap):
+        """Backoff is drawn from [0, cap] rather than a fixed exponential."""
+        wait = decorator(lambda: None).retry.wait
+        state = MagicMock()
+        state.attempt_number = 12
+        waits = [wait(state) for _ in range(50)]
+        assert all(0 <= w <= cap for w in waits)
+        assert len(set(waits)) > 1
+
+
+# ── Rate limiting ────────────────────────────────────────────────────
+
+
+class TestTokenBucket:
+    """Test the shared client-side rate limiter."""
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError, match="positive"):
+            TokenBucket(rate=0, capacity=5)
+
+    def test_burst_then_waits_for_refill(self):
+        """A full bucket allows `capacity` calls at once, then paces at `rate`."""
+        clock = [100.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        with patch("ccef_connections.core.ratelimit.time") as mock_time:
+            mock_time.monotonic.side_effect = lambda: clock[0]
+            mock_time.sleep.side_effect = fake_sleep
+            bucket = TokenBucket(rate=5, capacity=5)
+            for _ in range(7):
+                bucket.acquire()
+
+        assert sleeps == [pytest.approx(0.2), pytest.approx(0.2)]
+
+    def test_pause_holds_back_tokens(self):
+        """pause() makes the next acquire wait out the given delay."""
+        clock = [100.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        with patch("ccef_connections.core.ratelimit.time") as mock_time:
+            mock_time.monotonic.side_effect = lambda: clock[0]
+            mock_time.sleep.side_effect = fake_sleep
+            bucket = TokenBucket(rate=5, capacity=5)
+            bucket.pause(3)
+            bucket.acquire()
+            bucket.pause(0.1)  # shorter than the current deficit: no extra wait
+            bucket.acquire()
+
+        assert sleeps == [pytest.approx(3.0), pytest.approx(0.2)]
+
+    def test_acquire_async_waits_with_asyncio_sleep(self):
+        """acquire_async() paces like acquire() without blocking the event loop."""
+        import asyncio
+
+        clock = [100.0]
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        with patch("ccef_connections.core.ratelimit.time") as mock_time, patch(
+            "ccef_connections.core.ratelimit.asyncio.sleep", side_effect=fake_sleep
+        ):
+            mock_time.monotonic.side_effect = lambda: clock[0]
+            bucket = TokenBucket(rate=5, capacity=2)
+
+            async def run():
+                for _ in range(3):
+                    await bucket.acquire_async()
+
+            asyncio.run(run())
+
+        assert sleeps == [pytest.approx(0.2)]
+        mock_time.sleep.assert_not_called()
+
+
+# ── Package exports ──────────────────────────────────────────────────
+
+
+class TestLazyExports:
+    """Test the PEP 562 lazy exports on the package and connectors subpackage."""
+
+    def test_top_level_connector_resolves(self):
+        """Connectors are importable from the top-level package."""
+        import ccef_connections
+        from ccef_connections.connectors.airtable import AirtableConnector
+
+        assert ccef_connections.AirtableConnector is AirtableConnector
+
+    def test_top_level_config_manager_resolves(self):
+        """ConfigManager is importable from the top-level package."""
+        from ccef_connections import ConfigManager
+        from ccef_connections.config import ConfigManager as direct
+
+        assert ConfigManager is direct
+
+    def test_connectors_subpackage_resolves(self):
+        """Connectors are importable from the connectors subpackage."""
+        from ccef_connections.connectors import GeocodioConnector
+        from ccef_connections.connectors.geocodio import GeocodioConnector as direct
+
+        assert GeocodioConnector is direct
+
+    def test_all_names_resolve(self):
+        """Every name in __all__ is resolvable on both packages."""
+        import ccef_connections
+        import ccef_connections.connectors as connectors
+
+        for name in ccef_connections.__all__:
+            assert getattr(ccef_connections, name) is not None
+        for name in connectors.__all__:
+            assert getattr(connectors, name) is not None
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names raise AttributeError."""
+        import ccef_connections
+
+        with pytest.raises(AttributeError, match="NoSuchConnector"):
+            ccef_connections.NoSuchConnector
+
+    def test_dir_includes_lazy_names(self):
+        """dir() lists lazily exported names."""
+        import ccef_connections
+
+        assert "BigQueryConnector" in dir(ccef_connections)
@@ -7,10 +7,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 import requests
 
+from ccef_connections.connectors import helpscout
 from ccef_connections.connectors.helpscout import (
     HELPSCOUT_API_BASE,
     HELPSCOUT_TOKEN_URL,
+    MAX_INLINE_RETRIES,
     HelpScoutConnector,
+    _app_bucket,
 )
 from ccef_connections.exceptions import (
     AuthenticationError,
@@ -42,6 +45,22 @@ def _make_response(status_code=200, json_data=None, text="", headers=None):
     return resp
 
 
+@pytest.fixture(autouse=True)
+def rate_limiter():
+    """Replace the shared rate limiter so tests never wait on it."""
+    limiter = MagicMock()
+    with patch.object(helpscout, "_app_bucket", return_value=limiter):
+        yield limiter
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start every test without tokens cached by earlier tests."""
+    helpscout._token_cache.clear()
+    yield
+    helpscout._token_cache.clear()
+
+
 @pytest.fixture
 def connector():
     """Create a HelpScoutConnector with mocked credentials."""
@@ -85,7 +104,7 @@ class TestInit:
 
 
 class TestConnect:
-    @patch("ccef_connections.connectors.helpscout.requests.post")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.post")
     def test_connect_success(self, mock_post, connector):
         mock_post.return_value = _make_response(200, TOKEN_RESPONSE)
 
@@ -103,7 +122,7 @@ class TestConnect:
             timeout=30,
         )
 
-    @patch("ccef_connections.connectors.helpscout.requests.post")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.post")
     def test_connect_auth_failure(self, mock_post, connector):
         mock_post.return_value = _make_response(403, text="Forbidden")
 
@@ -112,7 +131,7 @@ class TestConnect:
 
         assert not connector.is_connected()
 
-    @patch("ccef_connections.connectors.helpscout.requests.post")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.post")
     def test_connect_network_error(self, mock_post, connector):
         mock_post.side_effect = requests.ConnectionError("DNS failure")
 
@@ -135,6 +154,57 @@ class TestConnect:
         assert connected_connector._access_token is None
         assert connected_connector._token_expires_at == 0.0
 
+    def test_disconnect_closes_session(self, connected_connector):
+        session = MagicMock()
+        connected_connector._session = session
+
+        connected_connector.disconnect()
+
+        session.close.assert_called_once()
+        assert connected_connector._session is None
+
+    def test_http2_uses_httpx_client(self, connected_connector):
+        httpx = pytest.importorskip("httpx")
+        connected_connector._http2 = True
+
+        with patch.dict("sys.modules", {"h2": MagicMock()}):
+            with patch.object(httpx, "Client") as mock_client_cls:
+                session = connected_connector._get_session()
+
+        assert session is mock_client_cls.return_value
+        assert mock_client_cls.call_args.kwargs["http2"] is True
+        assert httpx.HTTPError in connected_connector._transport_errors
+
+    def test_http2_transport_errors_wrapped(self, connected_connector):
+        httpx = pytest.importorskip("httpx")
+        connected_connector._transport_errors = (requests.RequestException, httpx.HTTPError)
+        connected_connector._session = MagicMock()
+        connected_connector._session.request.side_effect = httpx.ConnectError("refused")
+
+        with pytest.raises(ConnectionError, match="request failed"):
+            connected_connector._request("GET", "/mailboxes")
+
+    def test_http2_without_httpx_raises_import_error(self):
+        connector = HelpScoutConnector(http2=True)
+        with patch.dict("sys.modules", {"httpx": None}):
+            with pytest.raises(ImportError, match="ccef-connections\\[http2\\]"):
+                connector._get_session()
+
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
+    def test_session_reused_across_requests(self, mock_request, connected_connector):
+        mock_request.return_value = _make_response(200, {"id": 1})
+
+        connected_connector.get_conversation(1)
+        session = connected_connector._session
+        connected_connector.get_conversation(2)
+
+        assert session is not None
+        assert connected_connector._session is session
+        assert "Authorization" not in session.headers
+        assert mock_request.call_args.kwargs["headers"]["Authorization"] == (
+            "Bearer fake-token-abc"
+        )
+
 
 # ── Health Check ──────────────────────────────────────────────────────
 
@@ -143,14 +213,14 @@ class TestHealthCheck:
     def test_health_check_not_connected(self, connector):
         assert connector.health_check() is False
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_health_check_success(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(200, {"id": 1, "email": "a@b.com"})
 
         assert connected_connector.health_check() is True
         mock_request.assert_called_once()
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_health_check_failure(self, mock_request, connected_connector):
         mock_request.side_effect = requests.ConnectionError("timeout")
 
@@ -161,7 +231,7 @@ class TestHealthCheck:
 
 
 class TestContextManager:
-    @patch("ccef_connections.connectors.helpscout.requests.post")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.post")
     def test_context_manager(self, mock_post, connector):
         mock_post.return_value = _make_response(200, TOKEN_RESPONSE)
 
@@ -175,7 +245,7 @@ class TestContextManager:
 
 
 class TestTokenRefresh:
-    @patch("ccef_connections.connectors.helpscout.requests.post")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.post")
     def test_refresh_when_expired(self, mock_post, connected_connector):
         mock_post.return_value = _make_response(
             200, {"access_token": "new-token", "expires_in": 172800}
@@ -187,18 +257,116 @@ class TestTokenRefresh:
         assert headers["Authorization"] == "Bearer new-token"
         mock_post.assert_called_once()
 
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.post")
+    def test_refreshes_before_request_near_expiry(
+        self, mock_post, mock_request, connected_connector
+    ):
+        """A token about to expire is replaced up front, not after a 401."""
+        mock_post.return_value = _make_response(
+            200, {"access_token": "new-token", "expires_in": 172800}
+        )
+        mock_request.return_value = _make_response(200, {"ok": True})
+        connected_connector._token_expires_at = time.time() + 30  # inside the margin
+
+        connected_connector._request("GET", "/users/me")
+
+        mock_post.assert_called_once()
+        mock_request.assert_called_once()
+        headers = mock_request.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Bearer new-token"
+
     def test_no_refresh_when_valid(self, connected_connector):
         headers = connected_connector._get_headers()
 
         assert headers["Authorization"] == "Bearer fake-token-abc"
         assert headers["Content-Type"] == "application/json"
 
+    @patch("ccef_connections.connectors.helpscout.requests.Session.post")
+    def test_connect_starts_and_disconnect_stops_refresher(self, mock_post, connector):
+        mock_post.return_value = _make_response(200, TOKEN_RESPONSE)
+
+        connector.connect()
+        thread = connector._refresh_thread
+        assert thread is not None and thread.is_alive()
+        assert thread.daemon
+
+        connector.disconnect()
+        assert not thread.is_alive()
+        assert connector._refresh_thread is None
+
+    @patch("ccef_connections.connectors.helpscout.requests.Session.post")
+    def test_refresh_loop_renews_before_expiry(self, mock_post, connected_connector):
+        mock_post.return_value = _make_response(
+            200, {"access_token": "new-token", "expires_in": 172800}
+        )
+        connected_connector._token_expires_at = time.time() + 100  # inside the skew window
+        connected_connector._stop_event = MagicMock()
+        connected_connector._stop_event.wait.side_effect = [False, True]
+
+        connected_connector._refresh_loop()
+
+        assert connected_connector._access_token == "new-token"
+        mock_post.assert_called_once()
+
+    @patch("ccef_connections.connectors.helpscout.requests.Session.post")
+    def test_refresh_loop_survives_failures(self, mock_post, connected_connector):
+        mock_post.side_effect = requests.ConnectionError("down")
+        connected_connector._token_expires_at = time.time() + 100
+        connected_connector._stop_event = MagicMock()
+        connected_connector._stop_event.wait.side_effect = [False, False, True]
+
+        connected_connector._refresh_loop()
+
+        assert mock_post.call_count == 2
+        assert connected_connector._access_token == "fake-token-abc"
+
+    @patch("ccef_connections.connectors.helpscout.requests.Session.post")
+    def test_token_shared_across_instances(self, mock_post, connector):
+        mock_post.return_value = _make_response(200, TOKEN_RESPONSE)
+        connector.connect()
+
+        other = HelpScoutConnector()
+        other._credential_manager = connector._credential_manager
+        other.connect()
+
+        mock_post.assert_called_once()
+        assert other._access_token == "fake-token-abc"
+        assert other._token_expires_at == connector._token_expires_at
+        connector.disconnect()
+        other.disconnect()
+
+    @patch("ccef_connections.connectors.helpscout.requests.Session.post")
+    def test_cached_token_not_reused_by_its_holder(self, mock_post, connected_connector):
+        mock_post.return_value = _make_response(
+            200, {"access_token": "new-token", "expires_in": 172800}
+        )
+        helpscout._token_cache[("test-id", "test-secret")] = (
+            "fake-token-abc",
+            time.time() + 86400,
+        )
+
+        connected_connector._replace_rejected_token("fake-token-abc")
+
+        mock_post.assert_called_once()
+        assert connected_connector._access_token == "new-token"
+        assert helpscout._token_cache[("test-id", "test-secret")][0] == "new-token"
+
+    @patch("ccef_connections.connectors.helpscout.requests.Session.post")
+    def test_401_skips_refresh_if_token_already_replaced(self, mock_post, connected_connector):
+        connected_connector._access_token = "newer-token"
+
+        connected_connector._replace_rejected_token("fake-token-abc")
+
+        mock_post.assert_not_called()
+        assert connected_connector._access_token == "newer-token"
+
 
 # ── _request internals ────────────────────────────────────────────────
 
 
 class TestRequest:
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_get_request(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(200, {"id": 1})
 
@@ -214,7 +382,7 @@ class TestRequest:
             timeout=30,
         )
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_post_request_with_body(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(204)
 
@@ -226,7 +394,7 @@ class TestRequest:
         call_kwargs = mock_request.call_args
         assert call_kwargs.kwargs["json"] == {"text": "hi"}
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_201_returns_none(self, mock_request, connected_connector):
         """Write operations (reply, note) return 201 with no body."""
         mock_request.return_value = _make_response(201)
@@ -237,8 +405,8 @@ class TestRequest:
 
         assert result is None
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
-    @patch("ccef_connections.connectors.helpscout.requests.post")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.post")
     def test_401_triggers_refresh_and_retry(
         self, mock_post, mock_request, connected_connector
     ):
@@ -256,8 +424,8 @@ class TestRequest:
         assert result == {"ok": True}
         assert mock_request.call_count == 2
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
-    @patch("ccef_connections.connectors.helpscout.requests.post")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.post")
     def test_401_after_refresh_raises(self, mock_post, mock_request, connected_connector):
         """Both calls return 401 -> AuthenticationError."""
         mock_request.return_value = _make_response(401)
@@ -268,18 +436,68 @@ class TestRequest:
         with pytest.raises(AuthenticationError, match="after token refresh"):
             connected_connector._request("GET", "/users/me")
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
-    def test_429_raises_rate_limit(self, mock_request, connected_connector):
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
+    def test_429_raises_rate_limit(self, mock_request, connected_connector, rate_limiter):
+        mock_request.return_value = _make_response(
+            429, headers={"X-RateLimit-Retry-After": "60"}
+        )
+
+        with pytest.raises(RateLimitError, match="retry after 60s") as exc_info:
+            connected_connector._request("GET", "/mailboxes")
+
+        assert exc_info.value.retry_after == 60
+        rate_limiter.pause.assert_called_once_with(60)
+        mock_request.assert_called_once()
+
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
+    def test_short_429_waited_out_inline(self, mock_request, connected_connector, rate_limiter):
+        mock_request.side_effect = [
+            _make_response(429, headers={"X-RateLimit-Retry-After": "2"}),
+            _make_response(200, {"ok": True}),
+        ]
+
+        assert connected_connector._request("GET", "/mailboxes") == {"ok": True}
+        rate_limiter.pause.assert_called_once_with(2)
+        assert rate_limiter.acquire.call_count == 2
+
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
+    def test_429_raises_after_inline_retries(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(
             429, headers={"X-RateLimit-Retry-After": "30"}
         )
 
-        with pytest.raises(RateLimitError, match="retry after 30s") as exc_info:
+        with pytest.raises(RateLimitError, match="retry after 30s"):
             connected_connector._request("GET", "/mailboxes")
 
-        assert exc_info.value.retry_after == 30
+        assert mock_request.call_count == MAX_INLINE_RETRIES + 1
+
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
+    def test_requests_draw_from_rate_limiter(
+        self, mock_request, connected_connector, rate_limiter
+    ):
+        mock_request.return_value = _make_response(200, {"ok": True})
+
+        connected_connector._request("GET", "/mailboxes")
+        connected_connector._request("GET", "/mailboxes")
+
+        assert rate_limiter.acquire.call_count == 2
+        rate_limiter.pause.assert_not_called()
+
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
+    def test_rate_limiter_is_per_app(self, mock_request, connected_connector):
+        mock_request.return_value = _make_response(200, {"ok": True})
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+        connected_connector._request("GET", "/mailboxes")
+
+        helpscout._app_bucket.assert_called_once_with("test-id")
+
+    def test_app_buckets_are_separate(self):
+        with patch.dict(helpscout._app_buckets, clear=True):
+            first = _app_bucket("app-1")
+            assert _app_bucket("app-1") is first
+            assert _app_bucket("app-2") is not first
+
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_429_default_retry_after(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(429, headers={})
 
@@ -288,14 +506,43 @@ class TestRequest:
 
         assert exc_info.value.retry_after == 10
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
-    def test_500_raises_connection_error(self, mock_request, connected_connector):
+    @patch("ccef_connections.connectors.helpscout.time.sleep")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
+    def test_500_raises_connection_error(self, mock_request, mock_sleep, connected_connector):
         mock_request.return_value = _make_response(500, text="Internal Server Error")
 
         with pytest.raises(ConnectionError, match="500"):
             connected_connector._request("GET", "/mailboxes")
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+        assert mock_request.call_count == MAX_INLINE_RETRIES + 1
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(delays) == MAX_INLINE_RETRIES
+        assert all(0 <= d <= 2.0**i for i, d in enumerate(delays))
+
+    @patch("ccef_connections.connectors.helpscout.time.sleep")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
+    def test_5xx_retried_inline(self, mock_request, mock_sleep, connected_connector):
+        mock_request.side_effect = [
+            _make_response(503, text="Unavailable"),
+            _make_response(200, {"ok": True}),
+        ]
+
+        assert connected_connector._request("GET", "/mailboxes") == {"ok": True}
+        mock_sleep.assert_called_once()
+
+    @patch("ccef_connections.connectors.helpscout.time.sleep")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
+    def test_5xx_not_retried_inline_for_post(self, mock_request, mock_sleep, connected_connector):
+        """A POST that fails with 5xx may have been applied, so it is not re-sent inline."""
+        mock_request.return_value = _make_response(502, text="Bad Gateway")
+
+        with pytest.raises(ConnectionError, match="502"):
+            connected_connector._request("POST", "/conversations/1/reply", json_body={})
+
+        mock_request.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_network_error_raises_connection_error(
         self, mock_request, connected_connector
     ):
@@ -304,13 +551,13 @@ class TestRequest:
         with pytest.raises(ConnectionError, match="request failed"):
             connected_connector._request("GET", "/mailboxes")
 
-    @patch("ccef_connections.connectors.helpscout.requests.post")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.post")
     def test_auto_connect_on_request(self, mock_post, connector):
         """_request auto-connects when not connected and no token."""
         mock_post.return_value = _make_response(200, TOKEN_RESPONSE)
 
         with patch(
-            "ccef_connections.connectors.helpscout.requests.request"
+            "ccef_connections.connectors.helpscout.requests.Session.request"
         ) as mock_request:
             mock_request.return_value = _make_response(200, {"data": "ok"})
             result = connector._request("GET", "/mailboxes")
@@ -323,7 +570,7 @@ class TestRequest:
 
 
 class TestPagination:
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_single_page(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(
             200,
@@ -337,7 +584,7 @@ class TestPagination:
 
         assert result == [{"id": 1}, {"id": 2}]
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_multi_page(self, mock_request, connected_connector):
         page1 = _make_response(
             200,
@@ -362,7 +609,7 @@ class TestPagination:
         assert result == [{"id": 1}, {"id": 2}]
         assert mock_request.call_count == 2
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_pagination_without_resource_key(self, mock_request, connected_connector):
         """Falls back to first key in _embedded when no resource_key given."""
         mock_request.return_value = _make_response(
@@ -377,7 +624,7 @@ class TestPagination:
 
         assert result == [{"id": 10}]
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_pagination_empty_response(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(204)
 
@@ -385,7 +632,7 @@ class TestPagination:
 
         assert result == []
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_pagination_strips_base_url_from_next(self, mock_request, connected_connector):
         """next link with full URL is reduced to a path."""
         page1 = _make_response(
@@ -412,12 +659,38 @@ class TestPagination:
         # params should be None on the second call (encoded in the URL path)
         assert second_call_url is None
 
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
+    def test_total_pages_fetched_concurrently_in_order(self, mock_request, connected_connector):
+        def respond(method, url, headers=None, params=None, json=None, timeout=None):
+            n = (params or {}).get("page", 1)
+            links = {"next": {"href": f"{HELPSCOUT_API_BASE}/conversations?page={n + 1}"}}
+            return _make_response(
+                200,
+                {
+                    "_embedded": {"conversations": [{"id": n}]},
+                    "_links": links if n < 3 else {},
+                    "page": {"number": n, "totalPages": 3},
+                },
+            )
+
+        mock_request.side_effect = respond
+
+        result = connected_connector._paginate(
+            "/conversations", params={"mailbox": 1}, resource_key="conversations"
+        )
+
+        assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert sorted(
+            c.kwargs["params"]["page"] for c in mock_request.call_args_list[1:]
+        ) == [2, 3]
+        assert all(c.kwargs["params"]["mailbox"] == 1 for c in mock_request.call_args_list)
+
 
 # ── Mailboxes ─────────────────────────────────────────────────────────
 
 
 class TestListMailboxes:
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_list_mailboxes(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(
             200,
@@ -443,7 +716,7 @@ class TestListMailboxes:
 
 
 class TestListConversations:
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_list_conversations_basic(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(
             200,
@@ -464,7 +737,7 @@ class TestListConversations:
         call_kwargs = mock_request.call_args
         assert call_kwargs.kwargs["params"] == {"mailbox": 1}
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_list_conversations_with_filters(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(
             200,
@@ -482,7 +755,7 @@ class TestListConversations:
             "tag": "urgent",
         }
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_list_conversations_with_kwargs(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(
             200,
@@ -498,7 +771,7 @@ class TestListConversations:
 
 
 class TestGetConversation:
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_get_conversation(self, mock_request, connected_connector):
         conversation_data = {"id": 100, "subject": "Help!", "status": "active"}
         mock_request.return_value = _make_response(200, conversation_data)
@@ -509,7 +782,7 @@ class TestGetConversation:
         mock_request.assert_called_once()
         assert "/conversations/100" in mock_request.call_args[0][1]
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_get_conversation_returns_empty_on_204(
         self, mock_request, connected_connector
     ):
@@ -521,7 +794,7 @@ class TestGetConversation:
 
 
 class TestListThreads:
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_list_threads(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(
             200,
@@ -543,11 +816,48 @@ class TestListThreads:
         assert "/conversations/100/threads" in mock_request.call_args[0][1]
 
 
+class TestIterators:
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
+    def test_iter_conversations_fetches_pages_lazily(self, mock_request, connected_connector):
+        page1 = _make_response(
+            200,
+            {
+                "_embedded": {"conversations": [{"id": 1}, {"id": 2}]},
+                "_links": {"next": {"href": f"{HELPSCOUT_API_BASE}/conversations?page=2"}},
+                "page": {"number": 1, "totalPages": 2},
+            },
+        )
+        page2 = _make_response(
+            200, {"_embedded": {"conversations": [{"id": 3}]}, "_links": {}}
+        )
+        mock_request.side_effect = [page1, page2]
+
+        it = connected_connector.iter_conversations(12345, status="active")
+        assert next(it) == {"id": 1}
+        assert mock_request.call_count == 1
+        assert mock_request.call_args.kwargs["params"] == {"mailbox": 12345, "status": "active"}
+
+        assert list(it) == [{"id": 2}, {"id": 3}]
+        assert mock_request.call_args[0][1] == f"{HELPSCOUT_API_BASE}/conversations?page=2"
+        assert mock_request.call_args.kwargs["params"] is None
+
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
+    def test_iter_threads_and_mailboxes(self, mock_request, connected_connector):
+        mock_request.side_effect = [
+            _make_response(200, {"_embedded": {"threads": [{"id": 7}]}, "_links": {}}),
+            _make_response(200, {"_embedded": {"mailboxes": [{"id": 8}]}, "_links": {}}),
+        ]
+
+        assert list(connected_connector.iter_threads(100)) == [{"id": 7}]
+        assert "/conversations/100/threads" in mock_request.call_args[0][1]
+        assert list(connected_connector.iter_mailboxes()) == [{"id": 8}]
+
+
 # ── Conversations (write) ────────────────────────────────────────────
 
 
 class TestReplyToConversation:
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_reply_basic(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(201)
 
@@ -562,7 +872,7 @@ class TestReplyToConversation:
         assert body["customer"] == {"id": 42}
         assert body["draft"] is False
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_reply_as_draft(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(201)
 
@@ -572,7 +882,7 @@ class TestReplyToConversation:
 
         assert mock_request.call_args.kwargs["json"]["draft"] is True
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_reply_with_kwargs(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(201)
 
@@ -586,7 +896,7 @@ class TestReplyToConversation:
 
 
 class TestAddNote:
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_add_note(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(201)
 
@@ -599,7 +909,7 @@ class TestAddNote:
 
 
 class TestUpdateConversationStatus:
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_update_status_closed(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(204)
 
@@ -610,7 +920,7 @@ class TestUpdateConversationStatus:
         assert "/conversations/100" in call_args[0][1]
         assert call_args.kwargs["json"]["value"] == "closed"
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_update_status_active(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(204)
 
@@ -618,7 +928,7 @@ class TestUpdateConversationStatus:
 
         assert mock_request.call_args.kwargs["json"]["value"] == "active"
 
-    @patch("ccef_connections.connectors.helpscout.requests.request")
+    @patch("ccef_connections.connectors.helpscout.requests.Session.request")
     def test_update_status_pending(self, mock_request, connected_connector):
         mock_request.return_value = _make_response(204)
 
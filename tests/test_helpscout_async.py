@@ -0,0 +1,272 @@
+"""Tests for the async HelpScout connector."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from ccef_connections.connectors import helpscout  # noqa: E402
+from ccef_connections.connectors.helpscout import (  # noqa: E402
+    HELPSCOUT_API_BASE,
+    HELPSCOUT_TOKEN_URL,
+)
+from ccef_connections.connectors.helpscout_async import AsyncHelpScoutConnector  # noqa: E402
+from ccef_connections.exceptions import (  # noqa: E402
+    AuthenticationError,
+    ConnectionError,
+    RateLimitError,
+)
+
+from ._async_fakes import FakeResponse, FakeSession, use_session  # noqa: E402
+
+
+# -- helpers ----------------------------------------------------------------
+
+FAKE_CREDS = {"app_id": "test-id", "app_secret": "test-secret"}
+
+
+def _page(items, number, total_pages):
+    """Build a HAL page of conversations with page metadata."""
+    links = {}
+    if number < total_pages:
+        links["next"] = {"href": f"{HELPSCOUT_API_BASE}/conversations?page={number + 1}"}
+    return {
+        "_embedded": {"conversations": items},
+        "_links": links,
+        "page": {"number": number, "totalPages": total_pages},
+    }
+
+
+@pytest.fixture(autouse=True)
+def no_retry_sleep():
+    """Skip tenacity back-off sleeps so retried requests do not slow the suite."""
+    with patch.object(
+        AsyncHelpScoutConnector._request.retry, "sleep", new_callable=AsyncMock
+    ) as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.fixture(autouse=True)
+def rate_limiter():
+    """Replace the shared rate limiter so tests never wait on it."""
+    limiter = MagicMock()
+    limiter.acquire_async = AsyncMock()
+    with patch("ccef_connections.connectors.helpscout_async._app_bucket", return_value=limiter):
+        yield limiter
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start every test without tokens cached by earlier tests."""
+    helpscout._token_cache.clear()
+    yield
+    helpscout._token_cache.clear()
+
+
+@pytest.fixture
+def connected():
+    """Return an async connector with a valid token and no session yet."""
+    c = AsyncHelpScoutConnector()
+    c._credential_manager = MagicMock()
+    c._credential_manager.get_helpscout_credentials.return_value = FAKE_CREDS
+    c._access_token = "fake-token-abc"
+    c._token_expires_at = time.time() + 86400
+    c._is_connected = True
+    return c
+
+
+# ==========================================================================
+# Lifecycle
+# ==========================================================================
+
+
+class TestLifecycle:
+    def test_rejects_bad_concurrency(self):
+        with pytest.raises(ValueError, match="concurrency"):
+            AsyncHelpScoutConnector(concurrency=0)
+
+    def test_connect_fetches_and_shares_token(self, connected):
+        token = {"access_token": "tok-1", "expires_in": 172800}
+        session = FakeSession(None, lambda: FakeResponse(200, token))
+        connected._access_token = None
+
+        async def run():
+            with patch.object(connected, "_create_session", return_value=session):
+                await connected.connect()
+            other = AsyncHelpScoutConnector()
+            other._credential_manager = connected._credential_manager
+            with patch.object(other, "_create_session", return_value=session):
+                await other.connect()
+            return other
+
+        other = asyncio.run(run())
+        assert connected._access_token == other._access_token == "tok-1"
+        assert session.token_calls == [
+            (
+                HELPSCOUT_TOKEN_URL,
+                {
+                    "grant_type": "client_credentials",
+                    "client_id": "test-id",
+                    "client_secret": "test-secret",
+                },
+            )
+        ]
+
+    def test_connect_auth_failure(self, connected):
+        session = FakeSession(None, lambda: FakeResponse(403, text="Forbidden"))
+        connected._access_token = None
+        with patch.object(connected, "_create_session", return_value=session):
+            with pytest.raises(AuthenticationError, match="403"):
+                asyncio.run(connected.connect())
+
+    def test_disconnect_closes_session(self, connected):
+        session = use_session(connected, None)
+        asyncio.run(connected.disconnect())
+        assert session.closed
+        assert connected._session is None
+        assert not connected.is_connected()
+
+
+# ==========================================================================
+# _request
+# ==========================================================================
+
+
+class TestRequest:
+    def test_get_sends_bearer_token(self, connected, rate_limiter):
+        session = use_session(connected, lambda *a: FakeResponse(200, {"id": 1}))
+        assert asyncio.run(connected.get_conversation(1)) == {"id": 1}
+        method, url, _, _ = session.calls[0]
+        headers = session.headers[0]
+        assert (method, url) == ("GET", f"{HELPSCOUT_API_BASE}/conversations/1")
+        assert headers["Authorization"] == "Bearer fake-token-abc"
+        rate_limiter.acquire_async.assert_awaited_once()
+
+    def test_401_refreshes_token_once(self, connected):
+        responses = [FakeResponse(401), FakeResponse(200, {"ok": True})]
+        token = {"access_token": "new-token", "expires_in": 172800}
+        session = use_session(
+            connected, lambda *a: responses.pop(0), lambda: FakeResponse(200, token)
+        )
+
+        assert asyncio.run(connected._request("GET", "/users/me")) == {"ok": True}
+        assert len(session.token_calls) == 1
+        assert session.headers[1]["Authorization"] == "Bearer new-token"
+
+    def test_refreshes_before_request_near_expiry(self, connected):
+        token = {"access_token": "new-token", "expires_in": 172800}
+        session = use_session(
+            connected,
+            lambda *a: FakeResponse(200, {"ok": True}),
+            lambda: FakeResponse(200, token),
+        )
+        connected._token_expires_at = time.time() + 30
+
+        asyncio.run(connected._request("GET", "/users/me"))
+        assert len(session.token_calls) == 1
+        assert len(session.calls) == 1
+        assert session.headers[0]["Authorization"] == "Bearer new-token"
+
+    def test_in_flight_requests_bounded_by_concurrency(self, connected):
+        """Requests past the limit wait for a slot before they are sent."""
+        connected._concurrency = 2
+        in_flight = [0]
+        peak = [0]
+
+        class _SlowResponse(FakeResponse):
+            async def __aenter__(self):
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+                await asyncio.sleep(0.01)
+                return self
+
+            async def __aexit__(self, *exc):
+                in_flight[0] -= 1
+                return False
+
+        use_session(connected, lambda *a: _SlowResponse(204))
+        results = asyncio.run(connected.close_many(range(6)))
+        assert results == {cid: None for cid in range(6)}
+        assert peak[0] == 2
+
+    def test_429_pauses_limiter_and_raises(self, connected, rate_limiter):
+        use_session(
+            connected, lambda *a: FakeResponse(429, headers={"X-RateLimit-Retry-After": "7"})
+        )
+        with pytest.raises(RateLimitError) as exc_info:
+            asyncio.run(connected._request("GET", "/mailboxes"))
+        assert exc_info.value.retry_after == 7
+        rate_limiter.pause.assert_called_with(7)
+
+    def test_client_error_wrapped(self, connected):
+        use_session(connected, lambda *a: aiohttp.ClientConnectionError("down"))
+        with pytest.raises(ConnectionError, match="request failed"):
+            asyncio.run(connected._request("GET", "/mailboxes"))
+
+
+# ==========================================================================
+# Pagination
+# ==========================================================================
+
+
+class TestPagination:
+    def test_total_pages_fetched_concurrently_in_order(self, connected):
+        def responder(method, url, params, body):
+            n = (params or {}).get("page", 1)
+            return FakeResponse(200, _page([{"id": n}], n, 3))
+
+        session = use_session(connected, responder)
+        result = asyncio.run(connected.list_conversations(12345, status="active"))
+        assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert [c[2] for c in session.calls] == [
+            {"mailbox": 12345, "status": "active"},
+            {"mailbox": 12345, "status": "active", "page": 2},
+            {"mailbox": 12345, "status": "active", "page": 3},
+        ]
+
+
+# ==========================================================================
+# Batch writes
+# ==========================================================================
+
+
+class TestBatchWrites:
+    def test_reply_many_returns_per_conversation_errors(self, connected):
+        def responder(method, url, params, body):
+            if "/conversations/2/" in url:
+                return FakeResponse(400, text="bad customer")
+            return FakeResponse(201)
+
+        session = use_session(connected, responder)
+        results = asyncio.run(
+            connected.reply_many([(1, "Thanks!", 10), (2, "Thanks!", 20)], draft=True)
+        )
+        assert results[0] is None
+        assert isinstance(results[1], ConnectionError)
+        first = next(c for c in session.calls if c[1].endswith("/conversations/1/reply"))
+        assert first[3] == {"customer": {"id": 10}, "text": "Thanks!", "draft": True}
+
+    def test_reply_many_keeps_repeated_conversations(self, connected):
+        session = use_session(connected, lambda *a: FakeResponse(201))
+        results = asyncio.run(connected.reply_many([(1, "First", 10), (1, "Second", 10)]))
+        assert results == [None, None]
+        assert sorted(c[3]["text"] for c in session.calls) == ["First", "Second"]
+
+    def test_close_many_patches_status(self, connected):
+        session = use_session(connected, lambda *a: FakeResponse(204))
+        results = asyncio.run(connected.close_many([5, 6]))
+        assert results == {5: None, 6: None}
+        assert {c[1] for c in session.calls} == {
+            f"{HELPSCOUT_API_BASE}/conversations/5",
+            f"{HELPSCOUT_API_BASE}/conversations/6",
+        }
+        assert all(
+            c[3] == {"op": "replace", "path": "/status", "value": "closed"} for c in session.calls
+        )
+
+    def test_update_status_invalid(self, connected):
+        with pytest.raises(ValueError, match="Invalid status 'spam'"):
+            asyncio.run(connected.update_conversation_status(1, "spam"))
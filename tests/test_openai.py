@@ -1,7 +1,8 @@
 """Tests for the OpenAI connector."""
 
+import asyncio
 import os
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import AsyncMock, MagicMock, patch, call
 
 import pytest
 from pydantic import BaseModel
@@ -284,6 +285,40 @@ class TestGetChatModel:
 
         assert result is sentinel
 
+    @patch("ccef_connections.connectors.openai.init_chat_model")
+    def test_get_chat_model_reuses_instance(self, mock_init, connected_connector):
+        """Repeated calls with the same arguments build the model once."""
+        mock_init.side_effect = lambda *a, **kw: MagicMock()
+
+        first = connected_connector.get_chat_model("gpt-4o", max_tokens=500)
+        second = connected_connector.get_chat_model("gpt-4o", max_tokens=500)
+        other = connected_connector.get_chat_model("gpt-4o", max_tokens=100)
+
+        assert first is second
+        assert other is not first
+        assert mock_init.call_count == 2
+
+    @patch("ccef_connections.connectors.openai.init_chat_model")
+    def test_get_chat_model_unhashable_kwargs_not_cached(self, mock_init, connected_connector):
+        """Unhashable kwargs values bypass the cache instead of raising."""
+        mock_init.side_effect = lambda *a, **kw: MagicMock()
+
+        connected_connector.get_chat_model(model_kwargs={"seed": 1})
+        connected_connector.get_chat_model(model_kwargs={"seed": 1})
+
+        assert mock_init.call_count == 2
+
+    @patch("ccef_connections.connectors.openai.init_chat_model")
+    def test_disconnect_clears_model_cache(self, mock_init, connected_connector):
+        mock_init.side_effect = lambda *a, **kw: MagicMock()
+        first = connected_connector.get_chat_model()
+
+        connected_connector.disconnect()
+        second = connected_connector.get_chat_model()
+
+        assert second is not first
+        assert mock_init.call_count == 2
+
 
 # ── invoke_with_structured_output ────────────────────────────────────
 
@@ -435,6 +470,95 @@ class TestInvokeWithStructuredOutput:
         )
 
 
+    @patch("ccef_connections.connectors.openai.ChatPromptTemplate")
+    @patch("ccef_connections.connectors.openai.init_chat_model")
+    def test_invoke_structured_output_reuses_chain(
+        self, mock_init, mock_prompt_cls, connected_connector
+    ):
+        """The prompt | structured model chain is built once per model and schema."""
+        mock_llm = MagicMock()
+        mock_init.return_value = mock_llm
+        mock_template = MagicMock()
+        mock_prompt_cls.from_messages.return_value = mock_template
+        mock_chain = MagicMock()
+        mock_template.__or__ = MagicMock(return_value=mock_chain)
+        mock_chain.invoke.return_value = MockResponseModel(answer="a", confidence=1.0)
+
+        for text in ("first", "second"):
+            connected_connector.invoke_with_structured_output(
+                model="gpt-4o",
+                system_prompt="System",
+                user_content=text,
+                response_model=MockResponseModel,
+            )
+
+        mock_init.assert_called_once()
+        mock_llm.with_structured_output.assert_called_once_with(MockResponseModel)
+        mock_prompt_cls.from_messages.assert_called_once()
+        assert mock_chain.invoke.call_count == 2
+        assert mock_chain.invoke.call_args.args[0]["user_content"] == "second"
+
+
+# ── abatch_with_structured_output ────────────────────────────────────
+
+
+class TestAbatchWithStructuredOutput:
+    @patch("ccef_connections.connectors.openai.ChatPromptTemplate")
+    @patch("ccef_connections.connectors.openai.init_chat_model")
+    def test_abatch_runs_chain_concurrently(self, mock_init, mock_prompt_cls, connected_connector):
+        """abatch_with_structured_output() sends every item through chain.abatch()."""
+        mock_llm = MagicMock()
+        mock_init.return_value = mock_llm
+        mock_template = MagicMock()
+        mock_prompt_cls.from_messages.return_value = mock_template
+        mock_chain = MagicMock()
+        mock_template.__or__ = MagicMock(return_value=mock_chain)
+        expected = [
+            MockResponseModel(answer="a", confidence=0.9),
+            MockResponseModel(answer="b", confidence=0.8),
+        ]
+        mock_chain.abatch = AsyncMock(return_value=expected)
+
+        result = asyncio.run(
+            connected_connector.abatch_with_structured_output(
+                model="gpt-4o",
+                system_prompt="System",
+                user_contents=["one", "two"],
+                response_model=MockResponseModel,
+                max_concurrency=5,
+            )
+        )
+
+        assert result == expected
+        mock_chain.abatch.assert_awaited_once_with(
+            [
+                {"system_prompt": "System", "user_content": "one"},
+                {"system_prompt": "System", "user_content": "two"},
+            ],
+            config={"max_concurrency": 5},
+        )
+        mock_init.assert_called_once_with("gpt-4o", model_provider="openai", temperature=0.1)
+
+    @patch("ccef_connections.connectors.openai.init_chat_model")
+    def test_abatch_empty_input_makes_no_calls(self, mock_init, connected_connector):
+        result = asyncio.run(
+            connected_connector.abatch_with_structured_output(
+                "gpt-4o", "System", [], MockResponseModel
+            )
+        )
+
+        assert result == []
+        mock_init.assert_not_called()
+
+    def test_abatch_rejects_bad_max_concurrency(self, connected_connector):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            asyncio.run(
+                connected_connector.abatch_with_structured_output(
+                    "gpt-4o", "System", ["one"], MockResponseModel, max_concurrency=0
+                )
+            )
+
+
 # ── create_prompt_template ───────────────────────────────────────────
 
 